@@ -0,0 +1,177 @@
+"""
+Conditional GETs for the cache-backed read routes: an ETag derived from the cache
+entries a response was assembled from, `If-None-Match` → 304, and a `Cache-Control`
+hint.
+
+iOS re-polls Home, the asset detail screens and the stock sections on 30- and 60-second
+timers, and almost every poll lands inside the TTL of the entries the previous response
+was built from — yet each one was serialized, gzipped and downloaded in full again.
+
+Opt-in per route, on a router built with ``route_class=ConditionalRoute``::
+
+    router = APIRouter(route_class=ConditionalRoute)
+
+    @router.get("/{symbol}", response_model=ETFDetailResponse)
+    @conditional()
+    async def get_etf_detail(...): ...
+
+The ETag covers:
+  * the entry versions app.core.cache recorded while the endpoint ran (see
+    `track_versions`). A response that touched something no version describes — a
+    degraded build that is never cached, an in-flight join — gets no ETag and no
+    Cache-Control, i.e. exactly the response it got before;
+  * the request path and query string;
+  * the caller, when the route resolves a ``user``: its id and tier, because gated
+    routes render per plan. Those responses are ``private``.
+
+A route may only opt in if EVERYTHING it returns comes from a versioned source: a cache
+region, a `record_entry`-ed class-level dict, or a `record_version`-ed live value. A
+live read the log cannot see would be frozen behind a 304.
+
+The 304 is decided after the endpoint returns and BEFORE FastAPI validates and
+serializes its result, so a revalidation costs the cache reads only — no JSON, no gzip,
+no body.
+"""
+
+import asyncio
+import hashlib
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from starlette.concurrency import run_in_threadpool
+
+from app.core.cache import track_versions
+
+_POLICY_ATTR = "__conditional_get__"
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    # Seconds a client may reuse a response without revalidating. 0 → `no-cache`
+    # (revalidate every time), which is right for anything carrying a live price.
+    max_age: int = 0
+
+
+def conditional(max_age: int = 0) -> Callable:
+    """Opt a GET endpoint into ETag / 304 handling.
+
+    Goes BELOW the route decorator — it only marks the function, and the route reads
+    the mark when it is created. Does nothing on a router without `ConditionalRoute`.
+    """
+    policy = CachePolicy(max_age=max_age)
+
+    def mark(endpoint: Callable) -> Callable:
+        setattr(endpoint, _POLICY_ATTR, policy)
+        return endpoint
+
+    return mark
+
+
+class _Exchange:
+    """The request, and the headers the endpoint wrapper decided on for its response."""
+
+    __slots__ = ("request", "etag", "cache_control")
+
+    def __init__(self, request: Request):
+        self.request = request
+        self.etag: Optional[str] = None
+        self.cache_control: Optional[str] = None
+
+
+_exchange: ContextVar[Optional[_Exchange]] = ContextVar("conditional_exchange", default=None)
+
+
+def _etag(request: Request, values: Dict[str, Any], fingerprint: str) -> Tuple[str, bool]:
+    """``(weak ETag, private)`` for this response."""
+    user = values.get("user")
+    private = isinstance(user, dict)
+    caller = (user.get("id"), user.get("tier")) if private else None
+    digest = hashlib.blake2b(
+        repr((request.url.path, request.url.query, caller, fingerprint)).encode("utf-8"),
+        digest_size=12,
+    ).hexdigest()
+    # Weak: GZipMiddleware re-encodes the body, and the validator names the data, not
+    # the bytes on the wire.
+    return f'W/"{digest}"', private
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison (RFC 9110 §13.1.2): a ``W/`` prefix is ignored on both sides."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def _cache_control(policy: CachePolicy, private: bool) -> str:
+    scope = "private" if private else "public"
+    if policy.max_age > 0:
+        return f"{scope}, max-age={policy.max_age}"
+    return f"{scope}, no-cache"
+
+
+def _versioned(call: Callable, policy: CachePolicy) -> Callable:
+    """Run the endpoint under `track_versions` and answer a matching revalidation."""
+    is_coroutine = asyncio.iscoroutinefunction(call)
+
+    async def versioned_call(**values: Any) -> Any:
+        with track_versions() as log:
+            if is_coroutine:
+                result = await call(**values)
+            else:
+                result = await run_in_threadpool(call, **values)
+        exchange = _exchange.get()
+        fingerprint = log.fingerprint()
+        # A Response is an error envelope (make_error_response) or a stream — never
+        # something a version describes.
+        if exchange is None or fingerprint is None or isinstance(result, Response):
+            return result
+        etag, private = _etag(exchange.request, values, fingerprint)
+        cache_control = _cache_control(policy, private)
+        if etag_matches(exchange.request.headers.get("if-none-match"), etag):
+            return Response(
+                status_code=304, headers={"ETag": etag, "Cache-Control": cache_control}
+            )
+        exchange.etag, exchange.cache_control = etag, cache_control
+        return result
+
+    return versioned_call
+
+
+class ConditionalRoute(APIRoute):
+    """An `APIRoute` that honours `@conditional` on its GET endpoints.
+
+    The endpoint is wrapped at the dependant level — after FastAPI has read its
+    signature — so dependency resolution, the OpenAPI schema and direct calls to the
+    endpoint function (the tests make plenty) are all unchanged.
+    """
+
+    def get_route_handler(self) -> Callable:
+        policy = getattr(self.endpoint, _POLICY_ATTR, None)
+        if policy is None or "GET" not in self.methods:
+            return super().get_route_handler()
+        if self.dependant.call is self.endpoint:
+            self.dependant.call = _versioned(self.endpoint, policy)
+        handler = super().get_route_handler()
+
+        async def conditional_handler(request: Request) -> Response:
+            exchange = _Exchange(request)
+            token = _exchange.set(exchange)
+            try:
+                response = await handler(request)
+            finally:
+                _exchange.reset(token)
+            if exchange.etag is not None and response.status_code == 200:
+                response.headers["ETag"] = exchange.etag
+                response.headers["Cache-Control"] = exchange.cache_control
+            return response
+
+        return conditional_handler
@@ -0,0 +1,54 @@
+"""
+The app's default JSON response class (`FastAPI(default_response_class=...)`).
+
+Starlette's `JSONResponse` renders with stdlib `json.dumps`, which on the heavy GETs
+(ticker report, home dashboard, whale profile — hundreds of KB of nested lists) was a
+visible slice of every request. `FastJSONResponse` renders with orjson instead, and a
+Pydantic model handed to it directly is serialized straight to bytes by pydantic-core
+(`model_dump_json`), never materialised as Python dicts first.
+
+Output is the same JSON — Starlette already rendered compact (`separators=(",", ":")`)
+— with one deliberate difference: a NaN / ±inf float renders as `null`. Stdlib
+raised `ValueError` on those (`allow_nan=False`), so a single bad FMP ratio used to
+500 the whole response.
+
+orjson is optional: without it this is exactly `JSONResponse`.
+"""
+
+from decimal import Decimal
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - optional dependency
+    _orjson = None
+
+_ORJSON_OPTIONS = (
+    (_orjson.OPT_NON_STR_KEYS | _orjson.OPT_SERIALIZE_NUMPY) if _orjson else 0
+)
+
+
+def _default(obj: Any) -> Any:
+    """What orjson can't encode natively, encoded the way `jsonable_encoder` does."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    item = getattr(obj, "item", None)   # numpy scalars (np.float32, np.bool_, ...)
+    if callable(item):
+        return item()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode("utf-8")
+        if _orjson is None:
+            return super().render(content)
+        return _orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
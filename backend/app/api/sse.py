@@ -0,0 +1,26 @@
+"""
+Server-Sent Events plumbing shared by the streaming endpoints (chat turns, ticker
+reports): one frame formatter and one response constructor, so every stream goes
+out with the same framing and the same anti-buffering headers.
+"""
+
+import json
+from typing import AsyncIterator
+
+from fastapi.responses import StreamingResponse
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",   # defeat proxy buffering (Railway/nginx)
+    "Connection": "keep-alive",
+}
+
+
+def sse_frame(event: str, data: dict) -> str:
+    """Format a single Server-Sent Events frame."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def sse_response(frames: AsyncIterator[str]) -> StreamingResponse:
+    """Wrap an async iterator of `sse_frame` strings as a `text/event-stream`."""
+    return StreamingResponse(frames, media_type="text/event-stream", headers=SSE_HEADERS)
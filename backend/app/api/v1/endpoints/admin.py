@@ -224,6 +224,73 @@ async def industry_benchmarks_status(
         raise HTTPException(status_code=500, detail="Failed to read industry benchmark status")
 
 
+@router.get("/cache-stats")
+async def cache_stats_endpoint(
+    x_admin_token: Optional[str] = Header(default=None, alias="X-Admin-Token"),
+    user: dict = Depends(get_current_user_or_guest),
+):
+    """Per-region hit/miss/eviction counters and byte usage for the shared in-memory
+    cache (app/core/cache.py), plus the process-wide budget they are charged against,
+    and the FMP client's per-endpoint dedup counters under ``fmp``.
+
+    Counters are per PROCESS and reset on deploy — with several web workers each one
+    answers for itself, so compare like with like when reading hit rates.
+    """
+    _authorize_admin(user, x_admin_token)
+    from app.core.cache import cache_stats
+    from app.integrations.fmp import get_fmp_client
+
+    stats = cache_stats()
+    stats["fmp"] = get_fmp_client().dedup_stats()
+    return stats
+
+
+@router.get("/jobs")
+async def jobs_status_endpoint(
+    x_admin_token: Optional[str] = Header(default=None, alias="X-Admin-Token"),
+    user: dict = Depends(get_current_user_or_guest),
+):
+    """Every background job this process scheduled (app/core/scheduler.py): schedule,
+    last start / finish / duration / error, next run, run / failure / skip counters, and
+    the background budget's view of recent request latency.
+
+    Per PROCESS, like cache-stats. Local dev registers no jobs unless
+    RUN_NOTIFICATION_JOBS_LOCALLY is set, so an empty ``jobs`` there is expected.
+    """
+    _authorize_admin(user, x_admin_token)
+    from app.core.scheduler import get_scheduler
+
+    return get_scheduler().status()
+
+
+@router.post("/jobs/{name}/run")
+async def run_job_now(
+    name: str,
+    x_admin_token: Optional[str] = Header(default=None, alias="X-Admin-Token"),
+    user: dict = Depends(get_current_user_or_guest),
+):
+    """Run one pass of a scheduled job now, in the background, under the same per-job
+    cap and background budget as its scheduled passes — a trigger that lands while the
+    scheduled pass is running is skipped (see ``skipped`` in GET /admin/jobs), never
+    run twice concurrently. Self-scheduled loops cannot be triggered.
+    """
+    _authorize_admin(user, x_admin_token)
+    from app.core.scheduler import get_scheduler
+    from app.integrations.fmp import FMPPriority, fmp_priority
+
+    scheduler = get_scheduler()
+    job = scheduler.jobs.get(name)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {name}")
+    if job.schedule is None:
+        raise HTTPException(status_code=409, detail=f"{name} is self-scheduled and cannot be triggered")
+    # BACKGROUND to the FMP governor, like its scheduled passes, even though it was
+    # started from a request.
+    with fmp_priority(FMPPriority.BACKGROUND):
+        asyncio.create_task(scheduler.run_once(name), name=f"admin_run_{name}")
+    return {"status": "started", "job": name}
+
+
 @router.post("/refresh-industry-dossier")
 async def refresh_industry_dossier(
     x_admin_token: Optional[str] = Header(default=None, alias="X-Admin-Token"),
@@ -357,7 +424,7 @@ async def refresh_industry_moat_benchmarks(
       - Progress can be inspected via:
             GET /api/v1/admin/industry-moat-benchmarks-status
       - The same code runs quarterly inside `_run_industry_dossier_job`
-        in app.main lifespan — this endpoint just lets you trigger it
+        in app/jobs.py — this endpoint just lets you trigger it
         on-demand.
     """
     _authorize_admin(user, x_admin_token)
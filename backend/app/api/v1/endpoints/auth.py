@@ -11,6 +11,7 @@ from typing import Optional
 
 from app.database import get_auth_client, get_supabase
 from app.dependencies import get_current_user_id
+from app.core.user_cache import invalidate_user_record
 from app.core.security import (
     create_access_token, create_refresh_token, decode_token, rate_limiter,
     trusted_client_ip, verify_supabase_token,
@@ -99,6 +100,10 @@ def _mark_password_changed(supabase: Client, user_id: str) -> None:
     Best-effort by necessity: the password itself has already been changed by the time we
     get here, and failing the whole request would tell the user their reset didn't work
     when it did. Logged at ERROR because the security property silently degrades.
+
+    Evicts the cached `users` row on the way out (app/core/user_cache.py) — it carries the
+    OLD stamp, and the auth dependencies would otherwise keep accepting pre-change tokens
+    from it for the rest of its TTL.
     """
     try:
         supabase.table("users").update(
@@ -110,6 +115,8 @@ def _mark_password_changed(supabase: Client, user_id: str) -> None:
             "(%s: %s) — old sessions will remain valid until they expire",
             user_id, type(e).__name__, e,
         )
+    finally:
+        invalidate_user_record(user_id)
 
 
 @router.post("/login", response_model=TokenResponse)
@@ -131,7 +138,7 @@ async def sign_in(
     # `protected=True` on every credential limiter: it routes these keys into a pool that
     # attacker-minted identifiers cannot reach. Sharing one table with the X-Guest-Id-keyed
     # buckets let ~20k cheap requests evict this very bucket and reset the cap below.
-    _enforce_credential_limits(
+    await _enforce_credential_limits(
         (f"login:ip:{client_ip}", 10, 60),
         (f"login:email:{email_key}", 10, 900),
         detail="Too many login attempts. Please try again later.",
@@ -261,7 +268,7 @@ async def sign_up(
     # whoever the attacker names — and it burns the project's mail quota, which is what stops
     # legitimate signups from arriving at all.
     email_key = (request.email or "").strip().lower()
-    _enforce_credential_limits(
+    await _enforce_credential_limits(
         (f"register:ip:{client_ip}", 5, 60),
         (f"register:email:{email_key}", 5, 3600),
         detail="Too many registration attempts. Please try again later.",
@@ -343,7 +350,7 @@ async def refresh_token(
     # Generous, because a legitimate client refreshes rarely but several screens can race a
     # 401 at once. Present so a garbage-token flood cannot spin the decode + DB read path for
     # free — the other unlimited credential route was `/change-password`, now limited above.
-    if not rate_limiter.is_allowed(
+    if not await rate_limiter.is_allowed_async(
         f"refresh:ip:{trusted_client_ip(req)}", max_requests=60, window_seconds=60,
         protected=True,
     ):
@@ -437,7 +444,7 @@ async def resend_confirmation(
     client_ip = trusted_client_ip(req)
     email_key = request.email.strip().lower()
 
-    _enforce_credential_limits(
+    await _enforce_credential_limits(
         (f"resend:ip:{client_ip}", 5, 3600),
         (f"resend:email:{email_key}", 3, 3600),
         detail="Too many requests. Please try again later.",
@@ -562,7 +569,7 @@ def _password_rejection_reasons(exc: Exception) -> Optional[str]:
     return None
 
 
-def _enforce_credential_limits(
+async def _enforce_credential_limits(
     *checks: tuple[str, int, int],
     detail: str,
     retry_after: str,
@@ -590,7 +597,7 @@ def _enforce_credential_limits(
     keyed on caller-supplied input (email) second.
     """
     for key, max_requests, window_seconds in checks:
-        if not rate_limiter.is_allowed(
+        if not await rate_limiter.is_allowed_async(
             key, max_requests=max_requests, window_seconds=window_seconds, protected=True
         ):
             raise HTTPException(
@@ -653,6 +660,7 @@ def _ensure_display_name(supabase: Client, user_id: str, display_name: Optional[
         supabase.table("users").update(
             {"display_name": display_name.strip()}
         ).eq("id", user_id).execute()
+        invalidate_user_record(user_id)
     except Exception as e:
         # Cosmetic — never fail a sign-in over a name.
         logger.warning(
@@ -670,7 +678,7 @@ async def oauth_sign_in(
 ):
     """Sign in with a native provider identity token (Sign in with Apple)."""
     client_ip = trusted_client_ip(req)
-    if not rate_limiter.is_allowed(
+    if not await rate_limiter.is_allowed_async(
         f"oauth:{client_ip}", max_requests=20, window_seconds=60, protected=True
     ):
         raise HTTPException(
@@ -743,7 +751,7 @@ async def session_exchange(
     is only trusted after that check passes.
     """
     client_ip = trusted_client_ip(req)
-    if not rate_limiter.is_allowed(
+    if not await rate_limiter.is_allowed_async(
         f"exchange:{client_ip}", max_requests=20, window_seconds=60, protected=True
     ):
         raise HTTPException(
@@ -825,7 +833,7 @@ async def forgot_password(
 
     # 5/hour per IP, 3/hour per address. Deliberately tight — this endpoint sends mail.
     # Still a generic response shape, but 429 so a legitimate client can back off.
-    _enforce_credential_limits(
+    await _enforce_credential_limits(
         (f"forgot:ip:{client_ip}", 5, 3600),
         (f"forgot:email:{email_key}", 3, 3600),
         detail="Too many reset requests. Please try again later.",
@@ -865,7 +873,7 @@ async def reset_password(
     client_ip = trusted_client_ip(req)
     email_key = request.email.strip().lower()
 
-    _enforce_credential_limits(
+    await _enforce_credential_limits(
         (f"reset:ip:{client_ip}", 10, 3600),
         (f"reset:email:{email_key}", 10, 3600),
         detail="Too many attempts. Please request a new code and try again later.",
@@ -941,7 +949,7 @@ async def change_password(
     # Keyed per USER as well as per IP — the per-IP half alone would let an attacker with a
     # pool of addresses keep guessing against one account.
     client_ip = trusted_client_ip(req)
-    _enforce_credential_limits(
+    await _enforce_credential_limits(
         (f"changepw:ip:{client_ip}", 10, 3600),
         (f"changepw:user:{user_id}", 5, 900),
         detail="Too many password change attempts. Please try again later.",
@@ -7,14 +7,12 @@ Frontend: POST /chat/sessions, GET /chat/sessions,
 """
 
 import asyncio
-import json
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Header, Request
-from fastapi.responses import StreamingResponse
 from supabase import Client
 import logging
 
@@ -26,6 +24,7 @@ from app.dependencies import (
     chat_identity_key,
 )
 from app.api.error_response import make_error_response, ErrorCode
+from app.api.sse import sse_frame as _sse, sse_response
 from app.services.chat_security import (
     validate_message,
     sanitize_context,
@@ -518,11 +517,6 @@ def _persist_context_snapshot(
         )
 
 
-def _sse(event: str, data: dict) -> str:
-    """Format a single Server-Sent Events frame."""
-    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
-
-
 def _row_to_message(row: dict) -> ChatMessageResponse:
     """Map a Supabase chat_messages row to the response schema."""
     rc = row.get("rich_content") if isinstance(row.get("rich_content"), dict) else None
@@ -1352,15 +1346,7 @@ async def stream_chat_message(
             if not delivered:
                 quota.refund_once("chat_stream_cancelled")
 
-    return StreamingResponse(
-        _metered_stream(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "X-Accel-Buffering": "no",   # defeat proxy buffering (Railway/nginx)
-            "Connection": "keep-alive",
-        },
-    )
+    return sse_response(_metered_stream())
 
 
 @router.get("/sessions/{session_id}", response_model=ChatHistoryResponse)
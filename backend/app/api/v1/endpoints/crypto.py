@@ -16,6 +16,7 @@ from typing import Optional, Dict, Any
 import logging
 import re
 
+from app.api.conditional import ConditionalRoute, conditional
 from app.api.error_response import (
     ErrorCode,
     error_response_from_exception,
@@ -40,7 +41,7 @@ from app.services.technical_analysis_service import get_technical_analysis_servi
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(route_class=ConditionalRoute)
 
 
 # Crypto bases are short alphanumerics (BTC, ETH, 1INCH, USDT). Anything else
@@ -248,6 +249,7 @@ async def enrich_crypto_news(
 
 
 @router.get("/{symbol}/sentiment")
+@conditional(max_age=60)
 async def get_crypto_sentiment(symbol: str):
     """
     Get sentiment analysis for a crypto symbol.
@@ -282,6 +284,7 @@ async def get_crypto_sentiment(symbol: str):
     "/{symbol}/technical-analysis",
     response_model=TechnicalAnalysisResponse,
 )
+@conditional(max_age=60)
 async def get_crypto_technical_analysis(symbol: str):
     """
     Get technical analysis gauge data for a crypto symbol.
@@ -309,6 +312,7 @@ async def get_crypto_technical_analysis(symbol: str):
     "/{symbol}/technical-analysis/detail",
     response_model=TechnicalAnalysisDetailResponse,
 )
+@conditional(max_age=60)
 async def get_crypto_technical_analysis_detail(symbol: str):
     """
     Get detailed technical analysis breakdown for a crypto symbol.
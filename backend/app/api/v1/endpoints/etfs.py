@@ -12,6 +12,7 @@ from typing import Optional, Dict, Any
 import logging
 import re
 
+from app.api.conditional import ConditionalRoute, conditional
 from app.api.error_response import (
     ErrorCode,
     error_response_from_exception,
@@ -37,7 +38,7 @@ from app.schemas.news import (
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(route_class=ConditionalRoute)
 
 # ETF tickers are ordinary NMS symbols (SPY, QQQ, ARKK). Same shape as stocks.
 _ETF_SYMBOL_RE = re.compile(r"^[A-Z0-9.\-]{1,15}$")
@@ -54,6 +55,7 @@ def _invalid_news_symbol(raw: str) -> JSONResponse:
 
 
 @router.get("/{symbol}/quote", response_model=ETFQuoteResponse)
+@conditional()
 async def get_etf_quote(
     symbol: str,
     chart_range: Optional[str] = Query(
@@ -94,6 +96,7 @@ async def get_etf_quote(
 
 
 @router.get("/{symbol}", response_model=ETFDetailResponse)
+@conditional()
 async def get_etf_detail(
     symbol: str,
     chart_range: str = Query(
@@ -24,6 +24,7 @@ from app.schemas.home import HomeFeedResponse
 from app.schemas.home_dashboard import HomeDashboardResponse
 from app.schemas.signals_detail import SignalTickerDetailResponse
 from app.schemas.themes_detail import ThemeDetailResponse
+from app.api.conditional import ConditionalRoute, conditional
 from app.api.error_response import (
     error_response_from_exception,
     make_error_response,
@@ -35,7 +36,7 @@ _VALID_SIGNAL_KINDS = {"whale", "congress"}
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(route_class=ConditionalRoute)
 
 
 @router.get("/feed", response_model=HomeFeedResponse)
@@ -53,6 +54,7 @@ async def get_home_feed(
 
 
 @router.get("/dashboard", response_model=HomeDashboardResponse)
+@conditional()
 async def get_home_dashboard(
     # The WATCHLIST identity (a real account, else a per-INSTALL guest — migration
     # 108), not the shared guest sentinel: the strip must resolve to the same
@@ -92,6 +94,7 @@ async def get_home_dashboard(
 
 
 @router.get("/signals/{kind}/{ticker}", response_model=SignalTickerDetailResponse)
+@conditional(max_age=60)
 async def get_signal_ticker_detail(
     kind: str,
     ticker: str,
@@ -142,6 +145,7 @@ async def get_signal_ticker_detail(
 
 
 @router.get("/themes/{slug}", response_model=ThemeDetailResponse)
+@conditional(max_age=60)
 async def get_theme_detail(slug: str):
     """Emerging Frontiers theme drill-down — the theme's hero (title / subtitle /
     image) + its live constituent companies (price, daily %, market cap). Public
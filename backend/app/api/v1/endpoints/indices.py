@@ -16,6 +16,7 @@ import logging
 import re
 import traceback
 
+from app.api.conditional import ConditionalRoute, conditional
 from app.api.error_response import (
     ErrorCode,
     error_response_from_exception,
@@ -35,7 +36,7 @@ from app.schemas.news import (
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(route_class=ConditionalRoute)
 
 
 # Top-weighted constituent tickers for news queries
@@ -170,6 +171,7 @@ def _normalize_index_symbol(symbol: str) -> str:
 
 
 @router.get("/{symbol}/quote", response_model=IndexQuoteResponse)
+@conditional()
 async def get_index_quote(
     symbol: str,
     chart_range: Optional[str] = Query(
@@ -209,6 +211,7 @@ async def get_index_quote(
 
 
 @router.get("/{symbol}", response_model=IndexDetailResponse)
+@conditional()
 async def get_index_detail(
     symbol: str,
     chart_range: str = Query("3M", alias="range", pattern="^(1D|1W|3M|6M|1Y|5Y|ALL)$"),
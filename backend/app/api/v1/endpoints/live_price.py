@@ -1,9 +1,11 @@
 """
-Live Price WebSocket Endpoint
-Streams real-time stock prices from FMP to iOS clients.
+Live Price WebSocket Endpoints
+Streams real-time stock prices from FMP to iOS clients: one ticker per socket
+(`/ws/price/{ticker}`), or a whole watchlist over one socket (`/ws/prices`).
 """
 
 import asyncio
+import json
 import logging
 import re
 from collections import defaultdict
@@ -14,7 +16,7 @@ from app.core.security import trusted_client_ip
 # The endpoint layer importing from `dependencies` (not `integrations`) is consistent with how
 # every other endpoint reaches its auth helpers.
 from app.dependencies import _user_id_from_token
-from app.services.live_price_manager import get_live_price_manager
+from app.services.live_price_manager import BatchedPriceClient, get_live_price_manager
 from app.utils.market_hours import is_market_active
 
 logger = logging.getLogger(__name__)
@@ -25,6 +27,15 @@ router = APIRouter()
 _MAX_CONNECTIONS_PER_KEY = 10
 _active_connections: dict[str, int] = defaultdict(int)
 _TICKER_RE = re.compile(r"^[A-Za-z0-9.\-]{1,10}$")
+# Multi-ticker socket: symbols one connection may watch, and the batch cadence — every
+# symbol that ticked in a window goes out as ONE frame carrying its latest price.
+_MAX_SYMBOLS_PER_CONNECTION = 100
+_BATCH_INTERVAL_SECONDS = 0.25
+
+
+def _is_crypto(ticker: str) -> bool:
+    """Crypto pairs trade 24/7 and skip the market-hours gate."""
+    return ticker.endswith("USD") and len(ticker) >= 5
 
 def _release_connection(conn_key: str) -> None:
     """Decrement, and DELETE the key at zero.
@@ -117,7 +128,7 @@ async def live_price_ws(
     # Accept the connection
     await websocket.accept()
     _active_connections[conn_key] += 1
-    is_crypto = ticker_upper.endswith("USD") and len(ticker_upper) >= 5
+    is_crypto = _is_crypto(ticker_upper)
 
     # Check market hours for stocks — crypto trades 24/7
     if not is_crypto and not is_market_active():
@@ -175,3 +186,151 @@ async def live_price_ws(
         logger.info(
             f"WebSocket closed for {ticker_upper} (user: {user_id})"
         )
+
+
+async def _apply_subscription_message(manager, client: BatchedPriceClient, raw: str) -> dict:
+    """Apply one client control message to ``client``'s symbol set; returns the reply.
+
+    Subscribing joins the symbol's room (the room sends its cached price straight
+    away, so the next batch carries it); unsubscribing leaves it. Invalid symbols,
+    symbols past `_MAX_SYMBOLS_PER_CONNECTION` and — outside market hours — stock
+    symbols are not subscribed and are reported back instead.
+    """
+    try:
+        message = json.loads(raw)
+    except ValueError:
+        return {"type": "error", "message": "Invalid JSON"}
+    if not isinstance(message, dict):
+        return {"type": "error", "message": "Expected a JSON object"}
+
+    action = message.get("action")
+    if action == "ping":
+        return {"type": "pong"}
+    if action not in ("subscribe", "unsubscribe"):
+        return {"type": "error", "message": "Unknown action"}
+
+    symbols = message.get("symbols")
+    if isinstance(symbols, str):
+        symbols = [symbols]
+    if not isinstance(symbols, list):
+        return {"type": "error", "message": "symbols must be a list"}
+    if len(symbols) > _MAX_SYMBOLS_PER_CONNECTION:
+        return {"type": "error", "message": "Too many symbols"}
+
+    rejected: list[str] = []
+    market_closed: list[str] = []
+    joining: list[str] = []
+    market_open = None
+    for entry in symbols:
+        symbol = entry.strip().upper() if isinstance(entry, str) else ""
+        if not _TICKER_RE.match(symbol):
+            rejected.append(str(entry))
+            continue
+        if action == "unsubscribe":
+            if symbol in client.symbols:
+                client.forget(symbol)
+                await manager.unsubscribe(symbol, client)
+            continue
+        if symbol in client.symbols:
+            continue
+        if len(client.symbols) >= _MAX_SYMBOLS_PER_CONNECTION:
+            rejected.append(symbol)
+            continue
+        if not _is_crypto(symbol):
+            if market_open is None:
+                market_open = is_market_active()
+            if not market_open:
+                market_closed.append(symbol)
+                continue
+        # Before `subscribe_many`: the room's cached price is only kept for a watched symbol.
+        client.symbols.add(symbol)
+        joining.append(symbol)
+
+    # One call for the whole message: the new rooms' previous closes are fetched
+    # together, outside the manager's lock, which is then taken once.
+    if joining:
+        await manager.subscribe_many(joining, client)
+
+    return {
+        "type": "subscriptions",
+        "symbols": sorted(client.symbols),
+        "rejected": rejected,
+        "market_closed": market_closed,
+    }
+
+
+@router.websocket("/ws/prices")
+async def live_prices_ws(
+    websocket: WebSocket,
+    token: str = Query(None),
+):
+    """
+    WebSocket endpoint for real-time prices of many tickers over one connection.
+
+    `/ws/price/{ticker}` carries one ticker per socket under the same per-user/IP cap,
+    so a watchlist had to open a socket per row or fall back to REST polling. Here the
+    client opens ONE socket (one slot of the cap) and manages its symbol set:
+
+        {"action": "subscribe", "symbols": ["AAPL", "BTCUSD"]}
+        {"action": "unsubscribe", "symbols": ["AAPL"]}
+        {"action": "ping"}
+
+    Each subscribe/unsubscribe is answered with the full current set:
+        {"type": "subscriptions", "symbols": ["BTCUSD"], "rejected": [],
+         "market_closed": []}
+
+    and prices arrive batched — every symbol that ticked since the last frame, latest
+    price each, at most every `_BATCH_INTERVAL_SECONDS`:
+        {"type": "prices", "data": [{"type": "price_update", "symbol": "AAPL", ...}]}
+
+    Stock symbols are refused outside market hours (reported in "market_closed") and
+    dropped when the market closes mid-session (a {"type": "market_closed",
+    "symbols": [...]} notice); crypto streams 24/7. A symbol whose upstream feed is
+    lost gets {"type": "error", "symbol": ..., "message": ...} and leaves the set.
+    Auth is the same optional ?token= query parameter as `/ws/price/{ticker}`.
+    """
+    user_id = _validate_ws_token(token) if token else None
+
+    conn_key = user_id or trusted_client_ip(websocket)
+    if _active_connections.get(conn_key, 0) >= _MAX_CONNECTIONS_PER_KEY:
+        await websocket.close(code=1008, reason="Too many connections")
+        return
+
+    await websocket.accept()
+    _active_connections[conn_key] += 1
+
+    manager = get_live_price_manager()
+    client = BatchedPriceClient(websocket, _BATCH_INTERVAL_SECONDS)
+    # The flusher is the socket's ONLY writer — replies and notices are queued on the
+    # client too — so price batches and control replies never interleave mid-send.
+    flusher = asyncio.create_task(client.run(), name="live-prices-flush")
+    try:
+        while not flusher.done():
+            try:
+                raw = await asyncio.wait_for(websocket.receive_text(), timeout=300)
+            except asyncio.TimeoutError:
+                # Drop stock symbols once the market has closed during this session.
+                if not is_market_active():
+                    closed = sorted(s for s in client.symbols if not _is_crypto(s))
+                    for symbol in closed:
+                        client.forget(symbol)
+                        await manager.unsubscribe(symbol, client)
+                    if closed:
+                        await client.send_json({
+                            "type": "market_closed",
+                            "symbols": closed,
+                            "message": "US markets are now closed",
+                        })
+                continue
+            await client.send_json(await _apply_subscription_message(manager, client, raw))
+
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.error(f"Multi-ticker WebSocket error: {e}")
+    finally:
+        flusher.cancel()
+        _release_connection(conn_key)
+        for symbol in list(client.symbols):
+            await manager.unsubscribe(symbol, client)
+        logger.info(f"Multi-ticker WebSocket closed (user: {user_id})")
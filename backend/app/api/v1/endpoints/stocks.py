@@ -16,9 +16,10 @@ import math
 import re
 
 from app.integrations.coingecko import SYMBOL_TO_COINGECKO_ID
-from app.integrations.fmp import get_fmp_client, FMPClient
+from app.integrations.fmp import FMPClient, FMPPriority, fmp_priority, get_fmp_client
 from app.integrations.finra_short_interest import get_short_interest
 from app.schemas.common import normalize_fmp_response, normalize_fmp_list
+from app.api.conditional import ConditionalRoute, conditional
 from app.api.error_response import (
     ErrorCode,
     error_response_from_exception,
@@ -65,7 +66,7 @@ from app.services.ticker_data_cache import warm_ticker_collection
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(route_class=ConditionalRoute)
 
 # Ticker validation pattern: 1-10 uppercase letters, digits, dots, or hyphens
 _TICKER_RE = re.compile(r"^[A-Za-z0-9.\-]{1,10}$")
@@ -142,7 +143,10 @@ async def prewarm_report_collection(
     if len(_PREWARM_TASKS) >= settings.REPORT_PREWARM_MAX_INFLIGHT:
         return JSONResponse(status_code=202, content={"ticker": t, "status": "busy"})
 
-    task = asyncio.create_task(warm_ticker_collection(t))
+    # Speculative — nobody is waiting on it yet — so it queues behind interactive FMP
+    # traffic. The task copies the context at creation, priority included.
+    with fmp_priority(FMPPriority.BACKGROUND):
+        task = asyncio.create_task(warm_ticker_collection(t))
     _PREWARM_TASKS.add(task)
     task.add_done_callback(_PREWARM_TASKS.discard)
     return JSONResponse(status_code=202, content={"ticker": t, "status": "warming"})
@@ -1055,6 +1059,7 @@ async def enrich_stock_news(
 # ── Analyst analysis endpoint ─────────────────────────────────────
 
 @router.get("/{ticker}/analyst-analysis", response_model=AnalystAnalysisResponse)
+@conditional(max_age=60)
 async def get_analyst_analysis(ticker: str):
     """
     Get comprehensive analyst analysis data for a ticker.
@@ -1079,6 +1084,7 @@ async def get_analyst_analysis(ticker: str):
 # ── Earnings endpoint ────────────────────────────────────────────
 
 @router.get("/{ticker}/earnings", response_model=EarningsResponse)
+@conditional(max_age=60)
 async def get_earnings(ticker: str):
     """
     Get quarterly earnings data (EPS & Revenue actuals vs estimates),
@@ -1101,6 +1107,7 @@ async def get_earnings(ticker: str):
 # ── Growth endpoint ──────────────────────────────────────────────
 
 @router.get("/{ticker}/growth", response_model=GrowthResponse)
+@conditional(max_age=60)
 async def get_growth(ticker: str):
     """Get growth data (EPS & Revenue YoY growth with sector comparison)."""
     ticker = ticker.upper()
@@ -1120,6 +1127,7 @@ async def get_growth(ticker: str):
 # ── Profit Power endpoint ────────────────────────────────────────
 
 @router.get("/{ticker}/profit-power", response_model=ProfitPowerResponse)
+@conditional(max_age=60)
 async def get_profit_power(ticker: str):
     """Get profit power data (margin metrics with sector average net margin)."""
     ticker = ticker.upper()
@@ -1143,6 +1151,7 @@ async def get_profit_power(ticker: str):
 # ── Health Check endpoint ────────────────────────────────────────
 
 @router.get("/{ticker}/health-check", response_model=HealthCheckResponse)
+@conditional(max_age=60)
 async def get_health_check(ticker: str):
     """Get health check data (financial ratio analysis vs sector benchmarks)."""
     ticker = ticker.upper()
@@ -1166,6 +1175,7 @@ async def get_health_check(ticker: str):
 # ── Revenue breakdown endpoint ───────────────────────────────────
 
 @router.get("/{ticker}/revenue-breakdown", response_model=RevenueBreakdownResponse)
+@conditional(max_age=60)
 async def get_revenue_breakdown(ticker: str):
     """
     Get revenue breakdown showing how the company makes money.
@@ -1191,6 +1201,7 @@ async def get_revenue_breakdown(ticker: str):
 # ── Signal of Confidence endpoint ────────────────────────────────
 
 @router.get("/{ticker}/signal-of-confidence", response_model=SignalOfConfidenceResponse)
+@conditional(max_age=60)
 async def get_signal_of_confidence(ticker: str):
     """
     Get signal of confidence data (dividends, buybacks, shares outstanding).
@@ -1216,6 +1227,7 @@ async def get_signal_of_confidence(ticker: str):
 # ── Holders endpoint ─────────────────────────────────────────────
 
 @router.get("/{ticker}/holders", response_model=HoldersResponse)
+@conditional(max_age=60)
 async def get_holders(ticker: str):
     """
     Get shareholder breakdown, smart money flow, and recent activities.
@@ -1242,6 +1254,7 @@ async def get_holders(ticker: str):
 # ── Sentiment analysis endpoint ──────────────────────────────────
 
 @router.get("/{ticker}/sentiment", response_model=SentimentAnalysisResponse)
+@conditional(max_age=60)
 async def get_sentiment_analysis(ticker: str):
     """
     Get sentiment analysis / market mood data for a ticker.
@@ -1266,6 +1279,7 @@ async def get_sentiment_analysis(ticker: str):
 # ── Technical analysis endpoints ──────────────────────────────
 
 @router.get("/{ticker}/technical-analysis", response_model=TechnicalAnalysisResponse)
+@conditional(max_age=60)
 async def get_technical_analysis(ticker: str):
     """
     Get technical analysis gauge data for a ticker.
@@ -1320,6 +1334,7 @@ async def get_chart_events(ticker: str):
     "/{ticker}/technical-analysis/detail",
     response_model=TechnicalAnalysisDetailResponse,
 )
+@conditional(max_age=60)
 async def get_technical_analysis_detail(ticker: str):
     """
     Get detailed technical analysis breakdown for a ticker.
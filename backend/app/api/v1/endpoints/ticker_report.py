@@ -19,23 +19,31 @@ Phase 3 error contract:
 
 Endpoints:
   GET  /stocks/{ticker}/report?persona=warren_buffett
+  GET  /stocks/{ticker}/report/stream?persona=warren_buffett   (SSE, same report)
   POST /stocks/{ticker}/report/chat
 """
 
 import asyncio
+import json
 import logging
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
 from typing import Optional
 from fastapi import APIRouter, Depends, Header, Query
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
+from app.api.conditional import ConditionalRoute, conditional
 from app.api.error_response import (
     ErrorCode,
+    error_body_from_exception,
     error_response_from_exception,
     make_error_response,
 )
+from app.api.sse import sse_frame, sse_response
 from app.config import settings
+from app.core.cache import record_version
 from app.database import get_supabase
 from app.dependencies import (
     get_current_user,
@@ -59,7 +67,7 @@ from app.services.ticker_report_service import TickerReportService
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(route_class=ConditionalRoute)
 
 # Single source of truth for valid persona keys — alias the research agent's
 # registry (persona_config.PERSONA_KEYS) so this endpoint and
@@ -78,7 +86,12 @@ LEGACY_CACHE_TTL_HOURS = 24
 _INFLIGHT_REPORTS = 0
 
 
-@router.get("/{ticker}/report")
+# `response_model` with a validated instance: FastAPI dumps it through pydantic-core in one
+# pass. Returning `model_dump()` output instead sent ~100 KB of nested dicts through
+# `jsonable_encoder`'s per-value Python walk on every hit. Error returns are Responses and
+# bypass it.
+@router.get("/{ticker}/report", response_model=TickerReportResponse)
+@conditional(max_age=300)
 async def get_ticker_report(
     ticker: str,
     persona: str = Query("warren_buffett", description="Investor persona key"),
@@ -112,71 +125,18 @@ async def get_ticker_report(
     global _INFLIGHT_REPORTS
     ticker = ticker.upper().strip()
 
-    if not ticker or len(ticker) > 10:
-        return make_error_response(
-            ErrorCode.INVALID_INPUT,
-            message=f"Invalid ticker symbol: {ticker!r}",
-            details={"ticker": ticker},
-        )
-
-    if persona not in VALID_PERSONAS:
-        return make_error_response(
-            ErrorCode.INVALID_PERSONA,
-            message=f"Unsupported persona key: {persona!r}",
-            # Joined, not a list: iOS `AnyCodable` decodes String/Int/Double/Bool and silently
-            # falls through to "" for anything else, so a list arrived as an empty string and
-            # the hint the user needed was destroyed without an error anywhere.
-            details={"persona": persona, "valid": ", ".join(sorted(VALID_PERSONAS))},
-        )
-
-    # ── FREE PATH 1: legacy back-compat cache (recent completed research_reports).
-    try:
-        cached = await _check_legacy_report_cache(ticker, persona)
-        if cached:
-            logger.info(
-                f"Legacy cache HIT for {ticker}/{persona} — serving stored report"
-            )
-            # Overlay live Wall Street Consensus so saved reports match
-            # what `/stocks/{ticker}/analyst-analysis` and
-            # `/stocks/{ticker}/holders` are showing right now.
-            cached = await patch_wall_street_consensus_live(cached, ticker)
-            patched = patch_legacy_price_action(cached)
-            # VALIDATE, like every other return on this endpoint. This row came out of
-            # another user's `research_reports.ticker_report_data`, which the DEEP
-            # pipeline writes WITHOUT ever checking it against TickerReportResponse —
-            # so this was the one path that could hand iOS a payload nothing had
-            # type-checked. Swift's synthesized decoder is all-or-nothing, so a single
-            # bad field (a null `moat_competition.dimensions[].score`, say) would fail
-            # the whole screen with "Received unexpected data from the server".
-            #
-            # A row that fails is treated as a MISS, not as an error: the request falls
-            # through to the close-aligned cache and, failing that, to a fresh
-            # generation — the same handling `_short_interest_payload_stale` already
-            # gives a legacy row it doesn't trust, a few lines below.
-            result, err = _validate_report(patched, ticker, persona)
-            if err is None:
-                return result
-            logger.warning(
-                "Legacy cached report for %s/%s failed schema validation — treating as "
-                "a MISS rather than serving a payload iOS cannot decode",
-                ticker, persona,
-            )
-    except Exception as e:
-        # Cache lookup failures must never break the request — log and fall through.
-        logger.warning(
-            f"Legacy cache check failed for {ticker}: "
-            f"{type(e).__name__}: {e}"
-        )
-
-    # ── FREE PATH 2: the dedicated 24h ticker_report_cache. Checking it HERE (not
-    #    only inside the service) is what lets us charge strictly on a real
-    #    generation: a hit returns free, a miss is billable. get_cached_report
-    #    never raises (returns None on any error).
-    cached = await get_cached_report(ticker, persona)
-    if cached is not None:
-        logger.info(f"ticker_report_cache HIT for {ticker}/{persona} — free serve")
-        result, err = _validate_report(cached, ticker, persona)
-        return err if err is not None else result
+    err = _request_error(ticker, persona)
+    if err is not None:
+        return err
+
+    # ── FREE PATHS: the legacy research_reports bridge, then the dedicated 24h
+    #    ticker_report_cache. A hit (or a hit that fails validation) ends here,
+    #    before the admission gate and the charge.
+    result, err = await _free_report(ticker, persona)
+    if err is not None:
+        return err
+    if result is not None:
+        return result
 
     # ── ADMISSION GATE: shed load past a safe backlog. Placement is load-bearing
     #    on three counts:
@@ -186,18 +146,9 @@ async def get_ticker_report(
     #         (the invariant test_research_concurrency_cap pins for the other path).
     #      3. Released in the `finally` below, which also runs on CancelledError.
     #         A leaked slot permanently bricks the endpoint after N disconnects.
-    cap = settings.REPORT_GET_MAX_INFLIGHT
-    if cap and _INFLIGHT_REPORTS >= cap:
-        logger.warning(
-            "Report admission REJECTED for %s/%s — %d in flight (cap %d)",
-            ticker, persona, _INFLIGHT_REPORTS, cap,
-        )
-        return make_error_response(
-            ErrorCode.SYSTEM_BUSY,
-            status_code=409,
-            message=f"{_INFLIGHT_REPORTS} report generations already in flight (cap {cap})",
-            details={"ticker": ticker, "persona": persona, "step": "admission"},
-        )
+    err = _admission_error(ticker, persona)
+    if err is not None:
+        return err
     _INFLIGHT_REPORTS += 1
 
     # Everything from here on lives inside the try, so the slot is released on
@@ -218,33 +169,9 @@ async def get_ticker_report(
         #    Rotating it bought a fresh allowance per request, so this endpoint (the same
         #    ~17 Gemini + ~20 FMP cost as /research/generate on a miss) was unmetered against
         #    anyone willing to send a new header. Account-only closes that.
-        try:
-            new_remaining = credit_service.precharge(
-                user["id"], CreditService.DEEP_RESEARCH_COST,
-                reason="report_charge", ref_id=f"{ticker}:{persona}",
-            )
-        except CreditServiceUnavailable:
-            # Transient Supabase/RPC failure — retryable SYSTEM_BUSY (never
-            # INSUFFICIENT_CREDITS: a DB blip must not tell a paying user
-            # they're broke). Nothing was debited, so `charged` stays False.
-            return make_error_response(
-                ErrorCode.SYSTEM_BUSY,
-                status_code=409,
-                message="spend_credits RPC unavailable (transient)",
-                details={"user_id": user["id"], "ticker": ticker, "step": "credit_charge"},
-            )
-        if new_remaining is None:
-            return make_error_response(
-                ErrorCode.INSUFFICIENT_CREDITS,
-                message=(
-                    f"User has fewer than {CreditService.DEEP_RESEARCH_COST} "
-                    f"credits remaining"
-                ),
-                details={
-                    "user_id": user["id"],
-                    "required": CreditService.DEEP_RESEARCH_COST,
-                },
-            )
+        err = _precharge_error(credit_service, user, ticker, persona)
+        if err is not None:
+            return err
         charged = True
 
         service = TickerReportService()
@@ -256,22 +183,9 @@ async def get_ticker_report(
         # 20 credits and returned as a success — the user paid full price for a blank report.
         # Returning an error here leaves `delivered` False, so the `finally` refunds.
         # `generate_fresh_report` has already declined to cache it.
-        degraded = report.get("_degraded") if isinstance(report, dict) else None
-        if degraded:
-            logger.warning(
-                "Degraded report for %s/%s (%s) — refunding rather than delivering a shell",
-                ticker, persona, degraded,
-            )
-            return make_error_response(
-                ErrorCode.GEMINI_UNAVAILABLE,
-                message=f"report generation degraded for {ticker}/{persona}: {degraded}",
-                status_code=503,
-                user_message=(
-                    "Analysis is temporarily unavailable. You have not been charged — "
-                    "please try again in a few minutes."
-                ),
-                action="retry",
-            )
+        err = _degraded_error(report, ticker, persona)
+        if err is not None:
+            return err
 
         # A malformed report is a non-delivery → the finally refunds (the user
         # must not pay for a report they can't use).
@@ -315,12 +229,325 @@ async def get_ticker_report(
             )
 
 
+@router.get("/{ticker}/report/stream")
+async def stream_ticker_report(
+    ticker: str,
+    persona: str = Query("warren_buffett", description="Investor persona key"),
+    user: dict = Depends(get_current_user),
+    _rate: None = ReportRateLimit,
+):
+    """
+    The same report as `GET /{ticker}/report`, delivered progressively over SSE
+    (``text/event-stream``) so a cold report shows content at collection time
+    instead of after the whole Gemini pipeline.
+
+    Frames: ``meta`` → ``section``* / ``narrative``* → ``done`` or ``error``.
+      * ``section``   ``{key, data}`` — one top-level report section, validated
+        against its TickerReportResponse field. The real-data sections (price
+        action, insider + institutional flow, Street consensus, fundamentals
+        history) arrive right after the FMP collection; the Stage A sections
+        after assembly; core_thesis / critical_factors again once re-synthesized.
+      * ``narrative`` ``{label, key, data}`` — a Stage-B narrative landed; ``data``
+        is the whole updated section, so the client just replaces ``key``.
+      * ``done``      ``{report}`` — the full validated report, byte-for-byte what
+        the GET returns. Authoritative: it supersedes every earlier frame.
+      * ``error``     the structured error body the GET would have returned.
+
+    A cache hit is ``meta`` (``cached: true``) + ``done``. Billing, admission and
+    refunds match the GET: bad input and a cache entry that fails validation are a
+    normal JSON error; admission and credits are decided inside the stream (see
+    `_generation_frames`), so they arrive as an ``error`` frame; a degraded or
+    malformed report, a failure or a client disconnect refunds the charge.
+    """
+    ticker = ticker.upper().strip()
+
+    err = _request_error(ticker, persona)
+    if err is not None:
+        return err
+
+    result, err = await _free_report(ticker, persona)
+    if err is not None:
+        return err
+    if result is not None:
+        return sse_response(_cached_frames(ticker, persona, result))
+    return sse_response(_generation_frames(CreditService(), user, ticker, persona))
+
+
+async def _cached_frames(ticker: str, persona: str, report: dict):
+    yield sse_frame("meta", {"ticker": ticker, "persona": persona, "cached": True})
+    yield sse_frame("done", {"report": jsonable_encoder(report)})
+
+
+async def _generation_frames(credit_service, user: dict, ticker: str, persona: str):
+    """Run one billable generation, relaying its progress as SSE frames.
+
+    The pipeline runs as a task feeding a queue so frames go out the moment the
+    service reports them.
+
+    Admission, the slot and the charge all happen HERE, on the first iteration, with
+    no await between the admission check and the increment. In the handler they
+    could not be made safe: the generator's `finally` only runs once it has
+    started, so a slot or a charge taken before then leaked on a client that
+    disconnected before the first frame — and every concurrent stream passed the
+    check before any of them took a slot, so the cap limited nothing. A stream
+    that never starts now costs nothing and holds nothing.
+    """
+    global _INFLIGHT_REPORTS
+    err = _admission_error(ticker, persona)
+    if err is not None:
+        yield sse_frame("error", json.loads(err.body))
+        return
+    _INFLIGHT_REPORTS += 1
+    charged = False
+    delivered = False
+    progress: asyncio.Queue = asyncio.Queue()
+    gen_task: Optional[asyncio.Task] = None
+
+    async def _generate():
+        try:
+            return await TickerReportService().generate_fresh_report(
+                ticker, persona,
+                on_progress=lambda event, data: progress.put_nowait((event, data)),
+            )
+        finally:
+            progress.put_nowait(None)
+
+    try:
+        err = _precharge_error(credit_service, user, ticker, persona)
+        if err is not None:
+            yield sse_frame("error", json.loads(err.body))
+            return
+        charged = True
+        yield sse_frame("meta", {"ticker": ticker, "persona": persona, "cached": False})
+
+        gen_task = asyncio.create_task(_generate())
+        while (item := await progress.get()) is not None:
+            frame = _progress_frame(*item)
+            if frame is not None:
+                yield frame
+        report = await gen_task
+
+        err = _degraded_error(report, ticker, persona)
+        if err is None:
+            result, err = _validate_report(report, ticker, persona)
+        if err is not None:
+            yield sse_frame("error", json.loads(err.body))
+            return
+        # Set before the final frame, as the GET sets it before returning: the report
+        # is cached by now, so a client that drops here re-reads it for free.
+        delivered = True
+        yield sse_frame("done", {"report": jsonable_encoder(result)})
+    except ValueError as e:
+        logger.info(
+            f"Ticker {ticker} rejected at collector (profile lookup empty): {e}"
+        )
+        yield sse_frame("error", error_body_from_exception(
+            e, ticker=ticker, persona=persona, step="collector",
+        ))
+    except Exception as e:
+        logger.error(
+            f"Streamed ticker report failed for {ticker}/{persona}: "
+            f"{type(e).__name__}: {e}",
+            exc_info=True,
+        )
+        yield sse_frame("error", error_body_from_exception(
+            e, ticker=ticker, persona=persona, step="report_generation",
+        ))
+    finally:
+        _INFLIGHT_REPORTS -= 1
+        # A disconnect closes this generator mid-stream; stop paying for a report
+        # nobody will read (the GET's handler is cancelled the same way).
+        if gen_task is not None and not gen_task.done():
+            gen_task.cancel()
+        if charged and not delivered:
+            credit_service.refund_ledgered(
+                user["id"], CreditService.DEEP_RESEARCH_COST,
+                reason="report_refund", ref_id=f"{ticker}:{persona}",
+            )
+
+
+@lru_cache(maxsize=None)
+def _section_adapter(key: str) -> Optional[TypeAdapter]:
+    """Validator for one top-level report field; None for internal keys
+    (`_scoring_inputs`, `_degraded`) that never reach the client."""
+    field = TickerReportResponse.model_fields.get(key)
+    return TypeAdapter(field.annotation) if field is not None else None
+
+
+def _progress_frame(event: str, data: dict) -> Optional[str]:
+    """One service progress event → an SSE frame, shaped exactly as the section
+    will appear in the final report. A section that doesn't validate yet is
+    skipped — the `done` frame is authoritative either way."""
+    key = data.get("key")
+    adapter = _section_adapter(key) if isinstance(key, str) else None
+    if adapter is None:
+        return None
+    try:
+        section = adapter.dump_python(adapter.validate_python(data.get("data")), mode="json")
+    except ValidationError as ve:
+        logger.debug(f"Streamed section {key!r} skipped: {ve.error_count()} issues")
+        return None
+    payload = {"key": key, "data": section}
+    if event == "narrative":
+        payload["label"] = data.get("label")
+    return sse_frame(event, payload)
+
+
+# ── Shared by the GET and the stream ─────────────────────────────────────────
+
+
+def _request_error(ticker: str, persona: str):
+    """Input validation; the error response, or None when the request is good."""
+    if not ticker or len(ticker) > 10:
+        return make_error_response(
+            ErrorCode.INVALID_INPUT,
+            message=f"Invalid ticker symbol: {ticker!r}",
+            details={"ticker": ticker},
+        )
+
+    if persona not in VALID_PERSONAS:
+        return make_error_response(
+            ErrorCode.INVALID_PERSONA,
+            message=f"Unsupported persona key: {persona!r}",
+            # Joined, not a list: iOS `AnyCodable` decodes String/Int/Double/Bool and silently
+            # falls through to "" for anything else, so a list arrived as an empty string and
+            # the hint the user needed was destroyed without an error anywhere.
+            details={"persona": persona, "valid": ", ".join(sorted(VALID_PERSONAS))},
+        )
+    return None
+
+
+async def _free_report(ticker: str, persona: str):
+    """The two FREE paths. Returns (validated_report, None) on a hit, (None,
+    error_response) on a dedicated-cache hit that fails validation, and
+    (None, None) on a miss — the only outcome that may be charged."""
+    # ── FREE PATH 1: legacy back-compat cache (recent completed research_reports).
+    try:
+        cached = await _check_legacy_report_cache(ticker, persona)
+        if cached:
+            logger.info(
+                f"Legacy cache HIT for {ticker}/{persona} — serving stored report"
+            )
+            # Overlay live Wall Street Consensus so saved reports match
+            # what `/stocks/{ticker}/analyst-analysis` and
+            # `/stocks/{ticker}/holders` are showing right now.
+            cached = await patch_wall_street_consensus_live(cached, ticker)
+            patched = patch_legacy_price_action(cached)
+            # VALIDATE, like every other return on this endpoint. This row came out of
+            # another user's `research_reports.ticker_report_data`, which the DEEP
+            # pipeline writes WITHOUT ever checking it against TickerReportResponse —
+            # so this was the one path that could hand iOS a payload nothing had
+            # type-checked. Swift's synthesized decoder is all-or-nothing, so a single
+            # bad field (a null `moat_competition.dimensions[].score`, say) would fail
+            # the whole screen with "Received unexpected data from the server".
+            #
+            # A row that fails is treated as a MISS, not as an error: the request falls
+            # through to the close-aligned cache and, failing that, to a fresh
+            # generation — the same handling `_short_interest_payload_stale` already
+            # gives a legacy row it doesn't trust, a few lines below.
+            result, err = _validate_report(patched, ticker, persona)
+            if err is None:
+                return result, None
+            logger.warning(
+                "Legacy cached report for %s/%s failed schema validation — treating as "
+                "a MISS rather than serving a payload iOS cannot decode",
+                ticker, persona,
+            )
+    except Exception as e:
+        # Cache lookup failures must never break the request — log and fall through.
+        logger.warning(
+            f"Legacy cache check failed for {ticker}: "
+            f"{type(e).__name__}: {e}"
+        )
+
+    # ── FREE PATH 2: the dedicated 24h ticker_report_cache. Checking it HERE (not
+    #    only inside the service) is what lets us charge strictly on a real
+    #    generation: a hit returns free, a miss is billable. get_cached_report
+    #    never raises (returns None on any error).
+    cached = await get_cached_report(ticker, persona)
+    if cached is not None:
+        logger.info(f"ticker_report_cache HIT for {ticker}/{persona} — free serve")
+        return _validate_report(cached, ticker, persona)
+    return None, None
+
+
+def _admission_error(ticker: str, persona: str):
+    """409 SYSTEM_BUSY past `REPORT_GET_MAX_INFLIGHT` billable generations, else None."""
+    cap = settings.REPORT_GET_MAX_INFLIGHT
+    if cap and _INFLIGHT_REPORTS >= cap:
+        logger.warning(
+            "Report admission REJECTED for %s/%s — %d in flight (cap %d)",
+            ticker, persona, _INFLIGHT_REPORTS, cap,
+        )
+        return make_error_response(
+            ErrorCode.SYSTEM_BUSY,
+            status_code=409,
+            message=f"{_INFLIGHT_REPORTS} report generations already in flight (cap {cap})",
+            details={"ticker": ticker, "persona": persona, "step": "admission"},
+        )
+    return None
+
+
+def _precharge_error(credit_service, user: dict, ticker: str, persona: str):
+    """Charge DEEP_RESEARCH_COST upfront. None once charged, else the error response
+    (nothing was debited, so the caller must NOT refund)."""
+    try:
+        new_remaining = credit_service.precharge(
+            user["id"], CreditService.DEEP_RESEARCH_COST,
+            reason="report_charge", ref_id=f"{ticker}:{persona}",
+        )
+    except CreditServiceUnavailable:
+        # Transient Supabase/RPC failure — retryable SYSTEM_BUSY (never
+        # INSUFFICIENT_CREDITS: a DB blip must not tell a paying user
+        # they're broke). Nothing was debited, so `charged` stays False.
+        return make_error_response(
+            ErrorCode.SYSTEM_BUSY,
+            status_code=409,
+            message="spend_credits RPC unavailable (transient)",
+            details={"user_id": user["id"], "ticker": ticker, "step": "credit_charge"},
+        )
+    if new_remaining is None:
+        return make_error_response(
+            ErrorCode.INSUFFICIENT_CREDITS,
+            message=(
+                f"User has fewer than {CreditService.DEEP_RESEARCH_COST} "
+                f"credits remaining"
+            ),
+            details={
+                "user_id": user["id"],
+                "required": CreditService.DEEP_RESEARCH_COST,
+            },
+        )
+    return None
+
+
+def _degraded_error(report, ticker: str, persona: str):
+    """503 for a report generated on the degraded path (see the GET), else None."""
+    degraded = report.get("_degraded") if isinstance(report, dict) else None
+    if degraded:
+        logger.warning(
+            "Degraded report for %s/%s (%s) — refunding rather than delivering a shell",
+            ticker, persona, degraded,
+        )
+        return make_error_response(
+            ErrorCode.GEMINI_UNAVAILABLE,
+            message=f"report generation degraded for {ticker}/{persona}: {degraded}",
+            status_code=503,
+            user_message=(
+                "Analysis is temporarily unavailable. You have not been charged — "
+                "please try again in a few minutes."
+            ),
+            action="retry",
+        )
+    return None
+
+
 def _validate_report(report: dict, ticker: str, persona: str):
     """Validate a report dict against TickerReportResponse.
 
-    Returns (dumped_dict, None) on success, or (None, error_response) on schema
+    Returns (validated_model, None) on success, or (None, error_response) on schema
     drift — so callers return a structured DATA_INCOMPLETE instead of a Pydantic
-    500. model_dump() also strips internal-only fields (e.g. _scoring_inputs).
+    500. The model carries no internal-only fields (e.g. _scoring_inputs).
     """
     try:
         validated = TickerReportResponse(**report)
@@ -338,7 +565,7 @@ def _validate_report(report: dict, ticker: str, persona: str):
                 "issues": ve.error_count(),
             },
         )
-    return validated.model_dump(), None
+    return validated, None
 
 
 async def _check_legacy_report_cache(ticker: str, persona: str):
@@ -369,6 +596,7 @@ async def _check_legacy_report_cache(ticker: str, persona: str):
 
     def _query():
         supabase = get_supabase()
+        version_key = f"{ticker}|{persona}"
         result = (
             supabase.table("research_reports")
             .select("ticker_report_data, completed_at")
@@ -387,8 +615,13 @@ async def _check_legacy_report_cache(ticker: str, persona: str):
                     f"Legacy report for {ticker}/{persona} has short-interest "
                     f"change_3m but empty history — skipping stale row"
                 )
+                record_version("research_reports", version_key, None)
                 return None
+            # The row's completion stamp versions the response (app/api/conditional.py);
+            # a miss is versioned too, so a legacy row appearing changes the ETag.
+            record_version("research_reports", version_key, result.data[0].get("completed_at"))
             return rpt
+        record_version("research_reports", version_key, None)
         return None
 
     return await asyncio.to_thread(_query)
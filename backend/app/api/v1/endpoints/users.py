@@ -12,6 +12,7 @@ import logging
 from typing import Optional
 
 from app.api.error_response import ErrorCode, auth_error, make_error_response
+from app.core.user_cache import invalidate_user_record
 from app.database import get_auth_client, get_supabase
 from app.dependencies import (
     AvatarRateLimit,
@@ -173,6 +174,7 @@ async def get_current_user_info(
                     .eq("id", user_id)
                     .execute()
                 )
+                invalidate_user_record(user_id)
                 avatar_url = imported
             except Exception as exc:  # noqa: BLE001 — non-fatal, see below
                 # The object is stored but the column still points at Google. Not fatal and
@@ -960,6 +962,9 @@ async def update_profile(
     result = supabase.table("users").update(update_data).eq(
         "id", user["id"]
     ).execute()
+    # The auth dependencies reuse the row for a few seconds; the very next `GET /me` must
+    # not hand back the pre-edit values.
+    invalidate_user_record(user["id"])
 
     # A Supabase UPDATE that matches ZERO rows does not raise — it returns `data == []`.
     # Falling back to `user` answers 200 carrying the PRE-update values, so the client
@@ -1004,12 +1009,14 @@ def _avatar_response(user: dict, row: dict, signed: Optional[str]) -> UserRespon
 
 
 def _write_avatar_url(supabase: Client, user_id: str, url: Optional[str]):
-    return (
+    result = (
         supabase.table("users")
         .update({"avatar_url": url, "updated_at": _now_iso()})
         .eq("id", user_id)
         .execute()
     )
+    invalidate_user_record(user_id)
+    return result
 
 
 @router.post("/me/avatar", response_model=UserResponse)
@@ -1439,6 +1446,9 @@ async def delete_account(
             message=f"auth-step deletion failed: {type(e).__name__}",
         )
 
+    # The cascade removed public.users; a cached copy would keep authenticating the deleted
+    # account on this worker instead of answering AUTH_ACCOUNT_NOT_FOUND.
+    invalidate_user_record(user_id)
     logger.info("Account deleted for user=%s (storage + unlinked rows + cascade)", user_id)
     return {"deleted": True}
 
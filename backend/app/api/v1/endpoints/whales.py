@@ -16,6 +16,7 @@ from typing import Optional, List
 import logging
 
 from app.dependencies import get_current_user, get_watchlist_identity
+from app.api.conditional import ConditionalRoute, conditional
 from app.api.error_response import ErrorCode, make_error_body, make_error_response
 from app.schemas.whale import (
     TrendingWhaleResponse,
@@ -35,7 +36,7 @@ from app.database import get_supabase
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(route_class=ConditionalRoute)
 
 
 # ── Whale Listing ────────────────────────────────────────────────────
@@ -99,6 +100,7 @@ async def get_whale_alerts(
 
 
 @router.get("/{whale_id}/profile", response_model=WhaleProfileResponse)
+@conditional()
 async def get_whale_profile(
     whale_id: str,
     user: dict = Depends(get_watchlist_identity),
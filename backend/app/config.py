@@ -29,6 +29,13 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24       # 24 hours
     REFRESH_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 days
+    # How long the auth dependencies reuse a `users` row (app/core/user_cache.py). Writers
+    # invalidate explicitly, so this only bounds how long OTHER workers can serve a row
+    # another worker just changed. Keep it in seconds. 0 disables the cache.
+    USER_RECORD_CACHE_TTL_SECONDS: float = 5.0
+    # Verified JWT payloads kept (app/core/security.py `verified_claims`), each until its
+    # own `exp`. ~1 KB apiece; 0 disables the cache and re-verifies every request.
+    JWT_CLAIMS_CACHE_MAX_ENTRIES: int = 20_000
 
     # Admin trigger token — when set, accepted via `X-Admin-Token` header
     # as an alternative to the email-based admin allowlist on admin
@@ -42,6 +49,11 @@ class Settings(BaseSettings):
     SUPABASE_SERVICE_ROLE_KEY: str
     SUPABASE_JWT_SECRET: Optional[str] = None
     SUPABASE_ANON_KEY: Optional[str] = None
+    # Async PostgREST pool (database.get_async_supabase). Each in-flight read holds one
+    # socket rather than one executor thread, so this — not the default thread pool —
+    # bounds concurrent hot-path reads. Kept under the Supabase pooler's per-client cap.
+    SUPABASE_ASYNC_MAX_CONNECTIONS: int = 50
+    SUPABASE_ASYNC_TIMEOUT_SECONDS: float = 10.0
 
     # Gemini AI
     GEMINI_API_KEY: str
@@ -64,6 +76,13 @@ class Settings(BaseSettings):
     # Financial Modeling Prep
     FMP_API_KEY: str
     FMP_BASE_URL: str = "https://financialmodelingprep.com/stable"
+    # Client-side quota governor (integrations/fmp.py `FMPRateGovernor`). Set to the plan's
+    # per-minute limit divided by the number of processes sharing the key (Starter 300,
+    # Premium 750, Ultimate 3000). Background jobs may not spend the last RESERVE fraction
+    # of the bucket; a request that has queued MAX_WAIT seconds fails as a rate limit.
+    FMP_REQUESTS_PER_MINUTE: int = 750
+    FMP_BACKGROUND_RESERVE_FRACTION: float = 0.25
+    FMP_QUEUE_MAX_WAIT_SECONDS: float = 30.0
 
     # CoinGecko (Demo API — free tier, 30 calls/min, 10K/month)
     COINGECKO_API_KEY: str = ""
@@ -380,6 +399,10 @@ class Settings(BaseSettings):
     # as a fraction. Without a band, a price oscillating either side of the limit
     # notifies on every cycle. Matches `price_alert_engine.evaluate_alert`'s own default.
     PRICE_ALERT_REARM_PCT: float = 0.005
+    # Evaluate a rule the moment a price-bus update (live trade or poll) crosses its
+    # threshold, via the per-symbol trigger index, instead of waiting for the next cycle.
+    # Only has trades to act on where the live sockets are (the web process).
+    PRICE_ALERT_LIVE_TRIGGERS: bool = True
 
     # Gemini quota (429) handling. Instead of skipping retries on a rate-limit
     # error, back off and retry a bounded number of times — paired with the
@@ -534,6 +557,38 @@ class Settings(BaseSettings):
     SCANNER_PREWARM_ENABLED: bool = True
     SCANNER_PREWARM_INTERVAL_SECONDS: int = 900
 
+    # Technical-analysis sweep: refreshes the top watchlist tickers' gauges and
+    # publishes each response under the key the Analysis tab reads, so a ticker
+    # detail view is served precomputed. The first pass fetches one ~600-day history
+    # per ticker and scores them in a NumPy panel; later passes advance each ticker's
+    # stored indicator state over the bars since it (a two-week fetch, or none when
+    # the local price store is fresh). That makes an intraday cadence cheap: the
+    # default matches the price store's top-up interval.
+    TA_PRECOMPUTE_ENABLED: bool = True
+    TA_PRECOMPUTE_TOP_N: int = 500
+    TA_PRECOMPUTE_INTERVAL_SECONDS: int = 900
+
+    # Live-price upstream pool. Rooms no longer get an FMP socket each: every watched
+    # ticker is multiplexed onto a few upstream sockets per FMP endpoint (stock and
+    # crypto are separate hosts), up to SYMBOLS_PER_SOCKET tickers on each before
+    # another is opened. Past SOCKETS_PER_ENDPOINT sockets, tickers go to the least
+    # loaded one instead, so the pool never grows without bound at market open.
+    LIVE_PRICE_UPSTREAM_SYMBOLS_PER_SOCKET: int = 100
+    LIVE_PRICE_UPSTREAM_SOCKETS_PER_ENDPOINT: int = 8
+    # Per-room conflation: a ticker's room broadcasts at most this many frames a second,
+    # always the newest trade — FMP can tick SPY or NVDA far faster than a chart redraws.
+    # 0 forwards every tick.
+    LIVE_PRICE_MAX_FRAMES_PER_SECOND: float = 4.0
+
+    # Price bus (services/price_bus.py): the in-process latest-quote snapshot that price
+    # alerts, the Updates sweeper and the widget movers read instead of each making its
+    # own bulk quote call. One poller re-quotes what they watch every POLL seconds
+    # (symbols a live trade refreshed are skipped); a read older than MAX_AGE fetches
+    # for itself. A symbol nobody has asked for within WATCH_TTL leaves the poll.
+    PRICE_BUS_POLL_SECONDS: int = 30
+    PRICE_BUS_MAX_AGE_SECONDS: int = 60
+    PRICE_BUS_WATCH_TTL_SECONDS: int = 900
+
     # On-view report pre-warm: when a user opens a ticker's detail view, iOS
     # fires POST /stocks/{ticker}/prewarm-report, which warms the persona-neutral
     # ticker_data_cache so a later Generate Analysis skips the ~20-call FMP
@@ -568,6 +623,61 @@ class Settings(BaseSettings):
 
     # Rate limiting
     RATE_LIMIT_PER_MINUTE: int = 60
+    # "memory" (per-process; N workers = N× looser limits) or "redis" (one GCRA bucket per
+    # key across every process — app/core/redis_rate_limit.py; needs REDIS_URL). Falls back
+    # to the in-memory pools whenever Redis cannot answer.
+    RATE_LIMIT_BACKEND: str = "memory"
+    # Tighter than REDIS_TIMEOUT_SECONDS: the limiter check is synchronous, so this bounds
+    # how long one check can hold the event loop before it falls back.
+    RATE_LIMIT_REDIS_TIMEOUT_SECONDS: float = 0.05
+
+    # Shared in-memory cache (app/core/cache.py). ONE byte budget across every
+    # service's Tier-1 region: the per-region entry caps bound each dict, but only
+    # this bounds their sum. Past it the globally least-recently-used entry is
+    # evicted, whichever service owns it. 0 disables the aggregate budget.
+    CACHE_MEMORY_BUDGET_MB: int = 512
+    # Optional shared L2 behind that tier (app/core/redis_cache.py). Unset = every
+    # process caches on its own, which is correct but multiplies upstream calls by
+    # the worker/replica count. Set it before running `--workers N` or scaling out.
+    REDIS_URL: Optional[str] = None
+    # Per-operation socket timeout. A cache that is slower than the upstream it is
+    # protecting is worse than none; on expiry the call is treated as a miss.
+    REDIS_TIMEOUT_SECONDS: float = 0.5
+    # Hot tier in front of the `ticker_report_cache` table (app/services/ticker_report_cache.py):
+    # decoded reports keyed by (ticker, persona, close cycle), LRU past MAX_ENTRIES and
+    # counted against the budget above. TTL only bounds how long a worker can keep serving
+    # its copy after ANOTHER worker rewrote the row mid-cycle. 0 entries disables it.
+    TICKER_REPORT_MEMORY_MAX_ENTRIES: int = 256
+    TICKER_REPORT_MEMORY_TTL_SECONDS: float = 600.0
+    # Store new report-cache rows as compressed JSON (zstd when `zstandard` is installed,
+    # zlib otherwise) instead of JSONB. Needs migration 156 applied first.
+    TICKER_REPORT_CACHE_COMPRESSED: bool = False
+    # Store new `ticker_data_cache` collections as the binary, lazily-decoded format
+    # (app/services/ticker_data_cache.py: msgpack records in one zstd frame, each field
+    # decoded on first read) instead of JSONB. Needs migration 157 applied first.
+    TICKER_DATA_CACHE_BINARY: bool = False
+
+    # Local columnar daily-price store (app/services/price_history_store.py). One
+    # memory-mapped history per symbol, backfilled once and topped up at most every
+    # TOPUP seconds. Per-disk, so each replica keeps its own; empty disables it and every
+    # consumer fetches daily bars from FMP directly, as before.
+    PRICE_HISTORY_STORE_DIR: str = ".cache/price_history"
+    PRICE_HISTORY_TOPUP_SECONDS: float = 900.0
+
+    # In-process job scheduler (app/core/scheduler.py). At most MAX_CONCURRENT budgeted
+    # background passes run at once across every job; a pass about to start while the p95
+    # of the last WINDOW seconds of requests is above the threshold waits for it to drop,
+    # but never longer than MAX_DEFER (a slow API delays a sweep, it never starves it).
+    # A threshold of 0 disables the latency yield.
+    BACKGROUND_JOBS_MAX_CONCURRENT: int = 2
+    BACKGROUND_LATENCY_P95_THRESHOLD_MS: float = 1500.0
+    BACKGROUND_LATENCY_WINDOW_SECONDS: float = 60.0
+    BACKGROUND_MAX_DEFER_SECONDS: float = 300.0
+    # Which process runs the background jobs (app/jobs.py): "web" — the API process runs
+    # all of them; "worker" — the API keeps only the process-local cache warmers and
+    # `python -m app.worker` runs the rest under per-pass leases (apply migration 154
+    # first: the lease fails closed).
+    BACKGROUND_JOBS_RUNNER: str = "web"
 
     # Timeouts
     HTTP_TIMEOUT_SECONDS: int = 30
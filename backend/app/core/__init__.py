@@ -4,4 +4,7 @@ Core Module
 
 Contains foundational utilities for the backend:
 - security: Token creation/verification, rate limiting
+- cache: Shared in-memory cache regions, byte budget, and optional L2 tier
+- user_cache: Seconds-long cache of `users` rows for the auth dependencies
+- scheduler: Named background jobs, schedules, and the latency-aware background budget
 """
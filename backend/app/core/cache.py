@@ -0,0 +1,796 @@
+"""
+Shared In-Memory Cache
+======================
+
+One subsystem behind the per-service Tier-1 caches.
+
+Every detail service used to carry its own module-level
+``_cache: Dict[str, Tuple[float, Any]]`` with its own TTL, its own
+``_CACHE_MAX_ENTRIES`` cap and its own copy of the eviction loop. Each dict was
+bounded on its own, but nothing bounded them in AGGREGATE: twenty-odd services
+× 1024 entries × a few hundred KB for the big payloads (holders, ETF history,
+technicals) is gigabytes on paper, and there was no way to see hit rates or the
+resident size of any of them under load.
+
+A service now registers a named :class:`CacheRegion` instead::
+
+    _cache = register_region("holders", ttl=300, max_entries=256)
+
+The region is a drop-in replacement for the old dict — it is a
+``MutableMapping`` of ``key -> (ts, value, ttl)`` so ``_cache.clear()``,
+``key in _cache`` and ``len(_cache)`` (which tests and a few call sites use)
+keep working — and adds:
+
+  * **LRU eviction** — a hit moves the key to the tail, so a hot ticker that is
+    read constantly but written once an hour is no longer the first to go.
+  * **Byte accounting** — every write records an approximate deep size, and the
+    registry enforces ONE global budget (``CACHE_MEMORY_BUDGET_MB``) by evicting
+    the least-recently-used entry across ALL regions.
+  * **Per-entry TTL** — the writer may declare how long a section stays fresh
+    (the etf/index/commodity shape); an explicit reader TTL still wins.
+  * **Single-flight** — :meth:`CacheRegion.deduped` / :meth:`get_or_build`, and
+    the region owns the service's ``inflight`` future map so it is visible in
+    stats.
+  * **An optional L2 tier** — :class:`CacheBackend`, installed once with
+    :func:`set_l2_backend` (Redis when ``REDIS_URL`` is set — see
+    app/core/redis_cache.py). Only lookups that carry a ``codec`` use it, because
+    only they know how to turn a value into bytes and back. Behind it,
+    :func:`shared_build` takes a cross-process lock so N workers or replicas
+    missing the same key run ONE upstream build between them.
+
+``cache_stats()`` returns hits / misses / evictions / resident bytes per region
+and is served by ``GET /api/v1/admin/cache-stats``.
+
+Every write also stamps the entry with a **version**, and a request running under
+:func:`track_versions` collects the versions of the entries it read — which is what
+the conditional-GET routes (app/api/conditional.py) derive their ETags from.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    Any, Awaitable, Callable, Dict, Iterator, Optional, Protocol, Set, Tuple,
+)
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+# ── Size estimation ──────────────────────────────────────────────────────────
+
+# Upper bound on the objects visited per estimate. A HoldersResponse is a few
+# thousand nodes; this only exists so a pathological value cannot turn a cache
+# WRITE into a multi-second walk. Past it the estimate is an undercount, which is
+# the safe direction for a cache (it evicts slightly later, never wrongly).
+_SIZE_WALK_LIMIT = 200_000
+
+_ATOMIC = (str, bytes, bytearray, int, float, bool, type(None), complex)
+
+
+def approx_size(value: Any) -> int:
+    """Approximate deep size of ``value`` in bytes.
+
+    ``sys.getsizeof`` alone is shallow — a list of 500 Pydantic rows reports the
+    list header only — so this walks containers and model ``__dict__``s, counting
+    each distinct object once. It is an estimate for budgeting, not a profiler.
+    """
+    seen = set()
+    stack = [value]
+    total = 0
+    visited = 0
+    while stack and visited < _SIZE_WALK_LIMIT:
+        obj = stack.pop()
+        oid = id(obj)
+        if oid in seen:
+            continue
+        seen.add(oid)
+        visited += 1
+        try:
+            total += sys.getsizeof(obj)
+        except TypeError:
+            continue
+        if isinstance(obj, _ATOMIC):
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        else:
+            attrs = getattr(obj, "__dict__", None)
+            if attrs is not None:
+                stack.append(attrs)
+            slots = getattr(type(obj), "__slots__", ())
+            for name in slots if isinstance(slots, (tuple, list)) else ():
+                if hasattr(obj, name):
+                    stack.append(getattr(obj, name))
+    return total
+
+
+# ── L2 tier ──────────────────────────────────────────────────────────────────
+
+
+class CacheBackend(Protocol):
+    """A shared, out-of-process tier behind the in-memory regions.
+
+    Values cross it as BYTES — the region's codec owns (de)serialization, so a
+    backend never needs to know what a ``HoldersResponse`` is. Every method must
+    degrade rather than raise: a backend outage is a cache miss, never a 500.
+
+    A backend MAY also implement ``acquire_lock(key, ttl) -> Optional[str]`` and
+    ``release_lock(key, token)`` (see app/core/redis_cache.py). When it does,
+    :func:`shared_build` uses them so that N processes missing the same key run
+    ONE build between them instead of N.
+    """
+
+    async def get(self, key: str) -> Optional[bytes]: ...
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None: ...
+
+    async def delete(self, key: str) -> None: ...
+
+
+class Codec(Protocol):
+    def dumps(self, value: Any) -> bytes: ...
+
+    def loads(self, raw: bytes) -> Any: ...
+
+
+class ModelCodec:
+    """Codec for a Pydantic response model — JSON through the model's own schema,
+    so a value read back from L2 is the same type the builder returned."""
+
+    def __init__(self, model: Any):
+        self.model = model
+
+    def dumps(self, value: Any) -> bytes:
+        return value.model_dump_json().encode("utf-8")
+
+    def loads(self, raw: bytes) -> Any:
+        return self.model.model_validate_json(raw)
+
+
+_l2_backend: Optional[CacheBackend] = None
+
+# How long a cross-process build lock is held before it lapses on its own (a
+# builder that died mid-build must not wedge the key), and how long a process
+# that lost the lock waits for the winner's value before building anyway.
+_L2_LOCK_TTL_SECONDS = 30.0
+_L2_LOCK_WAIT_SECONDS = 10.0
+_L2_POLL_SECONDS = 0.05
+# Written beside the key by a lock holder whose build returned ``None``, so the
+# processes waiting on it stop at once instead of polling out the full wait for a
+# value that is never coming.
+_L2_EMPTY_SUFFIX = "#empty"
+
+_l2_counters: Dict[str, int] = {
+    "hits": 0,
+    "misses": 0,
+    "writes": 0,
+    "decode_errors": 0,
+    "lock_waits": 0,
+    "peer_fills": 0,
+    "peer_empties": 0,
+    "peer_failures": 0,
+    "lock_timeouts": 0,
+}
+
+
+def set_l2_backend(backend: Optional[CacheBackend]) -> None:
+    """Install (or, with ``None``, remove) the process-wide L2 backend."""
+    global _l2_backend
+    _l2_backend = backend
+
+
+def get_l2_backend() -> Optional[CacheBackend]:
+    return _l2_backend
+
+
+async def _l2_read(backend: CacheBackend, l2_key: str, codec: Codec) -> Optional[Any]:
+    raw = await backend.get(l2_key)
+    if raw is None:
+        return None
+    try:
+        return codec.loads(raw)
+    except Exception as e:
+        # A payload written by an older build (schema change) or truncated in
+        # transit. Rebuild and overwrite it; never fail the request on it.
+        _l2_counters["decode_errors"] += 1
+        logger.warning(
+            "cache L2: undecodable entry %s (%s: %s) — rebuilding",
+            l2_key, type(e).__name__, e,
+        )
+        return None
+
+
+async def _through_l2(
+    name: str,
+    key: str,
+    build: Callable[[], Awaitable[Any]],
+    ttl: float,
+    codec: Optional[Codec],
+) -> Tuple[Any, bool]:
+    """``(value, came_from_l2)`` — the body of :func:`shared_build`."""
+    backend = _l2_backend
+    if backend is None or codec is None:
+        return await build(), False
+
+    l2_key = f"{name}:{key}"
+    value = await _l2_read(backend, l2_key, codec)
+    if value is not None:
+        _l2_counters["hits"] += 1
+        return value, True
+    _l2_counters["misses"] += 1
+
+    acquire = getattr(backend, "acquire_lock", None)
+    empty_key = l2_key + _L2_EMPTY_SUFFIX
+    token: Optional[str] = None
+    if acquire is not None:
+        token = await acquire(l2_key, _L2_LOCK_TTL_SECONDS)
+        if token is None:
+            # Another PROCESS is building this key. Wait for its value rather than
+            # fanning out to the upstream a second time. A build that returned None
+            # leaves a marker, and that None is our answer too. A lock released with
+            # neither (the build raised or was cancelled) is ours to take: build it
+            # here, so its caller gets a value or its own error. If nothing lands in
+            # time (slow or dead builder) fall through and build it ourselves.
+            _l2_counters["lock_waits"] += 1
+            deadline = time.monotonic() + _L2_LOCK_WAIT_SECONDS
+            while token is None and time.monotonic() < deadline:
+                await asyncio.sleep(_L2_POLL_SECONDS)
+                value = await _l2_read(backend, l2_key, codec)
+                if value is not None:
+                    _l2_counters["peer_fills"] += 1
+                    return value, True
+                if await backend.get(empty_key) is not None:
+                    _l2_counters["peer_empties"] += 1
+                    return None, False
+                token = await acquire(l2_key, _L2_LOCK_TTL_SECONDS)
+            if token is None:
+                _l2_counters["lock_timeouts"] += 1
+            else:
+                # The holder may have published in the gap between our reads and
+                # the acquire; only a release with nothing behind it is a failure.
+                value = await _l2_read(backend, l2_key, codec)
+                if value is not None:
+                    await backend.release_lock(l2_key, token)
+                    _l2_counters["peer_fills"] += 1
+                    return value, True
+                if await backend.get(empty_key) is not None:
+                    await backend.release_lock(l2_key, token)
+                    _l2_counters["peer_empties"] += 1
+                    return None, False
+                _l2_counters["peer_failures"] += 1
+        if token is not None:
+            # A marker left by the previous holder describes THAT build, not ours.
+            await backend.delete(empty_key)
+
+    try:
+        built = await build()
+        if built is not None:
+            await backend.set(l2_key, codec.dumps(built), ttl)
+            _l2_counters["writes"] += 1
+        elif token is not None:
+            # Only a build that RETURNED None is an answer for the waiters; one that
+            # raised or was cancelled leaves no marker, and a waiter rebuilds.
+            await backend.set(empty_key, b"1", _L2_LOCK_WAIT_SECONDS)
+        return built, False
+    finally:
+        if token is not None:
+            await backend.release_lock(l2_key, token)
+
+
+async def shared_build(
+    name: str,
+    key: str,
+    build: Callable[[], Awaitable[Any]],
+    ttl: float,
+    codec: Optional[Codec],
+) -> Any:
+    """Read ``name:key`` from the L2 tier, or build it once ACROSS processes.
+
+    For services that keep their own in-memory tier (a class-level dict, a
+    hand-written ``_inflight`` block) and only want the shared tier behind it:
+    call this where ``build()`` used to be called. With no backend installed, or
+    no codec, it is exactly ``await build()``. A ``None`` build result is never
+    written.
+    """
+    value, _ = await _through_l2(name, key, build, ttl, codec)
+    return value
+
+
+# ── Entry versions ───────────────────────────────────────────────────────────
+#
+# A conditional GET needs to know whether the response it is about to send is the
+# one the client already holds. Hashing the serialized body answers that, but only
+# after paying for the serialization it was meant to skip. The cheaper question is
+# "was this response assembled from the same cache entries as last time?" — so every
+# region write stamps its entry with a fresh version, and a request that wants an
+# ETag records the version of each entry it reads.
+#
+# A version is process-local (a write counter, or the write timestamp of a legacy
+# `(ts, value)` dict) and the fingerprint carries this process's tag, so an ETag
+# minted by another replica — or by this one before a restart — never matches. That
+# costs one full response after a deploy or a replica switch; the alternative, two
+# processes agreeing on a version for different bytes, would be a wrong 304.
+
+_PROCESS_TAG = uuid.uuid4().hex[:8]
+_entry_versions = itertools.count(1)
+
+
+class VersionLog:
+    """The cache entries one response was assembled from.
+
+    ``versions`` maps ``region:key`` to the version served. ``unversioned`` holds
+    the entries whose last event was a MISS with no store after it — a degraded
+    build that is never cached, an in-flight join whose leader stored the value in
+    another request. A response with any of those has no fingerprint: nothing
+    recorded says what it contains.
+    """
+
+    __slots__ = ("versions", "unversioned")
+
+    def __init__(self) -> None:
+        self.versions: Dict[str, Any] = {}
+        self.unversioned: Set[str] = set()
+
+    def fingerprint(self) -> Optional[str]:
+        if not self.versions or self.unversioned:
+            return None
+        return f"{_PROCESS_TAG}|{sorted(self.versions.items())!r}"
+
+
+_version_log: ContextVar[Optional[VersionLog]] = ContextVar("cache_version_log", default=None)
+
+
+@contextmanager
+def track_versions() -> Iterator[VersionLog]:
+    """Collect the versions of every entry read or written inside the block.
+
+    Context-scoped, so work the block fans out (`asyncio.gather`, `to_thread`)
+    records into the same log; anything running outside a block records nothing.
+    """
+    log = VersionLog()
+    token = _version_log.set(log)
+    try:
+        yield log
+    finally:
+        _version_log.reset(token)
+
+
+def record_version(name: str, key: str, version: Any) -> None:
+    """Note that the response being built includes ``name:key`` at ``version``.
+
+    For data that is not in a region: a legacy ``(ts, value)`` dict (see
+    :func:`record_entry`), a Supabase row's timestamp, or a small live value that
+    is its own version (a follow flag, a market-status string).
+    """
+    log = _version_log.get()
+    if log is not None:
+        slot = f"{name}:{key}"
+        log.unversioned.discard(slot)
+        log.versions[slot] = version
+
+
+def record_unversioned(name: str, key: str) -> None:
+    """Note that ``name:key`` was served from something no version describes."""
+    log = _version_log.get()
+    if log is not None:
+        slot = f"{name}:{key}"
+        log.versions.pop(slot, None)
+        log.unversioned.add(slot)
+
+
+def record_entry(name: str, key: str, entry: Optional[Tuple], served: Any) -> None:
+    """Version ``served`` by the legacy ``(ts, value)`` ``entry`` it came from.
+
+    Identity, not equality: ``served`` is versioned only if it IS the cached
+    object. A degraded fallback, a joiner's shared result or a copy made after
+    the read is recorded as unversioned.
+    """
+    if entry is not None and entry[1] is served:
+        record_version(name, key, entry[0])
+    else:
+        record_unversioned(name, key)
+
+
+# ── Regions ──────────────────────────────────────────────────────────────────
+
+
+class _Entry:
+    __slots__ = ("ts", "value", "ttl", "size", "version", "accessed")
+
+    def __init__(self, ts: float, value: Any, ttl: float, size: int):
+        self.ts = ts
+        self.value = value
+        self.ttl = ttl
+        self.size = size
+        self.version = next(_entry_versions)
+        self.accessed = time.monotonic()
+
+
+class CacheRegion(MutableMapping):
+    """One service's in-memory tier, registered with the global registry.
+
+    The mapping view is the LEGACY shape — ``region[key]`` is ``(ts, value, ttl)``
+    (the per-entry-TTL tuple commodity_service already stored; ``[0]``/``[1]`` read
+    the same as the older 2-tuples) and assigning a 2- or 3-tuple stores it
+    verbatim — so a region can replace a ``Dict[str, Tuple[float, Any]]`` without
+    touching the code that reads it.
+    New code should use :meth:`lookup` / :meth:`store`, which apply TTLs, LRU
+    order and byte accounting.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: float,
+        max_entries: int,
+        codec: Optional[Codec] = None,
+        registry: Optional["CacheRegistry"] = None,
+    ):
+        self.name = name
+        self.ttl = float(ttl)
+        self.max_entries = int(max_entries)
+        self.codec = codec
+        self._registry = registry
+        # Shared with the registry: `enforce_budget` evicts across regions, and some
+        # lookups run on `asyncio.to_thread` workers (sector_benchmark_lookup), so an
+        # OrderedDict being reordered on one thread and trimmed on another is real.
+        self._lock = registry._lock if registry is not None else threading.RLock()
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self.bytes = 0
+        # The service's thundering-herd map. Owned here so `cache_stats()` can show
+        # how many builds are in flight; the leader/joiner logic stays with the caller.
+        self.inflight: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+        self.l2_hits = 0
+        self.joins = 0
+
+    # ── Mapping protocol (legacy `(ts, value, ttl)` view) ─────────────────────────
+
+    def __getitem__(self, key: str) -> Tuple[float, Any, float]:
+        entry = self._entries[key]
+        return (entry.ts, entry.value, entry.ttl)
+
+    def __setitem__(self, key: str, item: Tuple) -> None:
+        ts, value = item[0], item[1]
+        ttl = item[2] if len(item) > 2 and item[2] else self.ttl
+        self._put(key, value, ttl, ts)
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(key)
+            self._account(-entry.size)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def clear(self) -> None:
+        with self._lock:
+            self._account(-self.bytes)
+            self._entries.clear()
+
+    # ── Cache API ────────────────────────────────────────────────────────────
+
+    def lookup(self, key: str, ttl: Optional[float] = None) -> Optional[Any]:
+        """Return a fresh value or ``None``.
+
+        An explicit ``ttl`` wins over the TTL the writer stored with the entry —
+        the same precedence the per-service ``_cache_get`` helpers had. A hit
+        moves the key to the LRU tail; an expired entry is dropped on the spot.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                record_unversioned(self.name, key)
+                return None
+            max_age = entry.ttl if ttl is None else ttl
+            if time.time() - entry.ts > max_age:
+                self._entries.pop(key, None)
+                self._account(-entry.size)
+                self.expirations += 1
+                self.misses += 1
+                record_unversioned(self.name, key)
+                return None
+            self._entries.move_to_end(key)
+            entry.accessed = time.monotonic()
+            self.hits += 1
+            record_version(self.name, key, entry.version)
+            return entry.value
+
+    def store(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Write ``value`` under ``key``; ``ttl`` defaults to the region's."""
+        self._put(key, value, float(ttl) if ttl else self.ttl, time.time())
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._account(-entry.size)
+
+    def _put(self, key: str, value: Any, ttl: float, ts: float) -> None:
+        # Sized OUTSIDE the lock — the walk is the only non-trivial cost of a write.
+        size = approx_size(value)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._account(-old.size)
+            entry = self._entries[key] = _Entry(ts, value, ttl, size)
+            record_version(self.name, key, entry.version)
+            self._account(size)
+            self._trim()
+            if self._registry is not None:
+                self._registry.enforce_budget()
+
+    def _trim(self) -> None:
+        """Enforce ``max_entries``: sweep expired entries first, then drop LRU."""
+        if len(self._entries) <= self.max_entries:
+            return
+        now = time.time()
+        for k in [k for k, e in self._entries.items() if now - e.ts > e.ttl]:
+            self._account(-self._entries.pop(k).size)
+            self.expirations += 1
+        while len(self._entries) > self.max_entries:
+            self.evict_lru()
+
+    def evict_lru(self) -> bool:
+        if not self._entries:
+            return False
+        _, entry = self._entries.popitem(last=False)
+        self._account(-entry.size)
+        self.evictions += 1
+        return True
+
+    def _account(self, delta: int) -> None:
+        self.bytes += delta
+        if self._registry is not None:
+            self._registry.total_bytes += delta
+
+    # ── Single-flight ────────────────────────────────────────────────────────
+
+    async def deduped(self, key: str, build: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``build()`` once per key, sharing the result with concurrent callers.
+
+        Same contract as the services' hand-written `_inflight` blocks (see
+        tests/test_inflight_cancellation_safety.py): joiners are SHIELDED so one
+        that gives up cannot cancel the shared future, and the leader resolves the
+        future on every exit, cancellation included.
+        """
+        inflight = self.inflight.get(key)
+        if inflight is not None:
+            self.joins += 1
+            return await asyncio.shield(inflight)
+
+        loop = asyncio.get_running_loop()
+        fut: asyncio.Future = loop.create_future()
+        self.inflight[key] = fut
+        try:
+            result = await build()
+            if not fut.done():
+                fut.set_result(result)
+            return result
+        except BaseException as e:
+            if not fut.done():
+                if isinstance(e, asyncio.CancelledError):
+                    fut.set_exception(
+                        RuntimeError(f"{self.name}:{key} build was cancelled")
+                    )
+                else:
+                    fut.set_exception(e)
+                # Mark retrieved so a future nobody joined does not log
+                # "Future exception was never retrieved" at GC.
+                fut.exception()
+            raise
+        finally:
+            if self.inflight.get(key) is fut:
+                self.inflight.pop(key, None)
+
+    async def get_or_build(
+        self,
+        key: str,
+        build: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None,
+        codec: Optional[Codec] = None,
+    ) -> Any:
+        """L1 → L2 → single-flight ``build()``, populating both tiers on the way out.
+
+        ``codec`` overrides the region's for this call — for regions holding more
+        than one value type under different key prefixes. A ``None`` result is
+        returned but never cached, matching the services' "degraded is never
+        cached" rule.
+        """
+        value = self.lookup(key, ttl)
+        if value is not None:
+            return value
+
+        async def _load() -> Any:
+            built, from_l2 = await _through_l2(
+                self.name, key, build, ttl or self.ttl, codec or self.codec
+            )
+            if from_l2:
+                self.l2_hits += 1
+            if built is not None:
+                self.store(key, built, ttl)
+            return built
+
+        return await self.deduped(key, _load)
+
+    async def recall(
+        self, key: str, ttl: Optional[float] = None, codec: Optional[Codec] = None,
+    ) -> Optional[Any]:
+        """L1, then L2 — never a build. An L2 hit is copied into L1.
+
+        For state a caller extends rather than rebuilds: a miss means "start from
+        scratch", which only the caller knows how to do.
+        """
+        value = self.lookup(key, ttl)
+        if value is not None:
+            return value
+        backend, codec = _l2_backend, codec or self.codec
+        if backend is None or codec is None:
+            return None
+        value = await _l2_read(backend, f"{self.name}:{key}", codec)
+        if value is not None:
+            _l2_counters["hits"] += 1
+            self.l2_hits += 1
+            self.store(key, value, ttl)
+        else:
+            _l2_counters["misses"] += 1
+        return value
+
+    async def publish(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        codec: Optional[Codec] = None,
+    ) -> None:
+        """Write a value built OUTSIDE ``get_or_build`` into both tiers.
+
+        For background sweeps that compute many keys in one pass: the next
+        ``get_or_build`` for the key — in this process or, through L2, any other —
+        is a hit. No lock, no single-flight: the sweep is the only builder, and a
+        concurrent on-demand build of the same key writes an equivalent value.
+        """
+        if value is None:
+            return
+        self.store(key, value, ttl)
+        backend, codec = _l2_backend, codec or self.codec
+        if backend is None or codec is None:
+            return
+        await backend.set(f"{self.name}:{key}", codec.dumps(value), ttl or self.ttl)
+        _l2_counters["writes"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "bytes": self.bytes,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "expirations": self.expirations,
+            "evictions": self.evictions,
+            "l2_hits": self.l2_hits,
+            "inflight": len(self.inflight),
+            "joins": self.joins,
+        }
+
+
+# ── Registry ─────────────────────────────────────────────────────────────────
+
+
+class CacheRegistry:
+    """Every region in the process, plus the ONE byte budget they share."""
+
+    def __init__(self, budget_bytes: int):
+        self.budget_bytes = budget_bytes
+        self.total_bytes = 0
+        self.budget_evictions = 0
+        self._regions: Dict[str, CacheRegion] = {}
+        self._lock = threading.RLock()
+
+    def register(
+        self,
+        name: str,
+        ttl: float,
+        max_entries: int,
+        codec: Optional[Codec] = None,
+    ) -> CacheRegion:
+        with self._lock:
+            if name in self._regions:
+                # A module re-import (importlib.reload in a test) must not fork the
+                # accounting: hand back the live region instead of a second one.
+                return self._regions[name]
+            region = CacheRegion(name, ttl, max_entries, codec=codec, registry=self)
+            self._regions[name] = region
+            return region
+
+    def regions(self) -> Dict[str, CacheRegion]:
+        return dict(self._regions)
+
+    def enforce_budget(self) -> None:
+        """Evict the globally least-recently-used entry until under budget.
+
+        Each region's OrderedDict head is its own LRU entry; the head touched least
+        recently across regions (by last write or hit) is the global victim. O(regions) per
+        eviction, and there are a few dozen regions.
+        """
+        if self.budget_bytes <= 0:
+            return
+        with self._lock:
+            self._evict_to_budget()
+
+    def _evict_to_budget(self) -> None:
+        while self.total_bytes > self.budget_bytes:
+            victim: Optional[CacheRegion] = None
+            oldest = float("inf")
+            for region in self._regions.values():
+                head = next(iter(region._entries.values()), None)
+                if head is not None and head.accessed < oldest:
+                    oldest = head.accessed
+                    victim = region
+            if victim is None or not victim.evict_lru():
+                return
+            self.budget_evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        regions = {name: r.stats() for name, r in sorted(self._regions.items())}
+        hits = sum(r["hits"] for r in regions.values())
+        misses = sum(r["misses"] for r in regions.values())
+        return {
+            "budget_bytes": self.budget_bytes,
+            "total_bytes": self.total_bytes,
+            "total_entries": sum(r["entries"] for r in regions.values()),
+            "hit_rate": round(hits / (hits + misses), 4) if hits + misses else None,
+            "budget_evictions": self.budget_evictions,
+            "l2_backend": type(_l2_backend).__name__ if _l2_backend else None,
+            "l2": dict(_l2_counters),
+            "regions": regions,
+        }
+
+
+_registry = CacheRegistry(budget_bytes=settings.CACHE_MEMORY_BUDGET_MB * 1024 * 1024)
+
+
+def register_region(
+    name: str,
+    ttl: float,
+    max_entries: int = 1024,
+    codec: Optional[Codec] = None,
+) -> CacheRegion:
+    """Create (or return the existing) region ``name`` in the process registry."""
+    return _registry.register(name, ttl, max_entries, codec=codec)
+
+
+def get_cache_registry() -> CacheRegistry:
+    return _registry
+
+
+def cache_stats() -> Dict[str, Any]:
+    return _registry.stats()
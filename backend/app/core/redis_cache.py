@@ -0,0 +1,189 @@
+"""
+Redis L2 Cache Tier
+===================
+
+The shared tier behind app/core/cache.py, so several uvicorn workers or Railway
+replicas serve each other's warm data instead of each paying the FMP fan-out
+for the same key.
+
+Entirely OPTIONAL. With ``REDIS_URL`` unset, or the ``redis`` package absent, or
+the server unreachable at boot, :func:`init_redis_l2` logs one line and the
+process runs on its in-memory tier exactly as before. A Redis that dies AFTER
+boot is handled the same way per call: every operation degrades to a miss /
+no-op, and a short circuit breaker stops a dead server from adding a connect
+timeout to every request while it is down.
+
+Cross-process single-flight uses the standard single-instance Redis lock:
+``SET key token NX PX ttl`` to take it, and a compare-and-delete script to
+release it so a builder whose lock already lapsed cannot delete the NEXT
+holder's lock.
+"""
+
+import logging
+import secrets
+import time
+from typing import Any, Optional
+
+from app.config import settings
+from app.core.cache import set_l2_backend
+
+logger = logging.getLogger(__name__)
+
+try:  # optional dependency — see module docstring
+    import redis.asyncio as _redis_asyncio
+except ImportError:  # pragma: no cover - exercised only where redis is not installed
+    _redis_asyncio = None
+
+# Namespaces every key this process writes, so the cache can share a Redis with
+# anything else (and be flushed with one SCAN pattern) without collisions.
+_KEY_PREFIX = "caydex:cache:"
+_LOCK_PREFIX = "caydex:lock:"
+
+# After an error, skip Redis entirely for this long. Long enough that an outage
+# costs one slow call per window rather than one per request; short enough that
+# recovery is picked up without a restart.
+_BREAKER_SECONDS = 5.0
+
+# Release only if we still own it — a builder that overran its lock TTL must not
+# delete the lock a second builder has since taken.
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class RedisCacheBackend:
+    """:class:`app.core.cache.CacheBackend` over ``redis.asyncio``.
+
+    Takes an already-constructed client so tests can hand in a
+    ``fakeredis.aioredis.FakeRedis``.
+    """
+
+    def __init__(self, client: Any):
+        self._client = client
+        self._down_until = 0.0
+        self._release = client.register_script(_RELEASE_SCRIPT)
+        self.errors = 0
+
+    def _available(self) -> bool:
+        return time.monotonic() >= self._down_until
+
+    def _trip(self, op: str, exc: Exception) -> None:
+        self.errors += 1
+        self._down_until = time.monotonic() + _BREAKER_SECONDS
+        logger.warning(
+            "Redis L2 %s failed (%s: %s) — serving from memory for %.0fs",
+            op, type(exc).__name__, exc, _BREAKER_SECONDS,
+        )
+
+    async def get(self, key: str) -> Optional[bytes]:
+        if not self._available():
+            return None
+        try:
+            return await self._client.get(_KEY_PREFIX + key)
+        except Exception as e:
+            self._trip("get", e)
+            return None
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        if not self._available():
+            return
+        try:
+            await self._client.set(_KEY_PREFIX + key, value, px=max(1, int(ttl * 1000)))
+        except Exception as e:
+            self._trip("set", e)
+
+    async def delete(self, key: str) -> None:
+        if not self._available():
+            return
+        try:
+            await self._client.delete(_KEY_PREFIX + key)
+        except Exception as e:
+            self._trip("delete", e)
+
+    async def acquire_lock(self, key: str, ttl: float) -> Optional[str]:
+        """A token if this process now owns the build for ``key``, else ``None``.
+
+        Fails OPEN: when Redis is unreachable the caller gets a token and builds
+        locally — losing cross-process dedup for the outage is strictly better
+        than every process waiting on a lock nobody can take.
+        """
+        token = secrets.token_hex(16)
+        if not self._available():
+            return token
+        try:
+            acquired = await self._client.set(
+                _LOCK_PREFIX + key, token, nx=True, px=max(1, int(ttl * 1000))
+            )
+        except Exception as e:
+            self._trip("lock", e)
+            return token
+        return token if acquired else None
+
+    async def release_lock(self, key: str, token: str) -> None:
+        if not self._available():
+            return
+        try:
+            await self._release(keys=[_LOCK_PREFIX + key], args=[token])
+        except Exception as e:
+            self._trip("unlock", e)
+
+    async def ping(self) -> bool:
+        try:
+            return bool(await self._client.ping())
+        except Exception:
+            return False
+
+    async def close(self) -> None:
+        try:
+            await self._client.aclose()
+        except Exception:
+            pass
+
+
+_backend: Optional[RedisCacheBackend] = None
+
+
+async def init_redis_l2() -> Optional[RedisCacheBackend]:
+    """Connect to ``REDIS_URL`` and install it as the L2 tier. Idempotent.
+
+    Returns ``None`` (and leaves the in-memory tier alone) when Redis is not
+    configured, not installed, or not answering.
+    """
+    global _backend
+    if _backend is not None:
+        return _backend
+    url = settings.REDIS_URL
+    if not url:
+        logger.info("REDIS_URL not set — cache L2 disabled, in-memory tier only")
+        return None
+    if _redis_asyncio is None:
+        logger.warning("REDIS_URL is set but the redis package is not installed — L2 disabled")
+        return None
+
+    client = _redis_asyncio.from_url(
+        url,
+        socket_connect_timeout=settings.REDIS_TIMEOUT_SECONDS,
+        socket_timeout=settings.REDIS_TIMEOUT_SECONDS,
+    )
+    backend = RedisCacheBackend(client)
+    if not await backend.ping():
+        logger.warning("Redis at REDIS_URL is not answering — cache L2 disabled")
+        await backend.close()
+        return None
+
+    _backend = backend
+    set_l2_backend(backend)
+    logger.info("Cache L2 enabled (Redis)")
+    return backend
+
+
+async def close_redis_l2() -> None:
+    global _backend
+    if _backend is None:
+        return
+    set_l2_backend(None)
+    await _backend.close()
+    _backend = None
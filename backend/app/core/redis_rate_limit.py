@@ -0,0 +1,150 @@
+"""
+Redis Rate-Limit Backend
+========================
+
+A shared store for :class:`app.core.security.RateLimiter`, so chat 15/min,
+report 3/min and login 10/15min mean the same thing with one worker or ten.
+
+GCRA (the generic cell rate algorithm) instead of a timestamp list: each key
+holds ONE number — the theoretical arrival time (TAT) of the next conforming
+request — so memory is O(1) per key regardless of the limit, and the whole
+check is a single atomic script round-trip. ``max_requests`` per
+``window_seconds`` maps to an emission interval ``T = window / max`` with a
+burst tolerance of the full window, which admits the same burst of
+``max_requests`` the sliding window did and then one request per ``T``.
+The clock is Redis's own ``TIME``, so skew between app hosts cannot widen a
+window.
+
+The protected/general pool split (see the class comment on ``RateLimiter``)
+survives as two key namespaces, and the eviction attack it closes does not
+carry over: every key expires by its own TTL (never longer than its window),
+so a flood of minted guest ids cannot push a credential bucket out — provided
+the server does not run an ``allkeys-*`` maxmemory policy. Use ``noeviction``
+or a ``volatile-*`` policy on the instance these keys live on.
+
+The client is synchronous, and the async call sites (the dependency checkers
+and the auth routes) go through ``RateLimiter.is_allowed_async``, which runs
+:meth:`RedisRateLimitBackend.check` in the threadpool. Called on the event loop,
+a slow Redis stalled the whole worker for up to the socket timeout on every
+limited request. The socket timeout is tight, and any error hands the decision
+back to the in-memory pools for a short breaker window.
+"""
+
+import logging
+import time
+from typing import Any, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+try:  # optional dependency — see app/core/redis_cache.py
+    import redis as _redis
+except ImportError:  # pragma: no cover - exercised only where redis is not installed
+    _redis = None
+
+_PREFIX_GENERAL = "caydex:rl:g:"
+_PREFIX_PROTECTED = "caydex:rl:p:"
+
+_BREAKER_SECONDS = 5.0
+
+# KEYS[1] = bucket; ARGV[1] = emission interval (µs); ARGV[2] = burst tolerance (µs).
+# Returns 1 when the request conforms (and records it), 0 when it does not. A denied
+# request does NOT advance the TAT, matching the sliding window, which only appended
+# timestamps for allowed requests.
+_GCRA_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000000 + tonumber(t[2])
+local interval = tonumber(ARGV[1])
+local tolerance = tonumber(ARGV[2])
+local tat = tonumber(redis.call('GET', KEYS[1]))
+if tat == nil or tat < now then
+    tat = now
+end
+local new_tat = tat + interval
+if new_tat - now > tolerance then
+    return 0
+end
+redis.call('SET', KEYS[1], string.format('%.0f', new_tat), 'PX', math.ceil((new_tat - now) / 1000))
+return 1
+"""
+
+
+class RedisRateLimitBackend:
+    """:class:`app.core.security.RateLimitBackend` over a synchronous Redis client.
+
+    ``check`` blocks on the round-trip; it is called from the threadpool on the async
+    paths, and the client's connection pool is thread-safe. Takes an already-constructed
+    client so tests can hand in a ``fakeredis.FakeRedis``.
+    """
+
+    def __init__(self, client: Any):
+        self._client = client
+        self._gcra = client.register_script(_GCRA_SCRIPT)
+        self._down_until = 0.0
+        self.errors = 0
+
+    def check(
+        self, identifier: str, max_requests: int, window_seconds: int, *, protected: bool
+    ) -> Optional[bool]:
+        if max_requests <= 0:
+            return False
+        if time.monotonic() < self._down_until:
+            return None
+        window_us = int(window_seconds * 1_000_000)
+        interval = window_us // max_requests
+        prefix = _PREFIX_PROTECTED if protected else _PREFIX_GENERAL
+        try:
+            return bool(self._gcra(keys=[prefix + identifier], args=[interval, window_us]))
+        except Exception as e:
+            self.errors += 1
+            self._down_until = time.monotonic() + _BREAKER_SECONDS
+            logger.warning(
+                "Redis rate limiter unavailable (%s: %s) — per-process limits for %.0fs",
+                type(e).__name__, e, _BREAKER_SECONDS,
+            )
+            return None
+
+    def clear(self) -> None:
+        try:
+            for prefix in (_PREFIX_GENERAL, _PREFIX_PROTECTED):
+                keys = list(self._client.scan_iter(match=prefix + "*", count=1000))
+                if keys:
+                    self._client.delete(*keys)
+        except Exception as e:
+            logger.warning("Redis rate limiter clear failed: %s: %s", type(e).__name__, e)
+
+
+def init_redis_rate_limiter(limiter: Any) -> Optional[RedisRateLimitBackend]:
+    """Install the Redis backend on ``limiter`` when ``RATE_LIMIT_BACKEND=redis``.
+
+    Anything short of a reachable server leaves the in-memory limiter in charge and
+    says so once at boot.
+    """
+    if settings.RATE_LIMIT_BACKEND != "redis":
+        return None
+    if not settings.REDIS_URL:
+        logger.warning("RATE_LIMIT_BACKEND=redis but REDIS_URL is not set — per-process limits")
+        return None
+    if _redis is None:
+        logger.warning("RATE_LIMIT_BACKEND=redis but the redis package is not installed")
+        return None
+
+    client = _redis.Redis.from_url(
+        settings.REDIS_URL,
+        socket_connect_timeout=settings.RATE_LIMIT_REDIS_TIMEOUT_SECONDS,
+        socket_timeout=settings.RATE_LIMIT_REDIS_TIMEOUT_SECONDS,
+    )
+    try:
+        client.ping()
+    except Exception as e:
+        logger.warning(
+            "Redis rate limiter not answering (%s: %s) — per-process limits",
+            type(e).__name__, e,
+        )
+        return None
+
+    backend = RedisRateLimitBackend(client)
+    limiter.set_backend(backend)
+    logger.info("Rate limiter backend: Redis (GCRA)")
+    return backend
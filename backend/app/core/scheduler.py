@@ -0,0 +1,596 @@
+"""
+In-Process Job Scheduler
+========================
+
+One owner for the background work the API process runs beside its requests.
+
+``lifespan`` used to spawn a dozen independent ``while True: ...; await
+asyncio.sleep(N)`` loops. Each was correct on its own, but they shared the
+API's event loop, its default executor and the FMP/Gemini quota with no
+coordination at all: a quarterly benchmark recompute, the report pre-warmer and
+the whale sweep could all be mid-burst at the open while users were loading
+Home, and nothing could tell you which loop had last run, for how long, or
+when it would run next.
+
+A loop is now a named :class:`Job`::
+
+    scheduler.register(Job("news_pre_warmer", _news_pass, Every(7200), start_delay=30))
+
+and the scheduler owns everything around the pass:
+
+  * **Schedules** — :class:`Every` (fixed interval, measured from the END of a
+    pass so a slow pass never stacks), :class:`Cron` (five-field cron, any IANA
+    zone) and :class:`At` (a ``next_after(now)`` function, for calendars cron
+    cannot express, e.g. "first Sunday of the quarter").
+  * **Per-job concurrency caps** — a pass that would exceed ``max_concurrency``
+    (the scheduled run meeting a manual trigger) is skipped and counted, not
+    queued.
+  * **A global background budget** — :class:`BackgroundBudget` caps how many
+    budgeted passes run at once across ALL jobs, and DEFERS a pass while recent
+    request latency is above ``BACKGROUND_LATENCY_P95_THRESHOLD_MS``. Long
+    passes call :func:`background_checkpoint` between units of work to yield
+    the same way mid-run. Deferral is bounded (``BACKGROUND_MAX_DEFER_SECONDS``)
+    so a permanently slow API delays a sweep, it never starves it.
+  * **Status** — :meth:`JobScheduler.status` (served by
+    ``GET /api/v1/admin/jobs``): last start / finish / duration / error, next
+    run, run / failure / skip counters, and the budget's current view of
+    request latency.
+
+Jobs whose cadence is their own business — the 24/7 notification dispatcher,
+the whale hydration loop with its durable daily claim, the insight sweeper —
+register with ``schedule=None``: the scheduler starts them once and reports on
+them, and they report passes back through :meth:`JobScheduler.running` /
+:meth:`JobScheduler.note_next_run`.
+
+When more than one process can hold the same job table (the API and
+``python -m app.worker`` — see app/jobs.py), a job with ``lease_seconds`` also
+takes a cross-process lease per pass through the scheduler's ``lease`` hook; a
+pass whose lease is held elsewhere is skipped and counted, like a capped one.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+)
+from zoneinfo import ZoneInfo
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+# ── Schedules ────────────────────────────────────────────────────────────────
+
+
+class Every:
+    """Fixed interval, measured from the end of the previous pass."""
+
+    def __init__(self, seconds: float):
+        if seconds <= 0:
+            raise ValueError("interval must be positive")
+        self.seconds = float(seconds)
+
+    def next_after(self, now: datetime) -> datetime:
+        return now + timedelta(seconds=self.seconds)
+
+    def describe(self) -> str:
+        return f"every {self.seconds:g}s"
+
+
+# (low, high) per field: minute, hour, day-of-month, month, day-of-week (0 = Sunday).
+_CRON_BOUNDS = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+
+def _parse_cron_field(spec: str, lo: int, hi: int) -> FrozenSet[int]:
+    values = set()
+    for part in spec.split(","):
+        step = 1
+        if "/" in part:
+            part, raw_step = part.split("/", 1)
+            step = int(raw_step)
+            if step <= 0:
+                raise ValueError(f"bad cron step in {spec!r}")
+        if part == "*":
+            start, end = lo, hi
+        elif "-" in part:
+            a, b = part.split("-", 1)
+            start, end = int(a), int(b)
+        else:
+            start = int(part)
+            # "5/15" means "from 5, every 15" — the cron convention.
+            end = hi if step != 1 else start
+        if not lo <= start <= end <= hi:
+            raise ValueError(f"cron field {spec!r} out of range {lo}-{hi}")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+class Cron:
+    """Five-field cron (``minute hour day-of-month month day-of-week``).
+
+    Supports ``*``, lists, ranges and steps. Day-of-week is 0-7 with both 0 and 7
+    meaning Sunday. As in classic cron, when BOTH day fields are restricted a day
+    matches if EITHER does. Evaluated in ``tz`` (UTC by default) so an ET market
+    job stays on the ET clock across DST.
+    """
+
+    # Four years covers every satisfiable expression (Feb 29 included).
+    _HORIZON_DAYS = 4 * 366
+
+    def __init__(self, expr: str, tz: str = "UTC"):
+        fields = expr.split()
+        if len(fields) != 5:
+            raise ValueError(f"cron expression needs 5 fields: {expr!r}")
+        parsed = [_parse_cron_field(f, lo, hi) for f, (lo, hi) in zip(fields, _CRON_BOUNDS)]
+        self.expr = expr
+        self.tz = ZoneInfo(tz)
+        self._minutes = sorted(parsed[0])
+        self._hours = sorted(parsed[1])
+        self._doms = parsed[2]
+        self._months = parsed[3]
+        self._dows = frozenset(d % 7 for d in parsed[4])
+        self._dom_any = fields[2] == "*"
+        self._dow_any = fields[4] == "*"
+
+    def _day_matches(self, d: date) -> bool:
+        if d.month not in self._months:
+            return False
+        dom_ok = d.day in self._doms
+        dow_ok = (d.weekday() + 1) % 7 in self._dows
+        if self._dom_any or self._dow_any:
+            return dom_ok and dow_ok
+        return dom_ok or dow_ok
+
+    def next_after(self, now: datetime) -> datetime:
+        local = now.astimezone(self.tz).replace(second=0, microsecond=0) + timedelta(minutes=1)
+        day = local.date()
+        for offset in range(self._HORIZON_DAYS):
+            d = day + timedelta(days=offset)
+            if not self._day_matches(d):
+                continue
+            for hour in self._hours:
+                if offset == 0 and hour < local.hour:
+                    continue
+                for minute in self._minutes:
+                    if offset == 0 and hour == local.hour and minute < local.minute:
+                        continue
+                    fire = datetime(d.year, d.month, d.day, hour, minute, tzinfo=self.tz)
+                    return fire.astimezone(timezone.utc)
+        raise ValueError(f"cron expression never fires: {self.expr!r}")
+
+    def describe(self) -> str:
+        return f"cron {self.expr} ({self.tz.key})"
+
+
+class At:
+    """Schedule from a pure ``next_after(now) -> datetime`` function."""
+
+    def __init__(self, next_after: Callable[[datetime], datetime], label: str):
+        self._next_after = next_after
+        self.label = label
+
+    def next_after(self, now: datetime) -> datetime:
+        return self._next_after(now)
+
+    def describe(self) -> str:
+        return self.label
+
+
+# ── Request latency and the background budget ───────────────────────────────
+
+
+class RequestLatencyTracker:
+    """Rolling window of recent request durations, fed by the timing middleware.
+
+    A percentile over the last ``window_seconds``; below ``min_samples`` requests
+    in the window there is no reading (``None``) — three slow requests on an idle
+    instance are not congestion. The percentile is memoised for a second because
+    every waiting job polls it.
+    """
+
+    def __init__(self, window_seconds: float, max_samples: int = 4096, min_samples: int = 20):
+        self.window_seconds = window_seconds
+        self.min_samples = min_samples
+        self._samples: Deque[Tuple[float, float]] = deque(maxlen=max_samples)
+        self._memo: Tuple[float, Optional[float]] = (0.0, None)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append((time.monotonic(), seconds))
+
+    def p95(self) -> Optional[float]:
+        now = time.monotonic()
+        if now - self._memo[0] < 1.0:
+            return self._memo[1]
+        horizon = now - self.window_seconds
+        while self._samples and self._samples[0][0] < horizon:
+            self._samples.popleft()
+        value: Optional[float] = None
+        if len(self._samples) >= self.min_samples:
+            durations = sorted(d for _, d in self._samples)
+            value = durations[min(len(durations) - 1, int(len(durations) * 0.95))]
+        self._memo = (now, value)
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        p95 = self.p95()
+        return {
+            "window_seconds": self.window_seconds,
+            "samples": len(self._samples),
+            "p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+        }
+
+
+class BackgroundBudget:
+    """How much background work may run at once, and whether now is a good time.
+
+    ``slot()`` waits (bounded) for request latency to drop under the threshold,
+    then for one of ``max_concurrent`` slots. ``checkpoint()`` is the mid-pass
+    form: a no-op when the API is healthy, a bounded wait when it is not.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        latency: RequestLatencyTracker,
+        p95_threshold_seconds: float,
+        max_defer_seconds: float,
+        poll_seconds: float = 1.0,
+    ):
+        self.max_concurrent = max(1, max_concurrent)
+        self.latency = latency
+        self.p95_threshold_seconds = p95_threshold_seconds
+        self.max_defer_seconds = max_defer_seconds
+        self.poll_seconds = poll_seconds
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.active = 0
+        self.deferrals = 0
+        self.deferred_seconds = 0.0
+        self.forced = 0
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        # Created on first use and rebuilt if the loop changes (tests, a re-run
+        # lifespan) — an asyncio primitive must not outlive its loop.
+        loop = asyncio.get_running_loop()
+        if self._sem is None or self._loop is not loop:
+            self._sem = asyncio.Semaphore(self.max_concurrent)
+            self._loop = loop
+            self.active = 0
+        return self._sem
+
+    def congested(self) -> bool:
+        if self.p95_threshold_seconds <= 0:
+            return False
+        p95 = self.latency.p95()
+        return p95 is not None and p95 > self.p95_threshold_seconds
+
+    async def wait_for_headroom(self) -> float:
+        """Sleep while requests are slow, up to ``max_defer_seconds``. Returns the wait."""
+        if not self.congested():
+            return 0.0
+        self.deferrals += 1
+        started = time.monotonic()
+        while self.congested():
+            waited = time.monotonic() - started
+            if waited >= self.max_defer_seconds:
+                # Deferral is bounded on purpose: an API that stays slow for the whole
+                # window delays a sweep, it must never starve it (an expiry sweep that
+                # never runs is an entitlement bug, not a latency win).
+                self.forced += 1
+                logger.warning(
+                    "Background budget: request p95 still above %.0fms after %.0fs — "
+                    "running anyway", self.p95_threshold_seconds * 1000, waited,
+                )
+                break
+            await asyncio.sleep(min(self.poll_seconds, self.max_defer_seconds - waited))
+        waited = time.monotonic() - started
+        self.deferred_seconds += waited
+        return waited
+
+    async def checkpoint(self) -> None:
+        if self.congested():
+            await self.wait_for_headroom()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[float]:
+        waited = await self.wait_for_headroom()
+        sem = self._semaphore()
+        async with sem:
+            self.active += 1
+            try:
+                yield waited
+            finally:
+                self.active -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrent": self.max_concurrent,
+            "active": self.active,
+            "p95_threshold_ms": round(self.p95_threshold_seconds * 1000, 1),
+            "congested": self.congested(),
+            "deferrals": self.deferrals,
+            "deferred_seconds": round(self.deferred_seconds, 1),
+            "forced_after_max_defer": self.forced,
+            "requests": self.latency.stats(),
+        }
+
+
+# ── Jobs ─────────────────────────────────────────────────────────────────────
+
+
+@dataclass
+class Job:
+    """A named unit of background work.
+
+    ``run`` is ONE pass for a scheduled job, or the whole long-running loop when
+    ``schedule`` is None. ``run_on_start=False`` waits for the first scheduled
+    time instead of running right after ``start_delay`` (weekly / quarterly jobs).
+    ``budgeted=False`` is for user-visible latency-sensitive work (price alerts,
+    the quiet-hours flush) that must never be deferred behind request latency.
+    ``lease_seconds`` > 0 takes the scheduler's cross-process lease around each
+    pass (when it has one); size it well above the pass's normal duration — an
+    unreleased lease lapses only after it.
+    """
+
+    name: str
+    run: Callable[[], Awaitable[Any]]
+    schedule: Optional[Any] = None
+    start_delay: float = 0.0
+    run_on_start: bool = True
+    max_concurrency: int = 1
+    budgeted: bool = True
+    lease_seconds: float = 0.0
+    description: str = ""
+
+
+def _iso(ts: Optional[float]) -> Optional[str]:
+    if ts is None:
+        return None
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat()
+
+
+@dataclass
+class _JobState:
+    running: int = 0
+    runs: int = 0
+    failures: int = 0
+    skipped: int = 0
+    lease_skipped: int = 0
+    last_started_at: Optional[float] = None
+    last_finished_at: Optional[float] = None
+    last_duration: Optional[float] = None
+    last_deferred: float = 0.0
+    last_error: Optional[str] = None
+    next_run_at: Optional[float] = None
+    loop_started_at: Optional[float] = None
+    loop_alive: bool = False
+    history: Deque[float] = field(default_factory=lambda: deque(maxlen=20))
+
+
+# ``lease(job_name, lease_seconds)`` → an async context manager yielding whether this
+# process holds the job for the pass (and releasing it on exit).
+LeaseHook = Callable[[str, float], AsyncContextManager[bool]]
+
+
+class JobScheduler:
+    """Registry + driver for :class:`Job`s. One per process (see ``reset_scheduler``)."""
+
+    def __init__(self, budget: BackgroundBudget, lease: Optional[LeaseHook] = None):
+        self.budget = budget
+        self.lease = lease
+        self._jobs: Dict[str, Job] = {}
+        self._state: Dict[str, _JobState] = {}
+
+    # ── registry ──
+
+    def register(self, job: Job) -> Job:
+        if job.name in self._jobs:
+            raise ValueError(f"job {job.name!r} is already registered")
+        self._jobs[job.name] = job
+        self._state[job.name] = _JobState()
+        return job
+
+    @property
+    def jobs(self) -> Dict[str, Job]:
+        return dict(self._jobs)
+
+    def start(self, spawn: Callable[[Awaitable[Any], str], asyncio.Task]) -> Dict[str, asyncio.Task]:
+        """Start one driver per job through ``spawn`` (lifespan's task bookkeeping)."""
+        return {name: spawn(self._drive(job), name) for name, job in self._jobs.items()}
+
+    # ── running passes ──
+
+    @asynccontextmanager
+    async def running(self, name: str, budgeted: Optional[bool] = None) -> AsyncIterator[bool]:
+        """Bookkeeping around one pass: per-job cap, budget slot, lease, timing, errors.
+
+        Yields False (and runs nothing) when the job is already at its concurrency
+        cap, or its lease is held by another process — the caller skips the pass.
+        Exceptions are recorded and re-raised.
+        """
+        job = self._jobs.get(name)
+        if job is None:
+            # Not registered in this process (a loop invoked directly, a script): run the
+            # pass unaccounted rather than fail the work over missing bookkeeping.
+            yield True
+            return
+        state = self._state[name]
+        if state.running >= job.max_concurrency:
+            state.skipped += 1
+            logger.info("Job %s: already running (%d), pass skipped", name, state.running)
+            yield False
+            return
+        state.running += 1
+        try:
+            async with AsyncExitStack() as stack:
+                waited = 0.0
+                use_budget = job.budgeted if budgeted is None else budgeted
+                if use_budget:
+                    waited = await stack.enter_async_context(self.budget.slot())
+                # Leased AFTER the budget slot, so a pass deferred behind request latency
+                # is not holding the job away from another process meanwhile.
+                if self.lease is not None and job.lease_seconds > 0:
+                    held = await stack.enter_async_context(self.lease(name, job.lease_seconds))
+                    if not held:
+                        state.lease_skipped += 1
+                        logger.info("Job %s: lease held elsewhere, pass skipped", name)
+                        yield False
+                        return
+                await stack.enter_async_context(self._timed(name, state, waited))
+                yield True
+        finally:
+            state.running -= 1
+
+    @asynccontextmanager
+    async def _timed(self, name: str, state: _JobState, waited: float) -> AsyncIterator[None]:
+        state.last_started_at = time.time()
+        state.last_deferred = waited
+        started = time.monotonic()
+        try:
+            yield
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            state.failures += 1
+            state.last_error = f"{type(e).__name__}: {e}"
+            raise
+        else:
+            state.last_error = None
+        finally:
+            state.runs += 1
+            state.last_duration = time.monotonic() - started
+            state.last_finished_at = time.time()
+            state.history.append(state.last_duration)
+
+    async def run_once(self, name: str) -> bool:
+        """Run one pass of a scheduled job now. False if skipped or failed — never raises
+        (cancellation aside): one bad pass must not end the job's driver."""
+        job = self._jobs[name]
+        try:
+            async with self.running(name) as ok:
+                if not ok:
+                    return False
+                await job.run()
+            return True
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Job %s failed: %s: %s", name, type(e).__name__, e, exc_info=True)
+            return False
+
+    def note_next_run(self, name: str, when: datetime) -> None:
+        """For self-scheduled loops: publish when the next pass is due."""
+        if name in self._state:
+            self._state[name].next_run_at = when.timestamp()
+
+    async def _sleep_until(self, name: str, when: datetime) -> None:
+        self._state[name].next_run_at = when.timestamp()
+        delay = (when - datetime.now(timezone.utc)).total_seconds()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def _drive(self, job: Job) -> None:
+        state = self._state[job.name]
+        state.loop_started_at = time.time()
+        state.loop_alive = True
+        try:
+            if job.start_delay > 0:
+                state.next_run_at = time.time() + job.start_delay
+                await asyncio.sleep(job.start_delay)
+            if job.schedule is None:
+                # A self-scheduled loop (or a one-shot): it owns its cadence.
+                await job.run()
+                return
+            if not job.run_on_start:
+                await self._sleep_until(job.name, job.schedule.next_after(datetime.now(timezone.utc)))
+            while True:
+                state.next_run_at = None
+                await self.run_once(job.name)
+                await self._sleep_until(job.name, job.schedule.next_after(datetime.now(timezone.utc)))
+        finally:
+            state.loop_alive = False
+
+    # ── status ──
+
+    def status(self) -> Dict[str, Any]:
+        jobs: Dict[str, Any] = {}
+        for name, job in self._jobs.items():
+            s = self._state[name]
+            history: List[float] = list(s.history)
+            jobs[name] = {
+                "schedule": job.schedule.describe() if job.schedule is not None else "self-scheduled",
+                "description": job.description,
+                "budgeted": job.budgeted,
+                "max_concurrency": job.max_concurrency,
+                "lease_seconds": job.lease_seconds or None,
+                "alive": s.loop_alive,
+                "running": s.running,
+                "runs": s.runs,
+                "failures": s.failures,
+                "skipped": s.skipped,
+                "lease_skipped": s.lease_skipped,
+                "last_started_at": _iso(s.last_started_at),
+                "last_finished_at": _iso(s.last_finished_at),
+                "last_duration_seconds": round(s.last_duration, 3) if s.last_duration is not None else None,
+                "last_deferred_seconds": round(s.last_deferred, 1),
+                "avg_duration_seconds": round(sum(history) / len(history), 3) if history else None,
+                "last_error": s.last_error,
+                "next_run_at": _iso(s.next_run_at),
+            }
+        return {"budget": self.budget.stats(), "jobs": jobs}
+
+
+# ── Process-wide instances ───────────────────────────────────────────────────
+
+_request_latency = RequestLatencyTracker(settings.BACKGROUND_LATENCY_WINDOW_SECONDS)
+
+
+def _new_budget() -> BackgroundBudget:
+    return BackgroundBudget(
+        max_concurrent=settings.BACKGROUND_JOBS_MAX_CONCURRENT,
+        latency=_request_latency,
+        p95_threshold_seconds=settings.BACKGROUND_LATENCY_P95_THRESHOLD_MS / 1000,
+        max_defer_seconds=settings.BACKGROUND_MAX_DEFER_SECONDS,
+    )
+
+
+_scheduler = JobScheduler(_new_budget())
+
+
+def record_request_latency(seconds: float) -> None:
+    """Called by the request-timing middleware for every response."""
+    _request_latency.record(seconds)
+
+
+def get_scheduler() -> JobScheduler:
+    return _scheduler
+
+
+def reset_scheduler(lease: Optional[LeaseHook] = None) -> JobScheduler:
+    """A fresh, empty scheduler for this lifespan (the previous one's tasks are gone)."""
+    global _scheduler
+    _scheduler = JobScheduler(_new_budget(), lease=lease)
+    return _scheduler
+
+
+async def background_checkpoint() -> None:
+    """Yield to request traffic mid-pass: a no-op unless request latency is high."""
+    await _scheduler.budget.checkpoint()
@@ -6,11 +6,15 @@ Requirements: Section 5.3 - Security Requirements
 
 from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Any
+from typing import Any, Optional, Protocol
 from jose import JWTError, jwt
 from passlib.context import CryptContext
+from starlette.concurrency import run_in_threadpool
+import hashlib
+import json
 import secrets
 import logging
+import threading
 import time
 
 from app.config import settings
@@ -133,10 +137,86 @@ def create_refresh_token(
     return encoded_jwt
 
 
+# Verified-claims cache
+# =====================
+#
+# The iOS app fires dozens of requests per screen with the SAME bearer, and every one of them
+# used to re-run the full signature check (HMAC for our own tokens, ECDSA for Supabase's) in
+# `_user_id_from_token` and again in the password-change check. The claims a valid token
+# carries cannot change, so a token that verified once is cached here until its `exp`.
+#
+# Keyed on a SHA-256 of the token TOGETHER with the key material that verified it (secret +
+# algorithm, or the JWK), never on the raw token: rotating SECRET_KEY or dropping a JWKS key
+# therefore misses the cache instead of honouring tokens the new key would refuse. Only
+# successes are cached — a bad token still pays for its rejection every time.
+#
+# Revocation is unaffected: `password_changed_at` is compared against the cached `iat` on every
+# request (dependencies._reject_if_password_changed_since_issue), and `iat` is part of the
+# signed payload, so a cache hit gives exactly the answer a fresh decode would.
+class VerifiedClaimsCache:
+    """Bounded LRU of verified JWT payloads, each held no longer than its `exp`."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, tuple[float, dict[str, Any]]]" = OrderedDict()
+        # `decode_token` is also called from sync routes FastAPI runs on its threadpool.
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(token: str, *material: str) -> bytes:
+        h = hashlib.sha256(token.encode())
+        for part in material:
+            h.update(b"\0")
+            h.update(part.encode())
+        return h.digest()
+
+    def get(self, key: bytes) -> Optional[dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if time.time() >= entry[0]:
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            # A copy: callers read claims off it, and one mutating it must not poison the next.
+            return dict(entry[1])
+
+    def put(self, key: bytes, payload: dict[str, Any], max_age: Optional[float] = None) -> None:
+        exp = payload.get("exp")
+        if self.max_entries <= 0 or not isinstance(exp, (int, float)):
+            return  # no `exp` → no safe bound on how long the claims stay valid
+        until = float(exp)
+        if max_age is not None:
+            until = min(until, time.time() + max_age)
+        with self._lock:
+            self._entries[key] = (until, dict(payload))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+verified_claims = VerifiedClaimsCache(settings.JWT_CLAIMS_CACHE_MAX_ENTRIES)
+
+
 def decode_token(token: str) -> Optional[dict[str, Any]]:
     """
     Decode and verify a JWT token.
 
+    A token that verified before is answered from `verified_claims` until its `exp`.
+
     Args:
         token: JWT token string
 
@@ -146,16 +226,21 @@ def decode_token(token: str) -> Optional[dict[str, Any]]:
     Raises:
         JWTError: If token is invalid or expired
     """
+    cache_key = VerifiedClaimsCache.key(token, settings.ALGORITHM, settings.SECRET_KEY)
+    cached = verified_claims.get(cache_key)
+    if cached is not None:
+        return cached
     try:
         payload = jwt.decode(
             token,
             settings.SECRET_KEY,
             algorithms=[settings.ALGORITHM]
         )
-        return payload
     except JWTError as e:
         logger.warning(f"Token decode failed: {e}")
         raise
+    verified_claims.put(cache_key, payload)
+    return payload
 
 
 # Supabase JWT signing keys (JWKS)
@@ -278,11 +363,19 @@ async def verify_supabase_token(token: str) -> Optional[dict[str, Any]]:
         if not key:
             logger.warning("No Supabase JWKS key matches kid=%s", kid)
             return None
+        # Looked up AFTER the key: a kid dropped from the JWKS is refused above, never
+        # answered from the cache. Capped at the JWKS refresh interval for the same reason.
+        cache_key = VerifiedClaimsCache.key(token, alg, json.dumps(key, sort_keys=True))
+        cached = verified_claims.get(cache_key)
+        if cached is not None:
+            return cached
         try:
-            return jwt.decode(token, key, algorithms=[alg], audience="authenticated")
+            payload = jwt.decode(token, key, algorithms=[alg], audience="authenticated")
         except JWTError as e:
             logger.warning("Supabase token verification failed (%s): %s", alg, e)
             return None
+        verified_claims.put(cache_key, payload, max_age=_JWKS_TTL_SECONDS)
+        return payload
 
     if alg == "HS256":
         # Legacy path. Stays until the project revokes its legacy signing key; after that
@@ -290,8 +383,12 @@ async def verify_supabase_token(token: str) -> Optional[dict[str, Any]]:
         if not settings.SUPABASE_JWT_SECRET:
             logger.error("SUPABASE_JWT_SECRET not configured; cannot verify a legacy token")
             return None
+        cache_key = VerifiedClaimsCache.key(token, "HS256", settings.SUPABASE_JWT_SECRET)
+        cached = verified_claims.get(cache_key)
+        if cached is not None:
+            return cached
         try:
-            return jwt.decode(
+            payload = jwt.decode(
                 token,
                 settings.SUPABASE_JWT_SECRET,
                 algorithms=["HS256"],
@@ -300,6 +397,8 @@ async def verify_supabase_token(token: str) -> Optional[dict[str, Any]]:
         except JWTError as e:
             logger.warning("Supabase token verification failed (HS256): %s", e)
             return None
+        verified_claims.put(cache_key, payload)
+        return payload
 
     # Anything else — including `none` — is refused rather than guessed at.
     logger.warning("Supabase token uses unsupported alg=%r", alg)
@@ -337,10 +436,29 @@ def verify_api_key(api_key: str, valid_keys: set[str]) -> bool:
 # Rate Limiting Utilities
 # =======================
 
+class RateLimitBackend(Protocol):
+    """A shared limiter store behind :class:`RateLimiter` (see app/core/redis_rate_limit.py).
+
+    ``check`` returns the verdict, or ``None`` when the store cannot answer right now — the
+    limiter then decides from its in-memory pools, so an outage loosens limits to per-process
+    rather than lifting them.
+    """
+
+    def check(
+        self, identifier: str, max_requests: int, window_seconds: int, *, protected: bool
+    ) -> Optional[bool]: ...
+
+    def clear(self) -> None: ...
+
+
 class RateLimiter:
     """
-    Simple in-memory rate limiter.
-    For production, use Redis-based rate limiting.
+    In-memory sliding-window rate limiter, with an optional shared backend.
+
+    Per-process on its own: with N workers every limit is N× looser. Install a
+    :class:`RateLimitBackend` with :meth:`set_backend` (``RATE_LIMIT_BACKEND=redis``) to
+    enforce each limit once across every process; the in-memory pools then only serve while
+    that backend is unreachable.
     """
 
     # TWO POOLS, and the split is a security boundary — not tidiness.
@@ -388,6 +506,11 @@ class RateLimiter:
     def __init__(self):
         self._requests: "OrderedDict[str, list[datetime]]" = OrderedDict()
         self._protected: "OrderedDict[str, list[datetime]]" = OrderedDict()
+        self._backend: Optional[RateLimitBackend] = None
+
+    def set_backend(self, backend: Optional[RateLimitBackend]) -> None:
+        """Install (or, with ``None``, remove) the shared backend every check goes to first."""
+        self._backend = backend
 
     def is_allowed(
         self,
@@ -411,7 +534,46 @@ class RateLimiter:
 
         Returns:
             bool: True if request is allowed
+
+        Blocking when a backend is installed — from a coroutine, use
+        :meth:`is_allowed_async`.
+        """
+        if self._backend is not None:
+            verdict = self._backend.check(
+                identifier, max_requests, window_seconds, protected=protected
+            )
+            if verdict is not None:
+                return verdict
+        return self._is_allowed_locally(identifier, max_requests, window_seconds, protected)
+
+    async def is_allowed_async(
+        self,
+        identifier: str,
+        max_requests: int = 60,
+        window_seconds: int = 60,
+        *,
+        protected: bool = False,
+    ) -> bool:
+        """:meth:`is_allowed` for the async dependencies and routes.
+
+        The backend round-trip runs in the threadpool: on the event loop, a slow or
+        saturated Redis stalled every request on the worker for up to the socket
+        timeout, not just the one being limited. The in-memory pools are not
+        thread-safe, so the fallback stays on the loop.
         """
+        if self._backend is not None:
+            verdict = await run_in_threadpool(
+                self._backend.check, identifier, max_requests, window_seconds,
+                protected=protected,
+            )
+            if verdict is not None:
+                return verdict
+        return self._is_allowed_locally(identifier, max_requests, window_seconds, protected)
+
+    def _is_allowed_locally(
+        self, identifier: str, max_requests: int, window_seconds: int, protected: bool
+    ) -> bool:
+        """The in-memory sliding window — the whole limiter without a backend."""
         now = datetime.now(timezone.utc)
         window_start = now - timedelta(seconds=window_seconds)
 
@@ -453,6 +615,8 @@ class RateLimiter:
         """
         self._requests.clear()
         self._protected.clear()
+        if self._backend is not None:
+            self._backend.clear()
 
     def _evict(self, pool: "OrderedDict[str, list[datetime]]", cap: int, now: datetime) -> None:
         """Bound `pool` in amortized O(1): LRU order puts evictable keys at the front."""
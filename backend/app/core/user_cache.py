@@ -0,0 +1,100 @@
+"""
+User Record Cache
+=================
+
+A seconds-long cache of ``public.users`` rows for the auth dependencies.
+
+``get_current_user`` and ``get_current_user_or_guest`` read the caller's row on
+EVERY authenticated request — the ``password_changed_at`` eviction check needs
+it — and between them they back nearly every signed-in route, so a Home load
+that fans out to five endpoints read the same row five times inside a second.
+A few seconds of reuse removes that round-trip from the hot paths without
+changing what the row is used for.
+
+What keeps it safe is invalidation, not the TTL. Every writer of a field the
+auth path or its callers act on calls :func:`invalidate_user_record` right after
+its write:
+
+  * password change / reset — ``auth._mark_password_changed``. The cached row
+    carries the OLD ``password_changed_at``; serving it would let a pre-change
+    token keep working until expiry. Dropping it means the very next request
+    re-reads the stamp and the old token is rejected.
+  * tier change — ``IAPService.reconcile_user_tier`` (the only writer of
+    ``users.tier``; subscription_service only reads the catalog and
+    ``subscriptions``).
+  * profile edits and account deletion — ``users.update_profile`` /
+    ``users.delete_account``.
+
+A read that was already in flight when an invalidation landed must not put the
+pre-change row back: :func:`user_record_generation` is taken before the read
+and :func:`remember_user_record` drops the write if any invalidation happened
+since. That is conservative (any invalidation voids every in-flight fill) and
+costs one extra read in a rare race.
+
+Per process. With several workers the worker that handled the write evicts
+immediately and the others converge within ``USER_RECORD_CACHE_TTL_SECONDS``,
+which is why that TTL is seconds and not minutes. ``0`` disables the cache.
+"""
+
+import threading
+from typing import Any, Dict, Optional
+
+from app.config import settings
+from app.core.cache import register_region
+
+_cache = register_region(
+    "auth_users",
+    ttl=max(settings.USER_RECORD_CACHE_TTL_SECONDS, 0.0),
+    max_entries=10_000,
+)
+
+_lock = threading.Lock()
+_generation = 0
+
+
+def _enabled() -> bool:
+    return settings.USER_RECORD_CACHE_TTL_SECONDS > 0
+
+
+def user_record_generation() -> int:
+    """Snapshot to hand back to :func:`remember_user_record` after a read."""
+    return _generation
+
+
+def cached_user_record(user_id: str) -> Optional[Dict[str, Any]]:
+    """The cached row for ``user_id``, or ``None``.
+
+    A shallow COPY: handlers treat the dependency's return value as their own and
+    some decorate it, which must not leak into the next request's row.
+    """
+    if not _enabled():
+        return None
+    row = _cache.lookup(str(user_id))
+    return dict(row) if row is not None else None
+
+
+def remember_user_record(row: Dict[str, Any], generation: int) -> None:
+    """Cache ``row`` unless an invalidation landed since ``generation`` was taken."""
+    if not _enabled() or not row or not row.get("id"):
+        return
+    with _lock:
+        if generation != _generation:
+            return
+        _cache.store(str(row["id"]), dict(row))
+
+
+def invalidate_user_record(user_id: Optional[str]) -> None:
+    """Drop ``user_id``'s row. Call AFTER the write that made it stale."""
+    global _generation
+    with _lock:
+        _generation += 1
+        if user_id:
+            _cache.discard(str(user_id))
+
+
+def clear_user_records() -> None:
+    """Drop every row (tests, and any bulk ``users`` rewrite)."""
+    global _generation
+    with _lock:
+        _generation += 1
+        _cache.clear()
@@ -1,9 +1,13 @@
 """
 Database Connection - Supabase Only
-No SQLAlchemy. Uses Supabase Python client for all DB operations.
+No SQLAlchemy. Uses the Supabase Python client for DB operations, plus an async
+PostgREST client (`get_async_supabase`) for hot read paths that must not hold an
+executor thread per round-trip.
 """
 
-from typing import Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import asyncio
+import json
 import httpx
 from supabase import create_client, Client
 import logging
@@ -135,6 +139,247 @@ def get_auth_client() -> Client:
     return _auth_client
 
 
+# ── Async PostgREST access ───────────────────────────────────────────────────
+#
+# `get_supabase()` is SYNCHRONOUS, so every async caller wraps it in `asyncio.to_thread`
+# (~250 sites). Each in-flight DB read then holds a default-executor thread for its whole
+# round-trip, and that pool — min(32, cpu+4) threads — becomes the real concurrency ceiling:
+# under a burst, request N+1 queues for a THREAD, not for the database. That is the 40-49s
+# stall `scripts/measure_whale_latency.sh` documents.
+#
+# This client talks PostgREST directly over its own pooled `httpx.AsyncClient`, so a read
+# costs a socket, not a thread. It mirrors the sync builder's shape for the subset the hot
+# paths use — `await db.table(t).select(c).eq(k, v).limit(1).execute()` → `.data` — so a
+# call site migrates by dropping the `to_thread` wrapper and adding `await`. Errors surface
+# as postgrest's own `APIError`, so existing `except` clauses keep their meaning.
+#
+# Still service-role only, like `get_supabase()`. Auth calls stay on `get_auth_client()`.
+
+
+class AsyncQueryResult:
+    """The `.data` / `.count` pair a sync `execute()` returns."""
+
+    __slots__ = ("data", "count")
+
+    def __init__(self, data: Any, count: Optional[int] = None):
+        self.data = data
+        self.count = count
+
+
+def _pg_value(value: Any) -> str:
+    """Render a filter operand the way PostgREST parses it."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _pg_list_item(value: Any) -> str:
+    text = _pg_value(value)
+    # Reserved characters inside `in.(...)` must be double-quoted or PostgREST splits on them.
+    if any(c in text for c in ',()"\\ '):
+        text = '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+    return text
+
+
+class AsyncQuery:
+    """One PostgREST request under construction. Every filter returns ``self``."""
+
+    def __init__(self, client: "AsyncPostgrestClient", table: str):
+        self._client = client
+        self._table = table
+        self._method = "GET"
+        self._params: List[Tuple[str, str]] = []
+        self._headers: Dict[str, str] = {}
+        self._body: Any = None
+
+    # ── verbs ────────────────────────────────────────────────────────────
+
+    def select(self, columns: str = "*", count: Optional[str] = None) -> "AsyncQuery":
+        self._method = "GET"
+        self._params.append(("select", columns))
+        if count:
+            self._headers["Prefer"] = f"count={count}"
+        return self
+
+    def insert(self, rows: Any) -> "AsyncQuery":
+        self._method = "POST"
+        self._body = rows
+        self._headers["Prefer"] = "return=representation"
+        return self
+
+    def upsert(self, rows: Any, on_conflict: Optional[str] = None) -> "AsyncQuery":
+        self._method = "POST"
+        self._body = rows
+        self._headers["Prefer"] = "return=representation,resolution=merge-duplicates"
+        if on_conflict:
+            self._params.append(("on_conflict", on_conflict))
+        return self
+
+    def update(self, values: Dict[str, Any]) -> "AsyncQuery":
+        self._method = "PATCH"
+        self._body = values
+        self._headers["Prefer"] = "return=representation"
+        return self
+
+    def delete(self) -> "AsyncQuery":
+        self._method = "DELETE"
+        self._headers["Prefer"] = "return=representation"
+        return self
+
+    # ── filters / modifiers ──────────────────────────────────────────────
+
+    def _filter(self, column: str, op: str, value: Any) -> "AsyncQuery":
+        self._params.append((column, f"{op}.{_pg_value(value)}"))
+        return self
+
+    def eq(self, column: str, value: Any) -> "AsyncQuery":
+        return self._filter(column, "eq", value)
+
+    def neq(self, column: str, value: Any) -> "AsyncQuery":
+        return self._filter(column, "neq", value)
+
+    def gt(self, column: str, value: Any) -> "AsyncQuery":
+        return self._filter(column, "gt", value)
+
+    def gte(self, column: str, value: Any) -> "AsyncQuery":
+        return self._filter(column, "gte", value)
+
+    def lt(self, column: str, value: Any) -> "AsyncQuery":
+        return self._filter(column, "lt", value)
+
+    def lte(self, column: str, value: Any) -> "AsyncQuery":
+        return self._filter(column, "lte", value)
+
+    def is_(self, column: str, value: Any) -> "AsyncQuery":
+        return self._filter(column, "is", value)
+
+    def in_(self, column: str, values: Sequence[Any]) -> "AsyncQuery":
+        items = ",".join(_pg_list_item(v) for v in values)
+        self._params.append((column, f"in.({items})"))
+        return self
+
+    def order(
+        self, column: str, desc: bool = False, nullsfirst: Optional[bool] = None
+    ) -> "AsyncQuery":
+        term = f"{column}.{'desc' if desc else 'asc'}"
+        if nullsfirst is not None:
+            term += ".nullsfirst" if nullsfirst else ".nullslast"
+        # Repeated `.order()` calls compose into ONE `order=` parameter, as in postgrest-py.
+        for i, (key, existing) in enumerate(self._params):
+            if key == "order":
+                self._params[i] = ("order", f"{existing},{term}")
+                return self
+        self._params.append(("order", term))
+        return self
+
+    def limit(self, size: int) -> "AsyncQuery":
+        self._params.append(("limit", str(int(size))))
+        return self
+
+    def range(self, start: int, end: int) -> "AsyncQuery":
+        self._params.append(("offset", str(int(start))))
+        self._params.append(("limit", str(int(end) - int(start) + 1)))
+        return self
+
+    async def execute(self) -> AsyncQueryResult:
+        return await self._client._send(self)
+
+
+# A body this size or larger is parsed in a worker thread. The hot rows this client
+# serves (`ticker_report_cache`, the ~800 KB `ticker_data_cache.collected_data`) would
+# otherwise hold the event loop for the whole `json.loads`; a typical small row is
+# cheaper to parse inline than to hand to a thread.
+_OFFLOOP_JSON_BYTES = 64 * 1024
+
+
+async def _parse_json(content: bytes) -> Any:
+    if len(content) >= _OFFLOOP_JSON_BYTES:
+        return await asyncio.to_thread(json.loads, content)
+    return json.loads(content)
+
+
+class AsyncPostgrestClient:
+    """Pooled async PostgREST client. Build through :func:`get_async_supabase`."""
+
+    def __init__(self, http: httpx.AsyncClient):
+        self._http = http
+
+    def table(self, name: str) -> AsyncQuery:
+        return AsyncQuery(self, name)
+
+    async def _send(self, query: AsyncQuery) -> AsyncQueryResult:
+        from postgrest.exceptions import APIError
+
+        resp = await self._http.request(
+            query._method,
+            f"/{query._table}",
+            params=query._params,
+            headers=query._headers,
+            json=query._body,
+        )
+        if resp.status_code >= 400:
+            try:
+                body = await _parse_json(resp.content)
+            except ValueError:
+                body = {"message": resp.text[:500]}
+            if not isinstance(body, dict):
+                body = {"message": str(body)[:500]}
+            body.setdefault("code", str(resp.status_code))
+            raise APIError(body)
+
+        count: Optional[int] = None
+        content_range = resp.headers.get("content-range", "")
+        if "/" in content_range:
+            total = content_range.rsplit("/", 1)[1]
+            count = int(total) if total.isdigit() else None
+        data = await _parse_json(resp.content) if resp.content else []
+        return AsyncQueryResult(data, count)
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+
+_async_client: Optional[AsyncPostgrestClient] = None
+
+
+def get_async_supabase() -> AsyncPostgrestClient:
+    """Get or create the async PostgREST client singleton (service role, like `get_supabase`).
+
+    HTTP/1.1 for the same reason `_force_http1_on_postgrest` gives: a long-lived h2
+    connection to the gateway dies on GOAWAY and the next reuse raises. Concurrency here
+    comes from the POOL — `SUPABASE_ASYNC_MAX_CONNECTIONS` sockets — not from multiplexing.
+    """
+    global _async_client
+    if _async_client is None:
+        logger.info("Initializing async PostgREST client")
+        http = httpx.AsyncClient(
+            base_url=f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1",
+            headers={
+                "apikey": settings.SUPABASE_SERVICE_ROLE_KEY,
+                "Authorization": f"Bearer {settings.SUPABASE_SERVICE_ROLE_KEY}",
+                "Accept": "application/json",
+            },
+            timeout=httpx.Timeout(settings.SUPABASE_ASYNC_TIMEOUT_SECONDS),
+            http2=False,
+            limits=httpx.Limits(
+                max_connections=settings.SUPABASE_ASYNC_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.SUPABASE_ASYNC_MAX_CONNECTIONS,
+            ),
+        )
+        _async_client = AsyncPostgrestClient(http)
+    return _async_client
+
+
+async def close_async_supabase() -> None:
+    """Tear-down hook for app.main lifespan."""
+    global _async_client
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
+
+
 async def check_supabase_health() -> bool:
     """Check Supabase connection health via the PostgREST root endpoint."""
     try:
@@ -11,10 +11,15 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from supabase import Client
 import logging
 
-from app.database import get_supabase
+from app.database import AsyncPostgrestClient, get_async_supabase, get_supabase
 from jose import JWTError
 
 from app.core.security import decode_token, verify_supabase_token, rate_limiter
+from app.core.user_cache import (
+    cached_user_record,
+    remember_user_record,
+    user_record_generation,
+)
 from app.api.error_response import ErrorCode, auth_error
 from app.config import settings
 
@@ -252,7 +257,7 @@ def _reject_if_password_changed_since_issue(token: str, user_row: dict) -> None:
 async def get_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
     user_id: str = Depends(get_current_user_id),
-    supabase: Client = Depends(get_supabase),
+    supabase: AsyncPostgrestClient = Depends(get_async_supabase),
     request: Request = None,
 ) -> dict:
     """Get current user record from DB.
@@ -260,8 +265,24 @@ async def get_current_user(
     Also enforces password-change token invalidation: a token minted before the account's
     last password change is rejected here. Free to check — the `select("*")` below already
     returns `password_changed_at` (migration 105), so there is no extra round-trip.
+
+    Reads through the ASYNC PostgREST client. This runs on every strict-auth request, and
+    the sync client used to execute inline — blocking the event loop for the whole users
+    round-trip — where the `to_thread` alternative would have made it hold an executor
+    thread instead. Awaiting a pooled socket does neither.
+
+    And usually not at all: the row is reused for a few seconds (app/core/user_cache.py).
+    The password-change check still runs on EVERY request, against the cached row — which
+    is safe because the password-change path evicts that row before it returns.
     """
+    cached = cached_user_record(user_id)
+    if cached is not None:
+        # Same normalisation as the read path below — see the `.strip()` note there.
+        _reject_if_password_changed_since_issue(credentials.credentials.strip(), cached)
+        return cached
+
     try:
+        generation = user_record_generation()
         # limit(1), NOT single(). PostgREST answers `single()` on zero rows with a 406 /
         # PGRST116, which postgrest-py raises as APIError — an ordinary exception that the
         # `except Exception` below turns into a **500 "Error fetching user data"**. The
@@ -269,7 +290,7 @@ async def get_current_user(
         # error: iOS `AppError.isAuthError` covers only unauthorized/tokenExpired/forbidden,
         # so the client keeps a token that can never resolve and retries forever instead of
         # signing the user out. Same idiom already used by get_current_user_or_guest below.
-        result = supabase.table("users").select("*").eq("id", user_id).limit(1).execute()
+        result = await supabase.table("users").select("*").eq("id", user_id).limit(1).execute()
         rows = result.data or []
         if not rows:
             # 401, not 404: the token is valid but names an account that no longer exists
@@ -296,6 +317,7 @@ async def get_current_user(
         # authenticated AND skipped password-change eviction, so a stolen token survived the
         # victim's password reset. Both call sites must normalise identically.
         _reject_if_password_changed_since_issue(credentials.credentials.strip(), rows[0])
+        remember_user_record(rows[0], generation)
         return rows[0]
     except HTTPException:
         raise
@@ -380,6 +402,11 @@ async def get_current_user_or_guest(
             # would serve the guest's balance to a signed-in user and skip their
             # monthly reset. Surface a retryable error instead. (limit(1), not
             # single(), so "no row" is an empty list, not an exception.)
+            cached = cached_user_record(user_id)
+            if cached is not None:
+                _reject_if_password_changed_since_issue(token, cached)
+                return cached
+            generation = user_record_generation()
             try:
                 result = supabase.table("users").select("*").eq("id", user_id).limit(1).execute()
             except Exception as e:
@@ -401,6 +428,7 @@ async def get_current_user_or_guest(
                 # the victim reset their password; only POST /auth/refresh turned the thief away.
                 # Free to check: the select("*") above already returned password_changed_at.
                 _reject_if_password_changed_since_issue(token, rows[0])
+                remember_user_record(rows[0], generation)
                 return rows[0]
             # Valid token but no public.users row (rare — the signup trigger seeds it).
             # Fall through to guest as before rather than 500 a first-launch edge.
@@ -709,7 +737,7 @@ class RateLimitChecker:
         # self-bounds at _MAX_TRACKED with idle-drop + FIFO eviction
         # (core/security.py, pinned by tests/test_rate_limiter_bound.py).
         key = user_id or f"guest:{guest_user_id_for(x_guest_id)}"
-        if not rate_limiter.is_allowed(key, self.max_requests, self.window_seconds):
+        if not await rate_limiter.is_allowed_async(key, self.max_requests, self.window_seconds):
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 detail="Rate limit exceeded. Please try again later.",
@@ -766,7 +794,7 @@ class IdentityRateLimitChecker:
         x_guest_id: Optional[str] = Header(None, alias="X-Guest-Id"),
     ) -> None:
         key = f"{self.bucket}:{identity_key(user, x_guest_id)}"
-        if not rate_limiter.is_allowed(key, self.max_requests, self.window_seconds):
+        if not await rate_limiter.is_allowed_async(key, self.max_requests, self.window_seconds):
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 detail="Rate limit exceeded. Please slow down and try again shortly.",
@@ -805,7 +833,7 @@ class IdentityOnlyRateLimitChecker(IdentityRateLimitChecker):
         x_guest_id: Optional[str] = Header(None, alias="X-Guest-Id"),
     ) -> None:
         key = f"{self.bucket}:{identity_key(user, x_guest_id)}"
-        if not rate_limiter.is_allowed(key, self.max_requests, self.window_seconds):
+        if not await rate_limiter.is_allowed_async(key, self.max_requests, self.window_seconds):
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 detail="Too many requests. Please slow down.",
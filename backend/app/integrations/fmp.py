@@ -8,12 +8,22 @@ NOTE: FMP deprecated all /api/v3 ("legacy") endpoints after August 31 2025.
 """
 
 import asyncio
+import copy
+import heapq
 import httpx
+import itertools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+from typing import Iterator, Optional, List, Dict, Any
+from urllib.parse import urlencode
 import logging
 
 from app.config import settings
+from app.core.cache import CacheRegion, register_region
 from app.log_redaction import redact_secrets
 from app.utils.period_labels import latest_filed_13f_quarter
 
@@ -32,6 +42,125 @@ def _normalize_profile(profile: Dict[str, Any]) -> Dict[str, Any]:
     return profile
 
 
+# ── Response reuse policy ───────────────────────────────────────────
+#
+# One ticker report (`TickerReportDataCollector._fetch_all` + `_fetch_dependent`) and the
+# detail screens around it ask FMP for the same profile, quote and statements from half a
+# dozen services that never see each other's results. `_make_request` therefore dedups at
+# the one point they all share:
+#
+#   * single-flight — an identical endpoint+params already in flight is JOINED, always,
+#     for every endpoint (a concurrent duplicate can only ever get the same answer);
+#   * a short response cache — only for the endpoints listed here, each for as long as its
+#     data actually holds still. Anything unlisted is coalesced but never cached.
+#
+# Statements change only when a 10-Q/10-K lands. The client cannot know the next filing
+# date, so "until next filing" is approximated by half a day: long enough to serve every
+# report and detail screen of a session from one fetch, short enough that filing day
+# picks the new numbers up the same day.
+_QUOTE_TTL = 5.0
+_INTRADAY_TTL = 30.0
+_PRICE_DERIVED_TTL = 300.0     # TTM ratios/metrics move with the price
+_NEWS_TTL = 60.0
+_REFERENCE_TTL = 3600.0        # profile, peers, float, ETF composition
+_STATEMENT_TTL = 12 * 3600.0   # see "until next filing" above
+_QUARTERLY_TTL = 6 * 3600.0    # 13F-derived ownership, refreshed quarterly upstream
+
+_RESPONSE_TTL: Dict[str, float] = {
+    "quote": _QUOTE_TTL,
+    "batch-quote": _QUOTE_TTL,
+    "stock-price-change": _QUOTE_TTL,
+    "historical-price-eod/full": _PRICE_DERIVED_TTL,
+    "ratios-ttm": _PRICE_DERIVED_TTL,
+    "key-metrics-ttm": _PRICE_DERIVED_TTL,
+    "historical-market-capitalization": _PRICE_DERIVED_TTL,
+    "profile": _REFERENCE_TTL,
+    "company-outlook": _REFERENCE_TTL,
+    "stock-peers": _REFERENCE_TTL,
+    "shares-float": _REFERENCE_TTL,
+    "etf/info": _REFERENCE_TTL,
+    "etf/holdings": _REFERENCE_TTL,
+    "etf/sector-weightings": _REFERENCE_TTL,
+    "price-target-consensus": _REFERENCE_TTL,
+    "grades": _REFERENCE_TTL,
+    "income-statement": _STATEMENT_TTL,
+    "balance-sheet-statement": _STATEMENT_TTL,
+    "cash-flow-statement": _STATEMENT_TTL,
+    "key-metrics": _STATEMENT_TTL,
+    "ratios": _STATEMENT_TTL,
+    "financial-growth": _STATEMENT_TTL,
+    "income-statement-growth": _STATEMENT_TTL,
+    "revenue-product-segmentation": _STATEMENT_TTL,
+    "revenue-geographic-segmentation": _STATEMENT_TTL,
+    "analyst-estimates": _STATEMENT_TTL,
+    "dividends": _STATEMENT_TTL,
+    "splits": _STATEMENT_TTL,
+    "earnings": _STATEMENT_TTL,
+}
+_RESPONSE_TTL_PREFIXES = (
+    ("historical-chart/", _INTRADAY_TTL),
+    ("news/", _NEWS_TTL),
+    ("institutional-ownership/", _QUARTERLY_TTL),
+)
+
+_RESPONSE_CACHE_MAX_ENTRIES = 4096
+
+
+def _response_ttl(endpoint: str) -> float:
+    """Seconds a response for ``endpoint`` may be reused; 0 = coalesce only."""
+    ttl = _RESPONSE_TTL.get(endpoint)
+    if ttl is not None:
+        return ttl
+    for prefix, prefix_ttl in _RESPONSE_TTL_PREFIXES:
+        if endpoint.startswith(prefix):
+            return prefix_ttl
+    return 0.0
+
+
+def _request_key(endpoint: str, params: Optional[Dict[str, Any]]) -> str:
+    items = sorted(
+        (str(k), str(v)) for k, v in (params or {}).items() if k != "apikey"
+    )
+    return f"{endpoint}?{urlencode(items)}"
+
+
+# What a reader may mutate decides what it is handed. The price series are the long
+# payloads this cache exists for (`historical-price-eod/full` is years of bars), and their
+# callers re-sort or reverse the row LIST in place (chart_helper, crypto_service,
+# sentiment_service, stock_overview_service, the home sparkline) but never write into a
+# row — so each gets its own list over the SHARED row dicts, a pointer copy per bar rather
+# than a deep walk of every one. Every other endpoint is deep-copied: `profile` rows are
+# normalised in place (`_normalize_profile`), quote rows are patched by their readers, and
+# the rest are small enough that auditing every caller buys nothing.
+_ROW_SHARED_PREFIXES = (
+    "historical-price-eod/",
+    "historical-chart/",
+    "historical-market-capitalization",
+)
+
+
+def _private_copy(endpoint: str, data: Any) -> Any:
+    """A copy of a shared response that one caller may mutate as its endpoint's callers do."""
+    if endpoint.startswith(_ROW_SHARED_PREFIXES):
+        if isinstance(data, list):
+            return list(data)
+        if isinstance(data, dict):
+            # The legacy `{"historical": [...]}` shape: the list inside is what gets sorted.
+            out = dict(data)
+            if isinstance(out.get("historical"), list):
+                out["historical"] = list(out["historical"])
+            return out
+    return copy.deepcopy(data)
+
+
+def _cacheable(data: Any) -> bool:
+    # Degraded is never cached: an empty result may be a plan gap or a blip, and FMP
+    # answers some failures with a 200 carrying `{"Error Message": ...}`.
+    if not data:
+        return False
+    return not (isinstance(data, dict) and "Error Message" in data)
+
+
 class FMPException(Exception):
     """Base class for typed FMP integration errors."""
 
@@ -95,6 +224,203 @@ class FMPPartialPageException(FMPUnavailableException):
         self.partial = partial if partial is not None else []
 
 
+# ── Rate governor ───────────────────────────────────────────────────
+#
+# FMP meters requests per API key per minute, and before this the client's only defence was
+# the connection pool (20 sockets) plus a scatter of per-service semaphores — none of which
+# know the quota, and none of which know a background sweep from a user waiting on a screen.
+# At market open the pre-warmers, the benchmark recompute and whale hydration would burn the
+# minute and the user's detail screen got the 429.
+#
+# `FMPRateGovernor` is a token bucket refilled at FMP_REQUESTS_PER_MINUTE that every attempt
+# in `_make_request_impl` takes a token from first:
+#
+#   * priority — a waiting INTERACTIVE request is always granted before a BACKGROUND one,
+#     and BACKGROUND may not dip into the last FMP_BACKGROUND_RESERVE_FRACTION of the bucket,
+#     so a sweep that starts first still leaves headroom for the next tap;
+#   * Retry-After — a 429 pauses the whole bucket for the advertised delay (or a short
+#     backoff when FMP omits it, which /stable usually does) and the request is re-queued
+#     behind that pause instead of failing;
+#   * bounded queueing — a request that has waited FMP_QUEUE_MAX_WAIT_SECONDS gives up with
+#     the same FMPRateLimitException a 429 used to raise, so callers' degrade paths still run.
+#
+# Priority travels in a ContextVar, so it follows a job into every task it spawns: the
+# background jobs (app/jobs.py) are started under BACKGROUND, request handlers default to
+# INTERACTIVE. Per process — with N workers, give each 1/N of the plan.
+class FMPPriority(IntEnum):
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+_fmp_priority: ContextVar[int] = ContextVar("fmp_priority", default=FMPPriority.INTERACTIVE)
+
+
+def set_fmp_priority(priority: FMPPriority) -> None:
+    """Set the priority for this context and everything it spawns from here on."""
+    _fmp_priority.set(priority)
+
+
+@contextmanager
+def fmp_priority(priority: FMPPriority) -> Iterator[None]:
+    """Run a block (and the tasks it creates) at ``priority``."""
+    token = _fmp_priority.set(priority)
+    try:
+        yield
+    finally:
+        _fmp_priority.reset(token)
+
+
+# The bucket holds this many seconds of quota, so a burst after an idle spell is allowed
+# without letting a whole minute's budget go out in one instant.
+_BURST_SECONDS = 10.0
+# Pause after a 429 that carried no Retry-After: 2s, then 4s.
+_RATE_LIMIT_BASE_PAUSE = 2.0
+_RATE_LIMIT_MAX_PAUSE = 60.0
+
+
+def _retry_after_seconds(header: Optional[str], attempt: int) -> float:
+    """Seconds to hold off after a 429, from ``Retry-After`` (delta or HTTP-date)."""
+    if header:
+        try:
+            return min(max(float(header), 0.0), _RATE_LIMIT_MAX_PAUSE)
+        except ValueError:
+            pass
+        try:
+            when = parsedate_to_datetime(header)
+            delta = (when - datetime.now(timezone.utc)).total_seconds()
+            return min(max(delta, 0.0), _RATE_LIMIT_MAX_PAUSE)
+        except (TypeError, ValueError):
+            pass
+    return min(_RATE_LIMIT_BASE_PAUSE * (2 ** attempt), _RATE_LIMIT_MAX_PAUSE)
+
+
+class FMPRateGovernor:
+    """Priority token bucket in front of every FMP request. See the block comment above."""
+
+    def __init__(
+        self,
+        per_minute: float,
+        background_reserve: float = 0.25,
+        max_wait: float = 30.0,
+    ):
+        self.rate = max(float(per_minute), 1.0) / 60.0
+        self.capacity = max(self.rate * _BURST_SECONDS, 1.0)
+        self.reserve = self.capacity * min(max(background_reserve, 0.0), 0.9)
+        self.max_wait = max_wait
+        self._tokens = self.capacity
+        self._stamp = time.monotonic()
+        self._paused_until = 0.0
+        self._waiters: List[list] = []          # heap of [priority, seq, future]
+        self._seq = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.granted = {p.name.lower(): 0 for p in FMPPriority}
+        self.queued = {p.name.lower(): 0 for p in FMPPriority}
+        self.rate_limited = 0
+        self.timeouts = 0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.rate)
+        self._stamp = now
+
+    def _need(self, priority: int) -> float:
+        return 1.0 + (self.reserve if priority >= FMPPriority.BACKGROUND else 0.0)
+
+    def _bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        # A singleton outlives event loops (tests, scripts): waiters and the timer belong to
+        # the loop that created them, so a new loop starts from a clean queue.
+        if self._loop is not loop:
+            self._loop = loop
+            self._waiters = []
+            self._timer = None
+
+    async def acquire(self, priority: Optional[int] = None) -> None:
+        """Wait for a token at ``priority`` (default: the context's)."""
+        if priority is None:
+            priority = _fmp_priority.get()
+        label = FMPPriority(priority).name.lower()
+        loop = asyncio.get_running_loop()
+        self._bind(loop)
+        now = time.monotonic()
+        self._refill(now)
+        if not self._waiters and now >= self._paused_until and self._tokens >= self._need(priority):
+            self._tokens -= 1.0
+            self.granted[label] += 1
+            return
+
+        fut: asyncio.Future = loop.create_future()
+        heapq.heappush(self._waiters, [priority, next(self._seq), fut])
+        self.queued[label] += 1
+        self._dispatch()
+        try:
+            await asyncio.wait_for(fut, timeout=self.max_wait)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            logger.warning(
+                "FMP governor: %s request waited %.0fs for quota — giving up", label, self.max_wait
+            )
+            raise FMPRateLimitException(
+                f"FMP request queue wait exceeded {self.max_wait:.0f}s"
+            ) from None
+        self.granted[label] += 1
+
+    def pause(self, seconds: float) -> None:
+        """Hold every request for ``seconds`` (a 429 told us the quota is gone)."""
+        self.rate_limited += 1
+        now = time.monotonic()
+        self._refill(now)
+        self._paused_until = max(self._paused_until, now + seconds)
+        self._tokens = min(self._tokens, 0.0)
+        if self._loop is not None and not self._loop.is_closed():
+            self._dispatch()
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Grant queued waiters in priority order, then arm ONE timer for the next grant."""
+        now = time.monotonic()
+        self._refill(now)
+        wait = 0.0
+        while self._waiters:
+            priority, _, fut = self._waiters[0]
+            if fut.done():  # cancelled or timed out while queued
+                heapq.heappop(self._waiters)
+                continue
+            if now < self._paused_until:
+                wait = self._paused_until - now
+                break
+            need = self._need(priority)
+            if self._tokens < need:
+                wait = (need - self._tokens) / self.rate
+                break
+            heapq.heappop(self._waiters)
+            self._tokens -= 1.0
+            fut.set_result(None)
+        if not self._waiters:
+            return
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = self._loop.call_later(max(wait, 0.001), self._on_timer)
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        self._refill(now)
+        return {
+            "per_minute": round(self.rate * 60),
+            "tokens": round(self._tokens, 1),
+            "capacity": round(self.capacity, 1),
+            "background_reserve": round(self.reserve, 1),
+            "waiting": sum(1 for w in self._waiters if not w[2].done()),
+            "paused_seconds": round(max(self._paused_until - now, 0.0), 1),
+            "granted": dict(self.granted),
+            "queued": dict(self.queued),
+            "rate_limited": self.rate_limited,
+            "queue_timeouts": self.timeouts,
+        }
+
+
 class FMPClient:
     """
     Client for Financial Modeling Prep API (stable endpoints).
@@ -104,12 +430,28 @@ class FMPClient:
     efficient connection reuse across concurrent requests.
     """
 
-    def __init__(self):
-        """Initialize FMP client with API key from settings."""
+    def __init__(self, response_cache: Optional[CacheRegion] = None):
+        """Initialize FMP client with API key from settings.
+
+        ``response_cache`` enables the per-endpoint response reuse (see `_RESPONSE_TTL`).
+        `get_fmp_client()` passes the shared ``fmp_responses`` region; a bare
+        ``FMPClient()`` (tests, scripts) still coalesces concurrent duplicates but caches
+        nothing, so it always sees the upstream it was handed.
+        """
         self.base_url = settings.FMP_BASE_URL
         self.api_key = settings.FMP_API_KEY
         self.timeout = settings.HTTP_TIMEOUT_SECONDS
         self._client: Optional[httpx.AsyncClient] = None
+        self._responses = response_cache
+        self._governor = FMPRateGovernor(
+            settings.FMP_REQUESTS_PER_MINUTE,
+            background_reserve=settings.FMP_BACKGROUND_RESERVE_FRACTION,
+            max_wait=settings.FMP_QUEUE_MAX_WAIT_SECONDS,
+        )
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._joined: set = set()
+        # Per-endpoint counters behind `dedup_stats()`: calls, and how each was served.
+        self._endpoint_counts: Dict[str, Dict[str, int]] = {}
         # Monotonic count of requests that failed after retries. EVERY public method here
         # swallows its exception and returns [] / {}, which makes "upstream returned
         # nothing" indistinguishable from "upstream is down" at the call site — a 429, a
@@ -143,7 +485,9 @@ class FMPClient:
     # single blip must NOT fail the request or page on-call. We retry with
     # exponential backoff, then degrade to a typed FMPUnavailableException
     # logged at WARNING (handled/degraded) — keeping it OUT of high-priority
-    # Sentry. Real config errors (401) and quota (429) are NOT retried.
+    # Sentry. Real config errors (401) are NOT retried. A quota 429 is re-queued behind
+    # the governor's Retry-After pause within the same attempt budget, and only raises
+    # FMPRateLimitException once that budget is spent.
     _RETRYABLE_STATUS = frozenset({500, 502, 503, 504})
     _MAX_RETRIES = 2            # 3 attempts total
     _RETRY_BASE_DELAY = 0.5     # seconds; exponential backoff (0.5s, 1.0s)
@@ -153,17 +497,86 @@ class FMPClient:
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
     ) -> Any:
-        """Count failures, then delegate. See `_make_request_impl` for the contract.
+        """Serve from the response cache, join an identical in-flight call, or fetch.
 
-        Thin on purpose: this is the single point every public method funnels through,
-        so it is the only place a reliable "upstream failed" signal can be taken without
-        editing the ~20 methods that each swallow their own exception.
+        This is the single point every public method funnels through, which is why both the
+        failure count and the dedup live here: it is the only place a reliable "upstream
+        failed" signal can be taken without editing the ~20 methods that each swallow their
+        own exception, and the only place two services asking for the same thing meet.
+
+        Callers get their OWN copy of a shared response — several of them normalise rows in
+        place (`_normalize_profile` among them), which must not leak into the next reader.
+        How deep that copy goes is per endpoint (see `_private_copy`). See
+        `_make_request_impl` for the upstream contract.
         """
+        key = _request_key(endpoint, params)
+        ttl = _response_ttl(endpoint)
+        counts = self._endpoint_counts.get(endpoint)
+        if counts is None:
+            counts = self._endpoint_counts[endpoint] = {
+                "calls": 0, "cache_hits": 0, "coalesced": 0, "fetched": 0,
+            }
+        counts["calls"] += 1
+
+        if ttl and self._responses is not None:
+            cached = self._responses.lookup(key, ttl)
+            if cached is not None:
+                counts["cache_hits"] += 1
+                return _private_copy(endpoint, cached)
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            counts["coalesced"] += 1
+            self._joined.add(key)
+            return _private_copy(endpoint, await asyncio.shield(inflight))
+
+        loop = asyncio.get_running_loop()
+        fut: asyncio.Future = loop.create_future()
+        self._inflight[key] = fut
         try:
-            return await self._make_request_impl(endpoint, params)
-        except Exception:
-            self.request_failures += 1
+            counts["fetched"] += 1
+            try:
+                data = await self._make_request_impl(endpoint, params)
+            except Exception:
+                self.request_failures += 1
+                raise
+            store = ttl and self._responses is not None and _cacheable(data)
+            # The cache and any joiners get a private snapshot, never the object the leader's
+            # caller is about to mutate — joiners only wake after that caller has run on.
+            shared = _private_copy(endpoint, data) if store or key in self._joined else data
+            if store:
+                self._responses.store(key, shared, ttl)
+            if not fut.done():
+                fut.set_result(shared)
+            return data
+        except BaseException as e:
+            if not fut.done():
+                if isinstance(e, asyncio.CancelledError):
+                    fut.set_exception(RuntimeError(f"FMP {endpoint} fetch was cancelled"))
+                else:
+                    fut.set_exception(e)
+                fut.exception()  # retrieved: an unjoined failure must not log at GC
             raise
+        finally:
+            if self._inflight.get(key) is fut:
+                self._inflight.pop(key, None)
+                self._joined.discard(key)
+
+    def dedup_stats(self) -> Dict[str, Any]:
+        """Per-endpoint call counts split by how each call was served.
+
+        ``cache_hits`` + ``coalesced`` are upstream calls saved; ``fetched`` went to FMP.
+        Per process, never reset.
+        """
+        endpoints = {name: dict(c) for name, c in sorted(self._endpoint_counts.items())}
+        totals = {"calls": 0, "cache_hits": 0, "coalesced": 0, "fetched": 0}
+        for c in endpoints.values():
+            for field in totals:
+                totals[field] += c[field]
+        saved = totals["cache_hits"] + totals["coalesced"]
+        totals["saved_rate"] = round(saved / totals["calls"], 4) if totals["calls"] else None
+        totals["inflight"] = len(self._inflight)
+        return {"totals": totals, "endpoints": endpoints, "governor": self._governor.stats()}
 
     async def _make_request_impl(
         self,
@@ -178,6 +591,9 @@ class FMPClient:
         the typed FMPUnavailableException (logged at WARNING, not ERROR) so
         callers degrade gracefully and transient FMP blips don't page on-call.
 
+        Every attempt first takes a token from the rate governor (see
+        `FMPRateGovernor`), at the priority of the calling context.
+
         Args:
             endpoint: API endpoint path (relative to base_url)
             params: Optional query parameters
@@ -187,7 +603,8 @@ class FMPClient:
 
         Raises:
             FMPAuthException:        401 (bad/expired FMP_API_KEY)
-            FMPRateLimitException:   429 (quota / burst limit)
+            FMPRateLimitException:   429 still returned on the last attempt, or the
+                                     governor queue wait ran out
             FMPUnavailableException: transient 5xx / network error after retries
             httpx.HTTPStatusError:   other non-retryable HTTP status (e.g. 400)
         """
@@ -199,6 +616,7 @@ class FMPClient:
 
         for attempt in range(self._MAX_RETRIES + 1):
             try:
+                await self._governor.acquire()
                 client = await self._get_client()
                 response = await client.get(url, params=params)
 
@@ -239,6 +657,11 @@ class FMPClient:
                         retry_after or "not provided",
                         limit if limit is not None else "not provided",
                     )
+                    if attempt < self._MAX_RETRIES:
+                        # Queue, don't fail: pause the WHOLE bucket (every other caller is
+                        # about to hit the same wall) and take a fresh token after it.
+                        self._governor.pause(_retry_after_seconds(retry_after, attempt))
+                        continue
                     raise FMPRateLimitException(
                         f"FMP rate limit hit on {endpoint}",
                         retry_after=retry_after,
@@ -2086,7 +2509,13 @@ def get_fmp_client() -> FMPClient:
     """Get or create global FMP client instance."""
     global _fmp_client
     if _fmp_client is None:
-        _fmp_client = FMPClient()
+        _fmp_client = FMPClient(
+            response_cache=register_region(
+                "fmp_responses",
+                ttl=_REFERENCE_TTL,
+                max_entries=_RESPONSE_CACHE_MAX_ENTRIES,
+            )
+        )
     return _fmp_client
 
 
@@ -235,6 +235,9 @@ class NarrativeJob:
     # legitimately optional. When True, an empty/whitespace response
     # becomes None instead of the fallback string.
     nullable: bool = False
+    # Top-level report key `apply` writes under, so a caller streaming the
+    # report can push the updated section the moment this job lands.
+    section: Optional[str] = None
 
 
 # When `evidence` is hoisted into a Gemini CachedContent, each per-field
@@ -249,10 +252,15 @@ async def run_narrative_jobs(
     gemini: GeminiClient,
     persona: PersonaConfig,
     evidence: str = "",
+    on_applied: Optional[Callable[[NarrativeJob], None]] = None,
 ) -> None:
     """Execute every job in parallel. Each job's result lands in-place
     via `apply`; failures use the job's `fallback_value`.
 
+    `on_applied` (sync, optional) fires once per job right after its value —
+    real or fallback — has been applied; the streaming report endpoint uses it
+    to push each narrative as it completes instead of after the slowest one.
+
     When context caching is enabled AND a cache is created successfully, the
     shared `evidence` + persona system prompt are uploaded ONCE and every call
     bills only its per-field instruction plus the cached prefix (at the
@@ -301,14 +309,23 @@ async def run_narrative_jobs(
             cleaned = _post_process(raw, word_cap=job.word_cap)
             if not cleaned:
                 job.apply(None if job.nullable else job.fallback_value)
-                return
-            job.apply(cleaned)
+            else:
+                job.apply(cleaned)
         except Exception as e:
             logger.warning(
                 f"Stage-B narrative {job.label} failed: "
                 f"{type(e).__name__}: {e}"
             )
             job.apply(job.fallback_value)
+        if on_applied is not None:
+            try:
+                on_applied(job)
+            except Exception as e:
+                # A progress listener must never cost the report a narrative.
+                logger.warning(
+                    f"Stage-B on_applied for {job.label} failed: "
+                    f"{type(e).__name__}: {e}"
+                )
 
     try:
         await asyncio.gather(*(_one(j) for j in jobs))
@@ -1391,6 +1408,7 @@ def build_narrative_jobs(
     # ── executive_summary_text (general overview; bullets removed) ────
     jobs.append(NarrativeJob(
         label="executive_summary_text",
+        section="executive_summary_text",
         prompt=_executive_summary_text_prompt(persona, evidence, shell),
         word_cap=80,
         apply=lambda v: shell.__setitem__("executive_summary_text", v),
@@ -1402,6 +1420,7 @@ def build_narrative_jobs(
         oa = shell["overall_assessment"]
         jobs.append(NarrativeJob(
             label="overall_assessment_text",
+            section="overall_assessment",
             prompt=_overall_assessment_text_prompt(persona, evidence, shell),
             word_cap=90,
             apply=_setter_for_dict_key(oa, "text"),
@@ -1413,6 +1432,7 @@ def build_narrative_jobs(
     if isinstance(moat, dict):
         jobs.append(NarrativeJob(
             label="moat_durability_note",
+            section="moat_competition",
             prompt=_moat_durability_note_prompt(persona, evidence, shell),
             word_cap=70,
             apply=_setter_for_dict_key(moat, "durability_note"),
@@ -1420,6 +1440,7 @@ def build_narrative_jobs(
         ))
         jobs.append(NarrativeJob(
             label="moat_competitive_insight",
+            section="moat_competition",
             prompt=_moat_competitive_insight_prompt(persona, evidence, shell),
             word_cap=28,
             apply=_setter_for_dict_key(moat, "competitive_insight"),
@@ -1433,6 +1454,7 @@ def build_narrative_jobs(
     if isinstance(macro, dict):
         jobs.append(NarrativeJob(
             label="macro_intelligence_brief",
+            section="macro_data",
             prompt=_macro_intelligence_brief_prompt(persona, evidence, shell),
             word_cap=78,
             apply=_setter_for_dict_key(macro, "intelligence_brief"),
@@ -1444,6 +1466,7 @@ def build_narrative_jobs(
     if isinstance(pa, dict):
         jobs.append(NarrativeJob(
             label="price_action_narrative",
+            section="price_action",
             # Headroom over the prompt's "under 60 words / 3 sentences" so a
             # full 3-sentence Insight is never chopped mid-thought with "…".
             # The cap is a runaway safety net, not the target length.
@@ -1458,6 +1481,7 @@ def build_narrative_jobs(
     if isinstance(re_section, dict) and (re_section.get("segments") or []):
         jobs.append(NarrativeJob(
             label="revenue_engine_analysis_note",
+            section="revenue_engine",
             prompt=_revenue_engine_analysis_note_prompt(persona, evidence, shell),
             word_cap=22,
             apply=_setter_for_dict_key(re_section, "analysis_note"),
@@ -1470,6 +1494,7 @@ def build_narrative_jobs(
     if isinstance(rf, dict):
         jobs.append(NarrativeJob(
             label="revenue_forecast_insight",
+            section="revenue_forecast",
             prompt=_revenue_forecast_insight_prompt(persona, evidence, shell),
             word_cap=90,
             apply=_setter_for_dict_key(rf, "insight"),
@@ -1481,6 +1506,7 @@ def build_narrative_jobs(
     if isinstance(hms, dict):
         jobs.append(NarrativeJob(
             label="hidden_market_signals_insight",
+            section="hidden_market_signals",
             prompt=_hidden_market_signals_insight_prompt(persona, evidence, shell),
             # Headroom over the prompt's "2 to 4 sentences" target so the full
             # insight is never chopped mid-thought with "…". 24 → 90 still clipped
@@ -1505,6 +1531,7 @@ def build_narrative_jobs(
     if isinstance(km, dict):
         jobs.append(NarrativeJob(
             label="key_management_insight",
+            section="key_management",
             prompt=_key_management_insight_prompt(persona, evidence, shell),
             # 2-3 sentence synthesis (ownership + insider flow + capital
             # allocation), up from the old single-sentence (34).
@@ -1527,6 +1554,8 @@ def build_narrative_jobs(
     if isinstance(iv, dict):
         jobs.append(NarrativeJob(
             label="insider_key_insight",
+            # Internal scoring layer, stripped from every client response.
+            section="_scoring_inputs",
             prompt=_insider_key_insight_prompt(persona, evidence, shell),
             word_cap=17,
             apply=_setter_for_dict_key(iv, "key_insight"),
@@ -1551,6 +1580,7 @@ def build_narrative_jobs(
             continue
         jobs.append(NarrativeJob(
             label=f"critical_factor_description_{i}",
+            section="critical_factors",
             prompt=_critical_factor_description_prompt(persona, evidence, factor),
             word_cap=26,
             apply=_setter_for_dict_key(factor, "description"),
@@ -1558,6 +1588,7 @@ def build_narrative_jobs(
         ))
         jobs.append(NarrativeJob(
             label=f"critical_factor_watch_{i}",
+            section="critical_factors",
             prompt=_critical_factor_watch_prompt(persona, evidence, factor),
             word_cap=28,
             apply=_setter_with_null(factor, "watch"),
@@ -1570,6 +1601,7 @@ def build_narrative_jobs(
     if isinstance(ws, dict):
         jobs.append(NarrativeJob(
             label="wall_street_insight",
+            section="wall_street_consensus",
             prompt=_wall_street_insight_prompt(persona, evidence, shell),
             word_cap=45,
             apply=_setter_with_null(ws, "wall_street_insight"),
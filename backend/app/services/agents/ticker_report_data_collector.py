@@ -35,14 +35,13 @@ Honest-placeholder policy:
 from __future__ import annotations
 
 import asyncio
-import bisect
 import copy
 import json
 import logging
 import math
 import re
 import time
-from dataclasses import dataclass, field, replace
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta, timezone
 
 # Volatility-relative price-move math now lives in ONE shared leaf module
@@ -53,16 +52,21 @@ from app.services.price_volatility import (  # noqa: E402  (import-after-import
     _BIG_MOVE_Z,
     _DEFAULT_WINDOW,
     _EVAL_WINDOWS,
+    _bar_indices,
     _compute_price_volatility,
     _daily_returns,
+    _day_axis,
     _std_dev_pop,
     _tier_for_z,
     _z_score_for_window,
 )
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
 
 from app.integrations.fmp import FMPClient, get_fmp_client
+from app.services.price_history_store import fetch_daily_history
 from app.utils.period_labels import quarterly_period_label
 from app.schemas.analyst import (
     AnalystAnalysisResponse,
@@ -438,11 +442,13 @@ class TickerReportDataCollector:
         # dicts) could bleed across concurrent reports. A deep copy gives this
         # request its own object graph; cost is sub-ms vs. the Gemini Stage A/B
         # seconds that follow.
-        return replace(
-            copy.deepcopy(base),
-            persona_key=persona_key,
-            meta={**(base.meta or {}), "agent": _AGENT_MAP.get(persona_key, "buffett")},
-        )
+        # Stamped by assignment, not `dataclasses.replace`: replace reads every
+        # field, which would decode the whole of a lazily-decoded cached base
+        # (ticker_data_cache binary rows) that this request may never touch.
+        out = copy.deepcopy(base)
+        out.persona_key = persona_key
+        out.meta = {**(base.meta or {}), "agent": _AGENT_MAP.get(persona_key, "buffett")}
+        return out
 
     async def _collect_fresh(self, ticker: str) -> CollectedTickerData:
         """The actual persona-NEUTRAL collection — FMP fan-out + deterministic
@@ -663,7 +669,9 @@ class TickerReportDataCollector:
             # the left and forward estimates on the right, which lets the
             # window helper pick "current = first FY with date >= today".
             ("estimates", self.fmp.get_analyst_estimates(ticker, "annual", 10), []),
-            ("historical", self.fmp.get_historical_prices(ticker, from_date=hist_from), {}),
+            # Served from the local price store when enabled (FMP-shaped, newest-first):
+            # six years of bars re-read from disk, with only the trailing days fetched.
+            ("historical", fetch_daily_history(self.fmp, ticker, from_date=hist_from), {}),
             ("news", self.fmp.get_stock_news(ticker, 20), []),
             ("insider_trades", self.fmp.get_insider_trading(ticker, since_date=insider_since), []),
             ("insider_roster", self.fmp.get_insider_roster(ticker), []),
@@ -3462,7 +3470,7 @@ async def refresh_wall_street_consensus_block(
             fmp.get_stock_price_quote(ticker),
             analyst_service.get_analysis(ticker),
             holders_service.get_holders(ticker),
-            fmp.get_historical_prices(ticker),
+            fetch_daily_history(fmp, ticker),
             return_exceptions=True,
         )
 
@@ -5088,7 +5096,7 @@ def _price_change_at_index(
 
 def _index_for_date(
     target: date, today: date, recent_prices: List[float],
-    recent_price_dates: Optional[List[date]] = None,
+    recent_price_dates: Optional[Sequence[date]] = None,
 ) -> int:
     """Map a calendar date to a chart-array index.
 
@@ -5105,21 +5113,48 @@ def _index_for_date(
 
     When the parallel date series is available we binary-search it for the last bar
     at or before `target`, which is exact. `recent_price_dates` is built alongside
-    `recent_prices` in `_compute_metrics` and is chronological, so `bisect` applies
-    directly (the same lookup this module already does for the chart's minimum span).
+    `recent_prices` in `_compute_metrics` and is chronological, so a binary search
+    applies directly (the same lookup this module already does for the chart's minimum
+    span). The search itself is `price_volatility._bar_indices`, vectorized.
     The calendar arithmetic stays as the fallback for callers that have no dates
     (and for the legacy test path), and both clamp to the array bounds.
     """
-    if recent_price_dates and len(recent_price_dates) == len(recent_prices):
-        return max(
-            0,
-            min(
-                len(recent_prices) - 1,
-                bisect.bisect_right(recent_price_dates, target) - 1,
-            ),
-        )
-    days_ago = (today - target).days
-    return max(0, min(len(recent_prices) - 1, len(recent_prices) - days_ago - 1))
+    return _indices_for_dates([target], today, recent_prices, recent_price_dates)[0]
+
+
+def _aligned_dates(
+    recent_prices: List[float], recent_price_dates: Optional[Sequence[date]],
+) -> bool:
+    """True when the date series is present and parallel to the price series.
+    (``len`` rather than truthiness — it may be a ``datetime64`` array.)"""
+    return (
+        recent_price_dates is not None
+        and len(recent_price_dates) > 0
+        and len(recent_price_dates) == len(recent_prices)
+    )
+
+
+def _indices_for_dates(
+    targets: Sequence[date], today: date, recent_prices: List[float],
+    recent_price_dates: Optional[Sequence[date]] = None,
+) -> List[int]:
+    """:func:`_index_for_date` for many targets at once.
+
+    One ``searchsorted`` over the bar dates for all targets instead of a bisect
+    per target — the news scan maps every in-window headline in one call, and
+    `_build_price_action` converts the date series to a ``datetime64`` axis
+    once and passes that, so no call re-converts it. Same clamping as the
+    scalar function, same calendar-arithmetic fallback without dates.
+    """
+    if not len(targets) or not recent_prices:
+        return [0] * len(targets)
+    last = len(recent_prices) - 1
+    if _aligned_dates(recent_prices, recent_price_dates):
+        idx = _bar_indices(targets, recent_price_dates)
+    else:
+        days_ago = (_day_axis([today]) - _day_axis(targets)).astype(np.int64)
+        idx = last - days_ago
+    return np.clip(idx, 0, last).tolist()
 
 
 def _detect_news_catalysts(
@@ -5127,7 +5162,7 @@ def _detect_news_catalysts(
     recent_prices: List[float],
     today: date,
     window_start: date,
-    recent_price_dates: Optional[List[date]] = None,
+    recent_price_dates: Optional[Sequence[date]] = None,
 ) -> List[Dict[str, Any]]:
     """Scan FMP news within the chart window and return scored candidates.
 
@@ -5141,7 +5176,7 @@ def _detect_news_catalysts(
     """
     if not news or not recent_prices:
         return []
-    candidates: List[Dict[str, Any]] = []
+    matched: List[Tuple[str, date, str, Dict[str, Any]]] = []
     for item in news:
         title = item.get("title") or ""
         text = item.get("text") or ""
@@ -5155,7 +5190,13 @@ def _detect_news_catalysts(
             continue
         if not (window_start <= d <= today):
             continue
-        idx = _index_for_date(d, today, recent_prices, recent_price_dates)
+        matched.append((tag, d, title, item))
+    # Map every matched headline to its bar in one vectorized lookup.
+    indices = _indices_for_dates(
+        [d for _, d, _, _ in matched], today, recent_prices, recent_price_dates,
+    )
+    candidates: List[Dict[str, Any]] = []
+    for (tag, d, title, item), idx in zip(matched, indices):
         move = _price_change_at_index(recent_prices, idx)
         candidates.append({
             "tag": tag,
@@ -5232,9 +5273,15 @@ def _build_price_action(
         return _empty_price_action(current_price)
 
     today = datetime.now(timezone.utc).date()
+    # One datetime64 axis for every date→bar lookup below (σ windows, earnings,
+    # news, chart span) instead of re-searching the list of dates per lookup.
+    price_axis = (
+        _day_axis(recent_price_dates)
+        if _aligned_dates(recent_prices, recent_price_dates) else None
+    )
 
     # ── Volatility & dynamic window selection ─────────────────────────
-    vol = _compute_price_volatility(recent_prices, recent_price_dates)
+    vol = _compute_price_volatility(recent_prices, price_axis)
     sigma_daily = vol["sigma_daily"]
     chosen_window = vol["chosen_window"]
     chosen_ref_idx = vol["chosen_ref_idx"]
@@ -5283,7 +5330,7 @@ def _build_price_action(
                     continue
                 if not (scan_start <= d <= today):
                     continue
-                idx = _index_for_date(d, today, recent_prices, recent_price_dates)
+                idx = _index_for_date(d, today, recent_prices, price_axis)
                 change = _price_change_at_index(recent_prices, idx)
                 if change > 3:
                     tag_e = "Earnings Beat"
@@ -5301,7 +5348,7 @@ def _build_price_action(
                 break
 
         news_candidates = _detect_news_catalysts(
-            news or [], recent_prices, today, scan_start, recent_price_dates,
+            news or [], recent_prices, today, scan_start, price_axis,
         )
 
         # Priority: largest absolute move wins. Ties → earnings (higher
@@ -5371,9 +5418,9 @@ def _build_price_action(
     # the DETECTION window (change_pct/window_label/σ/tier above) is unchanged.
     # Using min(detect_idx, min_chart_idx) takes the EARLIER index, so the
     # chart naturally uses the longer span when the move itself is > 1 month.
-    if recent_price_dates and len(recent_price_dates) == len(recent_prices):
+    if price_axis is not None:
         target = today - timedelta(days=_MIN_CHART_DAYS)
-        min_chart_idx = max(0, bisect.bisect_right(recent_price_dates, target) - 1)
+        min_chart_idx = max(0, int(_bar_indices([target], price_axis)[0]))
     else:
         min_chart_idx = max(0, len(recent_prices) - (_MIN_CHART_DAYS + 1))
 
@@ -9,11 +9,11 @@ in-memory caching, helper functions for derived computations.
 import asyncio
 import logging
 import math
-import time
 from collections import Counter, defaultdict
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
+from app.core.cache import register_region
 from app.integrations.fmp import FMPClient, get_fmp_client
 from app.schemas.analyst import (
     AnalystAction,
@@ -51,19 +51,11 @@ def _num(v: Any, default: float = 0.0) -> float:
 
 # ── In-memory cache (same pattern as stock_overview_service) ─────────
 
-_cache: Dict[str, Tuple[float, Any]] = {}
 _CACHE_TTL = 300  # 5 minutes
 
 
 def _cache_get(key: str, ttl: float = _CACHE_TTL) -> Optional[Any]:
-    entry = _cache.get(key)
-    if entry is None:
-        return None
-    ts, value = entry
-    if time.time() - ts > ttl:
-        del _cache[key]
-        return None
-    return value
+    return _cache.lookup(key, ttl)
 
 
 # Hard cap on the in-memory tier. Without it this dict grew with the number of DISTINCT
@@ -71,16 +63,14 @@ def _cache_get(key: str, ttl: float = _CACHE_TTL) -> Optional[Any]:
 # SAME key is read again after expiry, so a ticker fetched once and never revisited stayed
 # resident for the life of the process. Across ~17 services on a long-lived Railway
 # container that is a slow leak whose only resolution is an OOM restart — which drops every
-# in-flight report with it. Bounded LRU-ish: evict from the head (least recently WRITTEN).
+# in-flight report with it. Enforced by the shared region (app/core/cache.py), which also
+# counts every entry against the process-wide CACHE_MEMORY_BUDGET_MB.
 _CACHE_MAX_ENTRIES = 1024
+_cache = register_region("analyst", ttl=_CACHE_TTL, max_entries=_CACHE_MAX_ENTRIES)
 
 
 def _cache_set(key: str, value: Any):
-    _cache.pop(key, None)
-    _cache[key] = (time.time(), value)
-    if len(_cache) > _CACHE_MAX_ENTRIES:
-        for _old in list(_cache.keys())[: len(_cache) - _CACHE_MAX_ENTRIES]:
-            _cache.pop(_old, None)
+    _cache.store(key, value)
 
 
 # ── FMP grade → category mapping ────────────────────────────────────
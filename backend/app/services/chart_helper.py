@@ -8,6 +8,7 @@ from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
 from app.integrations.fmp import FMPClient
+from app.services.price_history_store import get_price_history_store
 from app.utils.market_hours import US_MARKET_EARLY_CLOSES
 
 
@@ -401,22 +402,29 @@ async def fetch_chart_data(
             return prices
         return []
 
-    elif resolved_interval in AGGREGATED_INTERVALS:
-        if range_code == "ALL":
-            historical = await _fetch_all_daily(fmp, symbol)
-        else:
-            raw = await fmp.get_historical_prices(symbol, from_date, to_date)
-            historical = _parse_historical(raw)
+    historical = await _fetch_daily_history(fmp, symbol, range_code, from_date, to_date)
+    if resolved_interval in AGGREGATED_INTERVALS:
         return _aggregate_prices(historical, resolved_interval)
+    # Daily (EOD) data
+    return _normalize_prices(historical)
 
-    else:
-        # Daily (EOD) data
-        if range_code == "ALL":
-            historical = await _fetch_all_daily(fmp, symbol)
-        else:
-            raw = await fmp.get_historical_prices(symbol, from_date, to_date)
-            historical = _parse_historical(raw)
-        return _normalize_prices(historical)
+
+async def _fetch_daily_history(
+    fmp: FMPClient, symbol: str, range_code: str, from_date: str, to_date: str
+) -> List[Dict]:
+    """Oldest-first daily rows for a daily / aggregated chart.
+
+    From the local price store when it is enabled: the years behind an "ALL" chart are
+    read from disk instead of re-paging up to five 5000-bar FMP calls on every miss.
+    """
+    store = get_price_history_store()
+    if store is not None:
+        bars = await store.daily(fmp, symbol, from_date, to_date)
+        return bars.to_rows()
+    if range_code == "ALL":
+        return await _fetch_all_daily(fmp, symbol)
+    raw = await fmp.get_historical_prices(symbol, from_date, to_date)
+    return _parse_historical(raw)
 
 
 def _filter_regular_hours(prices: List[Dict]) -> List[Dict]:
@@ -8,11 +8,11 @@ CLUSD (Crude Oil WTI), NGUSD (Natural Gas), etc.
 import asyncio
 import logging
 import math
-import time
 from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
 from typing import Any, Dict, List, Optional
 
+from app.core.cache import register_region
 from app.integrations.fmp import (
     FMPClient,
     FMPUnavailableException,
@@ -51,7 +51,6 @@ logger = logging.getLogger(__name__)
 #
 # The TTL travels WITH the entry (index_service's variant) rather than being passed by
 # the reader: the writer knows the section's volatility, and a reader cannot mismatch it.
-_cache: Dict[str, tuple] = {}
 _CACHE_TTL_SECONDS = 300  # default when a caller declares nothing
 
 # Per-section TTLs, ordered by how fast the underlying data really moves.
@@ -63,34 +62,24 @@ _DERIVED_TTL = 43_200    # 12h — performance / benchmark / daily key stats, al
 
 # Hard cap: `_cache_get` only evicts a key when that same key is read again after
 # expiry, so on a long-lived Railway process a symbol fetched once would sit resident
-# forever. Bounded, evicting least-recently-written. 1024 matches every sibling service
+# forever. Bounded, evicting least-recently-used. 1024 matches every sibling service
 # — 256 was below the ~294 keys this service can hold, so it evicted under normal use.
 _CACHE_MAX_ENTRIES = 1024
+_cache = register_region("commodity", ttl=_CACHE_TTL_SECONDS, max_entries=_CACHE_MAX_ENTRIES)
 
 
 def _cache_get(key: str) -> Optional[Any]:
-    entry = _cache.get(key)
-    if entry is None:
-        return None
-    ts, value, entry_ttl = entry
-    if time.time() - ts > entry_ttl:
-        del _cache[key]
-        return None
-    return value
+    return _cache.lookup(key)
 
 
 def _cache_set(key: str, value: Any, ttl: Optional[float] = None) -> None:
-    _cache.pop(key, None)
-    _cache[key] = (time.time(), value, ttl or _CACHE_TTL_SECONDS)
-    if len(_cache) > _CACHE_MAX_ENTRIES:
-        for _old in list(_cache.keys())[: len(_cache) - _CACHE_MAX_ENTRIES]:
-            _cache.pop(_old, None)
+    _cache.store(key, value, ttl)
 
 
 # Thundering-herd guard. Keyed on the FULL request shape, because `chart_data` is built
 # from range+interval — keying on the symbol alone is the bug that made the ETF range
 # picker a no-op (see etf_service._cache_key).
-_inflight: Dict[str, asyncio.Future] = {}
+_inflight = _cache.inflight
 
 
 def _commodity_market_status() -> str:
@@ -13,10 +13,10 @@ Serves the CryptoDetailView screen on iOS.
 import asyncio
 import json
 import logging
-import time
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional
 
+from app.core.cache import register_region
 from app.database import get_supabase
 from app.services.agents.persona_config import neutral_system_instruction
 from app.integrations.coingecko import get_coingecko_client, CoinGeckoClient
@@ -484,13 +484,13 @@ _DEFAULT_RELATED = ["BTC", "ETH", "SOL", "BNB", "XRP", "DOGE"]
 
 # ── Simple in-memory cache ───────────────────────────────────────
 
-_cache: Dict[str, Tuple[float, Any]] = {}
 _CACHE_TTL_SECONDS = 300  # 5 minutes for CoinGecko data (rate-limit friendly)
 _DB_CACHE_TTL_HOURS = 12  # 12 hours in Supabase (budget-friendly for 10K/month)
 _AI_CACHE_TTL_SECONDS = 1800  # 30 minutes for AI-generated stories
 # Hard cap on live entries — see stock_overview_service for rationale. Eviction
-# is least-recently-written; a miss just re-fetches (no correctness impact).
+# is least-recently-used; a miss just re-fetches (no correctness impact).
 _CACHE_MAX_ENTRIES = 1024
+_cache = register_region("crypto", ttl=_CACHE_TTL_SECONDS, max_entries=_CACHE_MAX_ENTRIES)
 
 
 def _round_close(v: float) -> float:
@@ -509,23 +509,11 @@ def _round_close(v: float) -> float:
 
 
 def _cache_get(key: str, ttl: Optional[float] = None) -> Optional[Any]:
-    entry = _cache.get(key)
-    if entry is None:
-        return None
-    ts, value = entry
-    max_age = ttl or _CACHE_TTL_SECONDS
-    if time.time() - ts > max_age:
-        del _cache[key]
-        return None
-    return value
+    return _cache.lookup(key, ttl)
 
 
 def _cache_set(key: str, value: Any):
-    _cache.pop(key, None)
-    _cache[key] = (time.time(), value)
-    if len(_cache) > _CACHE_MAX_ENTRIES:
-        for _old in list(_cache.keys())[: len(_cache) - _CACHE_MAX_ENTRIES]:
-            _cache.pop(_old, None)
+    _cache.store(key, value)
 
 
 # ── Formatting helpers ───────────────────────────────────────────
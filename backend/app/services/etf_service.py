@@ -9,10 +9,10 @@ import asyncio
 import json
 import logging
 import math
-import time
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
+from app.core.cache import register_region
 from app.integrations.fmp import get_fmp_client, FMPClient
 from app.services.agents.persona_config import neutral_system_instruction
 from app.integrations.gemini import get_gemini_client
@@ -59,7 +59,6 @@ logger = logging.getLogger(__name__)
 # the section's volatility, so a reader cannot mismatch it. `_cache_get` still honours an
 # explicit ttl argument for the call sites that predate this.
 
-_cache: Dict[str, Tuple] = {}
 _CACHE_TTL_SECONDS = 300  # default when a writer declares nothing
 _AI_CACHE_TTL_SECONDS = 3600  # 1 hour for AI-generated snapshots
 # 12h, not 1h: the S&P history is daily EOD bars shared by every ETF on the platform, and
@@ -75,34 +74,23 @@ _DERIVED_TTL = 43_200       # 12h — performance periods + benchmark, both from
 _FUNDAMENTALS_TTL = 43_200  # 12h — profile, etf-info, holdings, sectors, dividends
 
 # Hard cap on live entries — see stock_overview_service for rationale. Eviction
-# is least-recently-written; a miss just re-fetches (no correctness impact).
+# is least-recently-used; a miss just re-fetches (no correctness impact).
 _CACHE_MAX_ENTRIES = 1024
+_cache = register_region("etf", ttl=_CACHE_TTL_SECONDS, max_entries=_CACHE_MAX_ENTRIES)
 
 
 def _cache_get(key: str, ttl: Optional[float] = None) -> Optional[Any]:
-    entry = _cache.get(key)
-    if entry is None:
-        return None
-    ts, value, entry_ttl = entry
-    # An explicit reader TTL still wins, for the sites that predate per-entry TTLs.
-    if time.time() - ts > (entry_ttl if ttl is None else ttl):
-        del _cache[key]
-        return None
-    return value
+    return _cache.lookup(key, ttl)
 
 
 def _cache_set(key: str, value: Any, ttl: Optional[float] = None) -> None:
-    _cache.pop(key, None)
-    _cache[key] = (time.time(), value, ttl or _CACHE_TTL_SECONDS)
-    if len(_cache) > _CACHE_MAX_ENTRIES:
-        for _old in list(_cache.keys())[: len(_cache) - _CACHE_MAX_ENTRIES]:
-            _cache.pop(_old, None)
+    _cache.store(key, value, ttl)
 
 
 # Thundering-herd guard, keyed on the FULL request shape because the assembled response is
 # range-specific. This service had none: N concurrent viewers of a cold SPY each ran the
 # entire fan-out. The per-section fetchers dedup through their own keys within one build.
-_inflight: Dict[str, asyncio.Future] = {}
+_inflight = _cache.inflight
 
 
 # ── Related ETF mappings ─────────────────────────────────────────
@@ -9,10 +9,10 @@ Matches the iOS GrowthSectionData struct.
 import asyncio
 import logging
 import math
-import time
 from datetime import datetime, timezone, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
+from app.core.cache import register_region
 from app.database import get_supabase
 from app.integrations.fmp import get_fmp_client
 from app.utils.period_labels import extract_year as _extract_year, quarterly_period_label
@@ -70,19 +70,11 @@ def _hold_back_thin_benchmarks(
     return out
 
 # ── In-memory cache ───────────────────────────────────────────────
-_cache: Dict[str, Tuple[float, Any]] = {}
 _CACHE_TTL = 300  # 5 minutes
 
 
 def _cache_get(key: str) -> Optional[Any]:
-    entry = _cache.get(key)
-    if entry is None:
-        return None
-    ts, value = entry
-    if time.time() - ts > _CACHE_TTL:
-        del _cache[key]
-        return None
-    return value
+    return _cache.lookup(key)
 
 
 # Hard cap on the in-memory tier. Without it this dict grew with the number of DISTINCT
@@ -90,22 +82,20 @@ def _cache_get(key: str) -> Optional[Any]:
 # SAME key is read again after expiry, so a ticker fetched once and never revisited stayed
 # resident for the life of the process. Across ~17 services on a long-lived Railway
 # container that is a slow leak whose only resolution is an OOM restart — which drops every
-# in-flight report with it. Bounded LRU-ish: evict from the head (least recently WRITTEN).
+# in-flight report with it. Enforced by the shared region (app/core/cache.py), which also
+# counts every entry against the process-wide CACHE_MEMORY_BUDGET_MB.
 _CACHE_MAX_ENTRIES = 1024
+_cache = register_region("growth", ttl=_CACHE_TTL, max_entries=_CACHE_MAX_ENTRIES)
 
 
 def _cache_set(key: str, value: Any) -> None:
-    _cache.pop(key, None)
-    _cache[key] = (time.time(), value)
-    if len(_cache) > _CACHE_MAX_ENTRIES:
-        for _old in list(_cache.keys())[: len(_cache) - _CACHE_MAX_ENTRIES]:
-            _cache.pop(_old, None)
+    _cache.store(key, value)
 
 
 # ── In-flight deduplication ───────────────────────────────────────
 # One growth MISS costs TEN FMP calls. Without this, N concurrent viewers of the
 # same cold ticker each fired the whole fan-out.
-_inflight: Dict[str, asyncio.Future] = {}
+_inflight = _cache.inflight
 
 
 # ── Helpers ───────────────────────────────────────────────────────
@@ -14,10 +14,10 @@ import asyncio
 import logging
 import math
 import re
-import time
 from datetime import datetime, timezone, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
+from app.core.cache import register_region
 from app.database import get_supabase
 from app.integrations.fmp import get_fmp_client
 from app.services._insider_common import (
@@ -55,19 +55,11 @@ from app.schemas.holders import (
 logger = logging.getLogger(__name__)
 
 # ── In-memory cache ───────────────────────────────────────────────
-_cache: Dict[str, Tuple[float, Any]] = {}
 _CACHE_TTL = 300  # 5 minutes
 
 
 def _cache_get(key: str) -> Optional[Any]:
-    entry = _cache.get(key)
-    if entry is None:
-        return None
-    ts, value = entry
-    if time.time() - ts > _CACHE_TTL:
-        del _cache[key]
-        return None
-    return value
+    return _cache.lookup(key)
 
 
 # Hard cap on the in-memory tier. A HoldersResponse is one of the largest
@@ -77,23 +69,15 @@ def _cache_get(key: str) -> Optional[Any]:
 # pinned for its full TTL, and expired entries were only reclaimed if that exact
 # key was read again. A crawl over a few thousand symbols grew it without bound.
 _CACHE_MAX_ENTRIES = 256
+_cache = register_region("holders", ttl=_CACHE_TTL, max_entries=_CACHE_MAX_ENTRIES)
 
 
 def _cache_set(key: str, value: Any) -> None:
-    _cache[key] = (time.time(), value)
-    if len(_cache) <= _CACHE_MAX_ENTRIES:
-        return
-    # Sweep expired entries first; only if that isn't enough, drop the oldest.
-    now = time.time()
-    for k in [k for k, (ts, _) in _cache.items() if now - ts > _CACHE_TTL]:
-        _cache.pop(k, None)
-    while len(_cache) > _CACHE_MAX_ENTRIES:
-        oldest = min(_cache, key=lambda k: _cache[k][0])
-        _cache.pop(oldest, None)
+    _cache.store(key, value)
 
 
 # ── In-flight deduplication ───────────────────────────────────────
-_inflight: Dict[str, asyncio.Future] = {}
+_inflight = _cache.inflight
 
 # Strong refs for fire-and-forget persistence writes. asyncio only holds a WEAK
 # reference to a task, so a bare `ensure_future(...)` can be collected before it
@@ -28,6 +28,7 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from app.core.cache import ModelCodec, record_entry, record_version, shared_build
 from app.database import get_supabase
 from app.services.active_group_service import (
     ActiveGroupUnavailable,
@@ -125,6 +126,7 @@ _SCANNER_ROWS = 10                          # top-N rows per leaderboard
 _SCANNER_CACHE_TTL_SECONDS = 1200           # 20 min — scanners move slowly; the
                                             # short-interest scan is too costly for 5 min
 _SCANNER_CACHE_KEY = "scanners"
+_SCANNER_CODEC = ModelCodec(ScannerGroupsResponse)
 _SCANNER_BUILD_TIMEOUT_SECONDS = 8          # never let a cold shorts scan block the dashboard
 _MOVERS_MIN_PRICE = 5.0
 _MOVERS_MIN_AVG_VOLUME = 1_000_000
@@ -693,7 +695,9 @@ class HomeDashboardService:
         # behind its own cache + guard. The import is function-local to avoid a
         # module cycle — signals_service imports `_canonical_symbol`/`_finite_float`
         # from THIS module (same pattern the pre-warmer uses in main.py).
-        from app.services.signals_service import get_signals_service, redact_signals
+        from app.services.signals_service import (
+            _SIGNALS_CACHE_KEY, SignalsService, get_signals_service, redact_signals,
+        )
 
         pulse, scanners, signals, themes, watchlist = await asyncio.gather(
             self._get_pulse_guarded(),
@@ -705,6 +709,24 @@ class HomeDashboardService:
             # never the whole screen.
             self._get_watchlist_guarded(user_id),
         )
+        # What this response was assembled from, for the route's ETag (app/api/
+        # conditional.py). The shared sections are versioned by the cache entry they
+        # came out of — a degraded fallback is not that entry, so it leaves the response
+        # unversioned. The watchlist strip and the market status are uncached and a few
+        # dozen bytes: they are their own version.
+        record_entry("home_pulse", _CACHE_KEY, self._cache.get(_CACHE_KEY), pulse)
+        record_entry(
+            "home_scanners", _SCANNER_CACHE_KEY,
+            self._scanner_cache.get(_SCANNER_CACHE_KEY), scanners,
+        )
+        record_entry(
+            "home_themes", _THEMES_CACHE_KEY, self._themes_cache.get(_THEMES_CACHE_KEY), themes,
+        )
+        record_entry(
+            "signals", _SIGNALS_CACHE_KEY, SignalsService._cache.get(_SIGNALS_CACHE_KEY), signals,
+        )
+        record_version("home_watchlist", user_id or "", watchlist)
+
         # App-Exclusive Signals are a Pro/Max surface. Redact AFTER the gather, per
         # request: `signals` is the SHARED 45-min cache object, so the gate has to be a
         # copy-on-read here rather than anything the service bakes into the cache —
@@ -714,6 +736,7 @@ class HomeDashboardService:
             signals = redact_signals(signals, required_tier_for_signals(tier) or TIER_PRO)
 
         status_text, is_open = _market_status()
+        record_version("market_status", "", (status_text, is_open))
         watchlist_title, watchlist_is_group, watchlist_tiles = watchlist
         return HomeDashboardResponse(
             market_status_text=status_text,
@@ -1068,8 +1091,18 @@ class HomeDashboardService:
         self._scanner_inflight[_SCANNER_CACHE_KEY] = fut
         try:
             try:
-                result = await self._build_scanner_groups()
-                self._scanner_cache[_SCANNER_CACHE_KEY] = (time.time(), result)
+                # Through the shared L2 tier when one is configured: the shorts scan is
+                # the most expensive build on Home, and every worker/replica missing it
+                # together would otherwise each run it.
+                result = await shared_build(
+                    "home_scanners", _SCANNER_CACHE_KEY, self._build_scanner_groups,
+                    _SCANNER_CACHE_TTL_SECONDS, _SCANNER_CODEC,
+                )
+                if result is None:
+                    # A peer process whose build came up empty; not cached → retries.
+                    result = ScannerGroupsResponse()
+                else:
+                    self._scanner_cache[_SCANNER_CACHE_KEY] = (time.time(), result)
             except Exception as exc:  # noqa: BLE001 — scanners must never fail the dashboard
                 logger.warning("Scanner build failed: %s: %s", type(exc).__name__, exc)
                 result = ScannerGroupsResponse()  # empty; not cached → retries
@@ -1553,12 +1586,15 @@ class HomeDashboardService:
         cached = self._theme_detail_cache.get(key)
         if cached is not None and (time.time() - cached[0]) < _THEME_DETAIL_CACHE_TTL_SECONDS:
             logger.debug("Theme detail %s served from in-memory cache", key)
+            record_entry("home_theme_detail", key, cached, cached[1])
             return cached[1]
 
         inflight = self._theme_detail_inflight.get(key)
         if inflight is not None:
             logger.debug("Theme detail %s joining in-flight build", key)
-            return await asyncio.shield(inflight)
+            shared = await asyncio.shield(inflight)
+            record_entry("home_theme_detail", key, None, shared)
+            return shared
 
         loop = asyncio.get_event_loop()
         fut: asyncio.Future = loop.create_future()
@@ -1570,6 +1606,7 @@ class HomeDashboardService:
             # surfaces on the next request.
             if result is not None:
                 self._theme_detail_cache[key] = (time.time(), result)
+            record_entry("home_theme_detail", key, self._theme_detail_cache.get(key), result)
             if not fut.done():
                 fut.set_result(result)
             return result
@@ -12,11 +12,11 @@ Design:
 
 import asyncio
 import random
-import time as _time
 from datetime import datetime, timedelta, timezone
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any
 import logging
 
+from app.core.cache import register_region
 from app.integrations.fmp import get_fmp_client
 from app.database import get_supabase
 from app.services.agents.persona_config import PERSONA_KEYS, get_persona_config
@@ -32,20 +32,12 @@ logger = logging.getLogger(__name__)
 
 # ── Simple TTL Cache ────────────────────────────────────────────────
 
-_cache: Dict[str, Tuple[float, Any]] = {}
 CACHE_TTL_SECONDS = 60  # 1 minute
 
 
 def _cache_get(key: str) -> Optional[Any]:
     """Return cached value if it exists and hasn't expired."""
-    entry = _cache.get(key)
-    if entry is None:
-        return None
-    ts, value = entry
-    if _time.monotonic() - ts > CACHE_TTL_SECONDS:
-        del _cache[key]
-        return None
-    return value
+    return _cache.lookup(key)
 
 
 # Hard cap on the in-memory tier. Without it this dict grew with the number of DISTINCT
@@ -53,17 +45,15 @@ def _cache_get(key: str) -> Optional[Any]:
 # SAME key is read again after expiry, so a ticker fetched once and never revisited stayed
 # resident for the life of the process. Across ~17 services on a long-lived Railway
 # container that is a slow leak whose only resolution is an OOM restart — which drops every
-# in-flight report with it. Bounded LRU-ish: evict from the head (least recently WRITTEN).
+# in-flight report with it. Enforced by the shared region (app/core/cache.py), which also
+# counts every entry against the process-wide CACHE_MEMORY_BUDGET_MB.
 _CACHE_MAX_ENTRIES = 1024
+_cache = register_region("home", ttl=CACHE_TTL_SECONDS, max_entries=_CACHE_MAX_ENTRIES)
 
 
 def _cache_set(key: str, value: Any) -> None:
     """Store a value in the cache with current timestamp."""
-    _cache.pop(key, None)
-    _cache[key] = (_time.monotonic(), value)
-    if len(_cache) > _CACHE_MAX_ENTRIES:
-        for _old in list(_cache.keys())[: len(_cache) - _CACHE_MAX_ENTRIES]:
-            _cache.pop(_old, None)
+    _cache.store(key, value)
 
 
 # ── Configuration ────────────────────────────────────────────────────
@@ -33,6 +33,7 @@ from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional, Tuple
 
 from app.config import settings
+from app.core.user_cache import invalidate_user_record
 from app.database import get_supabase
 
 logger = logging.getLogger(__name__)
@@ -917,6 +918,9 @@ class IAPService:
                 tier, user_id, type(e).__name__, e,
             )
             raise IAPError("could not update the account tier") from e
+        # The auth dependencies hand `users.tier` to every gated route; a cached row would
+        # keep the old tier's entitlements for the rest of its TTL.
+        invalidate_user_record(user_id)
 
         # Roll the period over if it is due, and create the balance row on a first touch.
         # Best-effort: the entitlement itself is already recorded, and the same RPC runs
@@ -7,10 +7,10 @@ Serves the IndexDetailView screen on iOS.
 
 import asyncio
 import logging
-import time
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
+from app.core.cache import register_region
 from app.integrations.fmp import get_fmp_client, FMPClient
 from app.services.agents.persona_config import neutral_system_instruction
 from app.integrations.gemini import get_gemini_client
@@ -112,7 +112,6 @@ _INDEX_PROFILES: Dict[str, Dict[str, Any]] = {
 # The TTL travels WITH the entry — the writer knows the section's volatility, so a reader
 # cannot mismatch it.
 
-_cache: Dict[str, Tuple] = {}
 _CACHE_TTL_SECONDS = 300  # default when a writer declares nothing
 _AI_CACHE_TTL_SECONDS = 3600  # 1 hour for AI-generated stories
 # A template fallback is cheap to regenerate but must not re-call Gemini on every request;
@@ -129,32 +128,22 @@ _DERIVED_TTL = 43_200       # 12h — performance periods + the moving averages
 _CONSTITUENTS_TTL = 43_200  # 12h — index membership changes quarterly at most
 
 # Hard cap on live entries — see stock_overview_service for rationale. Eviction
-# is least-recently-written; a miss just re-fetches (no correctness impact).
+# is least-recently-used; a miss just re-fetches (no correctness impact).
 _CACHE_MAX_ENTRIES = 1024
+_cache = register_region("index", ttl=_CACHE_TTL_SECONDS, max_entries=_CACHE_MAX_ENTRIES)
 
 # Thundering-herd guard, keyed on the FULL request shape because the assembled response is
 # range-specific. This service had none: N concurrent viewers of a cold ^GSPC each ran the
 # entire fan-out, including the 503-row constituent list fetched for a single `len()`.
-_inflight: Dict[str, asyncio.Future] = {}
+_inflight = _cache.inflight
 
 
 def _cache_get(key: str) -> Optional[Any]:
-    entry = _cache.get(key)
-    if entry is None:
-        return None
-    ts, value, entry_ttl = entry
-    if time.time() - ts > entry_ttl:
-        del _cache[key]
-        return None
-    return value
+    return _cache.lookup(key)
 
 
 def _cache_set(key: str, value: Any, ttl: Optional[float] = None):
-    _cache.pop(key, None)
-    _cache[key] = (time.time(), value, ttl or _CACHE_TTL_SECONDS)
-    if len(_cache) > _CACHE_MAX_ENTRIES:
-        for _old in list(_cache.keys())[: len(_cache) - _CACHE_MAX_ENTRIES]:
-            _cache.pop(_old, None)
+    _cache.store(key, value, ttl)
 
 
 # ── Helpers ──────────────────────────────────────────────────────
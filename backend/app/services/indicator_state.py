@@ -0,0 +1,422 @@
+"""
+Incremental technical-analysis indicators — one series, advanced one bar at a time.
+
+The panel engine (app/services/technical_indicators.py) and the ``ta`` path both
+recompute every indicator from the full ~600-day history, although between two
+computations only the newest bar has changed. :class:`IndicatorAccumulator` keeps the
+state each gauge indicator needs to move forward — the EMA / Wilder recursions, the
+``ta`` ADX and ATR smoothings, and short windows of recent bars for the rolling ones —
+so a settled bar is :meth:`~IndicatorAccumulator.push`-ed in O(1) and the provisional
+bar still forming (today's daily bar, this week's weekly bar) is scored with
+:meth:`~IndicatorAccumulator.preview` without being committed.
+
+Replaying a history through ``push`` yields the same values as the panel engine and
+the ``ta`` path, warm-up quirks included (the ADX seed is the sum of the first 14
+VALID movements, wherever they fall; the ATR seed skips missing ranges). Parity is
+pinned in tests/test_indicator_state.py.
+
+The state is plain floats and short lists: :meth:`~IndicatorAccumulator.to_dict`
+round-trips through JSON, so it can live in the shared cache tier.
+
+PURE — stdlib only, no NumPy, no service imports. Scalar Python beats NumPy's per-call
+overhead at one bar per series.
+"""
+from __future__ import annotations
+
+from collections import deque
+from itertools import islice
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from app.services.technical_indicators import MA_WINDOWS
+
+_NAN = float("nan")
+_W = 14  # RSI / stochastics / Williams / CCI / ATR / ADX window
+_MACD_FAST, _MACD_SLOW, _MACD_SIGN = 12, 26, 9
+
+# The EMA streams, advanced together every bar: the five moving averages, the two MACD
+# legs, RSI's two Wilder averages (alpha = 1/14), and the MACD signal line.
+_SPANS = MA_WINDOWS + (_MACD_FAST, _MACD_SLOW)
+_RSI_UP, _RSI_DOWN = len(_SPANS), len(_SPANS) + 1
+_MACD_SIGNAL = len(_SPANS) + 2
+
+
+def _span_alpha(span: int) -> float:
+    return 1.0 / (1.0 + (span - 1) / 2.0)  # pandas' centre-of-mass route, bit-for-bit
+
+
+_ALPHAS: Tuple[float, ...] = tuple(_span_alpha(s) for s in _SPANS) + (
+    1.0 / (1.0 + (_W - 1.0)),
+    1.0 / (1.0 + (_W - 1.0)),
+    _span_alpha(_MACD_SIGN),
+)
+_MIN_PERIODS: Tuple[int, ...] = _SPANS + (_W, _W, _MACD_SIGN)
+
+
+def _isnan(x: float) -> bool:
+    return x != x
+
+
+def _div(a: float, b: float) -> float:
+    """``a / b`` with NumPy's outcome for a zero divisor reduced to NaN (→ None downstream)."""
+    return a / b if b != 0 else _NAN
+
+
+def _fmax(*xs: float) -> float:
+    valid = [x for x in xs if not _isnan(x)]
+    return max(valid) if valid else _NAN
+
+
+def _window_range(values) -> Tuple[float, float]:
+    """``(min, max)`` of a full window, NaN when any value is missing (a rolling min_periods)."""
+    if _isnan(sum(values)):  # one C-level pass; prices are finite, so only NaN yields NaN
+        return _NAN, _NAN
+    return min(values), max(values)
+
+
+def _movement(high, low, close, prev_high, prev_low, prev_close) -> Tuple[float, float, float]:
+    """One bar's ``(true range, +DM, -DM)`` exactly as ``ta.trend.ADXIndicator`` derives them."""
+    tr = max(high, prev_close) - min(low, prev_close)
+    if _isnan(high) or _isnan(low) or _isnan(prev_close):
+        tr = _NAN
+    up, down = high - prev_high, prev_low - low
+    pos = abs(((up > down) and (up > 0)) * up)
+    neg = abs(((down > up) and (down > 0)) * down)
+    return tr, pos, neg
+
+
+class IndicatorAccumulator:
+    """The gauge indicators of ONE series, advanced one settled bar at a time."""
+
+    __slots__ = (
+        "bars", "prev", "closes", "highs", "lows", "typicals", "rsis",
+        "ewm", "seen", "atr", "atr_seed", "movements", "smooth", "dx_seed", "adx",
+    )
+
+    def __init__(self) -> None:
+        self.bars = 0
+        self.prev: Tuple[float, float, float] = (_NAN, _NAN, _NAN)  # high, low, close
+        self.closes: Deque[float] = deque(maxlen=max(MA_WINDOWS))
+        self.highs: Deque[float] = deque(maxlen=_W)
+        self.lows: Deque[float] = deque(maxlen=_W)
+        self.typicals: Deque[float] = deque(maxlen=_W)
+        self.rsis: Deque[float] = deque(maxlen=_W + 2)  # three StochRSI windows
+        self.ewm: List[float] = [_NAN] * len(_ALPHAS)
+        self.seen: List[int] = [0] * len(_ALPHAS)
+        self.atr = _NAN
+        self.atr_seed: List[float] = []
+        # ADX: every (tr, +DM, -DM) movement is kept until the seed — the first 14 VALID
+        # values of each — can be summed; from then on only the three smoothed sums.
+        self.movements: Optional[List[Tuple[float, float, float]]] = []
+        self.smooth: Tuple[float, float, float] = (_NAN, _NAN, _NAN)
+        self.dx_seed: List[float] = []
+        self.adx = _NAN
+
+    @classmethod
+    def from_bars(cls, high, low, close) -> "IndicatorAccumulator":
+        """Replay a chronological history — the one O(n) step, paid once per series."""
+        acc = cls()
+        for h, l, c in zip(high, low, close):
+            acc.push(float(h), float(l), float(c))
+        return acc
+
+    def copy(self) -> "IndicatorAccumulator":
+        new = IndicatorAccumulator.__new__(IndicatorAccumulator)
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if isinstance(value, (deque, list)):
+                value = value.copy()
+            setattr(new, name, value)
+        return new
+
+    # ── Advancing ────────────────────────────────────────────────────────────
+
+    def push(self, high: float, low: float, close: float) -> None:
+        """Commit one settled bar."""
+        prev_high, prev_low, prev_close = self.prev
+        b = self.bars  # this bar's index in the series
+
+        # EMA streams. RSI's up/down moves are 0.0 on the first bar (no diff yet), as in ta.
+        diff = close - prev_close
+        up = diff if diff > 0 else 0.0
+        down = -diff if diff < 0 else 0.0
+        inputs = [close] * len(_SPANS) + [up, down]
+        self._advance_ewm(inputs)
+        fast, slow = self._ewm_out(_SPANS.index(_MACD_FAST)), self._ewm_out(_SPANS.index(_MACD_SLOW))
+        self._advance_ewm([fast - slow], start=_MACD_SIGNAL)
+
+        self.closes.append(close)
+        self.highs.append(high)
+        self.lows.append(low)
+        self.typicals.append((high + low + close) / 3.0)
+        self.rsis.append(self._rsi())
+
+        # ATR: plain mean of the first 14 true ranges (missing ones skipped), Wilder after.
+        tr = _fmax(high - low, abs(high - prev_close), abs(low - prev_close))
+        if b < _W:
+            self.atr_seed.append(tr)
+            if b == _W - 1:
+                valid = [x for x in self.atr_seed if not _isnan(x)]
+                self.atr = sum(valid) / len(valid) if valid else _NAN
+                self.atr_seed = []
+        else:
+            self.atr = (self.atr * (_W - 1) + tr) / float(_W)
+
+        # ADX.
+        move = _movement(high, low, close, prev_high, prev_low, prev_close)
+        if self.movements is not None:
+            self.movements.append(move)
+            self._resolve_adx_seed()
+        else:
+            self._advance_adx(move)
+
+        self.prev = (high, low, close)
+        self.bars += 1
+
+    def _advance_ewm(self, inputs: List[float], start: int = 0) -> None:
+        for k, v in enumerate(inputs, start):
+            if _isnan(v):
+                continue
+            self.seen[k] += 1
+            state = self.ewm[k]
+            if _isnan(state):
+                self.ewm[k] = v
+            elif state != v:
+                a = _ALPHAS[k]
+                keep = 1.0 - a
+                self.ewm[k] = (keep * state + a * v) / (keep + a)
+
+    def _ewm_out(self, k: int) -> float:
+        return self.ewm[k] if self.seen[k] >= _MIN_PERIODS[k] else _NAN
+
+    def _rsi(self) -> float:
+        up, down = self._ewm_out(_RSI_UP), self._ewm_out(_RSI_DOWN)
+        if down == 0:
+            return 100.0
+        return 100 - (100 / (1 + up / down)) if not _isnan(down) else _NAN
+
+    # ── ADX (ta.trend.ADXIndicator's indexing) ───────────────────────────────
+    #
+    # Smoothed slot 0 belongs to bar 14 and holds the sum of the first 14 valid
+    # movements; slot i (bar 14 + i) is Wilder's running sum with bar 14 + i's movement
+    # added. DX per slot; the ADX is seeded with the mean of slots 0..13 (at bar 27) and
+    # Wilder-smoothed after. When a movement in bars 1..14 is missing the seed reaches
+    # past bar 14 — ta takes the first 14 VALID values wherever they fall — so the slots
+    # can only be filled once enough movements have arrived.
+
+    def _resolve_adx_seed(self) -> None:
+        moves = self.movements
+        if len(moves) <= _W:
+            return
+        seed = self._seed(moves)
+        if seed is None:
+            return
+        self.movements = None
+        self._replay_adx(seed, moves)
+
+    @staticmethod
+    def _seed(moves, final: bool = False) -> Optional[Tuple[float, float, float]]:
+        sums = []
+        for j in range(3):
+            valid = [m[j] for m in moves if not _isnan(m[j])][:_W]
+            if len(valid) < _W and not final:
+                return None
+            sums.append(sum(valid))
+        return sums[0], sums[1], sums[2]
+
+    def _replay_adx(self, seed, moves) -> None:
+        self.smooth = seed
+        self.dx_seed = []
+        self.adx = _NAN
+        self._record_dx()
+        for move in moves[_W + 1:]:
+            self._advance_adx(move)
+
+    def _advance_adx(self, move: Tuple[float, float, float]) -> None:
+        self.smooth = tuple(s - (s / float(_W)) + m for s, m in zip(self.smooth, move))
+        self._record_dx()
+
+    def _record_dx(self) -> None:
+        trs, pos, neg = self.smooth
+        plus = 100 * (pos / trs) if trs != 0 else 0.0
+        minus = 100 * (neg / trs) if trs != 0 else 0.0
+        total = plus + minus
+        dx = 100 * abs((plus - minus) / total) if total != 0 else 0.0
+        if len(self.dx_seed) < _W:
+            self.dx_seed.append(dx)
+            if len(self.dx_seed) == _W:
+                self.adx = sum(self.dx_seed) / _W
+        else:
+            self.adx = ((self.adx * (_W - 1)) + dx) / float(_W)
+
+    def _adx_now(self) -> Tuple[float, float, float]:
+        acc = self
+        if self.movements is not None:
+            # The seed never found 14 valid movements; ta sums what there is.
+            acc = self.copy()
+            acc.movements = None
+            acc._replay_adx(self._seed(self.movements, final=True), self.movements)
+        trs, pos, neg = acc.smooth
+        plus = 100 * (pos / trs) if trs != 0 else 0.0
+        minus = 100 * (neg / trs) if trs != 0 else 0.0
+        return acc.adx, plus, minus
+
+    # ── Reading ──────────────────────────────────────────────────────────────
+
+    def values(self) -> Dict[str, float]:
+        """The latest value of every gauge indicator, NaN where its history gate is unmet.
+
+        Same keys and gates as :func:`app.services.technical_indicators.panel_indicators`.
+        """
+        n = self.bars
+        out: Dict[str, float] = {}
+        for w in MA_WINDOWS:
+            if n >= w:
+                out[f"SMA({w})"] = sum(islice(self.closes, len(self.closes) - w, None)) / w
+            else:
+                out[f"SMA({w})"] = _NAN
+        for k, w in enumerate(MA_WINDOWS):
+            out[f"EMA({w})"] = self._ewm_out(k) if n >= w else _NAN
+
+        out["rsi"] = self.rsis[-1] if n >= _W + 1 else _NAN
+
+        if n >= _W:
+            close = self.closes[-1]
+            lo, _ = _window_range(self.lows)
+            _, hi = _window_range(self.highs)
+            out["stoch_k"] = _div(100 * (close - lo), hi - lo)
+            out["willr"] = _div(-100 * (hi - close), hi - lo)
+            mean = sum(self.typicals) / _W
+            mad = sum(abs(t - mean) for t in self.typicals) / _W
+            out["cci"] = _div(self.typicals[-1] - mean, 0.015 * mad)
+            out["atr"] = self.atr
+        else:
+            out["stoch_k"] = out["willr"] = out["cci"] = out["atr"] = _NAN
+
+        if n >= 2 * _W:
+            rsis = list(self.rsis)
+            points = []
+            for j in range(3):
+                window = rsis[j:j + _W]
+                lo, hi = _window_range(window)
+                points.append(_div(window[-1] - lo, hi - lo))
+            out["stochrsi_k"] = sum(points) / 3.0
+        else:
+            out["stochrsi_k"] = _NAN
+
+        if n >= 35:
+            fast = self._ewm_out(_SPANS.index(_MACD_FAST))
+            slow = self._ewm_out(_SPANS.index(_MACD_SLOW))
+            out["macd"], out["macd_signal"] = fast - slow, self._ewm_out(_MACD_SIGNAL)
+        else:
+            out["macd"] = out["macd_signal"] = _NAN
+
+        if n >= 2 * _W:
+            out["adx"], out["plus_di"], out["minus_di"] = self._adx_now()
+        else:
+            out["adx"] = out["plus_di"] = out["minus_di"] = _NAN
+        return out
+
+    def preview(self, high: float, low: float, close: float) -> Dict[str, float]:
+        """:meth:`values` with a provisional bar appended; this state is not touched."""
+        acc = self.copy()
+        acc.push(high, low, close)
+        return acc.values()
+
+    # ── Wire form ────────────────────────────────────────────────────────────
+
+    def to_dict(self) -> Dict[str, Any]:
+        out = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if isinstance(value, (deque, tuple)):
+                value = list(value)
+            elif isinstance(value, list) and value and isinstance(value[0], tuple):
+                value = [list(m) for m in value]
+            out[name] = value
+        return out
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "IndicatorAccumulator":
+        acc = cls()
+        for name in ("closes", "highs", "lows", "typicals", "rsis"):
+            getattr(acc, name).extend(data[name])
+        acc.bars = int(data["bars"])
+        acc.prev = tuple(data["prev"])
+        acc.ewm, acc.seen = list(data["ewm"]), [int(s) for s in data["seen"]]
+        acc.atr, acc.atr_seed = data["atr"], list(data["atr_seed"])
+        moves = data["movements"]
+        acc.movements = None if moves is None else [tuple(m) for m in moves]
+        acc.smooth = tuple(data["smooth"])
+        acc.dx_seed, acc.adx = list(data["dx_seed"]), data["adx"]
+        return acc
+
+
+def _same_bar(a: Tuple[float, float, float], b: Tuple[float, float, float]) -> bool:
+    return all(x == y or (_isnan(x) and _isnan(y)) for x, y in zip(a, b))
+
+
+class SeriesState:
+    """One (ticker, timeframe) series: its accumulator through the last SETTLED bar.
+
+    The newest bar of any fetch is provisional — today's daily bar moves until the
+    close, this week's weekly bar until the week ends — so it is only ever previewed.
+    ``last_day`` (days since the epoch) and ``last_bar`` identify the last settled
+    bar; a later fetch must contain that bar unchanged or the state is stale (an
+    upstream split re-adjustment, a gap) and the caller rebuilds from full history.
+    """
+
+    __slots__ = ("acc", "last_day", "last_bar")
+
+    def __init__(self, acc: IndicatorAccumulator, last_day: int, last_bar: Tuple[float, float, float]):
+        self.acc = acc
+        self.last_day = last_day
+        self.last_bar = last_bar
+
+    @classmethod
+    def from_bars(
+        cls, days: List[int], high: List[float], low: List[float], close: List[float],
+    ) -> Tuple[Optional["SeriesState"], Dict[str, float]]:
+        """Settle every bar but the newest; ``(state, values with the newest previewed)``.
+
+        The state is None for a single-bar history — there is nothing settled yet.
+        """
+        if len(days) < 2:
+            acc = IndicatorAccumulator.from_bars(high, low, close)
+            return None, acc.values()
+        acc = IndicatorAccumulator.from_bars(high[:-1], low[:-1], close[:-1])
+        state = cls(acc, int(days[-2]), (float(high[-2]), float(low[-2]), float(close[-2])))
+        return state, acc.preview(float(high[-1]), float(low[-1]), float(close[-1]))
+
+    def advance(
+        self, days: List[int], high: List[float], low: List[float], close: List[float],
+    ) -> Optional[Tuple["SeriesState", Dict[str, float]]]:
+        """Move forward over a recent window of bars that starts at or before ``last_day``.
+
+        Returns ``(new state, values)`` — this state is left untouched — or None when
+        the window does not contain the last settled bar exactly as it was.
+        """
+        try:
+            i = days.index(self.last_day)
+        except ValueError:
+            return None
+        if not _same_bar((float(high[i]), float(low[i]), float(close[i])), self.last_bar):
+            return None
+        if i == len(days) - 1:
+            return self, self.acc.values()
+        state = self
+        settled = range(i + 1, len(days) - 1)
+        if settled:
+            acc = self.acc.copy()
+            for j in settled:
+                acc.push(float(high[j]), float(low[j]), float(close[j]))
+            state = SeriesState(acc, int(days[-2]), (float(high[-2]), float(low[-2]), float(close[-2])))
+        return state, state.acc.preview(float(high[-1]), float(low[-1]), float(close[-1]))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"acc": self.acc.to_dict(), "last_day": self.last_day, "last_bar": list(self.last_bar)}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SeriesState":
+        return cls(
+            IndicatorAccumulator.from_dict(data["acc"]), int(data["last_day"]), tuple(data["last_bar"]),
+        )
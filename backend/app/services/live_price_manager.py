@@ -1,8 +1,18 @@
 """
 Live Price Manager — WebSocket fan-out proxy for FMP real-time prices.
 
-Maintains one upstream FMP WebSocket per ticker and broadcasts price
-updates to all connected iOS clients watching that ticker.
+Multiplexes every watched ticker onto a small pool of upstream FMP WebSockets
+(per endpoint: stock and crypto are separate hosts), demuxes their ticks by
+symbol into per-ticker rooms, and broadcasts price updates to all connected
+iOS clients watching that ticker.
+
+One socket per ticker — the original layout — meant hundreds of sockets, TLS
+sessions and reader tasks at market open; a pooled socket carries up to
+`LIVE_PRICE_UPSTREAM_SYMBOLS_PER_SOCKET` tickers and re-subscribes them in bulk
+after a reconnect. Each room conflates its ticks (at most
+`LIVE_PRICE_MAX_FRAMES_PER_SECOND`, newest wins), encodes a frame once, and
+queues it to a bounded per-client outbox, so neither a fast feed nor a slow
+client sets the pace for the rest of the room.
 """
 
 import asyncio
@@ -11,8 +21,9 @@ import logging
 import os
 import ssl
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Optional, Any
+from typing import Any, Awaitable, Callable, Optional
 
 import certifi
 import websockets
@@ -21,6 +32,7 @@ from fastapi import WebSocket
 from app.config import settings
 from app.services.asset_class import detect_asset_class
 from app.integrations.fmp import get_fmp_client
+from app.services.price_bus import get_price_bus
 
 logger = logging.getLogger(__name__)
 
@@ -88,15 +100,374 @@ def _fmp_ws_target(ticker: str) -> tuple[str, bool, str]:
 # (or repeated failures) can't hammer the FMP REST API on every trade tick.
 _PREV_CLOSE_RETRY_SECONDS = 60.0
 
+# FMP accepts a list of tickers in one subscribe/unsubscribe event. A bulk
+# (re)subscription is still chunked, so re-subscribing a full socket after a reconnect
+# is a handful of modest frames rather than one large one.
+_SUBSCRIBE_CHUNK = 50
+
+# Upstream reconnect policy, per pooled socket: attempts before the socket gives up
+# (its rooms are then told the feed is unavailable and cleaned up), and the base of the
+# exponential backoff between attempts.
+_MAX_RECONNECTS = 3
+_RECONNECT_BACKOFF_SECONDS = 1.0
+
+# Ticks queued for a room's reader. The upstream socket is shared, so it must never
+# wait on one room: a reader stalled on a previous-close fetch or a slow client drops
+# its oldest queued ticks past this bound instead — the latest price is what matters.
+_ROOM_INBOX_MAX = 64
+
+# Frames waiting for one slow client. Its sender drops the oldest past this — a stale
+# price is worth nothing once a newer one is queued — so a consumer that can't keep up
+# costs a few strings, never a stalled room. On a room teardown the final error frame
+# gets this long to drain before the client is closed.
+_CLIENT_QUEUE_MAX = 4
+_CLIENT_FLUSH_SECONDS = 1.0
+
+
+def _encode(message: dict) -> str:
+    """Serialize a frame once for every client in the room — byte-for-byte what
+    Starlette's ``send_json`` would have produced per client."""
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+class _Outbox:
+    """A client's bounded send queue, drained by its own sender task.
+
+    The room only ever ``push``es (never awaits a client), so one slow or stuck
+    connection can't delay the others; ``on_dead`` runs once when a send fails.
+    """
+
+    def __init__(self, client: Any, on_dead: Callable[[Any], None]):
+        self.client = client
+        self.frames: deque[str] = deque(maxlen=_CLIENT_QUEUE_MAX)
+        self.on_dead = on_dead
+        self._ready = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self.task = asyncio.create_task(self._drain(), name="live-price-client")
+
+    def push(self, text: str) -> None:
+        self.frames.append(text)
+        self._idle.clear()
+        self._ready.set()
+
+    async def flush(self, timeout: float) -> None:
+        """Wait (bounded) until everything pushed so far has been sent."""
+        if not self.task.done():
+            try:
+                await asyncio.wait_for(self._idle.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def cancel(self) -> None:
+        self.task.cancel()
+
+    async def _drain(self) -> None:
+        while True:
+            await self._ready.wait()
+            self._ready.clear()
+            while self.frames:
+                try:
+                    await self.client.send_text(self.frames.popleft())
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    self._idle.set()
+                    self.on_dead(self.client)
+                    return
+            self._idle.set()
+
+
+async def _open_fmp_ws(url: str, send_login: bool):
+    """Open + authenticate an upstream FMP socket (no subscriptions yet).
+
+    Pins the certifi TLS trust store and, for the crypto endpoint, sends the ``login``
+    event; the stock endpoint authenticates via the ``apikey`` in ``url``. Returns the
+    connected socket or raises — the pooled socket's reader owns the retry policy.
+    """
+    ws = await websockets.connect(
+        url,
+        # The trust store only applies to the real wss:// endpoints; websockets refuses
+        # an ssl argument for a plain ws:// URL (the local fake server in the tests).
+        ssl=_SSL_CONTEXT if url.startswith("wss://") else None,
+        ping_interval=20,
+        ping_timeout=10,
+        close_timeout=5,
+    )
+    if send_login:
+        try:
+            await ws.send(json.dumps({
+                "event": "login",
+                "data": {"apiKey": settings.FMP_API_KEY},
+            }))
+        except Exception:
+            # Handshake connected but the login failed — close the half-open socket
+            # before propagating so it doesn't leak past the caller's retry.
+            try:
+                await ws.close()
+            except Exception:
+                pass
+            raise
+    return ws
+
+
+async def _send_subscription(ws: Any, event: str, tickers: list[str]) -> None:
+    """Send ``subscribe``/``unsubscribe`` for ``tickers`` (wire casing), chunked.
+
+    A lone ticker goes out in the single-string form the per-ticker sockets always
+    used; several go out as FMP's list form, ``_SUBSCRIBE_CHUNK`` at a time.
+    """
+    for i in range(0, len(tickers), _SUBSCRIBE_CHUNK):
+        chunk = tickers[i:i + _SUBSCRIBE_CHUNK]
+        await ws.send(json.dumps({
+            "event": event,
+            "data": {"ticker": chunk[0] if len(chunk) == 1 else chunk},
+        }))
+
+
+class _UpstreamSocket:
+    """One pooled upstream FMP socket carrying many tickers of one endpoint.
+
+    Owns a single reader task for its lifetime: it connects (and, after a drop,
+    reconnects with backoff), re-subscribes every ticker it currently carries in bulk,
+    and hands each trade tick to the pool's ``on_tick`` by symbol.
+    """
+
+    def __init__(self, pool: "FMPUpstreamPool", url: str, send_login: bool):
+        self.pool = pool
+        self.url = url
+        self.send_login = send_login
+        self.kind = "crypto" if send_login else "stock"
+        # Room ticker (uppercase) -> the casing this endpoint subscribes with.
+        self.tickers: dict[str, str] = {}
+        self.ws: Any = None
+        self.task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self.task = asyncio.create_task(self._run(), name=f"fmp-upstream-{self.kind}")
+
+    async def add(self, ticker: str, wire: str) -> None:
+        self.tickers[ticker] = wire
+        # Not connected yet (or reconnecting): the connect path subscribes everything
+        # in `tickers`, this one included.
+        if self.ws is not None:
+            try:
+                await _send_subscription(self.ws, "subscribe", [wire])
+            except Exception:
+                pass  # the reader sees the close and re-subscribes in bulk
+
+    async def remove(self, ticker: str) -> None:
+        wire = self.tickers.pop(ticker, None)
+        if wire is not None and self.ws is not None:
+            try:
+                await _send_subscription(self.ws, "unsubscribe", [wire])
+            except Exception:
+                pass
+
+    async def close(self) -> None:
+        if self.task and not self.task.done() and self.task is not asyncio.current_task():
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+        if self.ws is not None:
+            try:
+                await self.ws.close()
+            except Exception:
+                pass
+            self.ws = None
+
+    async def _connect(self) -> None:
+        ws = await _open_fmp_ws(self.url, self.send_login)
+        # Publish the socket BEFORE snapshotting `tickers`, with no await in between:
+        # a ticker added from here on sends its own subscribe, one added before is in
+        # the snapshot. Either way nothing is missed (a duplicate is harmless).
+        self.ws = ws
+        await _send_subscription(ws, "subscribe", list(self.tickers.values()))
+        logger.info(
+            f"Live price upstream ({self.kind}): connected, "
+            f"subscribed {len(self.tickers)} tickers"
+        )
+
+    def _dispatch(self, data: Any) -> None:
+        # Trade ticks carry the symbol in "s" (lowercase on both endpoints); heartbeats
+        # and subscription acks don't, and FMP may batch several ticks in a list.
+        for item in data if isinstance(data, list) else (data,):
+            if not isinstance(item, dict):
+                continue
+            ticker = str(item.get("s") or "").upper()
+            if ticker in self.tickers:
+                self.pool._on_tick(ticker, item)
+
+    async def _run(self) -> None:
+        reconnect_attempts = 0
+        first = True
+
+        while True:
+            try:
+                if self.ws is None:
+                    if not first:
+                        if reconnect_attempts >= _MAX_RECONNECTS:
+                            logger.error(
+                                f"Live price upstream ({self.kind}): max reconnect attempts "
+                                f"reached, dropping {len(self.tickers)} tickers"
+                            )
+                            await self.pool._abandon(self)
+                            return
+                        delay = _RECONNECT_BACKOFF_SECONDS * (2 ** reconnect_attempts)
+                        logger.info(
+                            f"Live price upstream ({self.kind}): reconnecting in {delay}s "
+                            f"(attempt {reconnect_attempts + 1}/{_MAX_RECONNECTS})"
+                        )
+                        await asyncio.sleep(delay)
+                        reconnect_attempts += 1
+                    first = False
+                    try:
+                        await self._connect()
+                        reconnect_attempts = 0
+                    except Exception as e:
+                        logger.warning(
+                            f"Live price upstream ({self.kind}): connect failed: "
+                            f"{type(e).__name__}: {e}"
+                        )
+                        if self.ws is not None:
+                            try:
+                                await self.ws.close()
+                            except Exception:
+                                pass
+                        self.ws = None
+                        continue
+
+                raw = await self.ws.recv()
+                self._dispatch(json.loads(raw))
+
+            except websockets.exceptions.ConnectionClosed:
+                logger.warning(f"Live price upstream ({self.kind}): connection closed")
+                self.ws = None
+                continue
+
+            except asyncio.CancelledError:
+                return
+
+            except Exception as e:
+                logger.error(
+                    f"Live price upstream ({self.kind}): reader error: {e}",
+                    exc_info=True,
+                )
+                await asyncio.sleep(1)
+
+
+class FMPUpstreamPool:
+    """Multiplexes every watched ticker onto a few upstream FMP sockets.
+
+    Sockets are grouped per endpoint (``_fmp_ws_target`` decides stock vs crypto). A
+    new ticker joins the fullest socket of its endpoint that still has room, so tickers
+    pack onto as few sockets (and TLS sessions) as possible; once ``sockets_per_endpoint``
+    are open, the least loaded one takes it regardless. A socket with no tickers left
+    is closed.
+
+    ``on_tick(ticker, data)`` is called synchronously from a socket's reader for each
+    trade tick, so it must not block. ``on_lost(tickers)`` is awaited when a socket
+    exhausts its reconnects; those tickers are already dropped from the pool.
+    """
+
+    def __init__(
+        self,
+        on_tick: Callable[[str, dict], None],
+        on_lost: Callable[[list[str]], Awaitable[None]],
+        *,
+        symbols_per_socket: Optional[int] = None,
+        sockets_per_endpoint: Optional[int] = None,
+    ):
+        self._on_tick = on_tick
+        self._on_lost = on_lost
+        self._per_socket = max(1, symbols_per_socket or settings.LIVE_PRICE_UPSTREAM_SYMBOLS_PER_SOCKET)
+        self._max_sockets = max(
+            1, sockets_per_endpoint or settings.LIVE_PRICE_UPSTREAM_SOCKETS_PER_ENDPOINT
+        )
+        self._sockets: dict[str, list[_UpstreamSocket]] = {}
+        self._where: dict[str, _UpstreamSocket] = {}
+
+    def __len__(self) -> int:
+        """Number of open upstream sockets across both endpoints."""
+        return sum(len(group) for group in self._sockets.values())
+
+    def _place(self, url: str, send_login: bool) -> _UpstreamSocket:
+        group = self._sockets.setdefault(url, [])
+        roomy = [s for s in group if len(s.tickers) < self._per_socket]
+        if roomy:
+            return max(roomy, key=lambda s: len(s.tickers))
+        if len(group) < self._max_sockets:
+            sock = _UpstreamSocket(self, url, send_login)
+            group.append(sock)
+            sock.start()
+            return sock
+        return min(group, key=lambda s: len(s.tickers))
+
+    def _forget(self, sock: _UpstreamSocket) -> None:
+        group = self._sockets.get(sock.url, [])
+        if sock in group:
+            group.remove(sock)
+        if not group:
+            self._sockets.pop(sock.url, None)
+
+    async def subscribe(self, ticker: str) -> None:
+        """Start streaming ``ticker`` (a no-op when it already is)."""
+        if ticker in self._where:
+            return
+        url, send_login, wire = _fmp_ws_target(ticker)
+        sock = self._place(url, send_login)
+        self._where[ticker] = sock
+        await sock.add(ticker, wire)
+
+    async def unsubscribe(self, ticker: str) -> None:
+        """Stop streaming ``ticker``; closes its socket when it was the last one."""
+        sock = self._where.pop(ticker, None)
+        if sock is None:
+            return
+        if len(sock.tickers) <= 1:
+            sock.tickers.pop(ticker, None)
+            self._forget(sock)
+            await sock.close()
+        else:
+            await sock.remove(ticker)
+
+    async def _abandon(self, sock: _UpstreamSocket) -> None:
+        tickers = list(sock.tickers)
+        sock.tickers.clear()
+        for ticker in tickers:
+            if self._where.get(ticker) is sock:
+                del self._where[ticker]
+        self._forget(sock)
+        await self._on_lost(tickers)
+
+    async def close(self) -> None:
+        """Close every upstream socket. Called from the manager's shutdown."""
+        sockets = [s for group in self._sockets.values() for s in group]
+        self._sockets.clear()
+        self._where.clear()
+        for sock in sockets:
+            await sock.close()
+
 
 @dataclass
 class TickerRoom:
     """Represents a single ticker's live price room."""
     ticker: str
-    fmp_ws: Any = None  # websockets.WebSocketClientProtocol
     clients: set = field(default_factory=set)
+    # Per-client senders for plain WebSocket clients (a BatchedPriceClient buffers
+    # without blocking and is handed frames directly).
+    outboxes: dict = field(default_factory=dict)
+    # Trade ticks demuxed to this room by the upstream pool, drained by `reader_task`.
+    inbox: asyncio.Queue = field(default_factory=lambda: asyncio.Queue(maxsize=_ROOM_INBOX_MAX))
     reader_task: Optional[asyncio.Task] = None
     last_message: Optional[dict] = None
+    # `last_message` as sent — encoded once, replayed to each new subscriber.
+    last_text: Optional[str] = None
+    # Conflation window: the reader broadcasts at most once per this many seconds and
+    # then skips to the newest queued tick (0 forwards every tick).
+    frame_interval: float = 0.0
     previous_close: float = 0.0
     # UTC epoch-day the previous_close was fetched for (proxy for the trading day);
     # lets the reader detect a crossed day-boundary and refresh the reference close.
@@ -108,45 +479,69 @@ class TickerRoom:
 
 class LivePriceManager:
     """
-    Manages per-ticker FMP WebSocket connections and fans out
-    price updates to all subscribed iOS clients.
+    Manages per-ticker rooms over a pooled set of upstream FMP WebSockets
+    and fans out price updates to all subscribed iOS clients.
     """
 
     def __init__(self):
         self._rooms: dict[str, TickerRoom] = {}
         self._lock = asyncio.Lock()
+        self._upstream = FMPUpstreamPool(self._on_tick, self._on_upstream_lost)
 
     async def subscribe(self, ticker: str, client_ws: WebSocket):
         """
         Add a client to a ticker room.
-        Creates the room and opens an FMP connection if this is the first subscriber.
+        Creates the room and subscribes the ticker upstream if this is the first subscriber.
         """
-        async with self._lock:
-            room = self._rooms.get(ticker)
+        await self.subscribe_many([ticker], client_ws)
 
-            if room is None:
-                # First subscriber — create room and open FMP upstream
-                room = await self._create_room(ticker)
-                self._rooms[ticker] = room
+    async def subscribe_many(self, tickers: list[str], client_ws: WebSocket):
+        """Add a client to several ticker rooms, creating the ones that don't exist.
 
-            room.clients.add(client_ws)
-            logger.info(
-                f"Client subscribed to {ticker} "
-                f"(total: {len(room.clients)})"
-            )
+        The previous closes for new rooms are fetched concurrently and OUTSIDE the
+        lock; the lock is then taken once to register every room. Fetching inside it,
+        one ticker at a time, let a single 100-symbol subscribe hold every other
+        client's room join for seconds of REST round-trips.
 
-        # Send the last cached price immediately so the client doesn't
-        # have to wait for the next FMP tick
-        if room.last_message:
-            try:
-                await client_ws.send_json(room.last_message)
-            except Exception:
-                pass
+        A room another caller opened while the closes were in flight wins and the
+        prepared one is dropped; a room that closed in the meantime is reopened
+        without a close, which the reader fetches on its first tick.
+        """
+        tickers = list(dict.fromkeys(tickers))
+        prepared = {t: self._new_room(t) for t in tickers if t not in self._rooms}
+        if prepared:
+            await asyncio.gather(*(self._fetch_previous_close(r) for r in prepared.values()))
+
+        async with self._lock:
+            for ticker in tickers:
+                room = self._rooms.get(ticker)
+
+                if room is None:
+                    # First subscriber — start the room and subscribe upstream
+                    room = prepared.get(ticker) or self._new_room(ticker)
+                    await self._open_room(room)
+                    self._rooms[ticker] = room
+
+                if client_ws not in room.clients:
+                    room.clients.add(client_ws)
+                    if not isinstance(client_ws, BatchedPriceClient):
+                        room.outboxes[client_ws] = _Outbox(
+                            client_ws, lambda client, room=room: self._drop_client(room, client)
+                        )
+                logger.info(
+                    f"Client subscribed to {ticker} "
+                    f"(total: {len(room.clients)})"
+                )
+
+                # Queue the last cached price immediately so the client doesn't
+                # have to wait for the next FMP tick
+                if room.last_message:
+                    self._deliver(room, client_ws, room.last_message, room.last_text)
 
     async def unsubscribe(self, ticker: str, client_ws: WebSocket):
         """
         Remove a client from a ticker room.
-        Tears down the FMP connection if this was the last subscriber.
+        Unsubscribes the ticker upstream if this was the last subscriber.
         """
         async with self._lock:
             room = self._rooms.get(ticker)
@@ -154,13 +549,16 @@ class LivePriceManager:
                 return
 
             room.clients.discard(client_ws)
+            outbox = room.outboxes.pop(client_ws, None)
+            if outbox is not None:
+                outbox.cancel()
             logger.info(
                 f"Client unsubscribed from {ticker} "
                 f"(remaining: {len(room.clients)})"
             )
 
             if not room.clients:
-                # Last subscriber left — tear down FMP connection
+                # Last subscriber left — drop the ticker from its upstream socket
                 await self._destroy_room(room)
                 del self._rooms[ticker]
 
@@ -221,75 +619,30 @@ class LivePriceManager:
             return
         await self._fetch_previous_close(room)
 
-    async def _open_fmp_ws(self, ticker: str):
-        """Open + authenticate + subscribe an FMP upstream socket for ``ticker``.
-
-        Routes crypto vs stock to the correct endpoint (``_fmp_ws_target``), pins
-        the certifi TLS trust store, and sends the login (crypto only) + subscribe
-        events. Returns the connected socket or raises — the caller decides whether
-        the failure is fatal (room creation) or triggers a backoff-retry (reader).
-        """
-        url, send_login, sub_ticker = _fmp_ws_target(ticker)
-        ws = await websockets.connect(
-            url,
-            ssl=_SSL_CONTEXT,
-            ping_interval=20,
-            ping_timeout=10,
-            close_timeout=5,
-        )
-        try:
-            # Crypto socket authenticates via an explicit login event; the stock
-            # socket authenticates via the apikey URL query param (login no-op there).
-            if send_login:
-                await ws.send(json.dumps({
-                    "event": "login",
-                    "data": {"apiKey": settings.FMP_API_KEY},
-                }))
-            await ws.send(json.dumps({
-                "event": "subscribe",
-                "data": {"ticker": sub_ticker},
-            }))
-        except Exception:
-            # Handshake connected but auth/subscribe failed — close the half-open
-            # socket before propagating so it doesn't leak past the caller's
-            # `fmp_ws = None` reset.
-            try:
-                await ws.close()
-            except Exception:
-                pass
-            raise
-        return ws
-
-    async def _create_room(self, ticker: str) -> TickerRoom:
-        """Open an upstream FMP WebSocket and start the reader task."""
-        room = TickerRoom(ticker=ticker)
+    def _new_room(self, ticker: str) -> TickerRoom:
+        """A room not yet started. `subscribe_many` fetches its previous close (for
+        change/changePercent) before opening it — best-effort; the reader loop lazily
+        retries if that fails, so change% never stays pinned at 0."""
+        fps = settings.LIVE_PRICE_MAX_FRAMES_PER_SECOND
+        return TickerRoom(ticker=ticker, frame_interval=1.0 / fps if fps > 0 else 0.0)
 
-        # Fetch previous close for computing change/changePercent (best-effort; the
-        # reader loop lazily retries if this fails so change% never stays pinned at 0).
-        await self._fetch_previous_close(room)
-
-        # Connect to FMP WebSocket (best-effort; the reader loop retries on failure
-        # so a transient handshake error never leaves the room permanently dead).
-        try:
-            room.fmp_ws = await self._open_fmp_ws(ticker)
-            logger.info(f"Room {ticker}: FMP WebSocket connected and subscribed")
-        except Exception as e:
-            logger.error(
-                f"Room {ticker}: failed to connect to FMP WebSocket: "
-                f"{type(e).__name__}: {e}"
-            )
-            room.fmp_ws = None
+    async def _open_room(self, room: TickerRoom) -> None:
+        """Start the room's reader and subscribe the ticker on the upstream pool."""
+        ticker = room.ticker
 
-        # Start the reader task that fans out FMP messages to clients
+        # Start the reader task that fans out this room's ticks to clients
         room.reader_task = asyncio.create_task(
-            self._fmp_reader(room),
-            name=f"fmp-reader-{ticker}",
+            self._room_reader(room),
+            name=f"live-price-room-{ticker}",
         )
 
-        return room
+        # Best-effort and non-blocking: the pooled socket connects (or reconnects) in
+        # its own task and subscribes every ticker it carries once it is up.
+        await self._upstream.subscribe(ticker)
+        logger.info(f"Room {ticker}: subscribed upstream ({len(self._upstream)} sockets open)")
 
     async def _destroy_room(self, room: TickerRoom):
-        """Close FMP connection and cancel the reader task."""
+        """Unsubscribe the ticker upstream and cancel the room's reader task."""
         ticker = room.ticker
 
         if room.reader_task and not room.reader_task.done():
@@ -299,93 +652,79 @@ class LivePriceManager:
             except asyncio.CancelledError:
                 pass
 
-        if room.fmp_ws:
-            try:
-                # Unsubscribe before closing, using the same ticker casing the
-                # subscribe used (lowercase for crypto, uppercase for stocks).
-                _, _, sub_ticker = _fmp_ws_target(ticker)
-                unsub_msg = json.dumps({
-                    "event": "unsubscribe",
-                    "data": {"ticker": sub_ticker}
-                })
-                await room.fmp_ws.send(unsub_msg)
-                await room.fmp_ws.close()
-            except Exception:
-                pass
+        for outbox in room.outboxes.values():
+            outbox.cancel()
+        room.outboxes.clear()
 
-        logger.info(f"Room {ticker}: destroyed")
+        await self._upstream.unsubscribe(ticker)
 
-    async def _fmp_reader(self, room: TickerRoom):
-        """
-        Read messages from FMP WebSocket and broadcast to all clients.
-        Handles reconnection on unexpected disconnects.
-        """
-        reconnect_attempts = 0
-        max_reconnects = 3
-        backoff_base = 1.0
+        logger.info(f"Room {ticker}: destroyed")
 
-        while True:
+    def _on_tick(self, ticker: str, data: dict) -> None:
+        """Demux an upstream tick into its room's inbox (latest wins when full)."""
+        room = self._rooms.get(ticker)
+        if room is None:
+            return
+        if room.inbox.full():
             try:
-                if room.fmp_ws is None:
-                    # Attempt reconnect
-                    if reconnect_attempts >= max_reconnects:
-                        logger.error(
-                            f"Room {room.ticker}: max reconnect attempts reached, "
-                            f"notifying clients and cleaning up"
-                        )
-                        await self._broadcast(room, {
-                            "type": "error",
-                            "message": "Live price feed unavailable"
-                        })
-                        # Clean up the orphaned room so it doesn't persist as a zombie
-                        async with self._lock:
-                            if room.ticker in self._rooms:
-                                for client in list(room.clients):
-                                    try:
-                                        await client.close()
-                                    except Exception:
-                                        pass
-                                room.clients.clear()
-                                if room.fmp_ws:
-                                    try:
-                                        await room.fmp_ws.close()
-                                    except Exception:
-                                        pass
-                                del self._rooms[room.ticker]
-                                logger.info(f"Room {room.ticker}: orphaned room cleaned up")
-                        return
-
-                    delay = backoff_base * (2 ** reconnect_attempts)
-                    logger.info(
-                        f"Room {room.ticker}: reconnecting in {delay}s "
-                        f"(attempt {reconnect_attempts + 1}/{max_reconnects})"
-                    )
-                    await asyncio.sleep(delay)
-                    reconnect_attempts += 1
+                room.inbox.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+        room.inbox.put_nowait(data)
 
+    async def _on_upstream_lost(self, tickers: list[str]) -> None:
+        """An upstream socket gave up reconnecting: notify and clean up its rooms so
+        they don't persist as zombies (the next subscriber starts afresh)."""
+        async with self._lock:
+            for ticker in tickers:
+                room = self._rooms.pop(ticker, None)
+                if room is None:
+                    continue
+                await self._broadcast(room, {
+                    "type": "error",
+                    "symbol": ticker,
+                    "message": "Live price feed unavailable"
+                })
+                # Let the error frame reach each client before closing it.
+                await asyncio.gather(*(
+                    outbox.flush(_CLIENT_FLUSH_SECONDS) for outbox in room.outboxes.values()
+                ))
+                for client in list(room.clients):
                     try:
-                        room.fmp_ws = await self._open_fmp_ws(room.ticker)
-                        logger.info(f"Room {room.ticker}: reconnected to FMP")
-                        reconnect_attempts = 0
-                    except Exception as e:
-                        logger.warning(
-                            f"Room {room.ticker}: reconnect failed: "
-                            f"{type(e).__name__}: {e}"
-                        )
-                        room.fmp_ws = None
-                        continue
+                        await client.close()
+                    except Exception:
+                        pass
+                room.clients.clear()
+                for outbox in room.outboxes.values():
+                    outbox.cancel()
+                room.outboxes.clear()
+                if room.reader_task and not room.reader_task.done():
+                    room.reader_task.cancel()
+                logger.info(f"Room {ticker}: orphaned room cleaned up")
+
+    async def _room_reader(self, room: TickerRoom):
+        """
+        Drain the room's inbox of upstream ticks and broadcast to all clients.
+        Reconnection is the upstream socket's job; this only ever sees trade data.
 
-                # Read next message from FMP
-                raw = await room.fmp_ws.recv()
-                data = json.loads(raw)
+        Conflated: after each broadcast the reader sleeps out the room's
+        ``frame_interval`` and then keeps only the newest trade queued meanwhile, so a
+        hot symbol costs at most LIVE_PRICE_MAX_FRAMES_PER_SECOND frames a second no
+        matter how fast FMP ticks it.
+        """
+        while True:
+            try:
+                data = await room.inbox.get()
+                # Latest wins: every tick queued behind this one is newer.
+                while not room.inbox.empty():
+                    newer = room.inbox.get_nowait()
+                    if newer.get("lp") is not None:
+                        data = newer
 
                 # FMP sends various message types; we only care about trade ticks
-                # Format: {"s":"AAPL","t":1234567890,"type":"T","lp":150.25,
+                # Format: {"s":"aapl","t":1234567890,"type":"T","lp":150.25,
                 #          "ls":100,"v":42500000,"ap":150.20,"bp":150.19,...}
-                if not isinstance(data, dict):
-                    continue
-
-                # Skip non-trade messages (heartbeats, subscription confirmations)
+                # Skip non-trade messages (quotes without a last price)
                 last_price = data.get("lp")
                 if last_price is None:
                     continue
@@ -424,15 +763,18 @@ class LivePriceManager:
                     "timestamp": data.get("t"),
                 }
 
-                room.last_message = message
                 await self._broadcast(room, message)
-
-            except websockets.exceptions.ConnectionClosed:
-                logger.warning(
-                    f"Room {room.ticker}: FMP WebSocket connection closed"
+                # The same trade feeds the shared latest-quote bus, so price alerts,
+                # the Updates sweeper and the widgets see it without a quote call.
+                get_price_bus().publish_trade(
+                    room.ticker,
+                    last_price,
+                    previous_close=room.previous_close or None,
+                    volume=data.get("v"),
+                    timestamp=data.get("t"),
                 )
-                room.fmp_ws = None
-                continue
+                if room.frame_interval:
+                    await asyncio.sleep(room.frame_interval)
 
             except asyncio.CancelledError:
                 return
@@ -442,29 +784,40 @@ class LivePriceManager:
                     f"Room {room.ticker}: reader error: {e}",
                     exc_info=True,
                 )
-                await asyncio.sleep(1)
 
     async def _broadcast(self, room: TickerRoom, message: dict):
-        """Send a message to all connected clients. Remove dead connections."""
-        # Snapshot to avoid RuntimeError if clients set is mutated during iteration
-        clients_snapshot = list(room.clients)
-        dead_clients = []
+        """Queue a message for every client in the room without awaiting any of them.
 
-        for client in clients_snapshot:
-            try:
-                await client.send_json(message)
-            except Exception:
-                dead_clients.append(client)
-
-        for client in dead_clients:
-            room.clients.discard(client)
-            logger.debug(
-                f"Room {room.ticker}: removed dead client "
-                f"(remaining: {len(room.clients)})"
-            )
+        Encoded ONCE here, however many clients there are; each plain client's
+        `_Outbox` sends it concurrently with the others and drops stale frames when
+        it falls behind. A price update also becomes the room's replayed snapshot.
+        """
+        text = _encode(message)
+        if message.get("type") == "price_update":
+            room.last_message = message
+            room.last_text = text
+        # Snapshot: a failed send may drop a client while we iterate
+        for client in list(room.clients):
+            self._deliver(room, client, message, text)
+
+    def _deliver(self, room: TickerRoom, client: Any, message: dict, text: Optional[str]) -> None:
+        outbox = room.outboxes.get(client)
+        if outbox is not None:
+            outbox.push(text if text is not None else _encode(message))
+        elif isinstance(client, BatchedPriceClient):
+            client.offer(message)
+
+    def _drop_client(self, room: TickerRoom, client: Any) -> None:
+        """A send failed: the connection is dead. Its endpoint still unsubscribes."""
+        room.clients.discard(client)
+        room.outboxes.pop(client, None)
+        logger.debug(
+            f"Room {room.ticker}: removed dead client "
+            f"(remaining: {len(room.clients)})"
+        )
 
     async def shutdown(self):
-        """Gracefully close all rooms. Called from app lifespan shutdown."""
+        """Gracefully close all rooms and upstream sockets. Called from app lifespan shutdown."""
         async with self._lock:
             tickers = list(self._rooms.keys())
             for ticker in tickers:
@@ -477,9 +830,72 @@ class LivePriceManager:
                         pass
                 await self._destroy_room(room)
             self._rooms.clear()
+            await self._upstream.close()
             logger.info("LivePriceManager: all rooms shut down")
 
 
+class BatchedPriceClient:
+    """A room client standing in for ONE socket that watches many tickers.
+
+    The multi-ticker endpoint joins each of its tickers' rooms with this instead of
+    the raw WebSocket. Rooms hand it their messages through ``offer`` (it never blocks,
+    so it needs no `_Outbox`) and ``close`` it on teardown. Price updates land in a per-symbol slot (latest
+    wins) and ``run`` flushes them as one ``{"type": "prices", "data": [...]}`` frame at
+    most every ``interval`` seconds — one send per batch, not per tick per symbol.
+    Other room messages (a feed-unavailable error) go out on the next flush, and an
+    error for a symbol drops it from ``symbols``: its room is gone.
+
+    ``close`` deliberately does nothing. A room closes its clients when its upstream
+    is lost or on shutdown, but the connection belongs to the endpoint and still
+    carries every other symbol; the endpoint closes it.
+    """
+
+    def __init__(self, websocket: Any, interval: float):
+        self.websocket = websocket
+        self.interval = interval
+        self.symbols: set[str] = set()
+        self._prices: dict[str, dict] = {}
+        self._notices: list[dict] = []
+        self._ready = asyncio.Event()
+
+    async def send_json(self, message: dict) -> None:
+        self.offer(message)
+
+    def offer(self, message: dict) -> None:
+        """Buffer a room message for the next flush; never blocks."""
+        if message.get("type") == "price_update":
+            symbol = message.get("symbol")
+            if symbol in self.symbols:
+                self._prices[symbol] = message
+        else:
+            if message.get("symbol"):
+                self.symbols.discard(message["symbol"])
+                self._prices.pop(message["symbol"], None)
+            self._notices.append(message)
+        self._ready.set()
+
+    async def close(self) -> None:
+        pass
+
+    def forget(self, symbol: str) -> None:
+        """Drop a symbol the client unsubscribed from, pending update included."""
+        self.symbols.discard(symbol)
+        self._prices.pop(symbol, None)
+
+    async def run(self) -> None:
+        """Flush pending frames until cancelled; a failed send ends the loop."""
+        while True:
+            await self._ready.wait()
+            self._ready.clear()
+            notices, self._notices = self._notices, []
+            prices, self._prices = list(self._prices.values()), {}
+            for notice in notices:
+                await self.websocket.send_json(notice)
+            if prices:
+                await self.websocket.send_json({"type": "prices", "data": prices})
+            await asyncio.sleep(self.interval)
+
+
 # Singleton
 _manager: Optional[LivePriceManager] = None
 
@@ -17,7 +17,7 @@ from datetime import datetime, timezone, timedelta
 from app.utils.market_hours import to_utc_instant
 from typing import List, Dict, Any, Optional
 
-from app.database import get_supabase
+from app.database import get_async_supabase, get_supabase
 from app.services.agents.persona_config import neutral_system_instruction
 from app.integrations.apewisdom import get_all_mentions
 from app.integrations.fmp import (
@@ -229,11 +229,7 @@ class NewsCacheService:
         ticker = ticker.upper()
 
         # ── 1. Check cache ──
-        # The Supabase SDK is synchronous; called directly it would block the
-        # event loop for the whole round-trip on the hottest read of this tab.
-        cached_articles = await asyncio.to_thread(
-            self._get_cached, ticker, limit, offset
-        )
+        cached_articles = await self._get_cached(ticker, limit, offset)
         if offset > 0:
             return {
                 "articles": self._format_response(cached_articles),
@@ -294,10 +290,7 @@ class NewsCacheService:
         symbol = symbol.upper()
 
         # 1. Check cache (keyed by index symbol)
-        # Off-thread: the Supabase SDK is synchronous, so reading it inline stalls
-        # the whole event loop for the round-trip (the ticker/market paths already
-        # offload this; the index path did not).
-        cached_articles = await asyncio.to_thread(self._get_cached, symbol, limit)
+        cached_articles = await self._get_cached(symbol, limit)
         if cached_articles:
             logger.info(f"Index news cache HIT for {symbol}: {len(cached_articles)} articles")
             return {
@@ -367,11 +360,8 @@ class NewsCacheService:
         ends there, and refetching page 1 from upstream to satisfy it would burn
         quota to return rows the client already has.
         """
-        # Sync SDK — keep it off the event loop. This is the Updates screen's
-        # default tab, so it is the hottest read in the feature.
-        cached_articles = await asyncio.to_thread(
-            self._get_cached, MARKET_SCOPE, limit, offset
-        )
+        # The Updates screen's default tab, so the hottest read in the feature.
+        cached_articles = await self._get_cached(MARKET_SCOPE, limit, offset)
         if offset > 0:
             return {
                 "articles": self._format_response(cached_articles),
@@ -1186,11 +1176,16 @@ Return a JSON array with one object per article in order. Each object must have:
 
     # ── Private: Cache lookup ─────────────────────────────────────────
 
-    def _get_cached(
+    async def _get_cached(
         self, ticker: str, limit: int, offset: int = 0
     ) -> List[Dict[str, Any]]:
         """Query ticker_news_cache for fresh (non-expired) rows.
 
+        Async PostgREST (database.get_async_supabase), not the sync SDK behind
+        ``to_thread``: this is the first read of the Updates screen and every detail
+        News tab, and under a burst each call held an executor thread for its whole
+        round-trip.
+
         ``offset`` pages deeper into the retained history. The sweeper refreshes
         on a 96h lookback, so a busy scope holds several days of rows while a
         single page shows well under one — `.range()` is what lets the client
@@ -1202,8 +1197,9 @@ Return a JSON array with one object per article in order. Each object must have:
         repeat or skip rows that page 1 already returned.
         """
         try:
-            result = (
-                self.supabase.table("ticker_news_cache")
+            result = await (
+                get_async_supabase()
+                .table("ticker_news_cache")
                 .select("*")
                 .eq("ticker", ticker)
                 .gte("expires_at", datetime.now(timezone.utc).isoformat())
@@ -26,6 +26,8 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
+import os
+import socket
 from datetime import datetime, timezone
 from typing import AsyncIterator, Optional
 
@@ -367,3 +369,104 @@ async def claimed_scheduled_job(
                 timezone_name=timezone_name,
             )
         )
+
+
+# ─────────────────────────────────────────────────────────────────────────────────────
+# Per-pass job leases, added in migration 154.
+#
+# For the background jobs that can run in either the API process or the worker
+# (app/jobs.py). They run every hour or two, so the daily claim above is the wrong shape:
+# what they need is "I am running this pass, until T". The scheduler takes the lease
+# around each pass through `job_lease` (its `lease` hook); a process that is refused
+# skips that tick.
+#
+#   * Fail-closed, like the claims: a failed claim RPC costs one skipped tick, a
+#     duplicated pass costs the FMP spend the job's cadence exists to bound.
+#   * Leases are not renewed. The release in `finally` (shielded, as above) is the normal
+#     path; `lease_seconds` expiring is the crash path.
+#   * The holder is host:pid, so two processes on one host — or a restarted worker
+#     reusing a host name — never mistake each other's lease for their own.
+# ─────────────────────────────────────────────────────────────────────────────────────
+
+_LEASE_HOLDER = f"{socket.gethostname()}:{os.getpid()}"
+
+
+def claim_lease(
+    job: str, lease_seconds: float, *, holder: str = _LEASE_HOLDER, now: Optional[datetime] = None
+) -> bool:
+    """Try to take the lease on `job` for one pass. True = it's yours. False on ANY error."""
+    stamp = (now or datetime.now(timezone.utc)).isoformat()
+    try:
+        result = _sb().rpc(
+            "claim_job_lease",
+            {
+                "p_job": job,
+                "p_holder": holder,
+                "p_now": stamp,
+                "p_lease_seconds": max(1, int(lease_seconds)),
+            },
+        ).execute()
+        return bool(result.data)
+    except Exception as e:
+        logger.warning(
+            "job %s: lease claim failed (%s: %s) — skipping this pass",
+            job, type(e).__name__, e,
+        )
+        return False
+
+
+def release_lease(
+    job: str,
+    *,
+    success: bool,
+    error: Optional[str] = None,
+    holder: str = _LEASE_HOLDER,
+    now: Optional[datetime] = None,
+) -> None:
+    """Release our lease and record the outcome. Best-effort, never raises.
+
+    A failure here only delays the next pass until the lease lapses.
+    """
+    stamp = (now or datetime.now(timezone.utc)).isoformat()
+    try:
+        _sb().rpc(
+            "release_job_lease",
+            {
+                "p_job": job,
+                "p_holder": holder,
+                "p_now": stamp,
+                "p_success": success,
+                "p_error": (error or None) and str(error)[:500],
+            },
+        ).execute()
+    except Exception as e:
+        logger.warning(
+            "job %s: lease release failed (%s: %s) — it will lapse on its own",
+            job, type(e).__name__, e,
+        )
+
+
+@contextlib.asynccontextmanager
+async def job_lease(job: str, lease_seconds: float) -> AsyncIterator[bool]:
+    """Hold the lease on `job` for the duration of the block. Yields whether it was granted.
+
+    The signature is the scheduler's `LeaseHook` (app/core/scheduler.py).
+    """
+    granted = await asyncio.to_thread(claim_lease, job, lease_seconds)
+    if not granted:
+        yield False
+        return
+
+    error: Optional[str] = None
+    try:
+        yield True
+    except asyncio.CancelledError:
+        error = "cancelled (shutdown)"
+        raise
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        await asyncio.shield(
+            asyncio.to_thread(release_lease, job, success=error is None, error=error)
+        )
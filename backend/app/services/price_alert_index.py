@@ -0,0 +1,218 @@
+"""Price-alert trigger index — which rules can a new price possibly change?
+
+`evaluate_alert` is cheap, but applying it to every active rule on every price means a
+scan of the whole rule set per quote. That is what kept alerts on a polling cadence:
+fine once a minute, unaffordable per live trade. This index answers the narrower
+question in O(log n + k) — given a symbol's new price, the k rules whose decision could
+differ from "hold" — so a live trade can be checked the moment it arrives.
+
+Pure, like the engine: no I/O, no clock.
+
+EACH RULE WAITS ON EXACTLY ONE BOUNDARY. For a crossing rule the engine reads nothing
+from `last_price` but which SIDE of the threshold it is on (`prev < limit`, `prev >
+limit`), and a latched rule reads nothing from it at all. So between the events below,
+evaluating a rule can only restate its current side — never fire, never move the latch.
+The one boundary each rule waits on, by state:
+
+    kind          state                   touched when the price …
+    price_above   armed, below the line   rises to  >= threshold      (fires)
+    price_above   armed, at/above it      drops to  <  threshold      (new baseline side)
+    price_above   latched                 drops to  <= re-arm level   (re-arms)
+    price_below   armed, above the line   falls to  <= threshold      (fires)
+    price_below   armed, at/below it      rises to  >  threshold      (new baseline side)
+    price_below   latched                 rises to  >= re-arm level   (re-arms)
+    percent_move  any                     |day move| >= threshold     (fires)
+
+Never-observed rules (`last_price` unusable) are always returned — the engine seeds
+them on first sight. Rules the engine would hold forever (unknown kind, unusable
+threshold) are not indexed at all.
+
+Each boundary family is one sorted list of ``(key, rule_id)`` per symbol, so a price
+selects its crossed rules as a prefix or suffix found by bisection, and re-indexing a
+touched rule is a bisect-remove plus an insort.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from app.services.price_alert_engine import (
+    KIND_ABOVE,
+    KIND_PERCENT,
+    VALID_KINDS,
+    finite_percent,
+    finite_price,
+)
+
+# Sorts after every rule id, so `(price, _TOP)` bisects to the right of all entries at
+# exactly `price`.
+_TOP = "\U0010ffff"
+
+# Boundary families. `up_*` are crossed by prices at or above their key, `down_*` by
+# prices at or below it; `_gt` / `_lt` exclude the key itself.
+_UP_GE = "up_ge"
+_UP_GT = "up_gt"
+_DOWN_LE = "down_le"
+_DOWN_LT = "down_lt"
+_PCT = "pct"
+_COLD = "cold"
+
+
+class _Book:
+    """One symbol's boundaries."""
+
+    __slots__ = (_UP_GE, _UP_GT, _DOWN_LE, _DOWN_LT, _PCT, _COLD)
+
+    def __init__(self) -> None:
+        self.up_ge: List[Tuple[float, str]] = []
+        self.up_gt: List[Tuple[float, str]] = []
+        self.down_le: List[Tuple[float, str]] = []
+        self.down_lt: List[Tuple[float, str]] = []
+        self.pct: List[Tuple[float, str]] = []
+        self.cold: Set[str] = set()
+
+    def __bool__(self) -> bool:
+        return any(getattr(self, name) for name in self.__slots__)
+
+
+def boundary(rule: Dict[str, Any], rearm_pct: float) -> Optional[Tuple[str, Optional[float]]]:
+    """The one ``(family, key)`` ``rule`` waits on in its current state, or None.
+
+    Mirrors `evaluate_alert`'s branches; see the table in the module docstring.
+    """
+    kind = rule.get("kind")
+    if kind not in VALID_KINDS:
+        return None
+    if kind == KIND_PERCENT:
+        limit = finite_percent(rule.get("threshold"))
+        if limit is None or limit <= 0:
+            return None
+        return _PCT, limit
+    limit = finite_price(rule.get("threshold"))
+    if limit is None:
+        return None
+    prev = finite_price(rule.get("last_price"))
+    if prev is None:
+        return _COLD, None
+    armed = bool(rule.get("armed", True))
+    if kind == KIND_ABOVE:
+        if not armed:
+            return _DOWN_LE, limit * (1 - rearm_pct)
+        return (_UP_GE, limit) if prev < limit else (_DOWN_LT, limit)
+    if not armed:
+        return _UP_GE, limit * (1 + rearm_pct)
+    return (_DOWN_LE, limit) if prev > limit else (_UP_GT, limit)
+
+
+class PriceAlertIndex:
+    """Active rules by symbol, sorted by the price that would next change each one."""
+
+    def __init__(self, rearm_pct: float) -> None:
+        self.rearm_pct = rearm_pct
+        self._rules: Dict[str, Dict[str, Any]] = {}
+        self._books: Dict[str, _Book] = {}
+        # rule id → (symbol, family, key): where to find it again to move or drop it.
+        self._where: Dict[str, Tuple[str, str, Optional[float]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def __contains__(self, rule_id: object) -> bool:
+        return str(rule_id) in self._rules
+
+    def symbols(self) -> List[str]:
+        return list(self._books)
+
+    def rule(self, rule_id: str) -> Optional[Dict[str, Any]]:
+        return self._rules.get(str(rule_id))
+
+    def replace(self, rules: List[Dict[str, Any]]) -> None:
+        """Rebuild from a fresh read of the active rules.
+
+        Sorted once per family rather than insorted rule by rule.
+        """
+        self._rules.clear()
+        self._books.clear()
+        self._where.clear()
+        for rule in rules:
+            slot = self._locate(rule)
+            if slot is not None and slot[1] != _COLD:
+                symbol, family, key = slot
+                getattr(self._books[symbol], family).append((key, str(rule["id"])))
+        for book in self._books.values():
+            for name in (_UP_GE, _UP_GT, _DOWN_LE, _DOWN_LT, _PCT):
+                getattr(book, name).sort()
+
+    def place(self, rule: Dict[str, Any]) -> None:
+        """Index ``rule`` at its current state, replacing any earlier placement."""
+        self.remove(rule.get("id"))
+        slot = self._locate(rule)
+        if slot is not None and slot[1] != _COLD:
+            symbol, family, key = slot
+            insort(getattr(self._books[symbol], family), (key, str(rule["id"])))
+
+    def remove(self, rule_id: Any) -> None:
+        rid = str(rule_id)
+        self._rules.pop(rid, None)
+        where = self._where.pop(rid, None)
+        if where is None:
+            return
+        symbol, family, key = where
+        book = self._books[symbol]
+        if family == _COLD:
+            book.cold.discard(rid)
+        else:
+            entries = getattr(book, family)
+            i = bisect_left(entries, (key, rid))
+            if i < len(entries) and entries[i] == (key, rid):
+                del entries[i]
+        if not book:
+            del self._books[symbol]
+
+    def crossed(
+        self, symbol: str, price: Any, change_percent: Any = None
+    ) -> List[Dict[str, Any]]:
+        """The rules whose decision ``price`` (and the day move) could change.
+
+        Every rule NOT returned would evaluate to a hold that restates its side. An
+        unusable price crosses no price boundary, exactly as the engine holds on it.
+        """
+        book = self._books.get(symbol.upper())
+        if book is None:
+            return []
+        ids: List[str] = list(book.cold)
+        p = finite_price(price)
+        if p is not None:
+            ids.extend(rid for _, rid in book.up_ge[: bisect_right(book.up_ge, (p, _TOP))])
+            ids.extend(rid for _, rid in book.up_gt[: bisect_left(book.up_gt, (p, ""))])
+            ids.extend(rid for _, rid in book.down_le[bisect_left(book.down_le, (p, "")):])
+            ids.extend(rid for _, rid in book.down_lt[bisect_right(book.down_lt, (p, _TOP)):])
+        move = finite_percent(change_percent)
+        if move is not None:
+            ids.extend(rid for _, rid in book.pct[: bisect_right(book.pct, (abs(move), _TOP))])
+        return [self._rules[rid] for rid in ids]
+
+    def _locate(self, rule: Dict[str, Any]) -> Optional[Tuple[str, str, Optional[float]]]:
+        """Record ``rule`` and where it belongs, leaving the sorted entry to the caller
+        (`replace` appends and sorts once; `place` insorts).
+
+        Returns the placement, or None for a rule the engine would hold forever.
+        """
+        rid = rule.get("id")
+        symbol = str(rule.get("ticker") or "").upper()
+        if rid is None or not symbol:
+            return None
+        slot = boundary(rule, self.rearm_pct)
+        if slot is None:
+            return None
+        rid = str(rid)
+        family, key = slot
+        book = self._books.get(symbol)
+        if book is None:
+            book = self._books[symbol] = _Book()
+        self._rules[rid] = rule
+        self._where[rid] = (symbol, family, key)
+        if family == _COLD:
+            book.cold.add(rid)
+        return symbol, family, key
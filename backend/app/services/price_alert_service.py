@@ -17,8 +17,26 @@ Three reasons it is not:
   3. The sweeper's 150-second startup stagger and jitter are tuned for its own Gemini
      budget. Coupling the two makes both harder to reason about.
 
-Cost is one `batch-quote` call per cycle over the DISTINCT alerted tickers, which is a
-short list. `PRICE_ALERT_INTERVAL_SECONDS` is the single knob.
+Quotes come from the shared price bus (`price_bus`), which its poller and the live
+sockets keep fresh for every alerted ticker; a cycle pays at most one `batch-quote` call
+over the DISTINCT alerted tickers the bus does not hold fresh, which is a short list.
+`PRICE_ALERT_INTERVAL_SECONDS` is the single knob.
+
+ONE CYCLE IS SET-BASED. Every rule is decided in memory first; only the rules whose
+state actually changed (a seed, a new baseline, the latch moving, a fire) are written,
+in chunks through `apply_price_alert_states` (migration 155) rather than one UPDATE per
+rule; and the fired alerts go out as one `notify_each` fan-out whose recipient lookups
+are shared. The per-rule version cost one round-trip per rule per cycle, changed or not,
+which stops fitting in a minute somewhere in the tens of thousands of rules.
+
+ONLY CROSSED RULES ARE TOUCHED. Each cycle rebuilds a `PriceAlertIndex` from the rules it
+read — per symbol, every rule sorted by the one price that would next change it — and
+evaluates just the rules a symbol's quote has crossed. The same index then answers
+between cycles: every price-bus update (a live trade, a poll) is checked against it
+inline, and a crossed rule is evaluated within the event loop's next turn instead of at
+the next cycle. That path only sees trades where the live sockets are, i.e. when this
+loop runs in the web process; under a separate worker it idles and the cycle alone
+decides, as before. `PRICE_ALERT_LIVE_TRIGGERS` switches it off.
 
 NO CROSS-INSTANCE CLAIM, deliberately. Two instances both evaluating is harmless: the
 dedup key in `notification_events` is the lock, so the second instance's claim conflicts
@@ -30,12 +48,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from app.config import settings
 from app.database import get_supabase
-from app.integrations.fmp import get_fmp_client
 from app.services.notification_kinds import KIND_PRICE_ALERT
 from app.services.price_alert_engine import (
     KIND_PERCENT,
@@ -46,7 +64,13 @@ from app.services.price_alert_engine import (
     finite_percent,
     finite_price,
 )
-from app.services.push_dispatch_service import get_push_dispatch_service, trading_date_et
+from app.services.price_alert_index import PriceAlertIndex
+from app.services.price_bus import get_price_bus
+from app.services.push_dispatch_service import (
+    OutgoingPush,
+    get_push_dispatch_service,
+    trading_date_et,
+)
 from app.utils.market_hours import session_phase
 
 logger = logging.getLogger(__name__)
@@ -58,7 +82,15 @@ TABLE = "price_alerts"
 MAX_UNIVERSE = 500
 
 # Bound on rules loaded per cycle.
-MAX_RULES = 5_000
+MAX_RULES = 50_000
+
+# Rules read per page. PostgREST caps a single response at ~1000 rows by default, so a
+# bare `.limit(MAX_RULES)` silently returned the first thousand.
+_RULE_PAGE = 1000
+
+# Changed rows per `apply_price_alert_states` call. The rows travel in the POST body, so
+# this bounds statement size rather than a URL.
+_STATE_WRITE_CHUNK = 1000
 
 
 class PriceAlertLimitReached(Exception):
@@ -81,6 +113,17 @@ class PriceAlertUnavailable(Exception):
 class PriceAlertService:
     def __init__(self) -> None:
         self.supabase = get_supabase()
+        self._index = PriceAlertIndex(settings.PRICE_ALERT_REARM_PCT)
+        # One decide → write → send pass at a time, cycle or live: both read the index's
+        # rule state and write it back.
+        self._lock = asyncio.Lock()
+        self._unsubscribe_bus: Optional[Callable[[], None]] = None
+        self._live_symbols: Set[str] = set()
+        self._live_task: Optional[asyncio.Task] = None
+        # Rule id → monotonic time of a user edit or delete. Written from the CRUD
+        # threads, so only plain dict stores; the live path skips these rules until a
+        # cycle has re-read them, rather than writing stale state over the edit.
+        self._edited: Dict[str, float] = {}
 
     # ── CRUD ─────────────────────────────────────────────────────────
 
@@ -235,6 +278,7 @@ class PriceAlertService:
             raise PriceAlertInvalid("Nothing to update.")
         clean["updated_at"] = datetime.now(timezone.utc).isoformat()
 
+        self._edited[str(alert_id)] = time.monotonic()
         try:
             result = (
                 self.supabase.table(TABLE)
@@ -254,6 +298,7 @@ class PriceAlertService:
 
     def delete(self, user_id: str, alert_id: str) -> bool:
         """Delete a rule. Same user-scoping requirement as `update`."""
+        self._edited[str(alert_id)] = time.monotonic()
         try:
             result = (
                 self.supabase.table(TABLE)
@@ -300,27 +345,35 @@ class PriceAlertService:
         return tickers
 
     def _active_rules(self, tickers: List[str]) -> List[dict]:
+        rules: List[dict] = []
         try:
-            return (
-                self.supabase.table(TABLE)
-                .select("id, user_id, ticker, asset_type, kind, threshold, repeat_mode, "
-                        "armed, last_price, trigger_count")
-                .eq("is_active", True)
-                .in_("ticker", tickers)
-                .limit(MAX_RULES)
-                .execute()
-                .data
-                or []
-            )
+            while len(rules) < MAX_RULES:
+                page = (
+                    self.supabase.table(TABLE)
+                    .select("id, user_id, ticker, asset_type, kind, threshold, repeat_mode, "
+                            "armed, last_price, trigger_count")
+                    .eq("is_active", True)
+                    .in_("ticker", tickers)
+                    .order("id")
+                    .range(len(rules), len(rules) + _RULE_PAGE - 1)
+                    .execute()
+                    .data
+                    or []
+                )
+                rules.extend(page)
+                if len(page) < _RULE_PAGE:
+                    break
         except Exception as e:
             logger.warning(
                 "price alerts: rule read failed (%s: %s) — no evaluation this cycle",
                 type(e).__name__, e,
             )
             return []
+        return rules[:MAX_RULES]
 
     def _persist(self, rule: dict, decision: AlertDecision) -> None:
-        """Write the rule's new state. Best-effort but LOUD.
+        """Write one rule's new state — `_persist_many`'s per-row fallback. Best-effort
+        but LOUD.
 
         A lost state write is not a duplicate notification — the dedup claim already
         blocks that — but a lost `armed=False` means the latch never drops, so the next
@@ -346,6 +399,59 @@ class PriceAlertService:
                 rule.get("id"), type(e).__name__, e,
             )
 
+    @staticmethod
+    def state_changed(rule: dict, decision: AlertDecision) -> bool:
+        """Whether `decision` leaves the rule in a state other than the one it was read in.
+
+        Compared through the same finite guard the engine reads with, so a stored NaN
+        baseline the engine treats as "never observed" does not read as a change against
+        the None it holds it at.
+        """
+        if decision.fire or decision.deactivate:
+            return True
+        if bool(rule.get("armed", True)) != decision.new_armed:
+            return True
+        return finite_price(rule.get("last_price")) != decision.new_last_price
+
+    def _persist_many(self, changes: List[Tuple[dict, AlertDecision]]) -> int:
+        """Write every changed rule's new state, a chunk per round-trip. Returns rows written.
+
+        A chunk whose bulk call fails is retried row by row through `_persist`, so a
+        missing function (migration 155 not applied) or one poisoned row costs speed,
+        never the latch.
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        written = 0
+        for start in range(0, len(changes), _STATE_WRITE_CHUNK):
+            chunk = changes[start:start + _STATE_WRITE_CHUNK]
+            rows = [
+                {
+                    "id": rule["id"],
+                    "last_price": decision.new_last_price,
+                    "armed": decision.new_armed,
+                    "fired": decision.fire,
+                    "deactivate": decision.deactivate,
+                }
+                for rule, decision in chunk
+            ]
+            try:
+                result = self.supabase.rpc(
+                    "apply_price_alert_states", {"p_rows": rows, "p_now": now}
+                ).execute()
+                written += int(result.data or 0)
+                continue
+            except Exception as e:
+                logger.warning(
+                    "price alerts: bulk state write failed for %d row(s) (%s: %s) — "
+                    "writing them one by one. If PGRST202/undefined function, migration "
+                    "155 has not been applied.",
+                    len(chunk), type(e).__name__, e,
+                )
+            for rule, decision in chunk:
+                self._persist(rule, decision)
+                written += 1
+        return written
+
     @staticmethod
     def fire_copy(rule: dict, price: float, decision: AlertDecision) -> Tuple[str, str]:
         """Copy for a fired alert.
@@ -373,35 +479,16 @@ class PriceAlertService:
         base = f"pa:{rule.get('id')}"
         return base if repeat_mode == "once" else f"{base}:{trading_date_et()}"
 
-    async def evaluate_once(self) -> Dict[str, int]:
-        """One evaluation cycle. Never raises."""
-        stats = {"tickers": 0, "rules": 0, "fired": 0, "sent": 0}
-
-        tickers = await asyncio.to_thread(self._active_universe)
-        if not tickers:
-            return stats
-        stats["tickers"] = len(tickers)
-
-        try:
-            quotes = await get_fmp_client().get_batch_quotes_bulk(tickers)
-        except Exception as e:
-            logger.warning(
-                "price alerts: batch quote failed for %d ticker(s) (%s: %s) — "
-                "skipping this cycle",
-                len(tickers), type(e).__name__, e,
-            )
-            return stats
-
-        by_symbol = {
-            str(q.get("symbol") or "").upper(): q
-            for q in (quotes or [])
-            if isinstance(q, dict) and q.get("symbol")
-        }
-
-        rules = await asyncio.to_thread(self._active_rules, tickers)
-        stats["rules"] = len(rules)
-        dispatcher = get_push_dispatch_service()
-
+    async def _apply(
+        self,
+        rules: List[dict],
+        by_symbol: Dict[str, Dict[str, Any]],
+        stats: Dict[str, int],
+    ) -> None:
+        """Decide ``rules`` against ``by_symbol``, write what changed, send what fired,
+        and re-index each changed rule at its new state. Caller holds `_lock`."""
+        changes: List[Tuple[dict, AlertDecision]] = []
+        outgoing: List[OutgoingPush] = []
         for rule in rules:
             symbol = str(rule.get("ticker") or "").upper()
             quote = by_symbol.get(symbol)
@@ -418,17 +505,16 @@ class PriceAlertService:
                 change_percent=(quote or {}).get("changePercentage"),
                 rearm_pct=settings.PRICE_ALERT_REARM_PCT,
             )
-
-            await asyncio.to_thread(self._persist, rule, decision)
+            if self.state_changed(rule, decision):
+                changes.append((rule, decision))
             if not decision.fire:
                 continue
             stats["fired"] += 1
 
             price = finite_price((quote or {}).get("price")) or 0.0
             title, body = self.fire_copy(rule, price, decision)
-            stats["sent"] += await dispatcher.notify_users(
-                [rule["user_id"]],
-                kind=KIND_PRICE_ALERT,
+            outgoing.append(OutgoingPush(
+                user_id=rule["user_id"],
                 title=title,
                 body=body,
                 dedup_key=self.dedup_key(rule, rule.get("repeat_mode") or "once"),
@@ -440,7 +526,121 @@ class PriceAlertService:
                     "route": "ticker",
                     "alert_id": str(rule.get("id") or ""),
                 },
+            ))
+
+        # State before sends, as the per-rule loop did: the latch is down before the
+        # buzz goes out, and the dedup claim covers a crash in between.
+        if changes:
+            stats["written"] += await asyncio.to_thread(self._persist_many, changes)
+        if outgoing:
+            stats["sent"] += await get_push_dispatch_service().notify_each(
+                outgoing, kind=KIND_PRICE_ALERT
+            )
+
+        for rule, decision in changes:
+            rule["last_price"] = decision.new_last_price
+            rule["armed"] = decision.new_armed
+            if decision.fire:
+                rule["trigger_count"] = int(rule.get("trigger_count") or 0) + 1
+            if decision.deactivate or (decision.fire and rule.get("kind") == KIND_PERCENT):
+                # A percent rule stays over its line all day once it fires; re-touching
+                # it on every trade would only re-claim the same dedup key. The next
+                # cycle's rebuild puts it back, exactly as often as it was evaluated
+                # before the index existed.
+                self._index.remove(rule["id"])
+            else:
+                self._index.place(rule)
+
+    # ── live triggers ────────────────────────────────────────────────
+
+    def _watch_live(self) -> None:
+        if self._unsubscribe_bus is None and settings.PRICE_ALERT_LIVE_TRIGGERS:
+            self._unsubscribe_bus = get_price_bus().subscribe(self._on_quote)
+
+    def _on_quote(self, symbol: str, row: Dict[str, Any]) -> None:
+        """Price-bus listener: runs inline on the writer's path, so only a bisection
+        here; the evaluation itself is handed to one drain task."""
+        if not self._index.crossed(symbol, row.get("price"), row.get("changePercentage")):
+            return
+        if session_phase() == "closed":
+            return   # the same window the cycle keeps
+        self._live_symbols.add(symbol)
+        if self._live_task is None:
+            self._live_task = asyncio.get_running_loop().create_task(self._drain_live())
+
+    async def _drain_live(self) -> None:
+        """Evaluate the rules live quotes have crossed, newest quote per symbol."""
+        try:
+            while self._live_symbols:
+                async with self._lock:
+                    symbols, self._live_symbols = self._live_symbols, set()
+                    quotes = get_price_bus().snapshot(symbols)
+                    touched = [
+                        rule
+                        for symbol, quote in quotes.items()
+                        for rule in self._index.crossed(
+                            symbol, quote.get("price"), quote.get("changePercentage")
+                        )
+                        if str(rule.get("id")) not in self._edited
+                    ]
+                    if not touched:
+                        continue
+                    stats = {"evaluated": len(touched), "written": 0, "fired": 0, "sent": 0}
+                    await self._apply(touched, quotes, stats)
+                    if stats["fired"]:
+                        logger.info("price alerts (live): %s", stats)
+        except Exception as e:
+            logger.error(
+                "price alerts: live evaluation failed (%s: %s)",
+                type(e).__name__, e, exc_info=True,
+            )
+        finally:
+            self._live_task = None
+
+    async def evaluate_once(self) -> Dict[str, int]:
+        """One evaluation cycle: re-read the rules, rebuild the index, and decide every
+        rule this cycle's quotes crossed. Never raises."""
+        stats = {"tickers": 0, "rules": 0, "evaluated": 0, "written": 0, "fired": 0, "sent": 0}
+
+        tickers = await asyncio.to_thread(self._active_universe)
+        if not tickers:
+            return stats
+        stats["tickers"] = len(tickers)
+
+        # From the shared price bus: the poller (and, for watched symbols, live trades)
+        # usually has every alerted ticker fresh already, so a cycle makes no quote call
+        # of its own; whatever is older than a poll interval is bulk-quoted here.
+        try:
+            by_symbol = await get_price_bus().get_quotes(tickers)
+        except Exception as e:
+            logger.warning(
+                "price alerts: batch quote failed for %d ticker(s) (%s: %s) — "
+                "skipping this cycle",
+                len(tickers), type(e).__name__, e,
             )
+            return stats
+
+        async with self._lock:
+            read_at = time.monotonic()
+            rules = await asyncio.to_thread(self._active_rules, tickers)
+            stats["rules"] = len(rules)
+            self._index.replace(rules)
+            for rid, edited_at in list(self._edited.items()):
+                if edited_at < read_at:
+                    self._edited.pop(rid, None)   # this read already reflects it
+                else:
+                    self._index.remove(rid)
+            self._watch_live()
+
+            touched = [
+                rule
+                for symbol, quote in by_symbol.items()
+                for rule in self._index.crossed(
+                    symbol, quote.get("price"), quote.get("changePercentage")
+                )
+            ]
+            stats["evaluated"] = len(touched)
+            await self._apply(touched, by_symbol, stats)
 
         if stats["fired"]:
             logger.info("price alerts: %s", stats)
@@ -0,0 +1,269 @@
+"""
+Price Bus — one in-process snapshot of the latest quote per symbol.
+
+Three consumers used to issue their own `get_batch_quotes_bulk` for overlapping
+universes — `PriceAlertService.evaluate_once` every minute for every alerted ticker,
+the Updates `InsightSweeper` price pass every five minutes, and the widget movers on
+each build — while `LivePriceManager` was already receiving real-time trades for every
+watched symbol and throwing them away after the fan-out. They now all read this bus.
+
+Rows are FMP batch-quote rows (``symbol``, ``price``, ``change``,
+``changePercentage``, ``previousClose``, ``volume``, ``timestamp``, ``name``,
+``marketCap`` …), so a consumer swaps its bulk call for `get_quotes` without touching
+its field reads. Two writers keep them fresh:
+
+  * live trades (`publish_trade`, from the live-price rooms) move ``price`` and the
+    day change on top of the last full row, between polls. A trade for a symbol with
+    no full row yet is held but NOT fresh: it has no ``name``, ``marketCap`` or
+    ``open``, so the next read still fetches the full row;
+  * ONE periodic poller (`poll_once`, the ``price_bus_poll`` job) re-quotes, in a single
+    bulk call, every symbol a consumer asked for recently that no trade has refreshed.
+
+`get_quotes` still answers a cold or stale symbol itself — one bulk call for just
+those, shared by every concurrent caller that needs them — so a consumer is never
+worse off than before, only usually spared the call.
+
+The snapshot is per process. Under ``BACKGROUND_JOBS_RUNNER=worker`` the worker's bus
+(alerts, sweeper) is fed by its own poller only — the live sockets live in the API
+process — which is still one bulk call where there were two.
+
+Rows are shared, not copied: treat them as read-only. A write replaces a symbol's row
+with a new dict, so a snapshot a consumer holds never changes underneath it.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from app.config import settings
+from app.integrations.fmp import get_fmp_client
+
+logger = logging.getLogger(__name__)
+
+Listener = Callable[[str, Dict[str, Any]], None]
+
+
+def _finite(value: Any) -> Optional[float]:
+    try:
+        f = float(value)
+    except (TypeError, ValueError):
+        return None
+    return f if math.isfinite(f) else None
+
+
+class PriceBus:
+    """Latest quote per symbol, with pub/sub on every update."""
+
+    def __init__(self) -> None:
+        self._quotes: Dict[str, Dict[str, Any]] = {}
+        # Monotonic time a symbol was last known fresh: written, or bulk-quoted (even
+        # when FMP returned no row for it — a dead symbol is not retried every call).
+        self._fresh_at: Dict[str, float] = {}
+        # Symbols whose row is trade-only — built from live trades with no full
+        # batch-quote row under it. Never fresh; a read fetches the full row.
+        self._partial: Set[str] = set()
+        # Monotonic time a consumer last asked for a symbol; the poller's universe.
+        self._watched: Dict[str, float] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._listeners: List[Listener] = []
+        self.stats = {"hits": 0, "fetched": 0, "polls": 0, "trades": 0}
+
+    # ── Reads ─────────────────────────────────────────────────────────
+
+    def snapshot(self, symbols: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """The rows held right now for ``symbols`` — no fetch, however old."""
+        out: Dict[str, Dict[str, Any]] = {}
+        for s in symbols:
+            row = self._quotes.get(str(s).upper())
+            if row is not None:
+                out[str(s).upper()] = row
+        return out
+
+    def age(self, symbol: str) -> float:
+        """Seconds since ``symbol`` was last fresh (inf when never)."""
+        seen = self._fresh_at.get(symbol.upper())
+        return math.inf if seen is None else time.monotonic() - seen
+
+    async def get_quotes(
+        self, symbols: Iterable[str], max_age: Optional[float] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Rows for ``symbols`` no older than ``max_age`` seconds, keyed by symbol.
+
+        Symbols the bus cannot answer fresh are bulk-quoted together, joining any
+        fetch already in flight for them. A symbol FMP returns nothing for is simply
+        absent, as it was from the bulk response. Raises when the one fetch this call
+        made fails outright, like the bulk call it replaces.
+        """
+        if max_age is None:
+            max_age = settings.PRICE_BUS_MAX_AGE_SECONDS
+        wanted = list(dict.fromkeys(str(s).strip().upper() for s in symbols if s and str(s).strip()))
+        now = time.monotonic()
+        for s in wanted:
+            self._watched[s] = now
+
+        fetch: List[str] = []
+        waits = set()
+        for s in wanted:
+            seen = self._fresh_at.get(s)
+            if seen is not None and now - seen <= max_age:
+                continue
+            pending = self._inflight.get(s)
+            if pending is not None:
+                waits.add(pending)
+            else:
+                fetch.append(s)
+        self.stats["hits"] += len(wanted) - len(fetch) - len(waits)
+
+        if fetch:
+            await self._refresh(fetch)
+        if waits:
+            # Shielded: a cancelled waiter must not cancel the fetch others share.
+            await asyncio.gather(*(asyncio.shield(w) for w in waits), return_exceptions=True)
+        return self.snapshot(wanted)
+
+    # ── Writes ────────────────────────────────────────────────────────
+
+    def publish_quote(self, row: Dict[str, Any]) -> None:
+        """Store a full bulk-quote row as the symbol's latest."""
+        symbol = str(row.get("symbol") or "").upper()
+        if not symbol:
+            return
+        self._store(symbol, row)
+
+    def publish_trade(
+        self,
+        symbol: str,
+        price: float,
+        *,
+        previous_close: Optional[float] = None,
+        volume: Any = None,
+        timestamp: Any = None,
+    ) -> None:
+        """Move ``symbol``'s price to a live trade, recomputing the day change.
+
+        The reference close is the caller's when it has one (the live room fetched
+        it), else the last full row's ``previousClose``. Without either the change
+        fields are dropped rather than left describing an older price.
+        """
+        price_f = _finite(price)
+        if price_f is None:
+            return
+        symbol = symbol.upper()
+        base = self._quotes.get(symbol)
+        full = base is not None and symbol not in self._partial
+        row = dict(base or {"symbol": symbol})
+        prev = _finite(previous_close) or _finite(row.get("previousClose"))
+        row["price"] = price_f
+        if prev and prev > 0:
+            row["previousClose"] = prev
+            row["change"] = price_f - prev
+            row["changePercentage"] = (price_f - prev) / prev * 100
+        else:
+            row.pop("change", None)
+            row.pop("changePercentage", None)
+        if volume is not None:
+            row["volume"] = volume
+        if timestamp is not None:
+            row["timestamp"] = timestamp
+        self.stats["trades"] += 1
+        self._store(symbol, row, fresh=full)
+
+    def _store(self, symbol: str, row: Dict[str, Any], fresh: bool = True) -> None:
+        self._quotes[symbol] = row
+        if fresh:
+            self._fresh_at[symbol] = time.monotonic()
+            self._partial.discard(symbol)
+        else:
+            # Also drops a freshness stamp left by a bulk call that returned nothing
+            # for the symbol — a trade-only row must not be served as a hit.
+            self._fresh_at.pop(symbol, None)
+            self._partial.add(symbol)
+        for listener in list(self._listeners):
+            try:
+                listener(symbol, row)
+            except Exception as e:
+                logger.warning(
+                    "price bus: listener failed for %s (%s: %s)", symbol, type(e).__name__, e,
+                )
+
+    def subscribe(self, listener: Listener) -> Callable[[], None]:
+        """Call ``listener(symbol, row)`` on every update; returns the unsubscribe.
+
+        Listeners run inline on the writer's path (a live room's reader, a poll), so
+        they must be quick and must not block — hand real work to a task or a queue.
+        """
+        self._listeners.append(listener)
+
+        def _unsubscribe() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return _unsubscribe
+
+    # ── Fetching ──────────────────────────────────────────────────────
+
+    async def _refresh(self, symbols: List[str]) -> None:
+        fut = asyncio.get_running_loop().create_future()
+        for s in symbols:
+            self._inflight[s] = fut
+        try:
+            rows = await get_fmp_client().get_batch_quotes_bulk(symbols)
+            fetched_at = time.monotonic()
+            for row in rows or []:
+                if isinstance(row, dict):
+                    self.publish_quote(row)
+            for s in symbols:
+                self._fresh_at[s] = max(self._fresh_at.get(s, 0.0), fetched_at)
+            self.stats["fetched"] += len(symbols)
+        finally:
+            for s in symbols:
+                if self._inflight.get(s) is fut:
+                    del self._inflight[s]
+            if not fut.done():
+                fut.set_result(None)
+
+    async def poll_once(self) -> int:
+        """Re-quote every recently-watched symbol that nothing has refreshed lately.
+
+        One bulk call (chunked by the FMP client) for the whole stale set. Symbols no
+        consumer has asked for within PRICE_BUS_WATCH_TTL_SECONDS drop out of the
+        universe — and out of memory — so the poller idles when its consumers do
+        (overnight, say). Returns how many symbols were re-quoted.
+        """
+        now = time.monotonic()
+        ttl = settings.PRICE_BUS_WATCH_TTL_SECONDS
+        for s in [s for s, t in self._watched.items() if now - t > ttl]:
+            del self._watched[s]
+        # Live-only symbols nobody reads age out the same way once their trades stop.
+        for s in [s for s, t in self._fresh_at.items() if s not in self._watched and now - t > ttl]:
+            self._quotes.pop(s, None)
+            self._fresh_at.pop(s, None)
+        # Trade-only rows carry no freshness to age by; nobody reads them unless watched.
+        for s in [s for s in self._partial if s not in self._watched]:
+            self._quotes.pop(s, None)
+            self._partial.discard(s)
+        # Half an interval: a symbol a trade or a consumer refreshed since the last
+        # poll is left alone until the next one.
+        horizon = settings.PRICE_BUS_POLL_SECONDS / 2
+        stale = [
+            s for s in self._watched
+            if s not in self._inflight and now - self._fresh_at.get(s, -math.inf) > horizon
+        ]
+        self.stats["polls"] += 1
+        if not stale:
+            return 0
+        await self._refresh(stale)
+        return len(stale)
+
+
+_bus: Optional[PriceBus] = None
+
+
+def get_price_bus() -> PriceBus:
+    """Get the process-wide PriceBus singleton."""
+    global _bus
+    if _bus is None:
+        _bus = PriceBus()
+    return _bus
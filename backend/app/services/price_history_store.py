@@ -0,0 +1,556 @@
+"""
+Local columnar daily-price store — one on-disk history per symbol, topped up in place.
+
+Daily OHLCV was fetched from FMP independently by the chart helper (up to five 5000-bar
+pages for an "ALL" chart), the technical-analysis service (600 days), the daily σ
+precompute (270 days × ~200 symbols), and the report collector (six years) — each one
+re-downloading years of bars it had already parsed on the previous cache miss, then
+re-parsing the JSON into lists of dicts. The bars before yesterday never change (barring
+a split, below), so all of that was the same bytes fetched again.
+
+Now each symbol's history lives under ``PRICE_HISTORY_STORE_DIR`` as one flat binary file
+per column — ``dates.M8`` (``datetime64[D]``) and ``open/high/low/close/volume.f8`` — read
+back through ``np.memmap``. Consumers get :class:`DailyBars`, whose ``between`` / ``tail``
+are ``searchsorted`` slices of the mapped arrays: no copy, no JSON, no dicts unless a
+legacy caller asks for them via :meth:`DailyBars.to_rows`.
+
+Lifecycle of a symbol:
+
+  * **Backfill** — the first read fetches from the requested ``from_date`` (paged back in
+    5000-bar steps, like ``chart_helper._fetch_all_daily``). A later read that asks for
+    OLDER bars than the store covers extends it backwards once; ``covered_from`` records
+    how far back has been asked for, so a symbol that simply listed later is not
+    re-fetched on every read.
+  * **Top-up** — at most every ``PRICE_HISTORY_TOPUP_SECONDS``, one small call for the
+    trailing ~2 weeks. New days are appended; the LAST stored bar is treated as mutable
+    and replaced (a bar written before the close is re-stamped with the final one).
+  * **Re-adjustment** — FMP's EOD history is split-adjusted retroactively. If the
+    top-up's overlapping (settled) bars disagree with what is stored, the whole covered
+    range is re-fetched and rewritten instead of appending onto a stale scale.
+
+Writes are crash-safe without a database: appends land past the committed row count and
+only become visible when ``meta.json`` (the row count) is atomically replaced; rewrites go
+to a new generation directory that ``meta.json`` then points at. Mutations take an
+``fcntl`` lock on the symbol, so two processes sharing a disk (the API and the worker)
+never interleave. A top-up that fails serves the stored bars — stale-by-a-day beats a
+failed chart.
+
+Disabled when ``PRICE_HISTORY_STORE_DIR`` is empty (the test suite sets it so): every
+consumer then takes its original direct-FMP path, and :func:`fetch_daily_history` is a
+pass-through to ``get_historical_prices``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import fcntl
+import json
+import logging
+import math
+import os
+import shutil
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import quote
+
+import numpy as np
+
+from app.config import settings
+from app.integrations.fmp import FMPClient
+
+logger = logging.getLogger(__name__)
+
+COLUMNS: Tuple[str, ...] = ("open", "high", "low", "close", "volume")
+_DATE_FILE = "dates.M8"
+_DATE_DTYPE = np.dtype("datetime64[D]")
+_VALUE_DTYPE = np.dtype("<f8")
+_FORMAT_VERSION = 1
+
+# FMP's EOD endpoint returns at most 5000 bars per call; 5 pages is ~100 years.
+_PAGE_ROWS = 5000
+_MAX_PAGES = 5
+# A top-up re-reads this many calendar days behind the last stored bar: enough settled
+# bars to detect a retroactive re-adjustment, small enough to stay one cheap call.
+_TOPUP_OVERLAP_DAYS = 14
+# Relative tolerance for "the stored bar still matches upstream". FMP re-rounds nothing
+# at this scale; a split moves closes by 50%+.
+_ADJUSTMENT_RTOL = 1e-6
+# A read with no from_date (the FMP default window) covers five years.
+_DEFAULT_HISTORY_DAYS = 5 * 365
+
+DateLike = Union[str, date, datetime, np.datetime64, None]
+
+
+def _day(value: DateLike) -> Optional[np.datetime64]:
+    if value is None:
+        return None
+    if isinstance(value, np.datetime64):
+        return value.astype(_DATE_DTYPE)
+    if isinstance(value, datetime):
+        value = value.date()
+    if isinstance(value, date):
+        return np.datetime64(value, "D")
+    text = str(value)[:10]
+    try:
+        return np.datetime64(text, "D")
+    except ValueError:
+        return None
+
+
+def _today() -> np.datetime64:
+    return np.datetime64(datetime.now(timezone.utc).date(), "D")
+
+
+def _finite(v: Any) -> float:
+    try:
+        f = float(v)
+    except (TypeError, ValueError):
+        return math.nan
+    return f if math.isfinite(f) else math.nan
+
+
+# ── Read-side view ───────────────────────────────────────────────────────────
+
+
+@dataclass(frozen=True)
+class DailyBars:
+    """Oldest-first daily bars for one symbol. Arrays may be memory-mapped — read-only.
+
+    Missing OHLV values are NaN; ``close`` is always finite and positive (rows without a
+    usable close are dropped at ingest).
+    """
+
+    symbol: str
+    dates: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.dates.shape[0])
+
+    @classmethod
+    def empty(cls, symbol: str) -> "DailyBars":
+        z = np.empty(0, dtype=_VALUE_DTYPE)
+        return cls(symbol, np.empty(0, dtype=_DATE_DTYPE), z, z, z, z, z)
+
+    def _slice(self, lo: int, hi: int) -> "DailyBars":
+        return DailyBars(
+            self.symbol,
+            self.dates[lo:hi],
+            self.open[lo:hi],
+            self.high[lo:hi],
+            self.low[lo:hi],
+            self.close[lo:hi],
+            self.volume[lo:hi],
+        )
+
+    def between(self, from_date: DateLike = None, to_date: DateLike = None) -> "DailyBars":
+        """Bars with ``from_date <= date <= to_date`` (either bound optional). Zero-copy."""
+        lo, hi = 0, len(self)
+        start, end = _day(from_date), _day(to_date)
+        if start is not None:
+            lo = int(np.searchsorted(self.dates, start, side="left"))
+        if end is not None:
+            hi = int(np.searchsorted(self.dates, end, side="right"))
+        return self._slice(lo, max(lo, hi))
+
+    def tail(self, n: int) -> "DailyBars":
+        """The last ``n`` bars. Zero-copy."""
+        return self._slice(max(0, len(self) - max(0, n)), len(self))
+
+    @property
+    def last_date(self) -> Optional[date]:
+        return self.dates[-1].astype(date) if len(self) else None
+
+    def to_rows(self, *, newest_first: bool = False) -> List[Dict[str, Any]]:
+        """FMP-shaped ``{"date", "open", "high", "low", "close", "volume"}`` dicts, NaN → None.
+
+        For the callers that still walk rows; ``newest_first=True`` is FMP's own order,
+        which the report collector's helpers assume.
+        """
+        dates = np.datetime_as_string(self.dates, unit="D").tolist()
+        cols = [np.asarray(getattr(self, c)).tolist() for c in COLUMNS]
+        rows = [
+            {
+                "date": d,
+                "open": o if o == o else None,
+                "high": h if h == h else None,
+                "low": lo if lo == lo else None,
+                "close": c,
+                "volume": v if v == v else None,
+            }
+            for d, o, h, lo, c, v in zip(dates, *cols)
+        ]
+        if newest_first:
+            rows.reverse()
+        return rows
+
+
+def parse_fmp_daily(raw: Any) -> Dict[str, np.ndarray]:
+    """FMP ``historical-price-eod/full`` (flat list or ``{"historical": [...]}``) → columns.
+
+    Oldest-first, one row per date (first occurrence wins), rows without a date or a
+    finite positive close dropped — the same rows ``chart_helper._normalize_prices`` and
+    the σ math already discard. ``adjClose`` stands in for a missing close, as in the
+    chart helper.
+    """
+    if isinstance(raw, dict):
+        rows = raw.get("historical") or []
+    elif isinstance(raw, list):
+        rows = raw
+    else:
+        rows = []
+    by_date: Dict[str, Tuple[float, ...]] = {}
+    for p in rows:
+        if not isinstance(p, dict):
+            continue
+        d = str(p.get("date") or "")[:10]
+        if len(d) != 10 or d in by_date:
+            continue
+        close = _finite(p.get("close") if p.get("close") is not None else p.get("adjClose"))
+        if not close > 0:
+            continue
+        by_date[d] = (
+            _finite(p.get("open")),
+            _finite(p.get("high")),
+            _finite(p.get("low")),
+            close,
+            _finite(p.get("volume")),
+        )
+    keys = sorted(by_date)
+    try:
+        dates = np.array(keys, dtype=_DATE_DTYPE)
+    except ValueError:
+        good = [k for k in keys if _day(k) is not None]
+        dates = np.array(good, dtype=_DATE_DTYPE)
+        keys = good
+    values = np.array([by_date[k] for k in keys], dtype=_VALUE_DTYPE).reshape(len(keys), len(COLUMNS))
+    out = {"dates": dates}
+    for i, col in enumerate(COLUMNS):
+        out[col] = np.ascontiguousarray(values[:, i])
+    return out
+
+
+def _concat(a: Dict[str, np.ndarray], b: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    return {k: np.concatenate([a[k], b[k]]) for k in a}
+
+
+def _take(cols: Dict[str, np.ndarray], mask: np.ndarray) -> Dict[str, np.ndarray]:
+    return {k: v[mask] for k, v in cols.items()}
+
+
+# ── The store ────────────────────────────────────────────────────────────────
+
+
+class PriceHistoryStore:
+    """Per-symbol append-only columnar files under ``root``. See the module docstring."""
+
+    def __init__(self, root: Union[str, Path], *, topup_interval_seconds: float = 900.0):
+        self.root = Path(root)
+        self.topup_interval_seconds = topup_interval_seconds
+        # symbol → (loop, lock): one in-process refresh per symbol at a time. Keyed by
+        # loop because an asyncio.Lock is bound to the loop it first waited on.
+        self._locks: Dict[str, Tuple[Any, asyncio.Lock]] = {}
+        self.fetches = 0
+        self.rewrites = 0
+
+    # ── paths and metadata ──
+
+    def _dir(self, symbol: str) -> Path:
+        # quote(): index symbols carry "^" and FX/crypto carry "=" or "-"; never a "/".
+        return self.root / quote(symbol.upper(), safe="")
+
+    def _read_meta(self, sdir: Path) -> Optional[Dict[str, Any]]:
+        try:
+            meta = json.loads((sdir / "meta.json").read_text())
+        except (OSError, ValueError):
+            return None
+        if meta.get("version") != _FORMAT_VERSION:
+            return None
+        return meta
+
+    def _write_meta(self, sdir: Path, meta: Dict[str, Any]) -> None:
+        tmp = sdir / f"meta.json.{os.getpid()}.tmp"
+        tmp.write_text(json.dumps(meta))
+        os.replace(tmp, sdir / "meta.json")
+
+    @contextmanager
+    def _locked(self, sdir: Path) -> Iterator[None]:
+        sdir.mkdir(parents=True, exist_ok=True)
+        with open(sdir / ".lock", "a+") as fh:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+
+    # ── read ──
+
+    def read(self, symbol: str) -> Optional[DailyBars]:
+        """The stored bars, memory-mapped; None when the symbol has never been fetched.
+
+        Local-only: no network, and no freshness check.
+        """
+        sdir = self._dir(symbol)
+        meta = self._read_meta(sdir)
+        if meta is None:
+            return None
+        rows = int(meta.get("rows") or 0)
+        if rows == 0:
+            return DailyBars.empty(symbol.upper())
+        gdir = sdir / f"g{meta['gen']}"
+        try:
+            arrays = {
+                "dates": np.memmap(gdir / _DATE_FILE, dtype=_DATE_DTYPE, mode="r", shape=(rows,))
+            }
+            for col in COLUMNS:
+                arrays[col] = np.memmap(gdir / f"{col}.f8", dtype=_VALUE_DTYPE, mode="r", shape=(rows,))
+        except (OSError, ValueError) as e:
+            logger.warning("Price store: unreadable history for %s (%s) — refetching", symbol, e)
+            return None
+        return DailyBars(symbol.upper(), **arrays)
+
+    # ── write ──
+
+    def _rewrite(self, symbol: str, cols: Dict[str, np.ndarray], covered_from: str) -> None:
+        """Replace the whole history: new generation dir, then flip ``meta.json`` to it."""
+        sdir = self._dir(symbol)
+        with self._locked(sdir):
+            old = self._read_meta(sdir)
+            gen = int(old["gen"]) + 1 if old else 1
+            gdir = sdir / f"g{gen}"
+            if gdir.exists():
+                shutil.rmtree(gdir, ignore_errors=True)
+            gdir.mkdir(parents=True)
+            cols["dates"].astype(_DATE_DTYPE).tofile(gdir / _DATE_FILE)
+            for col in COLUMNS:
+                cols[col].astype(_VALUE_DTYPE).tofile(gdir / f"{col}.f8")
+            self._write_meta(sdir, {
+                "version": _FORMAT_VERSION,
+                "gen": gen,
+                "rows": int(cols["dates"].shape[0]),
+                "covered_from": covered_from,
+                "checked_at": time.time(),
+            })
+            if old:
+                # Readers holding the previous generation's maps keep them (an unlinked
+                # file stays readable while mapped); new readers follow meta.json.
+                shutil.rmtree(sdir / f"g{old['gen']}", ignore_errors=True)
+        self.rewrites += 1
+
+    def _append(self, symbol: str, keep_rows: int, tail: Dict[str, np.ndarray]) -> None:
+        """Write ``tail`` from row ``keep_rows`` on (overwriting the mutable last bar and
+        any uncommitted bytes a crashed writer left), then commit the new row count.
+
+        Overwrite, never truncate: a file shrinking under a live map would SIGBUS a
+        reader touching its last page. The file only ever grows, and bytes past the
+        committed count are invisible.
+        """
+        sdir = self._dir(symbol)
+        with self._locked(sdir):
+            meta = self._read_meta(sdir)
+            if meta is None:
+                return
+            keep_rows = min(keep_rows, int(meta["rows"]))
+            gdir = sdir / f"g{meta['gen']}"
+            files = [(_DATE_FILE, "dates", _DATE_DTYPE)] + [
+                (f"{c}.f8", c, _VALUE_DTYPE) for c in COLUMNS
+            ]
+            for fname, key, dtype in files:
+                with open(gdir / fname, "r+b") as fh:
+                    fh.seek(keep_rows * dtype.itemsize)
+                    fh.write(tail[key].astype(dtype).tobytes())
+            meta["rows"] = keep_rows + int(tail["dates"].shape[0])
+            meta["checked_at"] = time.time()
+            self._write_meta(sdir, meta)
+
+    def _touch(self, symbol: str) -> None:
+        sdir = self._dir(symbol)
+        with self._locked(sdir):
+            meta = self._read_meta(sdir)
+            if meta is not None:
+                meta["checked_at"] = time.time()
+                self._write_meta(sdir, meta)
+
+    # ── fetch ──
+
+    async def _fetch(self, fmp: FMPClient, symbol: str, from_day: np.datetime64) -> Dict[str, np.ndarray]:
+        """[from_day, today] from FMP, paged backwards in 5000-bar steps."""
+        cols = parse_fmp_daily([])
+        to_day = _today()
+        for _ in range(_MAX_PAGES):
+            self.fetches += 1
+            raw = await fmp.get_historical_prices(symbol, str(from_day), str(to_day))
+            page = parse_fmp_daily(raw)
+            n = page["dates"].shape[0]
+            if n == 0:
+                break
+            if cols["dates"].shape[0]:
+                page = _take(page, page["dates"] < cols["dates"][0])
+            cols = _concat(page, cols)
+            if n < _PAGE_ROWS:
+                break
+            earliest = page["dates"][0] if page["dates"].shape[0] else None
+            if earliest is None or earliest <= from_day:
+                break
+            to_day = earliest - np.timedelta64(1, "D")
+        return cols
+
+    def _lock_for(self, symbol: str) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        held = self._locks.get(symbol)
+        if held is None or held[0] is not loop:
+            held = (loop, asyncio.Lock())
+            self._locks[symbol] = held
+        return held[1]
+
+    async def daily(
+        self,
+        fmp: FMPClient,
+        symbol: str,
+        from_date: DateLike = None,
+        to_date: DateLike = None,
+    ) -> DailyBars:
+        """Bars for ``[from_date, to_date]``, backfilling / topping up the store as needed.
+
+        ``from_date=None`` means the FMP default window (five years). FMP errors on the
+        first backfill propagate, exactly as the direct call did; errors while topping up
+        an existing history are logged and the stored bars are served.
+        """
+        sym = symbol.upper()
+        start = _day(from_date)
+        if start is None:  # not `or`: 1970-01-01 is day 0, and falsy
+            start = _today() - np.timedelta64(_DEFAULT_HISTORY_DAYS, "D")
+        async with self._lock_for(sym):
+            await self._refresh(fmp, sym, start)
+        bars = await asyncio.to_thread(self.read, sym)
+        if bars is None:
+            return DailyBars.empty(sym)
+        return bars.between(start, to_date)
+
+    async def _refresh(self, fmp: FMPClient, sym: str, start: np.datetime64) -> None:
+        meta = await asyncio.to_thread(self._read_meta, self._dir(sym))
+        if meta is None:
+            cols = await self._fetch(fmp, sym, start)
+            await asyncio.to_thread(self._rewrite, sym, cols, str(start))
+            return
+
+        covered_from = _day(meta.get("covered_from"))
+        if covered_from is None:
+            covered_from = start
+        if start < covered_from:
+            # Asked for older bars than were ever requested: extend backwards once.
+            try:
+                older = await self._fetch(fmp, sym, start)
+            except Exception as e:
+                logger.warning("Price store: backfill of %s failed (%s: %s)", sym, type(e).__name__, e)
+                return
+            stored = await asyncio.to_thread(self.read, sym)
+            if stored is not None and len(stored):
+                older = _take(older, older["dates"] < stored.dates[0])
+                merged = _concat(older, {
+                    "dates": np.asarray(stored.dates), **{c: np.asarray(getattr(stored, c)) for c in COLUMNS},
+                })
+            else:
+                merged = older
+            await asyncio.to_thread(self._rewrite, sym, merged, str(start))
+            return
+
+        if time.time() - float(meta.get("checked_at") or 0) < self.topup_interval_seconds:
+            return
+        await self._top_up(fmp, sym, meta, covered_from)
+
+    async def _top_up(
+        self, fmp: FMPClient, sym: str, meta: Dict[str, Any], covered_from: np.datetime64
+    ) -> None:
+        stored = await asyncio.to_thread(self.read, sym)
+        if stored is None or not len(stored):
+            try:
+                cols = await self._fetch(fmp, sym, covered_from)
+            except Exception as e:
+                logger.warning("Price store: refetch of %s failed (%s: %s)", sym, type(e).__name__, e)
+                return
+            await asyncio.to_thread(self._rewrite, sym, cols, str(covered_from))
+            return
+
+        last = stored.dates[-1]
+        since = last - np.timedelta64(_TOPUP_OVERLAP_DAYS, "D")
+        try:
+            self.fetches += 1
+            fresh = parse_fmp_daily(await fmp.get_historical_prices(sym, str(since), str(_today())))
+        except Exception as e:
+            logger.warning(
+                "Price store: top-up of %s failed (%s: %s) — serving stored bars",
+                sym, type(e).__name__, e,
+            )
+            return
+        if not fresh["dates"].shape[0]:
+            await asyncio.to_thread(self._touch, sym)
+            return
+
+        # Settled overlap: bars strictly before the stored last one, on both sides.
+        settled = fresh["dates"] < last
+        idx = np.searchsorted(stored.dates, fresh["dates"][settled])
+        idx = np.clip(idx, 0, len(stored) - 1)
+        same_day = stored.dates[idx] == fresh["dates"][settled]
+        if not np.allclose(
+            stored.close[idx][same_day], fresh["close"][settled][same_day],
+            rtol=_ADJUSTMENT_RTOL, atol=0.0,
+        ):
+            logger.info("Price store: %s history was re-adjusted upstream — rewriting", sym)
+            try:
+                cols = await self._fetch(fmp, sym, covered_from)
+            except Exception as e:
+                logger.warning("Price store: refetch of %s failed (%s: %s)", sym, type(e).__name__, e)
+                return
+            await asyncio.to_thread(self._rewrite, sym, cols, str(covered_from))
+            return
+
+        tail = _take(fresh, fresh["dates"] >= last)
+        if not tail["dates"].shape[0]:
+            await asyncio.to_thread(self._touch, sym)
+            return
+        # The stored last bar is replaced by upstream's version of the same day.
+        await asyncio.to_thread(self._append, sym, len(stored) - 1, tail)
+
+
+# ── Process-wide instance ────────────────────────────────────────────────────
+
+_store: Optional[PriceHistoryStore] = None
+
+
+def get_price_history_store() -> Optional[PriceHistoryStore]:
+    """The configured store, or None when ``PRICE_HISTORY_STORE_DIR`` is empty."""
+    global _store
+    root = settings.PRICE_HISTORY_STORE_DIR
+    if not root:
+        return None
+    if _store is None or _store.root != Path(root):
+        _store = PriceHistoryStore(root, topup_interval_seconds=settings.PRICE_HISTORY_TOPUP_SECONDS)
+    return _store
+
+
+async def fetch_daily_history(
+    fmp: FMPClient,
+    symbol: str,
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+) -> Any:
+    """Drop-in for ``fmp.get_historical_prices``: FMP-shaped rows, newest-first.
+
+    Served from the store when it is enabled; otherwise exactly the direct call, with
+    the same arguments, so nothing changes for a deploy (or a test) without the store.
+    """
+    store = get_price_history_store()
+    if store is None:
+        kwargs = {k: v for k, v in (("from_date", from_date), ("to_date", to_date)) if v}
+        return await fmp.get_historical_prices(symbol, **kwargs)
+    bars = await store.daily(fmp, symbol, from_date, to_date)
+    return bars.to_rows(newest_first=True)
@@ -7,7 +7,7 @@ drives the Updates-screen insight trigger (``updates_materiality.classify_move``
 and the daily σ precompute (``volatility_cache_service``). A stock therefore gets
 the SAME tier on the report and on the Updates card.
 
-PURE — no network, no Supabase, no service imports (only ``bisect``/``datetime``/
+PURE — no network, no Supabase, no service imports (only NumPy, ``datetime`` and
 typing) — so the pure, exhaustively-testable materiality gate can import it
 without picking up the collector's heavy dependency tree.
 
@@ -16,13 +16,24 @@ baseline; a move over N trading days scores as ``z = |move%| / (σ_daily·√N·
 the tier is Typical / Notable (z≥1) / Unusual (z≥2) / Extreme (z≥3). The baseline
 length is independent of the move horizon (√N scaling handles that) and is a
 tunable constant.
+
+Vectorized: the math runs on NumPy arrays, one ROW per symbol. The single-symbol
+functions are the one-row case of the panel functions
+(:func:`price_panel` → :func:`sigma_daily_batch` /
+:func:`compute_price_volatility_batch`), so the daily σ precompute scores a whole
+chunk of the universe in a handful of array operations instead of a Python loop
+per close per symbol — and the two paths cannot drift apart. Results match the
+original list-based loops to floating-point summation order (the parity suite in
+tests/test_price_volatility_vectorized.py pins that; scripts/bench_price_volatility.py
+measures it).
 """
 from __future__ import annotations
 
-import bisect
 import math
-from datetime import date, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 _EVAL_WINDOWS: Tuple[int, ...] = (7, 15, 30, 45, 60)  # incl. 60d (2mo) so a slow build is detectable
 _BASELINE_DAYS: int = 180
@@ -42,6 +53,27 @@ TIER_UNUSUAL = "Unusual"
 TIER_EXTREME = "Extreme"
 
 
+def _as_closes(prices: Any) -> np.ndarray:
+    """float64 array view of a close series. ``None`` becomes NaN, which every
+    consumer below then rejects exactly like an FMP ``NaN``/``Infinity`` token."""
+    return np.asarray(prices, dtype=np.float64)
+
+
+def _returns_with_mask(closes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Simple returns along the last axis, plus the mask of the USABLE ones.
+
+    A pair is usable only when BOTH closes are finite and the prior one is > 0 —
+    the same guard as the original per-pair loop (see :func:`_daily_returns`).
+    Unusable slots hold 0.0 so masked row sums can add them without effect.
+    """
+    prev = closes[..., :-1]
+    curr = closes[..., 1:]
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        ok = np.isfinite(prev) & np.isfinite(curr) & (prev > 0)
+        returns = np.where(ok, (curr - prev) / prev, 0.0)
+    return returns, ok
+
+
 def _daily_returns(prices: List[float]) -> List[float]:
     """Daily simple returns from a price array (oldest→newest).
 
@@ -52,30 +84,110 @@ def _daily_returns(prices: List[float]) -> List[float]:
     propagates through the mean/variance and poisons the whole σ. Finite-guard
     both sides so one bad row cannot NaN the baseline (CLAUDE.md hardening rule).
     """
-    out: List[float] = []
-    for i in range(1, len(prices)):
-        prev = prices[i - 1]
-        curr = prices[i]
-        if (
-            prev is not None and curr is not None
-            and math.isfinite(prev) and math.isfinite(curr)
-            and prev > 0
-        ):
-            out.append((curr - prev) / prev)
-    return out
+    closes = _as_closes(prices)
+    if closes.size < 2:
+        return []
+    returns, ok = _returns_with_mask(closes)
+    return returns[ok].tolist()
 
 
 def _std_dev_pop(values: List[float]) -> Optional[float]:
     """Population standard deviation. None if <2 values or the result is
     non-finite (defence in depth against a nan/inf sneaking into ``values``)."""
-    if len(values) < 2:
+    v = np.asarray(values, dtype=np.float64)
+    if v.size < 2:
         return None
-    mean = sum(values) / len(values)
-    var = sum((v - mean) ** 2 for v in values) / len(values)
-    sigma = var ** 0.5
+    with np.errstate(invalid="ignore", over="ignore"):
+        mean = v.sum() / v.size
+        sigma = float(np.sqrt(np.square(v - mean).sum() / v.size))
     return sigma if math.isfinite(sigma) else None
 
 
+def _masked_std_dev_pop(returns: np.ndarray, ok: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Row-wise :func:`_std_dev_pop` over the ``ok`` entries of each row.
+
+    Returns ``(sigma, count)``; sigma is NaN wherever the scalar function would
+    return None (fewer than 2 usable values, or a non-finite result).
+    """
+    count = ok.sum(axis=-1)
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        mean = returns.sum(axis=-1) / count
+        dev = np.where(ok, returns - mean[..., None], 0.0)
+        sigma = np.sqrt(np.square(dev).sum(axis=-1) / count)
+    sigma[(count < 2) | ~np.isfinite(sigma)] = np.nan
+    return sigma, count
+
+
+def _price_panel(
+    series: Sequence[Sequence[float]], width: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Stack close series (each oldest→newest) into one ``(symbols × width)`` matrix.
+
+    Rows are RIGHT-aligned — column −1 is every symbol's latest close — and
+    left-padded with NaN, so a short history simply has fewer real columns.
+    ``width`` defaults to the longest series; a longer series keeps its newest
+    ``width`` closes. Returns ``(panel, lengths)`` where ``lengths[i]`` is the
+    FULL length of series ``i`` (what ``len(prices)`` was per symbol), so indices
+    computed on a narrower panel still map back into the original series.
+
+    The volatility math only reads the σ baseline and the evaluation windows, so
+    ``width=_BASELINE_DAYS + 1`` is enough for the default windows and saves
+    copying years of closes that nothing looks at.
+    """
+    lengths = np.fromiter((len(s) for s in series), dtype=np.int64, count=len(series))
+    if width is None:
+        width = int(lengths.max()) if lengths.size else 0
+    panel = np.full((len(series), width), np.nan)
+    for i, s in enumerate(series):
+        n = min(int(lengths[i]), width)
+        if n:
+            panel[i, width - n:] = s[len(s) - n:]
+    return panel, lengths
+
+
+def _sigma_daily_batch(
+    closes: np.ndarray, baseline_days: int = _BASELINE_DAYS,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """σ_daily per row of a :func:`_price_panel` matrix: ``(sigma, sample_size)``.
+
+    The baseline is the last ``baseline_days + 1`` columns, i.e. at most
+    ``baseline_days`` returns — the same slice :func:`_compute_price_volatility`
+    takes. Padding is NaN, so a short row's missing columns never form a pair.
+    sigma is NaN where the per-symbol path would get None from :func:`_std_dev_pop`.
+    """
+    returns, ok = _returns_with_mask(closes[:, -(baseline_days + 1):])
+    return _masked_std_dev_pop(returns, ok)
+
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _day_axis(dates: Sequence[date]) -> np.ndarray:
+    """Chronological dates as a ``datetime64[D]`` array (a no-op for one already).
+
+    Goes through ``toordinal()``: NumPy's own ``date`` → ``datetime64`` conversion
+    is ~20x slower per element, which on a year of bars costs more than the
+    searches the axis is built for.
+    """
+    if isinstance(dates, np.ndarray):
+        return dates.astype("datetime64[D]", copy=False)
+    days = np.fromiter(
+        (d.toordinal() for d in dates), dtype=np.int64, count=len(dates),
+    )
+    return (days - _EPOCH_ORDINAL).astype("datetime64[D]")
+
+
+def _bar_indices(targets: Sequence[date], price_dates: Any) -> np.ndarray:
+    """Index of the last bar on or before each target date (−1 when none is).
+
+    The vectorized ``bisect_right(price_dates, target) - 1``: one binary search
+    per target against the chronological bar dates, all in a single call.
+    ``price_dates`` may be a list of dates or an existing :func:`_day_axis`.
+    """
+    axis = _day_axis(price_dates)
+    return np.searchsorted(axis, _day_axis(targets), side="right") - 1
+
+
 def _z_score_for_window(
     move_pct: float, sigma_daily: Optional[float], days: int,
 ) -> Optional[float]:
@@ -103,6 +215,19 @@ def _tier_for_z(z: Optional[float]) -> str:
     return TIER_TYPICAL
 
 
+def _empty_volatility() -> Dict[str, Any]:
+    return {
+        "sigma_daily": None,
+        "windows": [],
+        "chosen_window": _DEFAULT_WINDOW,
+        "chosen_ref_idx": None,
+        "tier": TIER_TYPICAL,
+        "chosen_z": None,
+        "chosen_move_pct": None,
+        "chosen_band_pct": None,
+    }
+
+
 def _compute_price_volatility(
     prices: List[float],
     price_dates: Optional[List[date]] = None,
@@ -126,92 +251,126 @@ def _compute_price_volatility(
     When fewer than 30 daily returns are available the result still has the
     same shape but sigma_daily is None and the chosen window stays at the
     default — callers should treat tier as "Typical" without the σ math.
+
+    The one-row case of :func:`_compute_price_volatility_batch`.
     """
-    out: Dict[str, Any] = {
-        "sigma_daily": None,
-        "windows": [],
-        "chosen_window": _DEFAULT_WINDOW,
-        "chosen_ref_idx": None,
-        "tier": TIER_TYPICAL,
-        "chosen_z": None,
-        "chosen_move_pct": None,
-        "chosen_band_pct": None,
-    }
     if len(prices) < 30:
-        return out
+        return _empty_volatility()
     # If a date list was provided but doesn't line up, drop it and fall
     # back to trading-day mode rather than emitting subtly wrong windows.
     if price_dates is not None and len(price_dates) != len(prices):
         price_dates = None
+    # Only the tail is ever read: the σ baseline, and an N-day window's reference
+    # bar is at most N bars back (at most one bar per calendar day).
+    tail = max(baseline_days + 1, max(windows, default=0) + 1)
+    panel, lengths = _price_panel([prices], width=min(tail, len(prices)))
+    return _compute_price_volatility_batch(
+        panel, lengths,
+        dates=price_dates[-panel.shape[1]:] if price_dates is not None else None,
+        baseline_days=baseline_days, windows=windows,
+    )[0]
 
-    # Use the last `baseline_days + 1` closes so the returns array has
-    # at most `baseline_days` entries. The +1 covers the inter-day diff.
-    baseline_slice = prices[-(baseline_days + 1):]
-    sigma_daily = _std_dev_pop(_daily_returns(baseline_slice))
-    if sigma_daily is None or not math.isfinite(sigma_daily) or sigma_daily <= 0:
-        return out
-    out["sigma_daily"] = sigma_daily
-
-    newest = prices[-1]
-    if newest is None or not math.isfinite(newest):
-        # A non-finite latest close makes every window's move_pct/z NaN. The tier
-        # ladder (`nan >= k` is always False) would then mislabel a genuinely
-        # large move as Typical and lose its catalyst, and `"{:+.1f}".format(nan)`
-        # leaks "nan%" into the prompt. Bail with sigma only — no bogus windows.
+
+def _compute_price_volatility_batch(
+    closes: np.ndarray,
+    lengths: Optional[np.ndarray] = None,
+    dates: Optional[Sequence[date]] = None,
+    baseline_days: int = _BASELINE_DAYS,
+    windows: Tuple[int, ...] = _EVAL_WINDOWS,
+) -> List[Dict[str, Any]]:
+    """:func:`_compute_price_volatility` for every row of a :func:`_price_panel`.
+
+    ``lengths`` are the per-row series lengths (default: every row is exactly
+    the panel's width); ``ref_idx`` values index the original series. ``dates``
+    is the panel's SHARED chronological date axis, one per column — symbols on
+    the same exchange calendar line up column for column, and a row's own dates
+    end with the axis. Without it the windows are trading days, as in the
+    single-symbol fallback. The panel must be at least ``baseline_days + 1``
+    columns wide and reach back past the longest window.
+
+    Everything per (symbol, window) — reference column, move, √N band, z — is
+    computed as one ``symbols × windows`` matrix: the window's reference column is
+    the same for every row (one ``searchsorted`` on the shared axis), and a row
+    only needs its offset into the panel to tell whether that column is inside
+    its own history. Only the rounding and the per-row window choice stay in
+    Python, so the output dicts are the same values the list-based loop produced.
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    n_rows, width = closes.shape
+    lengths = (
+        np.full(n_rows, width, dtype=np.int64)
+        if lengths is None else np.asarray(lengths, dtype=np.int64)
+    )
+    out = [_empty_volatility() for _ in range(n_rows)]
+    if dates is not None and len(dates) != width:
+        dates = None
+    live = lengths >= 30
+    if not n_rows or not live.any():
         return out
-    metrics: List[Dict[str, Any]] = []
-
-    if price_dates:
-        # Calendar-day mode (production).
-        today = price_dates[-1]
-        for n in windows:
-            target = today - timedelta(days=n)
-            # Rightmost index whose date is <= target (handles
-            # weekends/holidays by stepping back to the prior trading day).
-            idx = bisect.bisect_right(price_dates, target) - 1
-            if idx < 0 or idx >= len(prices) - 1:
-                continue
-            oldest = prices[idx]
-            if not oldest or not math.isfinite(oldest) or oldest <= 0:
-                continue
-            move_pct = (newest - oldest) / oldest * 100
-            # Trading-day count actually elapsed in this calendar window;
-            # feeds the √n scaling so the σ band shrinks accordingly
-            # (e.g., 30 calendar days ≈ 21 trading days → smaller band
-            # than the old code's √30).
-            trading_days = len(prices) - 1 - idx
-            n_day_sigma_pct = sigma_daily * (trading_days ** 0.5) * 100
-            z = abs(move_pct) / n_day_sigma_pct if n_day_sigma_pct > 0 else 0.0
-            metrics.append({
-                "days": n,
-                "ref_idx": idx,
-                "move_pct": round(move_pct, 2),
-                "z": round(z, 2),
-                "band_2sigma": round(n_day_sigma_pct * 2, 2),
-            })
+
+    sigma, _ = _sigma_daily_batch(closes, baseline_days)
+    live &= sigma > 0  # NaN (the scalar path's None) compares False
+    newest = closes[:, -1]
+    # A non-finite latest close makes every window's move_pct/z NaN. The tier
+    # ladder (`nan >= k` is always False) would then mislabel a genuinely large
+    # move as Typical and lose its catalyst, and `"{:+.1f}".format(nan)` leaks
+    # "nan%" into the prompt. Such rows keep sigma only — no bogus windows.
+    scored = live & np.isfinite(newest)
+
+    days = np.asarray(windows, dtype=np.int64)
+    offsets = width - lengths
+    if dates is not None and len(dates):
+        # Calendar-day mode (production): the rightmost column whose date is
+        # <= today − N (handles weekends/holidays by stepping back to the prior
+        # trading day), and the trading-day count actually elapsed in that
+        # calendar window, which feeds the √n scaling so the σ band shrinks
+        # accordingly (30 calendar days ≈ 21 trading days → a smaller band).
+        axis = _day_axis(dates)
+        cols = np.searchsorted(axis, axis[-1] - days.astype("timedelta64[D]"), side="right") - 1
+        in_range = (cols >= 0) & (cols < width - 1)
+        elapsed = width - 1 - cols
     else:
         # Trading-day mode (test fixtures with synthetic price arrays).
-        for n in windows:
-            if len(prices) <= n:
-                continue
-            ref_idx = len(prices) - (n + 1)
-            oldest = prices[ref_idx]
-            if not oldest or not math.isfinite(oldest) or oldest <= 0:
-                continue
-            move_pct = (newest - oldest) / oldest * 100
-            n_day_sigma_pct = sigma_daily * (n ** 0.5) * 100
-            z = abs(move_pct) / n_day_sigma_pct if n_day_sigma_pct > 0 else 0.0
-            metrics.append({
-                "days": n,
-                "ref_idx": ref_idx,
-                "move_pct": round(move_pct, 2),
-                "z": round(z, 2),
-                "band_2sigma": round(n_day_sigma_pct * 2, 2),
-            })
+        cols = width - (days + 1)
+        in_range = cols >= 0
+        elapsed = days
+    valid = in_range[None, :] & (cols[None, :] >= offsets[:, None]) & scored[:, None]
+    oldest = closes[:, np.maximum(cols, 0)]  # cols never exceeds width − 1
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        valid &= np.isfinite(oldest) & (oldest > 0)
+        move_pct = (newest[:, None] - oldest) / oldest * 100
+        band = sigma[:, None] * np.sqrt(elapsed.astype(np.float64))[None, :] * 100
+        z = np.where(band > 0, np.abs(move_pct) / np.where(band > 0, band, 1.0), 0.0)
+
+    for i in np.flatnonzero(live).tolist():
+        row = out[i]
+        row["sigma_daily"] = float(sigma[i])
+        if not scored[i]:
+            continue
+        keep = valid[i]
+        metrics = [
+            {
+                "days": int(n),
+                "ref_idx": int(c) - int(offsets[i]),
+                "move_pct": round(m, 2),
+                "z": round(zz, 2),
+                "band_2sigma": round(b * 2, 2),
+            }
+            for n, c, m, zz, b, k in zip(
+                windows, cols.tolist(), move_pct[i].tolist(), z[i].tolist(),
+                band[i].tolist(), keep.tolist(),
+            )
+            if k
+        ]
+        _choose_window(row, metrics)
+    return out
+
 
+def _choose_window(out: Dict[str, Any], metrics: List[Dict[str, Any]]) -> None:
+    """Fill ``out``'s window fields from the scored ``metrics`` (in window order)."""
     out["windows"] = metrics
     if not metrics:
-        return out
+        return
 
     # Pick the most unusual window. If every window is within ±1σ
     # (genuinely quiet stock-week), default to 30 days so the section
@@ -231,4 +390,3 @@ def _compute_price_volatility(
     out["chosen_move_pct"] = chosen["move_pct"]
     out["chosen_band_pct"] = chosen["band_2sigma"]
     out["tier"] = _tier_for_z(chosen["z"])
-    return out
@@ -129,6 +129,18 @@ class _Recipient:
     preferences_known: bool = True
 
 
+@dataclass(frozen=True)
+class OutgoingPush:
+    """One personalised notification for `notify_each`: its own recipient, copy and key."""
+
+    user_id: str
+    title: str
+    body: str
+    dedup_key: str
+    route: Dict[str, Any] = field(default_factory=dict)
+    collapse_id: Optional[str] = None
+
+
 @dataclass(frozen=True)
 class Decision:
     """Why a recipient was or wasn't notified. Surfaced by the admin preview endpoint
@@ -835,55 +847,153 @@ class PushDispatchService:
         for uid in users:
             recipient = recipients.get(uid) or _Recipient(user_id=uid)
             key = dedup_key(uid) if callable(dedup_key) else dedup_key
-            try:
-                decision = self.decide(recipient, nkind, now)
-                if not decision.send:
-                    bucket = decision.reason.split(":", 1)[0]
-                    suppressed[bucket] = suppressed.get(bucket, 0) + 1
-                    if decision.deliver_after is None:
-                        # Preference or cap: no row, no claim. Claiming for someone we
-                        # will not message would burn their dedup slot and silently
-                        # suppress a LATER alert they did want.
-                        continue
-                    # Quiet hours: claim and PARK it. The claim first makes the
-                    # deferral idempotent — a second trigger of the same event finds
-                    # the row already claimed instead of queueing a duplicate.
-                    await asyncio.to_thread(
-                        self.claim_send, uid, key,
-                        kind=nkind.key, category=nkind.category,
-                        title=title, body=body, route={**route, "kind": nkind.key},
-                        push_state=STATE_DEFERRED, deliver_after=decision.deliver_after,
-                    )
-                    continue
+            if await self._send_one(
+                recipient, nkind, key, title=title, body=body, route=route,
+                collapse_id=collapse_id, now=now, suppressed=suppressed,
+            ):
+                sent += 1
+
+        if sent or suppressed:
+            # Suppression is logged explicitly and by reason — a silent cap reads as
+            # "push is broken" when someone asks why they didn't get an alert.
+            logger.info(
+                "push: kind=%s delivered %d/%d (suppressed: %s)",
+                kind, sent, len(users), suppressed or "none",
+            )
+        return sent
 
-                claimed = await asyncio.to_thread(
+    async def _send_one(
+        self,
+        recipient: _Recipient,
+        nkind: NotificationKind,
+        key: str,
+        *,
+        title: str,
+        body: str,
+        route: Dict[str, Any],
+        collapse_id: Optional[str],
+        now: datetime,
+        suppressed: Dict[str, int],
+    ) -> bool:
+        """Decide → claim → deliver for one recipient. True only on a real delivery.
+
+        Counts each suppression into `suppressed` by reason, and never raises: one bad
+        recipient must not abandon the rest of the fan-out.
+        """
+        uid = recipient.user_id
+        kind = nkind.key
+        try:
+            decision = self.decide(recipient, nkind, now)
+            if not decision.send:
+                bucket = decision.reason.split(":", 1)[0]
+                suppressed[bucket] = suppressed.get(bucket, 0) + 1
+                if decision.deliver_after is None:
+                    # Preference or cap: no row, no claim. Claiming for someone we
+                    # will not message would burn their dedup slot and silently
+                    # suppress a LATER alert they did want.
+                    return False
+                # Quiet hours: claim and PARK it. The claim first makes the
+                # deferral idempotent — a second trigger of the same event finds
+                # the row already claimed instead of queueing a duplicate.
+                await asyncio.to_thread(
                     self.claim_send, uid, key,
                     kind=nkind.key, category=nkind.category,
                     title=title, body=body, route={**route, "kind": nkind.key},
-                    push_state=STATE_PENDING,
+                    push_state=STATE_DEFERRED, deliver_after=decision.deliver_after,
                 )
-                if not claimed:
-                    suppressed["duplicate"] = suppressed.get("duplicate", 0) + 1
-                    continue
+                return False
 
-                if await self._deliver(
-                    recipient, nkind, title=title, body=body,
-                    dedup_key=key, route=route, collapse_id=collapse_id,
-                ):
-                    sent += 1
-            except Exception as e:
-                # One bad recipient must not abandon the rest of the fan-out.
-                logger.warning(
-                    "push: send to user=%s (kind=%s) failed (%s: %s)",
-                    uid, kind, type(e).__name__, e,
-                )
+            claimed = await asyncio.to_thread(
+                self.claim_send, uid, key,
+                kind=nkind.key, category=nkind.category,
+                title=title, body=body, route={**route, "kind": nkind.key},
+                push_state=STATE_PENDING,
+            )
+            if not claimed:
+                suppressed["duplicate"] = suppressed.get("duplicate", 0) + 1
+                return False
+
+            if await self._deliver(
+                recipient, nkind, title=title, body=body,
+                dedup_key=key, route=route, collapse_id=collapse_id,
+            ):
+                return True
+        except Exception as e:
+            # One bad recipient must not abandon the rest of the fan-out.
+            logger.warning(
+                "push: send to user=%s (kind=%s) failed (%s: %s)",
+                uid, kind, type(e).__name__, e,
+            )
+
+        return False
+
+    async def notify_each(
+        self,
+        messages: Sequence[OutgoingPush],
+        *,
+        kind: str,
+        now: Optional[datetime] = None,
+        concurrency: int = 16,
+    ) -> int:
+        """Send many one-recipient notifications of one kind. Returns how many delivered.
+
+        For senders whose every message is personal — a fired price alert names the
+        user's own threshold — so `notify_users` would be one call per message, each
+        paying its own recipient lookups. Here the audience is resolved ONCE, in the
+        same three bulk queries, and the claim/deliver round-trips run `concurrency`
+        recipients at a time. A user's own messages stay sequential, in order, so the
+        per-category cap and the badge count still advance between them exactly as
+        they did across separate calls.
 
+        Never raises, like `notify_users`.
+        """
+        try:
+            nkind = get_kind(kind)
+            now = now or datetime.now(timezone.utc)
+            by_user: Dict[str, List[OutgoingPush]] = {}
+            for m in messages:
+                if m.user_id:
+                    by_user.setdefault(m.user_id, []).append(m)
+            if not by_user:
+                return 0
+            if not settings.PUSH_DRY_RUN and not self.push.enabled:
+                logger.debug("push: APNs not configured — skipping %s alerts", kind)
+                return 0
+
+            recipients = await asyncio.to_thread(
+                self.resolve_recipients, list(by_user), nkind, now
+            )
+        except Exception as e:
+            logger.exception(
+                "push: notify_each(kind=%s) raised (%s: %s) — no alerts this call",
+                kind, type(e).__name__, e,
+            )
+            return 0
+
+        gate = asyncio.Semaphore(max(1, concurrency))
+        suppressed: Dict[str, int] = {}
+
+        async def _one_user(uid: str, queue: List[OutgoingPush]) -> int:
+            recipient = recipients.get(uid) or _Recipient(user_id=uid)
+            delivered = 0
+            async with gate:
+                for m in queue:
+                    if await self._send_one(
+                        recipient, nkind, m.dedup_key, title=m.title, body=m.body,
+                        route=dict(m.route), collapse_id=m.collapse_id, now=now,
+                        suppressed=suppressed,
+                    ):
+                        delivered += 1
+                        # What a fresh `resolve_recipients` would now read back.
+                        recipient.category_sent_today += 1
+                        recipient.unread += 1
+            return delivered
+
+        sent = sum(await asyncio.gather(*(_one_user(u, q) for u, q in by_user.items())))
         if sent or suppressed:
-            # Suppression is logged explicitly and by reason — a silent cap reads as
-            # "push is broken" when someone asks why they didn't get an alert.
             logger.info(
                 "push: kind=%s delivered %d/%d (suppressed: %s)",
-                kind, sent, len(users), suppressed or "none",
+                kind, sent, len(messages), suppressed or "none",
             )
         return sent
 
@@ -4,9 +4,9 @@ stored in Supabase, with 1-hour in-memory cache.
 """
 
 import logging
-import time
 from typing import Any, Dict, List, Optional, Tuple
 
+from app.core.cache import register_region
 from app.database import get_supabase
 from app.utils.supabase_errors import (
     is_transient_supabase_error,
@@ -17,7 +17,6 @@ logger = logging.getLogger(__name__)
 
 # ── In-memory cache ───────────────────────────────────────────────
 
-_cache: Dict[str, Tuple[float, Any]] = {}
 _CACHE_TTL = 3600  # 1 hour
 
 # period_type of the TTM current-snapshot rows (written by industry_benchmark_service).
@@ -25,16 +24,7 @@ TTM_PERIOD_TYPE = "ttm"
 
 
 def _cache_get(key: str) -> Optional[Any]:
-    entry = _cache.get(key)
-    if entry is None:
-        return None
-    ts, value = entry
-    if time.time() - ts > _CACHE_TTL:
-        # pop (not del) — the lookup is called from asyncio.to_thread workers, so
-        # two threads can expire the same key at once; del would raise KeyError.
-        _cache.pop(key, None)
-        return None
-    return value
+    return _cache.lookup(key)
 
 
 # Hard cap on the in-memory tier. Without it this dict grew with the number of DISTINCT
@@ -42,16 +32,14 @@ def _cache_get(key: str) -> Optional[Any]:
 # SAME key is read again after expiry, so a ticker fetched once and never revisited stayed
 # resident for the life of the process. Across ~17 services on a long-lived Railway
 # container that is a slow leak whose only resolution is an OOM restart — which drops every
-# in-flight report with it. Bounded LRU-ish: evict from the head (least recently WRITTEN).
+# in-flight report with it. Enforced by the shared region (app/core/cache.py), which also
+# counts every entry against the process-wide CACHE_MEMORY_BUDGET_MB.
 _CACHE_MAX_ENTRIES = 1024
+_cache = register_region("sector_benchmark_lookup", ttl=_CACHE_TTL, max_entries=_CACHE_MAX_ENTRIES)
 
 
 def _cache_set(key: str, value: Any) -> None:
-    _cache.pop(key, None)
-    _cache[key] = (time.time(), value)
-    if len(_cache) > _CACHE_MAX_ENTRIES:
-        for _old in list(_cache.keys())[: len(_cache) - _CACHE_MAX_ENTRIES]:
-            _cache.pop(_old, None)
+    _cache.store(key, value)
 
 
 # ── Transient-error retry (Supabase/httpx blips) ─────────────────────────
@@ -17,12 +17,12 @@ social-sentiments endpoints were removed from the stable API).
 
 import asyncio
 import logging
-import time
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 import math
 
+from app.core.cache import register_region
 from app.database import get_supabase
 from app.utils.market_hours import to_utc_instant
 from app.integrations.fmp import FMPClient, get_fmp_client
@@ -42,7 +42,6 @@ _NEWS_CACHE_TTL = timedelta(hours=_NEWS_CACHE_TTL_HOURS)
 
 # ── In-memory cache (same pattern as analyst_service) ─────────────
 
-_cache: Dict[str, Tuple[float, Any]] = {}
 _CACHE_TTL = 900  # 15 minutes
 
 # How often to re-fetch from FMP and refresh the DB cache
@@ -63,14 +62,7 @@ def _looks_like_timestamp(value: Any) -> bool:
 
 
 def _cache_get(key: str, ttl: float = _CACHE_TTL) -> Optional[Any]:
-    entry = _cache.get(key)
-    if entry is None:
-        return None
-    ts, value = entry
-    if time.time() - ts > ttl:
-        del _cache[key]
-        return None
-    return value
+    return _cache.lookup(key, ttl)
 
 
 # Hard cap on the in-memory tier. Without it this dict grew with the number of DISTINCT
@@ -78,16 +70,14 @@ def _cache_get(key: str, ttl: float = _CACHE_TTL) -> Optional[Any]:
 # SAME key is read again after expiry, so a ticker fetched once and never revisited stayed
 # resident for the life of the process. Across ~17 services on a long-lived Railway
 # container that is a slow leak whose only resolution is an OOM restart — which drops every
-# in-flight report with it. Bounded LRU-ish: evict from the head (least recently WRITTEN).
+# in-flight report with it. Enforced by the shared region (app/core/cache.py), which also
+# counts every entry against the process-wide CACHE_MEMORY_BUDGET_MB.
 _CACHE_MAX_ENTRIES = 1024
+_cache = register_region("sentiment", ttl=_CACHE_TTL, max_entries=_CACHE_MAX_ENTRIES)
 
 
 def _cache_set(key: str, value: Any):
-    _cache.pop(key, None)
-    _cache[key] = (time.time(), value)
-    if len(_cache) > _CACHE_MAX_ENTRIES:
-        for _old in list(_cache.keys())[: len(_cache) - _CACHE_MAX_ENTRIES]:
-            _cache.pop(_old, None)
+    _cache.store(key, value)
 
 
 # ── Keyword-based sentiment classifier ───────────────────────────
@@ -37,6 +37,7 @@ from typing import Any, Dict, List, Optional, Set, Tuple
 
 import re
 
+from app.core.cache import record_entry
 from app.database import get_supabase
 from app.integrations.fmp import get_fmp_client, FMPClient
 from app.services.earnings_service import _compute_surprise
@@ -823,11 +824,14 @@ class SignalsService:
 
         cached = self._detail_cache.get(key)
         if cached is not None and (time.time() - cached[0]) < _DETAIL_TTL_SECONDS:
+            record_entry("signals_detail", key, cached, cached[1])
             return cached[1]
 
         inflight = self._detail_inflight.get(key)
         if inflight is not None:
-            return await asyncio.shield(inflight)
+            shared = await asyncio.shield(inflight)
+            record_entry("signals_detail", key, None, shared)
+            return shared
 
         loop = asyncio.get_event_loop()
         fut: asyncio.Future = loop.create_future()
@@ -842,6 +846,7 @@ class SignalsService:
                     kind, sym, type(exc).__name__, exc,
                 )
                 result = SignalTickerDetailResponse(symbol=sym, kind=kind)
+            record_entry("signals_detail", key, self._detail_cache.get(key), result)
             if not fut.done():
                 fut.set_result(result)
             return result
@@ -9,10 +9,10 @@ helper functions for return calculations and snapshot ratings.
 import asyncio
 import logging
 import math
-import time
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
+from app.core.cache import register_region
 from app.integrations.fmp import (
     FMPClient,
     FMPUnavailableException,
@@ -47,7 +47,6 @@ def _normalize_sector(name: str) -> str:
 
 # ── In-memory cache ──────────────────────────────────────────────
 
-_cache: Dict[str, Tuple[float, Any]] = {}
 _VOLATILE_TTL = 120            # 2 min for intraday data (quote, chart)
 _FUNDAMENTALS_MEM_TTL = 3600   # 1 hour in-memory for fundamentals
 _FUNDAMENTALS_DB_TTL_HOURS = 24  # 24 hours in Supabase for fundamentals
@@ -56,29 +55,17 @@ _CACHE_TTL = _VOLATILE_TTL     # default TTL for general cache
 # Hard cap on live entries. Expired rows are only swept lazily on read of the
 # same key, so without a cap this dict grows unbounded in the long-lived Railway
 # process (one entry per ticker×range×key-type). Eviction is least-recently-
-# written; a miss just re-fetches, so there's no correctness impact.
+# used (app/core/cache.py); a miss just re-fetches, so there's no correctness impact.
 _CACHE_MAX_ENTRIES = 1024
+_cache = register_region("stock_overview", ttl=_CACHE_TTL, max_entries=_CACHE_MAX_ENTRIES)
 
 
 def _cache_get(key: str, ttl: float = _CACHE_TTL) -> Optional[Any]:
-    entry = _cache.get(key)
-    if entry is None:
-        return None
-    ts, value = entry
-    if time.time() - ts > ttl:
-        del _cache[key]
-        return None
-    return value
+    return _cache.lookup(key, ttl)
 
 
 def _cache_set(key: str, value: Any):
-    # Move-to-end on write so the dict head is the least-recently-written, then
-    # evict from the head once we exceed the cap.
-    _cache.pop(key, None)
-    _cache[key] = (time.time(), value)
-    if len(_cache) > _CACHE_MAX_ENTRIES:
-        for _old in list(_cache.keys())[: len(_cache) - _CACHE_MAX_ENTRIES]:
-            _cache.pop(_old, None)
+    _cache.store(key, value)
 
 
 # ── Sector P/E averages (approximate, for valuation context) ─────
@@ -8,16 +8,18 @@ stateless class, in-memory TTL cache, singleton getter.
 """
 
 import asyncio
+import json
 import logging
 import math
-import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import pandas as pd
 import ta as ta_lib
 from fastapi import HTTPException
 
+from app.core.cache import ModelCodec, register_region
 from app.integrations.fmp import FMPClient, get_fmp_client
 from app.schemas.technical_analysis import (
     FibonacciLevel,
@@ -40,11 +42,18 @@ from app.schemas.technical_analysis import (
     VolumeTrend,
 )
 from app.services.asset_class import detect_asset_class
+from app.services.indicator_state import SeriesState
+from app.services.price_history_store import DailyBars, get_price_history_store
+from app.services.technical_indicators import (
+    MA_WINDOWS,
+    group_by_length,
+    panel_indicators,
+    weekly_bars,
+)
 
 logger = logging.getLogger(__name__)
 
 # ── In-memory cache ──────────────────────────────────────────────
-_cache: Dict[str, Tuple[float, Any]] = {}
 _CACHE_TTL = 43_200  # 12 hours in seconds
 _CACHE_TTL_CRYPTO = 14_400  # 4 hours — crypto is 24/7 and more volatile
 
@@ -52,14 +61,7 @@ TOTAL_INDICATORS = 18
 
 
 def _cache_get(key: str, ttl: float = _CACHE_TTL) -> Optional[Any]:
-    entry = _cache.get(key)
-    if entry is None:
-        return None
-    ts, value = entry
-    if time.time() - ts > ttl:
-        del _cache[key]
-        return None
-    return value
+    return _cache.lookup(key, ttl)
 
 
 # Hard cap on the in-memory tier. Without it this dict grew with the number of DISTINCT
@@ -67,27 +69,99 @@ def _cache_get(key: str, ttl: float = _CACHE_TTL) -> Optional[Any]:
 # SAME key is read again after expiry, so a ticker fetched once and never revisited stayed
 # resident for the life of the process. Across ~17 services on a long-lived Railway
 # container that is a slow leak whose only resolution is an OOM restart — which drops every
-# in-flight report with it. Bounded LRU-ish: evict from the head (least recently WRITTEN).
+# in-flight report with it. Enforced by the shared region (app/core/cache.py), which also
+# counts every entry against the process-wide CACHE_MEMORY_BUDGET_MB.
 _CACHE_MAX_ENTRIES = 1024
+_cache = register_region("technical_analysis", ttl=_CACHE_TTL, max_entries=_CACHE_MAX_ENTRIES)
 
 
 # Thundering-herd guard. This service had NONE: a cold-start burst of N concurrent
 # viewers of the same ticker each ran its own 600-day fetch AND its own pandas indicator
 # pass. commodity_service has carried this guard for a while; this is the same pattern.
-_inflight: Dict[str, asyncio.Future] = {}
+_inflight = _cache.inflight
 
 # The 600-day OHLCV frame is shared between get_analysis and get_analysis_detail. They
 # cached their RESULTS under separate keys but each fetched its own copy of the identical
 # history, so opening the Analysis tab and then its detail sheet cost two 600-day calls.
 _OHLCV_TTL = 3600  # 1h — daily bars, so anything finer is wasted
 
+# The two RESULTS are shared with other workers/replicas through the L2 tier; the
+# OHLCV frame is not (a DataFrame has no stable wire form, and it is only an input).
+_ANALYSIS_CODEC = ModelCodec(TechnicalAnalysisResponse)
+_DETAIL_CODEC = ModelCodec(TechnicalAnalysisDetailResponse)
+
 
 def _cache_set(key: str, value: Any) -> None:
-    _cache.pop(key, None)
-    _cache[key] = (time.time(), value)
-    if len(_cache) > _CACHE_MAX_ENTRIES:
-        for _old in list(_cache.keys())[: len(_cache) - _CACHE_MAX_ENTRIES]:
-            _cache.pop(_old, None)
+    _cache.store(key, value)
+
+
+# The universe sweep's fetch fan-out. Its FMP calls already queue at BACKGROUND priority
+# behind interactive ones; this only bounds how many histories are in flight at once.
+_PRECOMPUTE_CONCURRENCY = 8
+
+
+def _history_window() -> Tuple[str, str]:
+    """``(from_date, to_date)`` for the ~600 calendar days every indicator pass reads."""
+    now = datetime.utcnow()
+    return (now - timedelta(days=600)).strftime("%Y-%m-%d"), now.strftime("%Y-%m-%d")
+
+
+# Incremental indicator state, one entry per (ticker, timeframe): the accumulators
+# (app/services/indicator_state.py) through the last SETTLED daily / weekly bar. With it a
+# gauge rebuild fetches only the bars since that bar and advances the signals in O(1)
+# instead of refetching 600 days and rerunning 36 indicator series — cheap enough for the
+# universe sweep to refresh every watchlist gauge intraday. A state is an input, never a
+# result: if it is lost, stale, or no longer lines up with upstream (a split
+# re-adjustment), the build falls back to the full history and seeds a new one.
+_STATE_TTL = 7 * 86_400
+_STATE_MAX_ENTRIES = 2048  # two timeframes × the 500-ticker sweep, with headroom
+# Past this the "tail" is most of a history: rebuild rather than replay it.
+_STATE_MAX_GAP_DAYS = 45
+_TIMEFRAMES = ("daily", "weekly")
+
+
+class _StateCodec:
+    """JSON for the shared tier — plain floats and lists, NaN included."""
+
+    def dumps(self, value: SeriesState) -> bytes:
+        return json.dumps(value.to_dict()).encode("utf-8")
+
+    def loads(self, raw: bytes) -> SeriesState:
+        return SeriesState.from_dict(json.loads(raw))
+
+
+_state_cache = register_region(
+    "technical_analysis_state", ttl=_STATE_TTL, max_entries=_STATE_MAX_ENTRIES,
+    codec=_StateCodec(),
+)
+
+_Columns = Tuple[List[int], List[float], List[float], List[float]]
+
+
+def _timeframe_columns(bars: DailyBars, is_crypto: bool) -> Dict[str, _Columns]:
+    """``{timeframe: (days, high, low, close)}`` as plain lists — the accumulators' input."""
+    days = bars.dates.astype("datetime64[D]").astype(np.int64)
+    weeks, _, w_high, w_low, w_close, _ = weekly_bars(
+        bars.dates, bars.open, bars.high, bars.low, bars.close, bars.volume, is_crypto=is_crypto,
+    )
+    return {
+        "daily": (days.tolist(), np.asarray(bars.high, dtype=np.float64).tolist(),
+                  np.asarray(bars.low, dtype=np.float64).tolist(),
+                  np.asarray(bars.close, dtype=np.float64).tolist()),
+        "weekly": (weeks.astype(np.int64).tolist(), w_high.tolist(), w_low.tolist(), w_close.tolist()),
+    }
+
+
+def _is_crypto(ticker: str) -> bool:
+    return detect_asset_class(ticker) == "crypto"
+
+
+def _bars_from_frame(ticker: str, df: pd.DataFrame) -> DailyBars:
+    return DailyBars(
+        ticker,
+        df.index.values.astype("datetime64[D]"),
+        *(df[col].to_numpy(dtype=np.float64) for col in ("open", "high", "low", "close", "volume")),
+    )
 
 
 def _round_price(v: Optional[float], default: float = 0.0) -> float:
@@ -209,29 +283,112 @@ class TechnicalAnalysisService:
         is_crypto = detect_asset_class(ticker) == "crypto"
 
         ttl = _CACHE_TTL_CRYPTO if is_crypto else _CACHE_TTL
-        cached = _cache_get(f"ta:{ticker}", ttl)
-        if cached is not None:
-            return cached
-
-        return await _deduped(
-            f"ta:build:{ticker}", lambda: self._build_analysis(ticker, is_crypto)
+        # L1 → shared L2 (when REDIS_URL is set) → one build across every process.
+        # A 600-day history fetch plus 36 indicator series is the expensive part of
+        # the Analysis tab; with N workers it used to be paid N times per ticker.
+        return await _cache.get_or_build(
+            f"ta:{ticker}",
+            lambda: self._build_analysis(ticker, is_crypto),
+            ttl,
+            codec=_ANALYSIS_CODEC,
         )
 
     async def _build_analysis(
         self, ticker: str, is_crypto: bool
     ) -> TechnicalAnalysisResponse:
-
+        # Warm path: advance the stored per-timeframe state over the bars since it.
+        response = await self._advance_analysis(ticker, is_crypto)
+        if response is not None:
+            return response
+        # Cold (or stale) path: the full history, shared with the detail endpoint.
         df_daily = await self._fetch_daily_ohlcv(ticker)
-        df_weekly = self._daily_to_weekly(df_daily, is_crypto=is_crypto)
+        response, states = self._seed_analysis(_bars_from_frame(ticker, df_daily), is_crypto)
+        await self._publish_states(ticker, states)
+        return response
 
-        daily_result, daily_gauge, _, _ = self._compute_timeframe_signal(df_daily)
-        weekly_result, weekly_gauge, _, _ = self._compute_timeframe_signal(df_weekly)
+    async def _advance_analysis(
+        self, ticker: str, is_crypto: bool
+    ) -> Optional[TechnicalAnalysisResponse]:
+        """The gauge from the stored state plus the bars since it, or None to rebuild.
 
+        Fetches from the first day of the last settled WEEK (never later than the last
+        settled day), so the window re-derives both settled bars: each must come back
+        unchanged, or upstream history moved under the state and it is discarded.
+        """
+        states = [await _state_cache.recall(f"{ticker}:{tf}") for tf in _TIMEFRAMES]
+        if any(st is None for st in states):
+            return None
+        daily_state, weekly_state = states
+        since = min(daily_state.last_day, weekly_state.last_day - 6)
+        since_date = np.datetime64(since, "D").astype(object)
+        if (datetime.utcnow().date() - since_date).days > _STATE_MAX_GAP_DAYS:
+            return None
+
+        try:
+            bars = await self._fetch_daily_bars(ticker, from_date=since_date.isoformat())
+        except HTTPException:
+            return None
+        columns = _timeframe_columns(bars, is_crypto) if len(bars) else None
+        if columns is None:
+            return None
+
+        advanced = {}
+        for tf, state in zip(_TIMEFRAMES, states):
+            step = state.advance(*columns[tf])
+            if step is None:
+                logger.info("TA state for %s:%s no longer lines up — rebuilding", ticker, tf)
+                for name in _TIMEFRAMES:
+                    _state_cache.discard(f"{ticker}:{name}")
+                return None
+            advanced[tf] = step
+
+        changed = {
+            tf: new for (tf, (new, _)), old in zip(advanced.items(), states) if new is not old
+        }
+        await self._publish_states(ticker, changed)
+        return self._analysis_response(
+            ticker,
+            *(self._signal(columns[tf][3][-1], advanced[tf][1]) for tf in _TIMEFRAMES),
+        )
+
+    def _seed_analysis(
+        self, bars: DailyBars, is_crypto: bool
+    ) -> Tuple[TechnicalAnalysisResponse, Dict[str, SeriesState]]:
+        """Replay a full history into fresh states; the response comes from the same pass."""
+        columns = _timeframe_columns(bars, is_crypto)
+        states: Dict[str, SeriesState] = {}
+        signals = []
+        for tf in _TIMEFRAMES:
+            state, values = SeriesState.from_bars(*columns[tf])
+            if state is not None:
+                states[tf] = state
+            signals.append(self._signal(columns[tf][3][-1], values))
+        return self._analysis_response(bars.symbol.upper(), *signals), states
+
+    @staticmethod
+    async def _publish_states(ticker: str, states: Dict[str, SeriesState]) -> None:
+        for tf, state in states.items():
+            await _state_cache.publish(f"{ticker}:{tf}", state)
+
+    def _signal(
+        self, current_price: float, values: Dict[str, float]
+    ) -> Tuple[TechnicalIndicatorResult, float]:
+        result, gauge, _, _ = self._timeframe_signal(
+            float(current_price), {name: _safe_float(v) for name, v in values.items()}
+        )
+        return result, gauge
+
+    @staticmethod
+    def _analysis_response(
+        ticker: str,
+        daily: Tuple[TechnicalIndicatorResult, float],
+        weekly: Tuple[TechnicalIndicatorResult, float],
+    ) -> TechnicalAnalysisResponse:
+        (daily_result, daily_gauge), (weekly_result, weekly_gauge) = daily, weekly
         # Overall gauge: average of the daily and weekly NET gauges (each already
         # centres NEUTRAL at 0.5), so a neutral/insufficient-data ticker reads HOLD.
         overall_gauge = (daily_gauge + weekly_gauge) / 2.0
-
-        response = TechnicalAnalysisResponse(
+        return TechnicalAnalysisResponse(
             symbol=ticker,
             daily_signal=daily_result,
             weekly_signal=weekly_result,
@@ -239,9 +396,6 @@ class TechnicalAnalysisService:
             gauge_value=round(overall_gauge, 4),
         )
 
-        _cache_set(f"ta:{ticker}", response)
-        return response
-
     async def get_analysis_detail(
         self, ticker: str
     ) -> TechnicalAnalysisDetailResponse:
@@ -256,10 +410,16 @@ class TechnicalAnalysisService:
         is_crypto = detect_asset_class(ticker) == "crypto"
 
         ttl = _CACHE_TTL_CRYPTO if is_crypto else _CACHE_TTL
-        cached = _cache_get(f"ta_detail:{ticker}", ttl)
-        if cached is not None:
-            return cached
+        return await _cache.get_or_build(
+            f"ta_detail:{ticker}",
+            lambda: self._build_analysis_detail(ticker, is_crypto),
+            ttl,
+            codec=_DETAIL_CODEC,
+        )
 
+    async def _build_analysis_detail(
+        self, ticker: str, is_crypto: bool
+    ) -> TechnicalAnalysisDetailResponse:
         df_daily = await self._fetch_daily_ohlcv(ticker)
         df_weekly = self._daily_to_weekly(df_daily, is_crypto=is_crypto)
 
@@ -284,10 +444,114 @@ class TechnicalAnalysisService:
             fibonacci_retracement=self._compute_fibonacci(df_daily),
             support_resistance=self._compute_support_resistance(df_daily),
         )
-
-        _cache_set(f"ta_detail:{ticker}", response)
         return response
 
+    # ── Universe sweep ─────────────────────────────────────────
+
+    async def precompute_universe(
+        self, tickers: Iterable[str], *, concurrency: int = _PRECOMPUTE_CONCURRENCY
+    ) -> int:
+        """Refresh every ticker's gauge and publish each response.
+
+        The background sweep behind the ticker-detail Analysis tab. A ticker with a
+        stored indicator state is advanced over the bars since it — a short fetch and
+        an O(1) update, which is what lets this run intraday. The rest fetch their full
+        history with bounded concurrency (from the local price store when it is on),
+        are scored in one panel pass off the event loop, and seed their states in the
+        same thread. Every response lands under the ``ta:{ticker}`` key
+        ``get_analysis`` reads — L1 and the shared L2 — so a viewer of a watchlist
+        ticker never waits on a fetch or an indicator pass. A ticker whose history
+        cannot be fetched is skipped; its next view builds on demand as before.
+        Returns the number published.
+        """
+        symbols = list(dict.fromkeys(t.upper() for t in tickers if t))
+        sem = asyncio.Semaphore(max(1, concurrency))
+        results: Dict[str, TechnicalAnalysisResponse] = {}
+
+        async def _refresh(ticker: str) -> Optional[DailyBars]:
+            """Advance a warm ticker in place; a cold one returns its full history."""
+            async with sem:
+                try:
+                    response = await self._advance_analysis(ticker, _is_crypto(ticker))
+                    if response is not None:
+                        results[ticker] = response
+                        return None
+                    return await self._fetch_daily_bars(ticker)
+                except Exception as e:
+                    logger.debug("TA precompute: no history for %s (%s)", ticker, e)
+                    return None
+
+        loaded = await asyncio.gather(*(_refresh(t) for t in symbols))
+        cold = [b for b in loaded if b is not None and len(b)]
+        if cold:
+            batch, states = await asyncio.to_thread(self._cold_pass, cold)
+            results.update(batch)
+            for ticker, seeded in states.items():
+                await self._publish_states(ticker, seeded)
+        for ticker, response in results.items():
+            ttl = _CACHE_TTL_CRYPTO if _is_crypto(ticker) else _CACHE_TTL
+            await _cache.publish(f"ta:{ticker}", response, ttl, codec=_ANALYSIS_CODEC)
+        return len(results)
+
+    def _cold_pass(
+        self, bars: Sequence[DailyBars]
+    ) -> Tuple[Dict[str, TechnicalAnalysisResponse], Dict[str, Dict[str, SeriesState]]]:
+        """Panel-score full histories and seed their states — the sweep's first pass."""
+        states = {
+            b.symbol.upper(): self._seed_analysis(b, _is_crypto(b.symbol))[1] for b in bars
+        }
+        return self.compute_analysis_batch(bars), states
+
+    def compute_analysis_batch(
+        self, bars: Sequence[DailyBars]
+    ) -> Dict[str, TechnicalAnalysisResponse]:
+        """``_build_analysis`` for many tickers at once, on NumPy panels.
+
+        Tickers are bucketed by bar count (daily and weekly separately) and each
+        bucket runs through :func:`panel_indicators` as one matrix; the per-ticker
+        work left is the weekly resample and the same signal builder the ``ta`` path
+        uses. CPU-bound — call it off the event loop.
+        """
+        daily: List[Tuple[str, np.ndarray, np.ndarray, np.ndarray]] = []
+        weekly: List[Tuple[str, np.ndarray, np.ndarray, np.ndarray]] = []
+        for b in bars:
+            if not len(b):
+                continue
+            symbol = b.symbol.upper()
+            daily.append((
+                symbol,
+                np.asarray(b.high, dtype=np.float64),
+                np.asarray(b.low, dtype=np.float64),
+                np.asarray(b.close, dtype=np.float64),
+            ))
+            _, _, high, low, close, _ = weekly_bars(
+                b.dates, b.open, b.high, b.low, b.close, b.volume,
+                is_crypto=_is_crypto(symbol),
+            )
+            weekly.append((symbol, high, low, close))
+
+        return {
+            symbol: self._analysis_response(symbol, daily_signal, weekly_signal)
+            for (symbol, *_), daily_signal, weekly_signal in zip(
+                daily, self._panel_signals(daily), self._panel_signals(weekly)
+            )
+        }
+
+    def _panel_signals(
+        self, rows: List[Tuple[str, np.ndarray, np.ndarray, np.ndarray]]
+    ) -> List[Tuple[TechnicalIndicatorResult, float]]:
+        """``(result, gauge)`` per ``(symbol, high, low, close)`` row, in input order."""
+        signals: List[Optional[Tuple[TechnicalIndicatorResult, float]]] = [None] * len(rows)
+        for _, positions in group_by_length(len(r[3]) for r in rows).items():
+            panel = panel_indicators(
+                np.stack([rows[i][1] for i in positions]),
+                np.stack([rows[i][2] for i in positions]),
+                np.stack([rows[i][3] for i in positions]),
+            )
+            for j, i in enumerate(positions):
+                signals[i] = self._signal(rows[i][3][-1], {k: col[j] for k, col in panel.items()})
+        return signals  # type: ignore[return-value]
+
     # ── Data Fetching ──────────────────────────────────────────
 
     async def _fetch_daily_ohlcv(self, ticker: str) -> pd.DataFrame:
@@ -307,10 +571,51 @@ class TechnicalAnalysisService:
             _cache_set(ohlcv_key, df)
         return df
 
-    async def _fetch_daily_ohlcv_uncached(self, ticker: str) -> pd.DataFrame:
-        """Fetch ~600 calendar days of daily OHLCV and return as DataFrame."""
-        to_date = datetime.utcnow().strftime("%Y-%m-%d")
-        from_date = (datetime.utcnow() - timedelta(days=600)).strftime("%Y-%m-%d")
+    async def _fetch_daily_bars(
+        self, ticker: str, from_date: Optional[str] = None
+    ) -> DailyBars:
+        """Daily history as columns — the ~600-day window, or from ``from_date`` on.
+
+        Read straight from the price store when it is on. Otherwise it goes through
+        the uncached DataFrame path — deliberately not ``_fetch_daily_ohlcv``, whose
+        1h frame cache would fill this region with 500 sweep-only histories.
+        """
+        store = get_price_history_store()
+        if store is not None:
+            window_start, to_date = _history_window()
+            return await store.daily(self.fmp, ticker, from_date or window_start, to_date)
+        df = await self._fetch_daily_ohlcv_uncached(ticker, from_date=from_date)
+        return _bars_from_frame(ticker, df)
+
+    async def _fetch_daily_ohlcv_uncached(
+        self, ticker: str, from_date: Optional[str] = None
+    ) -> pd.DataFrame:
+        """Fetch ~600 calendar days (or ``from_date`` on) of daily OHLCV as a DataFrame."""
+        window_start, to_date = _history_window()
+        from_date = from_date or window_start
+
+        store = get_price_history_store()
+        if store is not None:
+            # Straight from the store's columns — no JSON, no per-row dicts. Its rows are
+            # already deduplicated, oldest-first and close-validated.
+            bars = await store.daily(self.fmp, ticker, from_date, to_date)
+            if not len(bars):
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"No historical price data available for {ticker}",
+                )
+            # copy=True: the columns are read-only maps, and the indicator pass writes.
+            return pd.DataFrame(
+                {
+                    "open": bars.open,
+                    "high": bars.high,
+                    "low": bars.low,
+                    "close": bars.close,
+                    "volume": bars.volume,
+                },
+                index=pd.DatetimeIndex(bars.dates.astype("datetime64[ns]"), name="date"),
+                copy=True,
+            )
 
         raw = await self.fmp.get_historical_prices(ticker, from_date, to_date)
 
@@ -388,34 +693,33 @@ class TechnicalAnalysisService:
         List[OscillatorIndicator],
     ]:
         """Compute all 18 indicators, classify signals, return result + lists."""
+        return self._timeframe_signal(
+            float(df["close"].iloc[-1]), self._indicator_values(df)
+        )
+
+    @staticmethod
+    def _indicator_values(df: pd.DataFrame) -> Dict[str, Optional[float]]:
+        """The latest value of every gauge indicator, through the ``ta`` library.
+
+        Keys match :func:`app.services.technical_indicators.panel_indicators`, which
+        computes the same values for a whole panel of tickers at once; None where the
+        history is too short or the value is not finite.
+        """
         close = df["close"]
         high = df["high"]
         low = df["low"]
-        volume = df["volume"]
-        current_price = float(close.iloc[-1])
+        values: Dict[str, Optional[float]] = {}
 
         # ── Moving Averages (10) ─────────────────────────────
-        ma_configs: List[Tuple[str, Optional[float]]] = []
-        for window in [10, 20, 50, 100, 200]:
-            sma_val = _safe_float(
+        for window in MA_WINDOWS:
+            values[f"SMA({window})"] = _safe_float(
                 ta_lib.trend.SMAIndicator(close, window=window).sma_indicator().iloc[-1]
             ) if len(df) >= window else None
-            ma_configs.append((f"SMA({window})", sma_val))
 
-        for window in [10, 20, 50, 100, 200]:
-            ema_val = _safe_float(
+        for window in MA_WINDOWS:
+            values[f"EMA({window})"] = _safe_float(
                 ta_lib.trend.EMAIndicator(close, window=window).ema_indicator().iloc[-1]
             ) if len(df) >= window else None
-            ma_configs.append((f"EMA({window})", ema_val))
-
-        ma_list: List[MovingAverageIndicator] = []
-        for name, value in ma_configs:
-            signal = self._classify_ma_signal(current_price, value)
-            ma_list.append(
-                MovingAverageIndicator(
-                    name=name, value=_safe_round(value), signal=signal
-                )
-            )
 
         # ── Oscillators (8) ──────────────────────────────────
         # RSI
@@ -478,6 +782,53 @@ class TechnicalAnalysisService:
             .iloc[-1]
         ) if len(df) >= 14 else None
 
+        values.update(
+            rsi=rsi_val,
+            stoch_k=stoch_k,
+            stochrsi_k=stochrsi_k,
+            macd=macd_line,
+            macd_signal=macd_signal_val,
+            adx=adx_val,
+            plus_di=plus_di,
+            minus_di=minus_di,
+            willr=willr_val,
+            cci=cci_val,
+            atr=atr_val,
+        )
+        return values
+
+    def _timeframe_signal(
+        self, current_price: float, values: Dict[str, Optional[float]]
+    ) -> Tuple[
+        TechnicalIndicatorResult,
+        float,
+        List[MovingAverageIndicator],
+        List[OscillatorIndicator],
+    ]:
+        """Classify one timeframe's indicator values into signals and the gauge.
+
+        Shared by the per-ticker ``ta`` path and the panel sweep, so both score a
+        ticker identically once the values agree.
+        """
+        rsi_val = values["rsi"]
+        stoch_k = values["stoch_k"]
+        stochrsi_k = values["stochrsi_k"]
+        macd_line, macd_signal_val = values["macd"], values["macd_signal"]
+        adx_val, plus_di, minus_di = values["adx"], values["plus_di"], values["minus_di"]
+        willr_val = values["willr"]
+        cci_val = values["cci"]
+        atr_val = values["atr"]
+
+        ma_list: List[MovingAverageIndicator] = []
+        for name in [f"SMA({w})" for w in MA_WINDOWS] + [f"EMA({w})" for w in MA_WINDOWS]:
+            value = values[name]
+            signal = self._classify_ma_signal(current_price, value)
+            ma_list.append(
+                MovingAverageIndicator(
+                    name=name, value=_safe_round(value), signal=signal
+                )
+            )
+
         osc_list: List[OscillatorIndicator] = [
             OscillatorIndicator(
                 name="RSI(14)",
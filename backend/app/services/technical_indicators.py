@@ -0,0 +1,283 @@
+"""
+Technical-analysis indicators as NumPy panel kernels — many tickers in one pass.
+
+``TechnicalAnalysisService._compute_timeframe_signal`` computes the 18 gauge
+indicators for ONE ticker through the ``ta`` library: a pandas Series per
+indicator, a fresh rolling/ewm object per call, and ADX/ATR as Python loops over
+every bar. That is the right shape for a single on-demand request and the wrong
+one for the background sweep that scores the whole watchlist universe.
+
+Here the same indicators run over a PANEL: a ``(tickers × bars)`` matrix per
+OHLC column, one row per ticker. Rolling windows are slices of the last columns;
+the recursive ones (EMA, Wilder smoothing, the ``ta`` ADX/ATR recurrences) loop
+over BARS once with every ticker — and every EMA span — advanced together, so a
+500-ticker panel costs a few hundred vector steps instead of 500 × 18 pandas
+pipelines.
+
+Definitions follow the ``ta`` library exactly, quirks included (its StochRSI is a
+0–1 ratio, its ADX seeds and indexes the way ``ta.trend.ADXIndicator`` does, its
+ATR seeds with a plain mean), and the minimum-history gates are the service's. A
+panel must not be ragged: :func:`group_by_length` buckets tickers by bar count so
+every row of a panel is one ticker's full history with no padding. Parity with
+the ``ta`` path is pinned in tests/test_technical_indicators.py.
+
+PURE — NumPy only, no pandas, no service imports.
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+MA_WINDOWS: Tuple[int, ...] = (10, 20, 50, 100, 200)
+_RSI_WINDOW = 14
+_MACD_FAST, _MACD_SLOW, _MACD_SIGN = 12, 26, 9
+_ADX_WINDOW = 14
+
+_EPOCH_WEEKDAY = 3  # 1970-01-01 was a Thursday (Monday = 0)
+
+
+def group_by_length(lengths: Iterable[int]) -> Dict[int, List[int]]:
+    """Positions of the inputs, bucketed by bar count — one panel per bucket."""
+    groups: Dict[int, List[int]] = {}
+    for i, n in enumerate(lengths):
+        groups.setdefault(int(n), []).append(i)
+    return groups
+
+
+def _shift(x: np.ndarray) -> np.ndarray:
+    """``Series.shift(1)`` along the bar axis."""
+    out = np.empty_like(x)
+    out[..., 0] = np.nan
+    out[..., 1:] = x[..., :-1]
+    return out
+
+
+def _span_alpha(span: int) -> float:
+    # pandas derives alpha through the centre of mass; doing the same keeps the
+    # recursion bit-for-bit on the ``ta`` path's EMAs.
+    return 1.0 / (1.0 + (span - 1) / 2.0)
+
+
+def _alpha(alpha: float) -> float:
+    return 1.0 / (1.0 + (1.0 / alpha - 1.0))
+
+
+def _ewm(x: np.ndarray, alphas: np.ndarray, min_periods: np.ndarray) -> np.ndarray:
+    """``Series.ewm(alpha=a, adjust=False, min_periods=m).mean()`` for a stack of panels.
+
+    ``x`` is ``(k, tickers, bars)``; row ``k`` uses ``alphas[k]`` / ``min_periods[k]``.
+    Leading NaNs (a MACD line before its slow EMA exists) delay the start exactly as
+    in pandas. Interior gaps are carried forward — the inputs here never have any.
+    """
+    k, n, t = x.shape
+    a = alphas.reshape(k, 1)
+    keep = 1.0 - a
+    denom = keep + a  # pandas divides by (old_wt + new_wt), which is not always 1.0
+    need = min_periods.reshape(k, 1)
+    out = np.empty_like(x)
+    state = np.full((k, n), np.nan)
+    seen = np.zeros((k, n), dtype=np.int64)
+    with np.errstate(invalid="ignore"):
+        for j in range(t):
+            v = x[:, :, j]
+            obs = ~np.isnan(v)
+            seen += obs
+            moved = np.where(state != v, (keep * state + a * v) / denom, state)
+            state = np.where(obs, np.where(np.isnan(state), v, moved), state)
+            out[:, :, j] = np.where(seen >= need, state, np.nan)
+    return out
+
+
+def _first_valid_sum(x: np.ndarray, count: int) -> np.ndarray:
+    """Per row: ``x.dropna().iloc[:count].sum()``."""
+    valid = ~np.isnan(x)
+    take = valid & (np.cumsum(valid, axis=-1) <= count)
+    return np.where(take, x, 0.0).sum(axis=-1)
+
+
+def _adx(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, w: int = _ADX_WINDOW,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Latest ``(adx, +DI, -DI)`` per row, as ``ta.trend.ADXIndicator`` computes them.
+
+    Including its indexing: the smoothed series start from the sum of the first
+    ``w`` valid values, the recursion never fills the final slot (so the ADX's last
+    DX term reads one bar back), and +DI / -DI at the last bar come from the
+    second-to-last smoothed value.
+    """
+    n, t = close.shape
+    prev_close = _shift(close)
+    with np.errstate(invalid="ignore"):
+        dm = np.maximum(high, prev_close) - np.minimum(low, prev_close)
+        up = high - _shift(high)
+        down = _shift(low) - low
+        pos = np.abs(((up > down) & (up > 0)) * up)
+        neg = np.abs(((down > up) & (down > 0)) * down)
+
+    raw = np.stack([dm, pos, neg])
+    m = t - (w - 1)
+    smooth = np.zeros((3, n, m))
+    smooth[:, :, 0] = _first_valid_sum(raw, w)
+    for i in range(1, m - 1):
+        prev = smooth[:, :, i - 1]
+        smooth[:, :, i] = prev - (prev / float(w)) + raw[:, :, w + i]
+    trs, dip_s, din_s = smooth
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        dip = np.where(trs != 0, 100 * (dip_s / trs), 0.0)
+        din = np.where(trs != 0, 100 * (din_s / trs), 0.0)
+        total = dip + din
+        dx = np.where(total != 0, 100 * np.abs((dip - din) / total), 0.0)
+
+    adx = dx[:, 0:w].mean(axis=1)
+    for i in range(w + 1, m):
+        adx = ((adx * (w - 1)) + dx[:, i - 1]) / float(w)
+
+    i = m - 2
+    if i < 1:
+        zero = np.zeros(n)
+        return adx, zero, zero
+    last_tr = trs[:, i]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        plus = np.where(last_tr != 0, 100 * (dip_s[:, i] / last_tr), 0.0)
+        minus = np.where(last_tr != 0, 100 * (din_s[:, i] / last_tr), 0.0)
+    return adx, plus, minus
+
+
+def _atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, w: int = 14) -> np.ndarray:
+    """Latest ``ta.volatility.AverageTrueRange`` per row (plain-mean seed, Wilder after)."""
+    prev_close = _shift(close)
+    # DataFrame.max(axis=1) skips NaN — so does fmax.
+    tr = np.fmax(np.fmax(high - low, np.abs(high - prev_close)), np.abs(low - prev_close))
+    seed = tr[:, 0:w]
+    valid = ~np.isnan(seed)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Series.mean skips NaN; all-NaN → NaN.
+        atr = np.where(valid, seed, 0.0).sum(axis=1) / valid.sum(axis=1)
+    for i in range(w, tr.shape[1]):
+        atr = (atr * (w - 1) + tr[:, i]) / float(w)
+    return atr
+
+
+def _rsi_series(up_dn: np.ndarray) -> np.ndarray:
+    emaup, emadn = up_dn
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(emadn == 0, 100.0, 100 - (100 / (1 + emaup / emadn)))
+
+
+def panel_indicators(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """The latest value of every gauge indicator, one entry per row.
+
+    Keys match ``TechnicalAnalysisService._indicator_values``. An indicator whose
+    history gate is not met (the panel has too few bars) is all-NaN — the service
+    turns NaN into None, exactly as it does for the ``ta`` path.
+    """
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
+    n, t = close.shape
+    nan = np.full(n, np.nan)
+    out: Dict[str, np.ndarray] = {}
+
+    for w in MA_WINDOWS:
+        out[f"SMA({w})"] = close[:, -w:].mean(axis=1) if t >= w else nan
+
+    # One pass over the bars for every close EMA plus RSI's two Wilder averages.
+    diff = close - _shift(close)
+    with np.errstate(invalid="ignore"):
+        up = np.where(diff > 0, diff, 0.0)
+        down = -np.where(diff < 0, diff, 0.0)
+    spans = MA_WINDOWS + (_MACD_FAST, _MACD_SLOW)
+    stack = np.concatenate([np.broadcast_to(close, (len(spans), n, t)), np.stack([up, down])])
+    alphas = np.array([_span_alpha(s) for s in spans] + [_alpha(1 / _RSI_WINDOW)] * 2)
+    periods = np.array(list(spans) + [_RSI_WINDOW] * 2)
+    ewm = _ewm(stack, alphas, periods)
+    for k, w in enumerate(MA_WINDOWS):
+        out[f"EMA({w})"] = ewm[k, :, -1] if t >= w else nan
+
+    rsi = _rsi_series(ewm[len(spans):])
+    out["rsi"] = rsi[:, -1] if t >= _RSI_WINDOW + 1 else nan
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if t >= 14:
+            lo, hi = low[:, -14:].min(axis=1), high[:, -14:].max(axis=1)
+            out["stoch_k"] = 100 * (close[:, -1] - lo) / (hi - lo)
+            out["willr"] = -100 * (hi - close[:, -1]) / (hi - lo)
+            tp = ((high + low + close) / 3.0)[:, -14:]
+            mean = tp.mean(axis=1)
+            mad = np.abs(tp - tp.mean(axis=1, keepdims=True)).mean(axis=1)
+            out["cci"] = (tp[:, -1] - mean) / (0.015 * mad)
+            out["atr"] = _atr(high, low, close)
+        else:
+            out["stoch_k"] = out["willr"] = out["cci"] = out["atr"] = nan
+
+        if t >= 2 * _RSI_WINDOW:
+            # The last three StochRSI points, each over a 14-bar RSI window.
+            windows = np.lib.stride_tricks.sliding_window_view(
+                rsi[:, -(_RSI_WINDOW + 2):], _RSI_WINDOW, axis=1,
+            )
+            lo, hi = windows.min(axis=2), windows.max(axis=2)
+            stochrsi = (windows[:, :, -1] - lo) / (hi - lo)
+            out["stochrsi_k"] = stochrsi.mean(axis=1)
+        else:
+            out["stochrsi_k"] = nan
+
+    if t >= 35:
+        fast = ewm[spans.index(_MACD_FAST)]
+        slow = ewm[spans.index(_MACD_SLOW)]
+        macd = fast - slow
+        signal = _ewm(
+            macd[None], np.array([_span_alpha(_MACD_SIGN)]), np.array([_MACD_SIGN]),
+        )[0]
+        out["macd"], out["macd_signal"] = macd[:, -1], signal[:, -1]
+    else:
+        out["macd"] = out["macd_signal"] = nan
+
+    if t >= 2 * _ADX_WINDOW:
+        out["adx"], out["plus_di"], out["minus_di"] = _adx(high, low, close)
+    else:
+        out["adx"] = out["plus_di"] = out["minus_di"] = nan
+    return out
+
+
+def weekly_bars(
+    dates: np.ndarray,
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray,
+    *,
+    is_crypto: bool = False,
+) -> Tuple[np.ndarray, ...]:
+    """``TechnicalAnalysisService._daily_to_weekly`` on arrays.
+
+    Same buckets (weeks ending Friday, or Sunday for crypto) and the same
+    aggregation as the pandas resample — first valid open, max high, min low,
+    last close, summed volume — over one ticker's chronological daily bars.
+    Returns ``(week_end_dates, open, high, low, close, volume)``.
+    """
+    days = np.asarray(dates, dtype="datetime64[D]").astype(np.int64)
+    if not days.size:
+        empty = np.empty(0)
+        return (np.empty(0, dtype="datetime64[D]"),) + (empty,) * 5
+    weekday = (days + _EPOCH_WEEKDAY) % 7
+    week_end = days + (((6 if is_crypto else 4) - weekday) % 7)
+    starts = np.flatnonzero(np.r_[True, week_end[1:] != week_end[:-1]])
+    ends = np.r_[starts[1:], days.size] - 1
+
+    open_ = np.asarray(open_, dtype=np.float64)
+    first_ok = np.where(~np.isnan(open_), np.arange(days.size), days.size)
+    first = np.minimum.reduceat(first_ok, starts)
+    w_open = np.where(first < days.size, open_[np.minimum(first, days.size - 1)], np.nan)
+    with np.errstate(invalid="ignore"):
+        w_high = np.fmax.reduceat(np.asarray(high, dtype=np.float64), starts)
+        w_low = np.fmin.reduceat(np.asarray(low, dtype=np.float64), starts)
+    w_close = np.asarray(close, dtype=np.float64)[ends]
+    w_volume = np.add.reduceat(np.nan_to_num(np.asarray(volume, dtype=np.float64)), starts)
+    return (
+        week_end[starts].astype("datetime64[D]"), w_open, w_high, w_low, w_close, w_volume,
+    )
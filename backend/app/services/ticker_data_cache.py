@@ -23,19 +23,43 @@ FAIL-SAFE: serialization, deserialization, and DB calls NEVER raise. They log an
 degrade to a cache MISS (a fresh collect), so a serialization imperfection can
 only slow a request, never corrupt a report. Reconstruction is additionally
 post-validated (profile + computed present) before it's trusted.
+
+Binary rows (TICKER_DATA_CACHE_BINARY, migration 157): the JSONB round-trip
+re-validated every Pydantic model in the collection on every read — and
+`collect()` then deep-copied all of them — although the per-persona layer only
+reads a handful. A binary row stores each field as its own msgpack (JSON where
+msgpack is absent) record inside one zstd/zlib frame, and a read returns a
+`CollectedTickerData` subclass that decodes a field on first access. What is
+never read is never decoded, and a deep copy of an undecoded field is a copy
+of its bytes.
 """
 
 from __future__ import annotations
 
 import asyncio
+import base64
 import dataclasses
+import functools
+import hashlib
 import json
 import logging
 import time
+import zlib
 from datetime import date, datetime, timedelta, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import msgpack as _msgpack
+except ImportError:  # pragma: no cover - exercised only where msgpack is not installed
+    _msgpack = None
+try:
+    import zstandard as _zstd
+except ImportError:  # pragma: no cover - exercised only where zstandard is not installed
+    _zstd = None
+
+from app.config import settings
 
-from app.database import get_supabase
+from app.database import get_async_supabase, get_supabase
 # Shared close-aligned freshness (schema floor + trading-close cycle) so this
 # collection cache refreshes on the SAME boundary as ticker_report_cache —
 # critical, else a post-close report regen would reuse stale historical here.
@@ -49,6 +73,7 @@ from app.schemas.signal_of_confidence import SignalOfConfidenceResponse
 from app.schemas.earnings import EarningsResponse
 from app.schemas.stock_overview import SnapshotItemResponse
 from app.schemas.growth import GrowthResponse
+from app.schemas.profit_power import ProfitPowerResponse
 from app.services.sector_aggregates_service import SectorAggregates
 from app.services.industry_tam_service import IndustryTAM
 
@@ -70,6 +95,7 @@ _PYDANTIC_FIELDS: Dict[str, Any] = {
     "snap_growth": SnapshotItemResponse,
     "snap_valuation": SnapshotItemResponse,
     "growth_chart": GrowthResponse,
+    "profit_power": ProfitPowerResponse,
 }
 
 # Flat dataclass fields → (class, [datetime field names needing ISO round-trip]).
@@ -150,6 +176,24 @@ def _serialize(out: Any) -> Optional[Dict[str, Any]]:
         return None
 
 
+def _rebuild_field(name: str, val: Any) -> Any:
+    """One field's JSON-clean value → the object CollectedTickerData holds."""
+    if val is None:
+        return None
+    if name in _PYDANTIC_FIELDS:
+        return _PYDANTIC_FIELDS[name].model_validate(val)
+    if name in _DATACLASS_FIELDS:
+        cls, dt_fields = _DATACLASS_FIELDS[name]
+        d = dict(val)
+        for k in dt_fields:
+            if isinstance(d.get(k), str):
+                d[k] = datetime.fromisoformat(d[k])
+        return cls(**d)
+    if name == "computed":
+        return _deserialize_computed(val)
+    return val
+
+
 def _deserialize(data: Dict[str, Any], field_names: set) -> Optional[Any]:
     """JSON dict → CollectedTickerData, or None on any failure / incomplete
     reconstruction (→ treated as a cache miss). `field_names` is the live set of
@@ -163,21 +207,7 @@ def _deserialize(data: Dict[str, Any], field_names: set) -> Optional[Any]:
         for name, val in data.items():
             if name not in field_names:
                 continue  # field no longer on the dataclass → skip (fail-safe)
-            if val is None:
-                kwargs[name] = None
-            elif name in _PYDANTIC_FIELDS:
-                kwargs[name] = _PYDANTIC_FIELDS[name].model_validate(val)
-            elif name in _DATACLASS_FIELDS:
-                cls, dt_fields = _DATACLASS_FIELDS[name]
-                d = dict(val)
-                for k in dt_fields:
-                    if isinstance(d.get(k), str):
-                        d[k] = datetime.fromisoformat(d[k])
-                kwargs[name] = cls(**d)
-            elif name == "computed":
-                kwargs[name] = _deserialize_computed(val)
-            else:
-                kwargs[name] = val
+            kwargs[name] = _rebuild_field(name, val)
 
         out = CollectedTickerData(**kwargs)
         # Trust only a structurally-complete reconstruction.
@@ -195,6 +225,198 @@ def _deserialize(data: Dict[str, Any], field_names: set) -> Optional[Any]:
         return None
 
 
+# ── Binary row format (fail-safe, lazily decoded) ───────────────────
+# Base64 of: b"TDC" + version byte + compression byte (b"z" zstd / b"l" zlib) +
+# the compressed body. The body is a 4-byte big-endian header length, a JSON
+# header {"schema": fingerprint, "fields": {name: [offset, length, encoding]}},
+# then every field's record back to back. Encoding is per field — b"m" msgpack,
+# b"j" JSON — so a value msgpack cannot carry (an int past 64 bits) falls back
+# alone. Values are exactly what `_serialize` produces for the JSONB column.
+BLOB_COLUMN = "collected_blob"
+_MAGIC = b"TDC"
+_FORMAT_VERSION = 1
+_ZSTD_LEVEL = 6
+_ZLIB_LEVEL = 6
+# Decoded while the row is opened: the completeness check needs profile +
+# computed, `collect()` reads meta, and all five are small.
+_EAGER_FIELDS = ("ticker", "persona_key", "profile", "computed", "meta")
+
+
+@functools.lru_cache(maxsize=1)
+def _schema_fingerprint() -> str:
+    """Short hash of the shape a binary row was written against: the dataclass's
+    fields and the top-level fields of every model / dataclass it rebuilds.
+
+    A row from a different shape reads as a miss, like a pre-floor row. Only the
+    top level is covered — a nested model change still needs the schema floor —
+    but that is where fields get added.
+    """
+    from app.services.agents.ticker_report_data_collector import CollectedTickerData
+
+    parts = [",".join(f.name for f in dataclasses.fields(CollectedTickerData))]
+    for name, cls in sorted(_PYDANTIC_FIELDS.items()):
+        parts.append(f"{name}:{cls.__name__}:{','.join(sorted(cls.model_fields))}")
+    for name, (cls, _) in sorted(_DATACLASS_FIELDS.items()):
+        parts.append(
+            f"{name}:{cls.__name__}:{','.join(f.name for f in dataclasses.fields(cls))}"
+        )
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+def _pack_value(val: Any) -> Tuple[str, bytes]:
+    if _msgpack is not None:
+        try:
+            return "m", _msgpack.packb(val, use_bin_type=True)
+        except (TypeError, ValueError, OverflowError):
+            pass
+    return "j", json.dumps(val, separators=(",", ":")).encode("utf-8")
+
+
+def _unpack_value(encoding: str, raw: bytes) -> Any:
+    if encoding == "m":
+        return _msgpack.unpackb(raw, raw=False, strict_map_key=False)
+    return json.loads(raw)
+
+
+def encode_collection(payload: Dict[str, Any]) -> Optional[str]:
+    """`_serialize` output → the `collected_blob` text form, or None on failure."""
+    try:
+        fields: Dict[str, list] = {}
+        records = []
+        offset = 0
+        for name, val in payload.items():
+            encoding, raw = _pack_value(val)
+            fields[name] = [offset, len(raw), encoding]
+            records.append(raw)
+            offset += len(raw)
+        header = json.dumps(
+            {"schema": _schema_fingerprint(), "fields": fields}, separators=(",", ":")
+        ).encode("utf-8")
+        body = len(header).to_bytes(4, "big") + header + b"".join(records)
+        if _zstd is not None:
+            codec = b"z"
+            packed = _zstd.ZstdCompressor(level=_ZSTD_LEVEL, write_checksum=True).compress(body)
+        else:
+            codec, packed = b"l", zlib.compress(body, _ZLIB_LEVEL)
+        frame = _MAGIC + bytes([_FORMAT_VERSION]) + codec + packed
+        return base64.b64encode(frame).decode("ascii")
+    except Exception as e:
+        logger.warning(
+            "ticker_data_cache binary encode failed: %s: %s", type(e).__name__, e
+        )
+        return None
+
+
+class _LazyField:
+    """Non-data descriptor for one CollectedTickerData field on a binary read.
+
+    The first read decodes the field's record and stores the value in the
+    instance `__dict__`, which from then on shadows the descriptor — so every
+    later read is a plain attribute lookup, and an assignment simply wins.
+    """
+
+    __slots__ = ("name", "field")
+
+    def __init__(self, f: "dataclasses.Field") -> None:
+        self.name = f.name
+        self.field = f
+
+    def __get__(self, obj: Any, owner: Any = None) -> Any:
+        if obj is None:
+            return self
+        record = obj.__dict__.get("_records", {}).get(self.name)
+        value: Any = dataclasses.MISSING
+        if record is not None:
+            try:
+                value = _rebuild_field(self.name, _unpack_value(*record))
+            except Exception as e:
+                if self.name in _EAGER_FIELDS:
+                    raise
+                # Past the open, a bad field degrades to "not collected" (what an
+                # upstream outage leaves) rather than failing the report mid-assembly.
+                logger.warning(
+                    "ticker_data_cache lazy decode of %s failed: %s: %s",
+                    self.name, type(e).__name__, e,
+                )
+        if value is dataclasses.MISSING:
+            if self.field.default is not dataclasses.MISSING:
+                value = self.field.default
+            elif self.field.default_factory is not dataclasses.MISSING:
+                value = self.field.default_factory()
+            else:
+                raise AttributeError(self.name)
+        obj.__dict__[self.name] = value
+        return value
+
+
+@functools.lru_cache(maxsize=1)
+def _lazy_class() -> type:
+    """`CollectedTickerData` with every field behind a `_LazyField`. Built on first
+    use: the collector module imports this one, so it cannot be a top-level import."""
+    from app.services.agents.ticker_report_data_collector import CollectedTickerData
+
+    attrs: Dict[str, Any] = {
+        f.name: _LazyField(f) for f in dataclasses.fields(CollectedTickerData)
+    }
+    attrs["__doc__"] = "CollectedTickerData read from a binary row; fields decode on first access."
+    return type("LazyCollectedTickerData", (CollectedTickerData,), attrs)
+
+
+def _deserialize_binary(blob: str, field_names: set) -> Optional[Any]:
+    """`collected_blob` → a lazily-decoded CollectedTickerData, or None (a miss) on
+    a corrupt frame, another format version or schema, a codec this process
+    lacks, or an incomplete collection."""
+    try:
+        frame = base64.b64decode(blob)
+        if frame[:3] != _MAGIC or frame[3] != _FORMAT_VERSION:
+            logger.info("ticker_data_cache binary row has another format version — miss")
+            return None
+        codec, packed = frame[4:5], frame[5:]
+        if codec == b"z":
+            if _zstd is None:
+                logger.warning("ticker_data_cache zstd row but `zstandard` is not installed — miss")
+                return None
+            body = _zstd.ZstdDecompressor().decompress(packed)
+        elif codec == b"l":
+            body = zlib.decompress(packed)
+        else:
+            return None
+        size = int.from_bytes(body[:4], "big")
+        header = json.loads(body[4:4 + size])
+        if header.get("schema") != _schema_fingerprint():
+            logger.info("ticker_data_cache binary row has another schema — miss")
+            return None
+        fields = header["fields"]
+        if _msgpack is None and any(enc == "m" for _, _, enc in fields.values()):
+            logger.warning("ticker_data_cache msgpack row but `msgpack` is not installed — miss")
+            return None
+
+        start = 4 + size
+        view = memoryview(body)
+        records = {
+            name: (enc, bytes(view[start + off:start + off + length]))
+            for name, (off, length, enc) in fields.items()
+            if name in field_names
+        }
+        cls = _lazy_class()
+        out = cls.__new__(cls)
+        out.__dict__["_records"] = records
+        for name in _EAGER_FIELDS:
+            getattr(out, name)
+        if not out.profile or not out.computed:
+            logger.warning(
+                "ticker_data_cache binary row incomplete (missing profile/"
+                "computed) — treating as miss"
+            )
+            return None
+        return out
+    except Exception as e:
+        logger.warning(
+            "ticker_data_cache binary decode failed: %s: %s", type(e).__name__, e
+        )
+        return None
+
+
 # ── Supabase read / write (fail-safe) ───────────────────────────────
 
 
@@ -203,44 +425,55 @@ async def get_cached_collection(ticker: str) -> Optional[Any]:
     cache row is < 24h old and on/after the schema floor, else None."""
     ticker = ticker.upper().strip()
 
-    def _query() -> Optional[Dict[str, Any]]:
-        try:
-            supabase = get_supabase()
-            row = (
-                supabase.table(TABLE_NAME)
-                .select("collected_data, cached_at")
-                .eq("ticker", ticker)
-                .limit(1)
-                .execute()
-            )
-            if not row.data:
-                return None
-            entry = row.data[0]
-            cached_at_str = entry.get("cached_at")
-            if not cached_at_str:
-                return None
+    # The blob column exists only once migration 157 is applied, so it is named only
+    # when binary rows are switched on — selecting it earlier would make every read a miss.
+    columns = "collected_data, cached_at"
+    if settings.TICKER_DATA_CACHE_BINARY:
+        columns = f"collected_data, {BLOB_COLUMN}, cached_at"
+
+    # Async PostgREST read: a pooled socket per in-flight read instead of an executor
+    # thread (see database.get_async_supabase). The payload is large: the client parses
+    # a body that size in a worker thread, and the DESERIALIZE below goes off-loop too.
+    data: Optional[Dict[str, Any]] = None
+    blob: Optional[str] = None
+    try:
+        row = await (
+            get_async_supabase()
+            .table(TABLE_NAME)
+            .select(columns)
+            .eq("ticker", ticker)
+            .limit(1)
+            .execute()
+        )
+        entry = row.data[0] if row.data else None
+        cached_at_str = entry.get("cached_at") if entry else None
+        if cached_at_str:
             cached_at = datetime.fromisoformat(cached_at_str.replace("Z", "+00:00"))
             if not is_cache_fresh(cached_at):
                 logger.info("ticker_data_cache STALE/PRE-FLOOR for %s", ticker)
-                return None
-            data = entry.get("collected_data")
-            return data if isinstance(data, dict) else None
-        except Exception as e:
-            logger.warning(
-                "ticker_data_cache read failed for %s: %s: %s",
-                ticker, type(e).__name__, e,
-            )
-            return None
-
-    data = await asyncio.to_thread(_query)
-    if data is None:
+            elif isinstance(entry.get("collected_data"), dict):
+                # JSONB wins when present: a row rewritten with binary rows switched
+                # back off carries fresh JSONB next to the blob it wrote earlier.
+                data = entry["collected_data"]
+            elif isinstance(entry.get(BLOB_COLUMN), str):
+                blob = entry[BLOB_COLUMN]
+    except Exception as e:
+        logger.warning(
+            "ticker_data_cache read failed for %s: %s: %s",
+            ticker, type(e).__name__, e,
+        )
+    if data is None and blob is None:
         return None
 
     # Deserialize off the event loop too — it touches Pydantic validation which
-    # can be non-trivial for big payloads.
+    # can be non-trivial for big payloads. A binary row only decompresses here and
+    # decodes the few eager fields; the rest decode where they are first read.
     from app.services.agents.ticker_report_data_collector import CollectedTickerData
     field_names = {f.name for f in dataclasses.fields(CollectedTickerData)}
-    out = await asyncio.to_thread(_deserialize, data, field_names)
+    if blob is not None:
+        out = await asyncio.to_thread(_deserialize_binary, blob, field_names)
+    else:
+        out = await asyncio.to_thread(_deserialize, data, field_names)
     if out is not None:
         logger.info("ticker_data_cache HIT for %s", ticker)
     return out
@@ -253,15 +486,20 @@ async def store_collection(ticker: str, out: Any) -> None:
     payload = await asyncio.to_thread(_serialize, out)
     if payload is None:
         return
+    row: Dict[str, Any] = {"ticker": ticker}
+    if settings.TICKER_DATA_CACHE_BINARY:
+        blob = await asyncio.to_thread(encode_collection, payload)
+        if blob is None:
+            return
+        row["collected_data"] = None
+        row[BLOB_COLUMN] = blob
+    else:
+        row["collected_data"] = payload
 
     def _upsert() -> None:
         try:
             get_supabase().table(TABLE_NAME).upsert(
-                {
-                    "ticker": ticker,
-                    "collected_data": payload,
-                    "cached_at": datetime.now(timezone.utc).isoformat(),
-                },
+                {**row, "cached_at": datetime.now(timezone.utc).isoformat()},
                 on_conflict="ticker",
             ).execute()
             logger.info("ticker_data_cache UPSERTED for %s", ticker)
@@ -332,7 +570,6 @@ _WARM_SEMAPHORE: Optional["asyncio.Semaphore"] = None
 def _get_warm_semaphore() -> "asyncio.Semaphore":
     global _WARM_SEMAPHORE
     if _WARM_SEMAPHORE is None:
-        from app.config import settings
         _WARM_SEMAPHORE = asyncio.Semaphore(
             max(1, settings.REPORT_PREWARM_DETAIL_CONCURRENCY)
         )
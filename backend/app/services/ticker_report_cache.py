@@ -11,20 +11,42 @@ Cache key: (ticker, persona) — same TickerReportResponse JSONB, same
 shape Swift decodes. When the row is older than CACHE_TTL_HOURS, the
 read returns None and the caller regenerates.
 
-All Supabase calls run via asyncio.to_thread to avoid blocking the
-event loop. Read/write failures NEVER raise — they log and return
+The read goes through the async PostgREST client (database.get_async_supabase);
+writes still run the sync SDK via asyncio.to_thread. Neither blocks the event
+loop. Read/write failures NEVER raise — they log and return
 None / no-op so a transient DB blip cannot break a report request.
+
+Two layers sit on top of the table:
+  - A hot in-process tier (a `CacheRegion`, app/core/cache.py) of decoded
+    reports keyed by (ticker, persona, close cycle). AAPL/NVDA are opened
+    thousands of times a session; each of those used to be a round-trip plus a
+    multi-hundred-KB download and parse. Keying on the cycle start means a new
+    close moves every key at once — nothing has to invalidate the tier.
+  - An optional compressed row format (TICKER_REPORT_CACHE_COMPRESSED,
+    migration 156): the JSON payload zstd- (or zlib-) compressed into
+    `ticker_report_blob`, so a worker that misses in memory downloads a
+    fraction of the bytes.
 """
 
 from __future__ import annotations
 
 import asyncio
+import base64
+import json
 import logging
+import zlib
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional
 from zoneinfo import ZoneInfo
 
-from app.database import get_supabase
+try:
+    import zstandard as _zstd
+except ImportError:  # pragma: no cover - exercised only where zstandard is not installed
+    _zstd = None
+
+from app.config import settings
+from app.core.cache import record_unversioned, record_version, register_region
+from app.database import get_async_supabase, get_supabase
 
 logger = logging.getLogger(__name__)
 
@@ -335,69 +357,154 @@ def _normalize_key(ticker: str, persona: str) -> tuple[str, str]:
     return ticker.upper().strip(), persona.lower().strip()
 
 
+# ── Compressed row format ───────────────────────────────────────────
+# `ticker_report_blob` is "<codec>:<base64 of the compressed JSON>". The codec
+# tag is per row, so a replica without `zstandard` still writes (zlib) and
+# still reads every zlib row; only a zstd row it cannot open reads as a miss.
+# JSON rather than msgpack: it is what the JSONB column held, so a decoded blob
+# is byte-for-byte the dict a JSONB read returns, and compression claws back
+# most of what a binary encoding would have saved on the wire.
+BLOB_COLUMN = "ticker_report_blob"
+_ZSTD_LEVEL = 6
+_ZLIB_LEVEL = 6
+
+
+def encode_report(ticker_report_data: Dict[str, Any]) -> str:
+    """Compress a report payload into the `ticker_report_blob` text form."""
+    raw = json.dumps(ticker_report_data, separators=(",", ":")).encode("utf-8")
+    if _zstd is not None:
+        codec, packed = "zstd", _zstd.ZstdCompressor(level=_ZSTD_LEVEL).compress(raw)
+    else:
+        codec, packed = "zlib", zlib.compress(raw, _ZLIB_LEVEL)
+    return f"{codec}:{base64.b64encode(packed).decode('ascii')}"
+
+
+def decode_report(blob: str) -> Any:
+    """Inverse of `encode_report`. Raises on a corrupt blob or an unknown codec;
+    the caller's read path turns that into a miss."""
+    codec, _, body = blob.partition(":")
+    packed = base64.b64decode(body)
+    if codec == "zstd":
+        if _zstd is None:
+            raise ValueError("zstd blob but `zstandard` is not installed here")
+        raw = _zstd.ZstdDecompressor().decompress(packed)
+    elif codec == "zlib":
+        raw = zlib.decompress(packed)
+    else:
+        raise ValueError(f"unknown ticker_report_blob codec {codec!r}")
+    return json.loads(raw)
+
+
+# ── Hot in-process tier ─────────────────────────────────────────────
+# Sized by entry count AND by the shared CACHE_MEMORY_BUDGET_MB (the region's
+# byte accounting), since one report is a few hundred KB decoded. Values are
+# shared between readers: callers treat a returned report as read-only (the
+# endpoint validates it into a fresh model; chat grounding only reads it).
+_memory = register_region(
+    "ticker_report",
+    ttl=settings.TICKER_REPORT_MEMORY_TTL_SECONDS,
+    max_entries=max(1, settings.TICKER_REPORT_MEMORY_MAX_ENTRIES),
+)
+
+
+def _memory_key(ticker: str, persona: str, now: Optional[datetime] = None) -> str:
+    return f"{ticker}|{persona}|{current_close_cycle_start(now).isoformat()}"
+
+
+def _memory_enabled() -> bool:
+    return settings.TICKER_REPORT_MEMORY_MAX_ENTRIES > 0
+
+
 async def get_cached_report(
     ticker: str, persona: str
 ) -> Optional[Dict[str, Any]]:
     """Return the cached ticker_report_data JSONB if fresh (< 24h), else None.
 
+    The in-process tier answers first; a row read from the table is decoded
+    (JSONB or compressed blob), checked, and kept there for the rest of the
+    close cycle. The returned dict may be shared with other readers — do not
+    mutate it.
+
     On any DB error, logs the underlying type+message and returns None so the
     caller falls through to regeneration. The error is intentionally swallowed
     here because cache misses are recoverable; cache lookups must never break
     the request path.
     """
     ticker, persona = _normalize_key(ticker, persona)
+    key = _memory_key(ticker, persona)
+    if _memory_enabled():
+        hot = _memory.lookup(key)
+        if hot is not None:
+            return hot
+
+    # Only name the blob column once compression is switched on: before migration 156
+    # it does not exist, and selecting it would turn every read into an error → a miss.
+    columns = "ticker_report_data, cached_at"
+    if settings.TICKER_REPORT_CACHE_COMPRESSED:
+        columns = f"ticker_report_data, {BLOB_COLUMN}, cached_at"
+
+    # Unversioned until a fresh row is served: a miss, a stale row or a read error all
+    # end in a regeneration, which no version describes (see app.core.cache).
+    record_unversioned(TABLE_NAME, key)
+
+    # Async PostgREST, not `to_thread` around the sync SDK: this read sits in front of
+    # every report view, and under a burst each one used to hold an executor thread for
+    # its whole round-trip — the pool, not the database, set the concurrency ceiling.
+    try:
+        row = await (
+            get_async_supabase()
+            .table(TABLE_NAME)
+            .select(columns)
+            .eq("ticker", ticker)
+            .eq("persona", persona)
+            .limit(1)
+            .execute()
+        )
+        if not row.data:
+            return None
 
-    def _query() -> Optional[Dict[str, Any]]:
-        try:
-            supabase = get_supabase()
-            row = (
-                supabase.table(TABLE_NAME)
-                .select("ticker_report_data, cached_at")
-                .eq("ticker", ticker)
-                .eq("persona", persona)
-                .limit(1)
-                .execute()
-            )
-            if not row.data:
-                return None
-
-            entry = row.data[0]
-            cached_at_str = entry.get("cached_at")
-            if not cached_at_str:
-                return None
+        entry = row.data[0]
+        cached_at_str = entry.get("cached_at")
+        if not cached_at_str:
+            return None
 
-            cached_at = datetime.fromisoformat(
-                cached_at_str.replace("Z", "+00:00")
-            )
-            # Close-aligned freshness (not a rolling TTL): stale once a newer
-            # market close has settled, so the first post-close viewer regenerates.
-            if not is_cache_fresh(cached_at):
-                logger.info(
-                    f"ticker_report_cache STALE/PRE-FLOOR for {ticker}/{persona} "
-                    f"(cached_at={cached_at.isoformat()}, "
-                    f"cycle_start={current_close_cycle_start().isoformat()})"
-                )
-                return None
-
-            data = entry.get("ticker_report_data")
-            if not isinstance(data, dict):
-                return None
-            if _short_interest_payload_stale(data):
-                logger.info(
-                    f"ticker_report_cache SHORT-INTEREST-STALE for "
-                    f"{ticker}/{persona} (change_3m present, history empty) — "
-                    f"regenerating so the 12-month chart fills"
-                )
-                return None
-            return data
-        except Exception as e:
-            logger.warning(
-                f"ticker_report_cache read failed for {ticker}/{persona}: "
-                f"{type(e).__name__}: {e}"
+        cached_at = datetime.fromisoformat(
+            cached_at_str.replace("Z", "+00:00")
+        )
+        # Close-aligned freshness (not a rolling TTL): stale once a newer
+        # market close has settled, so the first post-close viewer regenerates.
+        if not is_cache_fresh(cached_at):
+            logger.info(
+                f"ticker_report_cache STALE/PRE-FLOOR for {ticker}/{persona} "
+                f"(cached_at={cached_at.isoformat()}, "
+                f"cycle_start={current_close_cycle_start().isoformat()})"
             )
             return None
 
-    return await asyncio.to_thread(_query)
+        # JSONB wins when present: a row rewritten with compression switched back
+        # off carries fresh JSONB next to the blob it wrote earlier.
+        data = entry.get("ticker_report_data")
+        if data is None and entry.get(BLOB_COLUMN):
+            data = decode_report(entry[BLOB_COLUMN])
+        if not isinstance(data, dict):
+            return None
+        if _short_interest_payload_stale(data):
+            logger.info(
+                f"ticker_report_cache SHORT-INTEREST-STALE for "
+                f"{ticker}/{persona} (change_3m present, history empty) — "
+                f"regenerating so the 12-month chart fills"
+            )
+            return None
+        record_version(TABLE_NAME, key, cached_at_str)
+        if _memory_enabled():
+            _memory.store(key, data)
+        return data
+    except Exception as e:
+        logger.warning(
+            f"ticker_report_cache read failed for {ticker}/{persona}: "
+            f"{type(e).__name__}: {e}"
+        )
+        return None
 
 
 async def upsert_cached_report(
@@ -407,19 +514,29 @@ async def upsert_cached_report(
 
     Fire-and-forget: failures are logged but never raised. Callers can
     `await` this for sequencing but it should never block the response.
+
+    A successful write also seeds this process's hot tier — with a decoded
+    copy of what was written, not the caller's dict, so a caller that keeps
+    editing its report cannot change what later readers are served.
     """
     ticker, persona = _normalize_key(ticker, persona)
+    key = _memory_key(ticker, persona)
 
     def _upsert() -> None:
         try:
+            row: Dict[str, Any] = {
+                "ticker": ticker,
+                "persona": persona,
+                "cached_at": datetime.now(timezone.utc).isoformat(),
+            }
+            if settings.TICKER_REPORT_CACHE_COMPRESSED:
+                row["ticker_report_data"] = None
+                row[BLOB_COLUMN] = encode_report(ticker_report_data)
+            else:
+                row["ticker_report_data"] = ticker_report_data
             supabase = get_supabase()
             supabase.table(TABLE_NAME).upsert(
-                {
-                    "ticker": ticker,
-                    "persona": persona,
-                    "ticker_report_data": ticker_report_data,
-                    "cached_at": datetime.now(timezone.utc).isoformat(),
-                },
+                row,
                 on_conflict="ticker,persona",
             ).execute()
             logger.info(
@@ -430,5 +547,13 @@ async def upsert_cached_report(
                 f"ticker_report_cache upsert failed for {ticker}/{persona}: "
                 f"{type(e).__name__}: {e}"
             )
+            return
+        if not _memory_enabled() or _short_interest_payload_stale(ticker_report_data):
+            return
+        try:
+            _memory.store(key, json.loads(json.dumps(ticker_report_data)))
+        except (TypeError, ValueError):
+            # Not JSON-round-trippable as-is; the next read fills the tier from the row.
+            _memory.discard(key)
 
     await asyncio.to_thread(_upsert)
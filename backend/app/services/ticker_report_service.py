@@ -31,11 +31,12 @@ and fires only for `/research/generate`.
 
 import asyncio
 import logging
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional
 
 from app.integrations.fmp import get_fmp_client
 from app.integrations.gemini import get_gemini_client
 from app.services.agents.narrative_prompts import (
+    NarrativeJob,
     build_narrative_jobs,
     build_stage_a_prompt,
     parse_stage_a_response,
@@ -58,6 +59,37 @@ from app.services.ticker_report_cache import (
 
 logger = logging.getLogger(__name__)
 
+# `on_progress(event, data)` — the streaming report endpoint's listener. Events:
+#   "section"   {"key": <top-level report key>, "data": <its current value>}
+#   "narrative" {"label": <Stage-B job label>, "key": ..., "data": ...}
+ProgressCallback = Callable[[str, Dict[str, Any]], None]
+
+# Real-data sections (price action, insider + institutional flow, Street consensus,
+# fundamentals history): everything in them but a narrative slot is known as soon as
+# the collection lands, so a streaming caller gets them before Stage A even starts.
+# Their narrative slots (price_action.narrative, wall_street_insight, ...) arrive
+# later as "narrative" events.
+_EARLY_SECTIONS = (
+    "price_action",
+    "insider_data",
+    "wall_street_consensus",
+    "fundamental_metrics",
+    "growth_chart",
+    "profit_power",
+    "revenue_forecast",
+    "hidden_market_signals",
+)
+
+
+def _emit(on_progress: Optional[ProgressCallback], event: str, data: Dict[str, Any]) -> None:
+    """Best-effort progress delivery: a broken listener never breaks generation."""
+    if on_progress is None:
+        return
+    try:
+        on_progress(event, data)
+    except Exception as e:
+        logger.warning(f"Report progress listener failed on {event}: {type(e).__name__}: {e}")
+
 
 # Degradation marker — now shared with the deep path (`ResearchAgent`), which had the
 # identical bug open on the more expensive door. Re-exported here because ~5 tests and the
@@ -171,7 +203,10 @@ LENGTH: 2-4 sentences, total under 90 words."""
         return await self.generate_fresh_report(ticker, persona_key)
 
     async def generate_fresh_report(
-        self, ticker: str, persona_key: str = "warren_buffett"
+        self,
+        ticker: str,
+        persona_key: str = "warren_buffett",
+        on_progress: Optional[ProgressCallback] = None,
     ) -> Dict[str, Any]:
         """Generate a FRESH report (no cache read) and cache it on success.
 
@@ -192,6 +227,10 @@ LENGTH: 2-4 sentences, total under 90 words."""
         The dedup namespace is `"direct"`, NOT the deep path's: the two pipelines
         produce different reports for the same (ticker, persona), so sharing a
         namespace would hand a deep-research caller a shallow report.
+
+        `on_progress` receives sections as they become final (see
+        `ProgressCallback`). Only a dedup LEADER reports progress: a follower
+        attaches to someone else's run and just gets the finished report.
         """
         ticker = ticker.upper().strip()
 
@@ -201,12 +240,15 @@ LENGTH: 2-4 sentences, total under 90 words."""
 
         return await run_agent_deduped(
             ticker, persona_key,
-            lambda: self._generate_uncontended(ticker, persona_key),
+            lambda: self._generate_uncontended(ticker, persona_key, on_progress=on_progress),
             key_prefix="direct",
         )
 
     async def _generate_uncontended(
-        self, ticker: str, persona_key: str
+        self,
+        ticker: str,
+        persona_key: str,
+        on_progress: Optional[ProgressCallback] = None,
     ) -> Dict[str, Any]:
         """The actual pipeline. Only ever runs as a dedup LEADER holding a
         semaphore slot — followers get a deep copy of this result, so the cache
@@ -216,11 +258,46 @@ LENGTH: 2-4 sentences, total under 90 words."""
         persona = get_persona_config(persona_key)
         evidence = build_financial_context(out)
 
+        # 2b. Streaming callers get the real-data sections now — assembled
+        #     against the empty Stage A shell, which only leaves their narrative
+        #     slots blank — so first content lands at collection time instead
+        #     of after the whole Gemini pipeline.
+        preview: Dict[str, Any] = {}
+        if on_progress is not None:
+            try:
+                preview = self.collector.assemble_report(out, stage_a_fallback())
+            except Exception as e:
+                logger.warning(
+                    f"Early-section preview failed for {ticker}: "
+                    f"{type(e).__name__}: {e}"
+                )
+            for key in _EARLY_SECTIONS:
+                if preview.get(key) is not None:
+                    _emit(on_progress, "section", {"key": key, "data": preview[key]})
+
         # 3. Stage A: structural / scoring shell
         shell = await self._generate_stage_a(out, persona, evidence)
 
         # 4. Merge deterministic real-data with Stage A shell
         report = self.collector.assemble_report(out, shell)
+        if on_progress is not None:
+            # Everything else (scores, moat dimensions, bull/bear case) is final
+            # from here on except the Stage B slots, which are pushed per job.
+            # An early section is re-sent only if Stage A changed it (a verbatim
+            # guidance quote on revenue_forecast, say).
+            for key, value in report.items():
+                if key not in _EARLY_SECTIONS or value != preview.get(key):
+                    _emit(on_progress, "section", {"key": key, "data": value})
+
+        def _narrative_applied(job: NarrativeJob) -> None:
+            if job.section in report:
+                _emit(on_progress, "narrative", {
+                    "label": job.label, "key": job.section, "data": report[job.section],
+                })
+
+        async def _core_thesis() -> None:
+            await synthesize_core_thesis(report, persona, self.gemini, evidence)
+            _emit(on_progress, "section", {"key": "core_thesis", "data": report.get("core_thesis")})
 
         # 5. Stage B narratives + cross-module thesis synthesis, in parallel.
         #    Stage B fills per-field prose; synthesize_core_thesis rewrites
@@ -233,8 +310,11 @@ LENGTH: 2-4 sentences, total under 90 words."""
             # context cache shared across all N parallel narrative calls.
             # Omitting it leaves `use_cache` False and every call re-sends the
             # full evidence blob inline at full token price.
-            run_narrative_jobs(jobs, self.gemini, persona, evidence),
-            synthesize_core_thesis(report, persona, self.gemini, evidence),
+            run_narrative_jobs(
+                jobs, self.gemini, persona, evidence,
+                on_applied=_narrative_applied if on_progress is not None else None,
+            ),
+            _core_thesis(),
         )
 
         # 6. Critical Factors — synthesized AFTER the thesis so it reads the
@@ -242,6 +322,9 @@ LENGTH: 2-4 sentences, total under 90 words."""
         #    watch triggers (Fed / war / earnings / analyst / market). Overwrites
         #    on success; the Stage A/B factors stay as the fallback otherwise.
         await synthesize_critical_factors(report, persona, self.gemini, evidence)
+        _emit(on_progress, "section", {
+            "key": "critical_factors", "data": report.get("critical_factors"),
+        })
 
         # 6. Persist to cache (best-effort; failure logged but doesn't raise) — but ONLY
         #    when the report is real.
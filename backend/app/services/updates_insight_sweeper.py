@@ -1,7 +1,7 @@
 """
 Updates-screen AI Insight sweeper.
 
-Runs inside the FastAPI lifespan (registered in ``app/main.py``). Two passes on
+Runs as a background job (registered in ``app/jobs.py``). Two passes on
 different cadences, both gated on ``is_market_active()``:
 
   * PRICE pass  (every 5 min)  — one ``batch-quote`` call for the whole universe,
@@ -56,6 +56,7 @@ from app.services.news_insight_service import (
 from app.services.ticker_report_cache import current_close_cycle_start
 from app.services.volatility_cache_service import get_volatility_cache_service
 from app.config import settings
+from app.services.price_bus import get_price_bus
 from app.services.price_catalyst_service import get_price_catalyst_service
 from app.services.updates_materiality import (
     ACTION_GENERATE,
@@ -658,14 +659,13 @@ class InsightSweeper:
         if not scopes:
             return {}
 
-        # 1. Quotes — ONE batch-quote call for the whole universe (plus the index).
+        # 1. Quotes — the shared price bus for the whole universe (plus the index): the
+        #    snapshot the bus poller keeps fresh, with ONE batch-quote call for whatever
+        #    it does not hold fresh yet.
         symbols = [s for s in scopes if s != MARKET_SCOPE] + [MARKET_INDEX_SYMBOL]
         quotes_by_symbol: Dict[str, Dict[str, Any]] = {}
         try:
-            for row in await self.fmp.get_batch_quotes_bulk(symbols):
-                sym = row.get("symbol")
-                if sym:
-                    quotes_by_symbol[str(sym).upper()] = row
+            quotes_by_symbol = await get_price_bus().get_quotes(symbols)
         except Exception as e:
             logger.warning(
                 "Insight sweep quote fetch failed (%s: %s) — continuing with "
@@ -952,7 +952,7 @@ NEWS_EVERY_N_CYCLES = 3           # => news refresh every 15 min
 
 
 async def run_insight_sweeper_loop() -> None:
-    """Lifespan task. Cancelled on shutdown by ``app/main.py``."""
+    """Lifespan task. Cancelled on shutdown by ``app/jobs.stop_job_tasks``."""
     # Stagger behind the existing 30/45/120s pre-warmers so startup isn't a
     # thundering herd against FMP.
     await asyncio.sleep(150)
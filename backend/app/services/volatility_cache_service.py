@@ -30,7 +30,14 @@ from app.integrations.fmp import (
     FMPRateLimitException,
     get_fmp_client,
 )
-from app.services.price_volatility import _BASELINE_DAYS, _daily_returns, _std_dev_pop
+from app.services.price_history_store import get_price_history_store
+from app.services.price_volatility import (
+    _BASELINE_DAYS,
+    _daily_returns,
+    _price_panel,
+    _sigma_daily_batch,
+    _std_dev_pop,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +48,10 @@ _CACHE_TTL_HOURS = 36            # DB row lifetime — survives a single missed
 _HISTORY_LOOKBACK_DAYS = int((_BASELINE_DAYS + 10) * 1.5)
 _MIN_CLOSES = 30                 # matches price_volatility._compute_price_volatility's floor
 _RECOMPUTE_CONCURRENCY = 6
+# Symbols fetched, then scored as ONE panel, per step. Bounds both the matrix and how
+# much finished work a killed run loses (rows are upserted chunk by chunk, so the
+# skip-if-fresh resume still picks up where it stopped).
+_RECOMPUTE_CHUNK = 250
 
 # symbol(upper) -> (monotonic_ts, sigma_daily|None)
 _mem: Dict[str, Tuple[float, Optional[float]]] = {}
@@ -99,6 +110,29 @@ def _sigma_from_closes(closes: List[float]) -> Tuple[Optional[float], int]:
     return sigma, len(returns)
 
 
+def _sigmas_from_closes(series: List[List[float]]) -> List[Tuple[Optional[float], int]]:
+    """:func:`_sigma_from_closes` for many symbols at once, as one NumPy panel.
+
+    Each symbol's last ``_BASELINE_DAYS+1`` closes become a row of a right-aligned,
+    NaN-padded matrix and every σ comes out of the same few array operations — the
+    precompute's per-close Python loop was the only CPU in an otherwise I/O-bound job.
+    Same floor, same slice, same None rules as the per-symbol function.
+    """
+    if not series:
+        return []
+    panel, _ = _price_panel(series, width=_BASELINE_DAYS + 1)
+    sigmas, counts = _sigma_daily_batch(panel, _BASELINE_DAYS)
+    out: List[Tuple[Optional[float], int]] = []
+    for closes, sigma, count in zip(series, sigmas.tolist(), counts.tolist()):
+        if len(closes) < _MIN_CLOSES:
+            out.append((None, max(0, len(closes) - 1)))
+        elif not math.isfinite(sigma) or sigma <= 0:
+            out.append((None, count))
+        else:
+            out.append((sigma, count))
+    return out
+
+
 class VolatilityCacheService:
     def __init__(self) -> None:
         self.supabase = get_supabase()
@@ -176,7 +210,9 @@ class VolatilityCacheService:
     ) -> int:
         """Precompute σ for ``symbols`` and upsert. Returns rows written.
 
-        Bounded concurrency; per-symbol failures are logged, not fatal.
+        Bounded concurrency; per-symbol failures are logged, not fatal. Symbols are
+        fetched and scored in chunks of ``_RECOMPUTE_CHUNK`` (σ for a whole chunk is
+        one :func:`_sigmas_from_closes` panel), then upserted.
         ``skip_if_fresh_hours`` lets a redeploy-retriggered run RESUME (skip
         tickers computed in the last N hours) instead of redoing everything.
         """
@@ -201,24 +237,42 @@ class VolatilityCacheService:
             datetime.now(timezone.utc) - timedelta(days=_HISTORY_LOOKBACK_DAYS)
         ).strftime("%Y-%m-%d")
 
-        async def _one(sym: str) -> int:
+        store = get_price_history_store()
+
+        async def _closes(sym: str) -> Optional[List[float]]:
             async with sem:
                 try:
+                    if store is not None:
+                        # One trailing-days top-up per symbol instead of 270 days of JSON;
+                        # the closes are the store's column, already oldest-first and finite.
+                        bars = await store.daily(self.fmp, sym, from_date)
+                        return bars.close.tolist()
                     hist = await self.fmp.get_historical_prices(sym, from_date=from_date)
+                    return _chronological_closes(hist)
                 except (FMPRateLimitException, FMPAuthException) as e:
                     logger.warning("Volatility precompute quota/auth on %s: %s", sym, e)
-                    return 0
                 except Exception as e:
                     logger.warning(
                         "Volatility precompute fetch failed for %s: %s: %s",
                         sym, type(e).__name__, e,
                     )
-                    return 0
-                sigma, sample = _sigma_from_closes(_chronological_closes(hist))
+                return None
+
+        async def _write(sym: str, sigma: Optional[float], sample: int) -> int:
+            async with sem:
                 return await asyncio.to_thread(self._upsert, sym, sigma, sample)
 
-        results = await asyncio.gather(*[_one(s) for s in todo], return_exceptions=True)
-        written = sum(r for r in results if isinstance(r, int))
+        written = 0
+        for start in range(0, len(todo), _RECOMPUTE_CHUNK):
+            chunk = todo[start:start + _RECOMPUTE_CHUNK]
+            fetched = await asyncio.gather(*[_closes(s) for s in chunk], return_exceptions=True)
+            ready = [(s, c) for s, c in zip(chunk, fetched) if isinstance(c, list)]
+            scored = _sigmas_from_closes([c for _, c in ready])
+            results = await asyncio.gather(
+                *[_write(s, sigma, sample) for (s, _), (sigma, sample) in zip(ready, scored)],
+                return_exceptions=True,
+            )
+            written += sum(r for r in results if isinstance(r, int))
         logger.info("Volatility precompute complete: %d/%d rows written", written, len(todo))
         return written
 
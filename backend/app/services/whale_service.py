@@ -27,6 +27,7 @@ from app.integrations.fmp import (
     FMPClient,
     FMPPartialPageException,
 )
+from app.core.cache import record_entry, record_unversioned, record_version
 from app.database import get_supabase
 from app.utils.period_labels import filing_period_display
 from app.services._whale_common import (
@@ -743,6 +744,8 @@ class WhaleService:
             # ── Tier 1: In-memory cache (fast, per-process) ────────────
             cached = _cache_get(_whale_profile_cache, mem_key, WHALE_PROFILE_CACHE_TTL)
             if cached is not None:
+                # Versioned by its Tier-1 entry for the route's ETag (app/api/conditional.py).
+                record_entry("whale_profile", mem_key, _whale_profile_cache.get(mem_key), cached)
                 # Overlay fresh follow state
                 return self._overlay_follow_state(cached, user_id, sb)
 
@@ -775,6 +778,9 @@ class WhaleService:
                     if age_hours < self.PROFILE_CACHE_TTL_HOURS:
                         profile = WhaleProfileResponse(**row["profile_json"])
                         _cache_set(_whale_profile_cache, mem_key, profile)
+                        record_entry(
+                            "whale_profile", mem_key, _whale_profile_cache.get(mem_key), profile,
+                        )
                         logger.info(
                             "Whale profile %s served from Supabase cache (%.1fh old)",
                             whale_id, age_hours,
@@ -803,6 +809,8 @@ class WhaleService:
             inflight = _whale_profile_inflight.get(whale_id)
             if inflight is not None:
                 shared = await asyncio.shield(inflight)
+                # A joiner cannot tell whether the build it shared was cached.
+                record_unversioned("whale_profile", mem_key)
                 if shared is None:
                     return None
                 return self._overlay_follow_state(shared, user_id, sb)
@@ -867,6 +875,10 @@ class WhaleService:
             if not force_refresh:
                 _whale_profile_inflight.pop(whale_id, None)
 
+        # A degraded build was never stored, so it is not the Tier-1 entry: unversioned.
+        record_entry(
+            "whale_profile", mem_key, _whale_profile_cache.get(mem_key), profile_no_follow,
+        )
         if profile_no_follow is None:
             return None
         return self._overlay_follow_state(profile_no_follow, user_id, sb)
@@ -889,10 +901,13 @@ class WhaleService:
                 .execute()
             )
             is_following = bool(follow_result.data)
+            # Live per-user state: the flag is its own version.
+            record_version("whale_follow", f"{profile.id}:{user_id}", is_following)
             if is_following != profile.is_following:
                 return profile.model_copy(update={"is_following": is_following})
         except Exception as e:
             logger.warning("Follow state check failed: %s", e)
+            record_unversioned("whale_follow", f"{profile.id}:{user_id}")
         return profile
 
     async def _build_whale_profile(
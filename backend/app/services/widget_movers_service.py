@@ -90,6 +90,7 @@ from app.services.daily_move_attribution import (
     _pct,
 )
 from app.services.news_insight_service import get_news_insight_service
+from app.services.price_bus import get_price_bus
 from app.services.updates_materiality import classify_move, finite, move_z
 from app.services.volatility_cache_service import get_volatility_cache_service
 from app.utils.market_hours import (
@@ -1245,13 +1246,9 @@ class WidgetMoversService:
         return ranked, cards, news_available, index_rows
 
     async def _quotes(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
-        rows = await get_fmp_client().get_batch_quotes_bulk(symbols)
-        out: Dict[str, Dict[str, Any]] = {}
-        for r in rows or []:
-            sym = str(r.get("symbol") or "").upper()
-            if sym:
-                out[sym] = r
-        return out
+        # The shared price bus: the same snapshot price alerts and the Updates sweeper
+        # read, so a widget build mostly costs no quote call of its own.
+        return await get_price_bus().get_quotes(symbols)
 
     async def _sectors(
         self, user_id: str, tickers: Sequence[str]
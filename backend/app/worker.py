@@ -0,0 +1,129 @@
+"""
+Background Job Worker
+=====================
+
+``python -m app.worker`` — runs the background jobs OUTSIDE the API process.
+
+With ``BACKGROUND_JOBS_RUNNER=worker`` the API process keeps only the process-local
+cache warmers and this process runs everything else from the shared job table in
+app/jobs.py: whale hydration, the quarterly / weekly benchmark recomputes, the daily σ
+precompute, the report and news pre-warmers, the insight sweeper and the notification
+loops. Their CPU-bound aggregation and synchronous Supabase writes then stop competing
+with request handling for one event loop and one default executor.
+
+Same scheduler, same budget, same jobs as in the API process — plus the per-pass lease
+(migration 154), so a rollout that briefly overlaps two workers skips a tick rather than
+running it twice. There is no request traffic here, so the budget's latency yield never
+fires; its concurrency cap still does.
+
+Refuses to start unless ``BACKGROUND_JOBS_RUNNER=worker``: with ``web`` the API process
+is already running every job, without leases.
+"""
+
+import asyncio
+import logging
+import signal
+import sys
+from typing import List, Optional
+
+from app.config import settings
+from app.core.redis_cache import close_redis_l2, init_redis_l2
+from app.core.scheduler import reset_scheduler
+from app.database import check_supabase_health, close_async_supabase
+from app.integrations.coingecko import close_coingecko_client
+from app.integrations.finra_short_interest import close_finra_client
+from app.integrations.fmp import close_fmp_client
+from app.integrations.openfda import close_openfda_client
+from app.integrations.uspto import close_uspto_client
+from app.jobs import (
+    RUNNER_WORKER,
+    job_lease_hook,
+    register_background_jobs,
+    register_notification_jobs,
+    spawn_job_task,
+    stop_job_tasks,
+)
+from app.log_redaction import SecretRedactingFilter, scrub_sentry_event
+
+logger = logging.getLogger("app.worker")
+
+
+def _configure_logging() -> None:
+    logging.basicConfig(
+        level=settings.LOG_LEVEL,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    # Same redaction as the API process (see app/main.py): FMP warnings echo apikey=.
+    for handler in logging.getLogger().handlers:
+        handler.addFilter(SecretRedactingFilter())
+
+    # Same production-only gate as the API process — a worker started on a laptop must
+    # not ship its errors to the prod project.
+    if settings.SENTRY_DSN and settings.ENVIRONMENT == "production":
+        import sentry_sdk
+        from sentry_sdk.integrations.logging import LoggingIntegration
+
+        sentry_sdk.init(
+            dsn=settings.SENTRY_DSN,
+            environment=settings.ENVIRONMENT,
+            release=settings.APP_VERSION,
+            integrations=[LoggingIntegration(level=logging.INFO, event_level=logging.ERROR)],
+            before_send=lambda event, hint: scrub_sentry_event(event),
+            send_default_pii=False,
+            server_name="worker",
+        )
+
+
+async def run_worker(stop: Optional[asyncio.Event] = None) -> None:
+    """Run the worker's jobs until ``stop`` is set (SIGTERM / SIGINT when run as a script)."""
+    stop = stop or asyncio.Event()
+    logger.info(f"Starting {settings.APP_NAME} worker v{settings.APP_VERSION}")
+
+    if not await check_supabase_health():
+        logger.warning("Supabase connection FAILED — check configuration")
+    await init_redis_l2()
+
+    scheduler = reset_scheduler(lease=job_lease_hook())
+    register_background_jobs(scheduler, process=RUNNER_WORKER)
+    register_notification_jobs(scheduler, process=RUNNER_WORKER)
+    logger.info("Worker jobs: %s", ", ".join(sorted(scheduler.jobs)))
+
+    tasks: List[asyncio.Task] = []
+    job_tasks = scheduler.start(lambda coro, name: spawn_job_task(tasks, coro, name))
+    try:
+        await stop.wait()
+    finally:
+        # Jobs first, then the clients they use — the same order as the API shutdown.
+        await stop_job_tasks(tasks, first=job_tasks.get("insight_sweeper"))
+        await close_fmp_client()
+        await close_coingecko_client()
+        await close_openfda_client()
+        await close_uspto_client()
+        await close_finra_client()
+        await close_redis_l2()
+        await close_async_supabase()
+        logger.info("Worker stopped")
+
+
+async def _main() -> None:
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stop.set)
+    await run_worker(stop)
+
+
+def main() -> int:
+    _configure_logging()
+    if settings.BACKGROUND_JOBS_RUNNER != RUNNER_WORKER:
+        logger.error(
+            "BACKGROUND_JOBS_RUNNER=%r — the API process already runs every job; set it to "
+            "%r on BOTH services to use the worker", settings.BACKGROUND_JOBS_RUNNER, RUNNER_WORKER,
+        )
+        return 2
+    asyncio.run(_main())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
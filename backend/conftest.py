@@ -30,6 +30,12 @@ import pytest
 # Force Sentry inert for tests regardless of what backend/.env contains.
 os.environ["SENTRY_DSN"] = ""
 
+# Keep the on-disk daily-price store (app/services/price_history_store.py) out of the suite:
+# it would persist one test's mocked FMP bars into the next test's reads. Every consumer
+# falls back to its direct-FMP path when it is off; the store's own tests point it at a
+# tmp_path explicitly.
+os.environ["PRICE_HISTORY_STORE_DIR"] = ""
+
 # ---------------------------------------------------------------------------
 # Stop the cyclic collector for the session.
 #
@@ -82,3 +88,22 @@ def pytest_sessionfinish(session, exitstatus):  # noqa: ARG001 - pytest hook sig
     gc.enable()
     gc.collect()
 
+
+
+@pytest.fixture(autouse=True)
+def _fresh_auth_caches():
+    """Start every test with empty auth caches — the users-row cache (app/core/user_cache.py)
+    and the verified-JWT cache (`app.core.security.verified_claims`).
+
+    The suite calls the auth dependencies directly with a different stub client per test but
+    the SAME user ids and often the same minted token, so an entry cached by one test would
+    otherwise answer the next test's lookup and the stub or patch it installed would never be
+    consulted. Imported lazily so the Sentry override above still lands before any `app.*`
+    import.
+    """
+    from app.core.security import verified_claims
+    from app.core.user_cache import clear_user_records
+
+    clear_user_records()
+    verified_claims.clear()
+    yield
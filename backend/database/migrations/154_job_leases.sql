@@ -0,0 +1,108 @@
+-- 154_job_leases.sql
+--
+-- Why: background jobs can now run OUTSIDE the web process (`python -m app.worker`,
+-- app/worker.py), and during a rollout — or with more than one worker replica, or a web
+-- process started with BACKGROUND_JOBS_RUNNER=web next to a worker — two processes hold
+-- the same job table. Without a cross-process guard both would run the 2-hourly news
+-- pre-warm, the daily σ precompute and the quarterly benchmark chain, doubling the FMP
+-- spend those jobs are scheduled to bound.
+--
+-- The daily claim (claim_scheduled_job, migration 147) is the wrong shape for them: it
+-- allows at most ONE successful run per day, and most of these jobs run every hour or
+-- two. What they need is a LEASE: "I am running this now, until T". Whoever holds an
+-- unexpired lease runs the pass; everyone else skips that tick.
+--
+-- What this does:
+--   1. Adds `lease_holder` / `lease_until` to notification_job_state. Same table, same
+--      `enabled` kill switch, one row per job — the existing claim columns (`claim_at`,
+--      `run_day`) are NOT touched, so the daily-claim jobs are unaffected.
+--   2. claim_job_lease(): grant when the lease is free, expired, or already ours.
+--   3. release_job_lease(): clear OUR lease only (a holder whose lease expired and was
+--      re-granted elsewhere must not release the new holder's) and record the outcome.
+--
+-- An expired lease is the crash path: a process killed mid-pass never releases, and
+-- leases are not renewed, so the job is simply free again `lease_seconds` after the
+-- claim. Callers size the lease above the pass's normal duration.
+--
+-- Idempotent: ADD COLUMN IF NOT EXISTS, CREATE OR REPLACE FUNCTION.
+
+BEGIN;
+
+ALTER TABLE public.notification_job_state
+    ADD COLUMN IF NOT EXISTS lease_holder TEXT;
+ALTER TABLE public.notification_job_state
+    ADD COLUMN IF NOT EXISTS lease_until TIMESTAMPTZ;
+
+COMMENT ON COLUMN public.notification_job_state.lease_holder IS
+    'Process currently running this job (host:pid), or NULL. Set by claim_job_lease(), '
+    'cleared by release_job_lease(). Independent of the daily claim (claim_at / run_day).';
+COMMENT ON COLUMN public.notification_job_state.lease_until IS
+    'When the current lease lapses. Past it the job is free again even if the holder never '
+    'released — the crash path.';
+
+CREATE OR REPLACE FUNCTION claim_job_lease(
+    p_job           TEXT,
+    p_holder        TEXT,
+    p_now           TIMESTAMPTZ,
+    p_lease_seconds INTEGER
+)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public, pg_temp
+SET row_security = off
+AS $$
+DECLARE
+    v_ok BOOLEAN;
+BEGIN
+    INSERT INTO notification_job_state (job, updated_at)
+    VALUES (p_job, p_now)
+    ON CONFLICT (job) DO NOTHING;
+
+    UPDATE notification_job_state s
+       SET lease_holder = p_holder,
+           lease_until  = p_now + make_interval(secs => GREATEST(p_lease_seconds, 1)),
+           updated_at   = p_now
+     WHERE s.job = p_job
+       AND s.enabled                               -- the kill switch
+       AND (s.lease_until IS NULL
+            OR s.lease_until <= p_now
+            OR s.lease_holder = p_holder)
+    RETURNING TRUE INTO v_ok;
+
+    RETURN COALESCE(v_ok, FALSE);
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION release_job_lease(
+    p_job     TEXT,
+    p_holder  TEXT,
+    p_now     TIMESTAMPTZ,
+    p_success BOOLEAN,
+    p_error   TEXT DEFAULT NULL
+)
+RETURNS VOID
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public, pg_temp
+SET row_security = off
+AS $$
+BEGIN
+    UPDATE notification_job_state s
+       SET lease_holder = NULL,
+           lease_until  = NULL,
+           last_run_at  = p_now,
+           last_error   = CASE WHEN p_success THEN NULL ELSE p_error END,
+           updated_at   = p_now
+     WHERE s.job = p_job
+       AND s.lease_holder = p_holder;
+END;
+$$;
+
+REVOKE ALL ON FUNCTION claim_job_lease(TEXT, TEXT, TIMESTAMPTZ, INTEGER) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION claim_job_lease(TEXT, TEXT, TIMESTAMPTZ, INTEGER) TO service_role;
+
+REVOKE ALL ON FUNCTION release_job_lease(TEXT, TEXT, TIMESTAMPTZ, BOOLEAN, TEXT) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION release_job_lease(TEXT, TEXT, TIMESTAMPTZ, BOOLEAN, TEXT) TO service_role;
+
+COMMIT;
@@ -0,0 +1,65 @@
+-- 155_price_alert_bulk_state.sql
+--
+-- Why: the price-alert loop (app/services/price_alert_service.py) wrote every active
+-- rule's state back with its own UPDATE, every cycle, changed or not — one serialized
+-- PostgREST round-trip per rule. At a few hundred rules that was tolerable; at tens of
+-- thousands a 60-second cycle spends most of its minute waiting on writes that mostly
+-- rewrite the values already there.
+--
+-- The loop now diffs each rule's decision against the state it read and sends only the
+-- rows that changed, in chunks, through this function: ONE UPDATE ... FROM over a JSON
+-- recordset per chunk.
+--
+-- What the function owns, rather than the caller:
+--   * `trigger_count` is incremented HERE (`+ 1` when `fired`), not computed from the
+--     value the loop read a minute ago — two overlapping instances cannot lose a count.
+--   * `is_active` only ever goes TRUE → FALSE through `deactivate`. A cycle never
+--     re-activates a rule the user switched off between the read and the write.
+--   * timestamps come from `p_now`, one clock for the whole cycle.
+--
+-- Rows whose id no longer exists (deleted mid-cycle) simply match nothing. Returns the
+-- number of rows updated.
+--
+-- Idempotent: CREATE OR REPLACE FUNCTION.
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION apply_price_alert_states(
+    p_rows JSONB,
+    p_now  TIMESTAMPTZ
+)
+RETURNS INTEGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public, pg_temp
+SET row_security = off
+AS $$
+DECLARE
+    v_count INTEGER;
+BEGIN
+    UPDATE price_alerts a
+       SET last_price        = r.last_price,
+           armed             = r.armed,
+           is_active         = a.is_active AND NOT COALESCE(r.deactivate, FALSE),
+           trigger_count     = a.trigger_count + CASE WHEN r.fired THEN 1 ELSE 0 END,
+           last_triggered_at = CASE WHEN r.fired THEN p_now ELSE a.last_triggered_at END,
+           last_evaluated_at = p_now,
+           updated_at        = p_now
+      FROM jsonb_to_recordset(p_rows) AS r(
+               id         UUID,
+               last_price NUMERIC,
+               armed      BOOLEAN,
+               fired      BOOLEAN,
+               deactivate BOOLEAN
+           )
+     WHERE a.id = r.id;
+
+    GET DIAGNOSTICS v_count = ROW_COUNT;
+    RETURN v_count;
+END;
+$$;
+
+REVOKE ALL ON FUNCTION apply_price_alert_states(JSONB, TIMESTAMPTZ) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION apply_price_alert_states(JSONB, TIMESTAMPTZ) TO service_role;
+
+COMMIT;
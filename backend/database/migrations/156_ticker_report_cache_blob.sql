@@ -0,0 +1,37 @@
+-- 156_ticker_report_cache_blob.sql
+--
+-- Why: every `ticker_report_cache` hit downloaded the full `ticker_report_data` JSONB —
+-- hundreds of KB of JSON per (ticker, persona) that compresses very well (the same keys
+-- on every row of every series, long runs of similar numbers). The app can now
+-- store the payload compressed instead (app/services/ticker_report_cache.py,
+-- TICKER_REPORT_CACHE_COMPRESSED): `ticker_report_blob` holds "<codec>:<base64>" of the
+-- JSON, and `ticker_report_data` is left NULL on those rows.
+--
+-- What this does:
+--   1. Adds `ticker_report_blob TEXT` (TEXT + base64 rather than BYTEA: PostgREST ships
+--      BYTEA as a hex string, which doubles the bytes this exists to save).
+--   2. Drops NOT NULL from `ticker_report_data` so a compressed row can omit it.
+--   3. Requires at least one of the two, so a row can never be an empty payload.
+--
+-- Readers take `ticker_report_data` when it is present and the blob otherwise, so rows
+-- written before the switch — and rows rewritten after switching it back off — keep
+-- serving. Apply this BEFORE setting TICKER_REPORT_CACHE_COMPRESSED=true: until then the
+-- column does not exist and the app never names it.
+--
+-- Idempotent: ADD COLUMN IF NOT EXISTS, DROP NOT NULL, DROP CONSTRAINT IF EXISTS.
+
+BEGIN;
+
+ALTER TABLE public.ticker_report_cache
+    ADD COLUMN IF NOT EXISTS ticker_report_blob TEXT;
+
+ALTER TABLE public.ticker_report_cache
+    ALTER COLUMN ticker_report_data DROP NOT NULL;
+
+ALTER TABLE public.ticker_report_cache
+    DROP CONSTRAINT IF EXISTS ticker_report_cache_payload_present;
+ALTER TABLE public.ticker_report_cache
+    ADD CONSTRAINT ticker_report_cache_payload_present
+    CHECK (ticker_report_data IS NOT NULL OR ticker_report_blob IS NOT NULL);
+
+COMMIT;
@@ -0,0 +1,37 @@
+-- 157_ticker_data_cache_blob.sql
+--
+-- Why: a `ticker_data_cache` hit parsed the whole `collected_data` JSONB and re-validated
+-- every Pydantic model in it, then `collect()` deep-copied all of them — for each of
+-- personas 2..N, although the per-persona layer reads only a handful of fields. The app
+-- can now store collections in a binary, per-field format instead
+-- (app/services/ticker_data_cache.py, TICKER_DATA_CACHE_BINARY): `collected_blob` holds
+-- the base64 frame, each field is decoded only when first read, and `collected_data` is
+-- left NULL on those rows.
+--
+-- What this does:
+--   1. Adds `collected_blob TEXT` (TEXT + base64, not BYTEA: PostgREST ships BYTEA as a
+--      hex string, twice the bytes).
+--   2. Drops NOT NULL from `collected_data` so a binary row can omit it.
+--   3. Requires at least one of the two.
+--
+-- Readers take `collected_data` when it is present and the blob otherwise, so JSONB rows
+-- keep serving across the switch in either direction. Apply this BEFORE setting
+-- TICKER_DATA_CACHE_BINARY=true: until then the app never names the column.
+--
+-- Idempotent: ADD COLUMN IF NOT EXISTS, DROP NOT NULL, DROP CONSTRAINT IF EXISTS.
+
+BEGIN;
+
+ALTER TABLE public.ticker_data_cache
+    ADD COLUMN IF NOT EXISTS collected_blob TEXT;
+
+ALTER TABLE public.ticker_data_cache
+    ALTER COLUMN collected_data DROP NOT NULL;
+
+ALTER TABLE public.ticker_data_cache
+    DROP CONSTRAINT IF EXISTS ticker_data_cache_payload_present;
+ALTER TABLE public.ticker_data_cache
+    ADD CONSTRAINT ticker_data_cache_payload_present
+    CHECK (collected_data IS NOT NULL OR collected_blob IS NOT NULL);
+
+COMMIT;
@@ -0,0 +1,139 @@
+"""
+Benchmark: p50/p99 latency of 200 concurrent PostgREST reads, sync SDK in
+`asyncio.to_thread` vs the async client (`app.database.AsyncPostgrestClient`).
+
+The sync path is what get_current_user and the report / collection / news cache reads
+used to do: every read held a default-executor thread (min(32, cpu + 4) of them) for its
+whole round-trip, so a burst queued behind the pool and the tail grew with the burst.
+The async path holds a pooled socket instead.
+
+By default it stands up a local fake PostgREST (a threaded HTTP server that sleeps
+--latency-ms per request and returns one row), so it runs anywhere and measures the
+client side only. Point --url at a real project to include the network:
+
+    ./venv/bin/python scripts/bench_async_postgrest.py
+    ./venv/bin/python scripts/bench_async_postgrest.py --concurrency 400 --latency-ms 40
+    ./venv/bin/python scripts/bench_async_postgrest.py --url https://xyz.supabase.co --key <service-role>
+
+With --url it reads `users?id=eq.<random uuid>` — zero rows, read-only.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Awaitable, Callable, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import httpx  # noqa: E402
+
+from app.database import AsyncPostgrestClient  # noqa: E402
+
+
+def _serve_fake_postgrest(latency: float, port_out) -> None:
+    body = json.dumps([{"id": "u1", "email": "a@b.c"}]).encode()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):  # noqa: N802 - http.server API
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    ThreadingHTTPServer.request_queue_size = 1024
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    port_out.put(server.server_address[1])
+    server.serve_forever()
+
+
+def _fake_postgrest(latency: float) -> int:
+    """Start the fake server in its own PROCESS so it does not compete for this GIL."""
+    ports: multiprocessing.Queue = multiprocessing.Queue()
+    proc = multiprocessing.Process(target=_serve_fake_postgrest, args=(latency, ports), daemon=True)
+    proc.start()
+    return ports.get(timeout=10)
+
+
+async def _burst(call: Callable[[], Awaitable[None]], concurrency: int) -> List[float]:
+    async def one() -> float:
+        t0 = time.perf_counter()
+        await call()
+        return (time.perf_counter() - t0) * 1000
+
+    return sorted(await asyncio.gather(*(one() for _ in range(concurrency))))
+
+
+def _report(label: str, samples: List[float]) -> None:
+    p50 = samples[len(samples) // 2]
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    print(f"{label:<22} p50 {p50:8.1f} ms   p99 {p99:8.1f} ms   max {samples[-1]:8.1f} ms")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--pool", type=int, default=50, help="async client max connections")
+    parser.add_argument("--url", default=None)
+    parser.add_argument("--key", default=os.environ.get("SUPABASE_SERVICE_ROLE_KEY", "bench"))
+    args = parser.parse_args()
+
+    if args.url:
+        base = args.url.rstrip("/")
+    else:
+        base = f"http://127.0.0.1:{_fake_postgrest(args.latency_ms / 1000)}"
+        print(f"fake PostgREST on {base} ({args.latency_ms:.0f} ms per request)")
+
+    from supabase import create_client
+
+    sync_client = create_client(base, args.key)
+    http = httpx.AsyncClient(
+        base_url=f"{base}/rest/v1",
+        headers={"apikey": args.key, "Authorization": f"Bearer {args.key}"},
+        limits=httpx.Limits(max_connections=args.pool, max_keepalive_connections=args.pool),
+        timeout=30.0,
+    )
+    async_client = AsyncPostgrestClient(http)
+
+    def sync_read() -> None:
+        sync_client.table("users").select("*").eq("id", str(uuid.uuid4())).limit(1).execute()
+
+    async def threaded() -> None:
+        await asyncio.to_thread(sync_read)
+
+    async def native() -> None:
+        await async_client.table("users").select("*").eq("id", str(uuid.uuid4())).limit(1).execute()
+
+    # Warm both: connection setup is not what is being compared.
+    await _burst(threaded, 8)
+    await _burst(native, 8)
+
+    print(f"{args.concurrency} concurrent reads x {args.rounds} rounds")
+    for label, call in (("sync + to_thread", threaded), ("async client", native)):
+        samples: List[float] = []
+        for _ in range(args.rounds):
+            samples.extend(await _burst(call, args.concurrency))
+        _report(label, sorted(samples))
+
+    await async_client.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,170 @@
+"""
+Benchmark: requests/sec on the heavy GETs through the full HTTP stack — the previous
+stack (`@app.middleware("http")` body cap + timing, stdlib `JSONResponse`, the report
+served as `model_dump()` output) vs the current one (pure-ASGI middlewares,
+`FastJSONResponse`, the report served as a validated model).
+
+Both apps mount the real routers — `GET /stocks/{ticker}/report` (cache-hit path),
+`GET /home/dashboard`, `GET /whales/{id}/profile` — with auth, rate limiting and the
+data sources stubbed, so what is measured is routing, dependency resolution,
+serialization, middleware and gzip. Payloads are synthetic model instances with
+``--rows`` items per list. Requests go over an in-process ASGI transport, ``--concurrency``
+at a time, sending ``Accept-Encoding: gzip`` like the app does.
+
+Usage:
+    ./venv/bin/python scripts/bench_http_stack.py
+    ./venv/bin/python scripts/bench_http_stack.py --rows 40 --requests 400 --concurrency 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import httpx  # noqa: E402
+from fastapi import FastAPI, Request  # noqa: E402
+from fastapi.middleware.cors import CORSMiddleware  # noqa: E402
+from fastapi.middleware.gzip import GZipMiddleware  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from app import dependencies, main  # noqa: E402
+from app.api.responses import FastJSONResponse  # noqa: E402
+from app.api.v1.endpoints import home, ticker_report, whales  # noqa: E402
+from app.schemas.home_dashboard import HomeDashboardResponse  # noqa: E402
+from app.schemas.ticker_report import TickerReportResponse  # noqa: E402
+from app.schemas.whale import WhaleProfileResponse  # noqa: E402
+from bench_ticker_data_cache import _fake  # noqa: E402  (synthetic-model generator)
+
+_USER = {"id": "bench-user", "tier": "max", "is_guest": False}
+
+
+def _stub_sources(rows: int) -> None:
+    rng = random.Random(1)
+    report = _fake(TickerReportResponse, rows, rng).model_dump()
+    dashboard = _fake(HomeDashboardResponse, rows, rng)
+    profile = _fake(WhaleProfileResponse, rows, rng)
+
+    async def cached_report(ticker, persona):
+        return report
+
+    async def no_legacy(ticker, persona):
+        return None
+
+    class _Dashboard:
+        async def get_dashboard(self, user_id=None, tier=None):
+            return dashboard
+
+    class _Whales:
+        async def get_whale_profile(self, **kwargs):
+            return profile
+
+    ticker_report.get_cached_report = cached_report
+    ticker_report._check_legacy_report_cache = no_legacy
+    home.get_home_dashboard_service = lambda: _Dashboard()
+    whales.WhaleService = _Whales
+
+
+def _mount(app: FastAPI) -> FastAPI:
+    app.add_middleware(
+        CORSMiddleware, allow_origins=["*"], allow_credentials=True,
+        allow_methods=["*"], allow_headers=["*"], expose_headers=["X-Request-ID"],
+    )
+    app.add_middleware(GZipMiddleware, minimum_size=1000)
+    app.include_router(home.router, prefix="/api/v1/home")
+    app.include_router(whales.router, prefix="/api/v1/whales")
+    app.dependency_overrides[dependencies.get_current_user] = lambda: _USER
+    app.dependency_overrides[dependencies.get_watchlist_identity] = lambda: _USER
+    app.dependency_overrides[dependencies.ReportRateLimit.dependency] = lambda: None
+    return app
+
+
+def _before_app() -> FastAPI:
+    app = _mount(FastAPI(default_response_class=JSONResponse))
+
+    # The report route as it was: no response_model, `_validate_report` output dumped
+    # to dicts and walked by jsonable_encoder.
+    @app.get("/api/v1/stocks/{ticker}/report")
+    async def report(ticker: str, persona: str = "warren_buffett"):
+        result = await ticker_report.get_ticker_report(ticker, persona, _USER)
+        return result.model_dump() if hasattr(result, "model_dump") else result
+
+    @app.middleware("http")
+    async def cap_json_body(request: Request, call_next):
+        if request.method in ("PUT", "POST", "PATCH") and request.url.path.endswith(
+            main._BODY_CAPPED_PATH_SUFFIXES
+        ):
+            int(request.headers.get("content-length") or 0)
+        return await call_next(request)
+
+    @app.middleware("http")
+    async def add_process_time(request: Request, call_next):
+        start = time.time()
+        request.state.request_id = f"{int(start * 1000)}"
+        response = await call_next(request)
+        elapsed = time.time() - start
+        main.record_request_latency(elapsed)
+        response.headers["X-Process-Time"] = str(elapsed)
+        response.headers["X-Request-ID"] = request.state.request_id
+        return response
+
+    return app
+
+
+def _after_app() -> FastAPI:
+    app = _mount(FastAPI(default_response_class=FastJSONResponse))
+    app.include_router(ticker_report.router, prefix="/api/v1/stocks")
+    app.add_middleware(main.BodySizeCapMiddleware)
+    app.add_middleware(main.RequestTimingMiddleware)
+    return app
+
+
+async def _drive(app: FastAPI, path: str, requests: int, concurrency: int):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        first = await client.get(path)
+        assert first.status_code == 200, (path, first.status_code, first.text[:300])
+        queue = iter(range(requests))
+
+        async def worker():
+            for _ in queue:
+                (await client.get(path)).raise_for_status()
+
+        t0 = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - t0
+    return requests / elapsed, len(first.content)
+
+
+def main_() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rows", type=int, default=30)
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+    main.logger.disabled = True
+    _stub_sources(args.rows)
+    before, after = _before_app(), _after_app()
+
+    paths = {
+        "ticker report": "/api/v1/stocks/AAPL/report",
+        "home dashboard": "/api/v1/home/dashboard",
+        "whale profile": "/api/v1/whales/bench/profile",
+    }
+    print(f"{args.requests} requests per route, {args.concurrency} concurrent, "
+          f"{args.rows} rows per list")
+    print(f"  {'':<16}{'body KB':>9}{'before req/s':>15}{'after req/s':>14}{'speedup':>9}")
+    for label, path in paths.items():
+        rps_before, size = asyncio.run(_drive(before, path, args.requests, args.concurrency))
+        rps_after, _ = asyncio.run(_drive(after, path, args.requests, args.concurrency))
+        print(f"  {label:<16}{size / 1024:>9.0f}{rps_before:>15.0f}{rps_after:>14.0f}"
+              f"{rps_after / rps_before:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main_()
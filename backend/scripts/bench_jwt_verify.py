@@ -0,0 +1,108 @@
+"""
+Micro-benchmark: per-request bearer verification cost, full signature check vs the
+verified-claims cache (`app.core.security.verified_claims`).
+
+Three token kinds, each measured cold (cache cleared before every call, i.e. what every
+request paid before) and warm (the same token again, i.e. every request after the first on
+a screen):
+
+  * app-minted access token  — `decode_token`, HS256 over SECRET_KEY
+  * Supabase legacy token    — `verify_supabase_token`, HS256 over SUPABASE_JWT_SECRET
+  * Supabase current token   — `verify_supabase_token`, ES256 against a JWKS key
+
+No network: the JWKS cache is seeded with a locally generated P-256 key.
+
+Usage:
+    ./venv/bin/python scripts/bench_jwt_verify.py
+    ./venv/bin/python scripts/bench_jwt_verify.py --iterations 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from cryptography.hazmat.primitives import serialization  # noqa: E402
+from cryptography.hazmat.primitives.asymmetric import ec  # noqa: E402
+from jose import jwk, jwt  # noqa: E402
+
+from app.core import security  # noqa: E402
+from app.core.security import create_access_token, decode_token, verified_claims  # noqa: E402
+
+
+def _measure(call: Callable[[], None], n: int, cold: bool) -> List[float]:
+    samples: List[float] = []
+    for _ in range(n):
+        if cold:
+            verified_claims.clear()
+        t0 = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - t0) * 1e6)
+    return samples
+
+
+def _report(label: str, cold: List[float], warm: List[float]) -> None:
+    c, w = statistics.median(cold), statistics.median(warm)
+    print(f"{label:<26} full verify {c:8.1f} µs   cached {w:6.2f} µs   ({c / w:6.0f}x)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--iterations", type=int, default=20_000)
+    args = parser.parse_args()
+    n = args.iterations
+    exp = datetime.now(timezone.utc) + timedelta(hours=1)
+
+    app_token = create_access_token({"sub": "u1", "email": "u@example.com"})
+
+    security.settings.SUPABASE_JWT_SECRET = "bench-legacy-secret"
+    legacy = jwt.encode({"sub": "u1", "aud": "authenticated", "exp": exp},
+                        "bench-legacy-secret", algorithm="HS256")
+
+    private = ec.generate_private_key(ec.SECP256R1())
+    pem = private.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    public_jwk = jwk.construct(
+        private.public_key().public_bytes(
+            serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+        ),
+        "ES256",
+    ).to_dict()
+    public_jwk = {k: (v.decode() if isinstance(v, bytes) else v) for k, v in public_jwk.items()}
+    public_jwk["kid"] = "bench"
+    security._JWKS_CACHE["keys"] = {"bench": public_jwk}
+    security._JWKS_CACHE["fetched_at"] = time.monotonic()
+    current = jwt.encode({"sub": "u1", "aud": "authenticated", "exp": exp}, pem,
+                         algorithm="ES256", headers={"kid": "bench"})
+
+    loop = asyncio.new_event_loop()
+
+    def sb(token: str) -> Callable[[], None]:
+        # run_until_complete adds a fixed ~15 µs to both columns of the Supabase rows.
+        return lambda: loop.run_until_complete(security.verify_supabase_token(token))
+
+    print(f"median of {n:,} calls each")
+    for label, call in (
+        ("app access (HS256)", lambda: decode_token(app_token)),
+        ("supabase legacy (HS256)", sb(legacy)),
+        ("supabase current (ES256)", sb(current)),
+    ):
+        if call() is None:
+            raise SystemExit(f"{label}: token did not verify — the benchmark is misconfigured")
+        _report(label, _measure(call, n, cold=True), _measure(call, n, cold=False))
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
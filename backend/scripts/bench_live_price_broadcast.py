@@ -0,0 +1,128 @@
+"""
+Micro-benchmark: cost of one price tick in a hot live-price room, the old sequential
+per-client `send_json` loop vs `LivePriceManager._broadcast` (encode once, queue to each
+client's outbox).
+
+For rooms of 10 / 100 / 1,000 clients, times the broadcast call itself — what the
+room's reader (and so the next tick) waits on — and the end-to-end time until every
+client has its frame. Clients are in-memory stand-ins for Starlette WebSockets: their
+`send_json` serializes the way Starlette does, their `send_text` only stores. With one
+client made slow (5 ms per send), the old loop's call time grows by that for every
+tick; the outbox path does not. No network.
+
+Usage:
+    ./venv/bin/python scripts/bench_live_price_broadcast.py
+    ./venv/bin/python scripts/bench_live_price_broadcast.py --ticks 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import app.services.live_price_manager as m  # noqa: E402
+
+
+class _Client:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.received = 0
+
+    async def send_json(self, message):
+        json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+        await self._sent()
+
+    async def send_text(self, text):
+        await self._sent()
+
+    async def _sent(self):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.received += 1
+
+    async def close(self):
+        pass
+
+
+async def _reference_broadcast(room, message):
+    """The pre-outbox `_broadcast`: one awaited send_json per client, in turn."""
+    for client in list(room.clients):
+        try:
+            await client.send_json(message)
+        except Exception:
+            room.clients.discard(client)
+
+
+class _NoUpstream:
+    async def subscribe(self, ticker):
+        pass
+
+    async def unsubscribe(self, ticker):
+        pass
+
+    async def close(self):
+        pass
+
+    def __len__(self):
+        return 0
+
+
+async def _room(size: int, slow: bool):
+    mgr = m.LivePriceManager()
+    mgr._upstream = _NoUpstream()
+
+    async def no_quote(room):
+        room.previous_close = 100.0
+
+    mgr._fetch_previous_close = no_quote
+    clients = [_Client(0.005 if slow and i == 0 else 0.0) for i in range(size)]
+    for c in clients:
+        await mgr.subscribe("SPY", c)
+    return mgr, mgr._rooms["SPY"], clients
+
+
+async def _run(size: int, ticks: int, slow: bool, reference: bool) -> tuple[float, float]:
+    mgr, room, clients = await _room(size, slow)
+    message = {"type": "price_update", "symbol": "SPY", "price": 500.25, "change": 1.5,
+               "change_percent": 0.3, "volume": 42_500_000, "timestamp": 1_760_000_000}
+    fast = clients[1:] if slow else clients
+    call = 0.0
+    t0 = time.perf_counter()
+    for _ in range(ticks):
+        c0 = time.perf_counter()
+        if reference:
+            await _reference_broadcast(room, message)
+        else:
+            await mgr._broadcast(room, message)
+        call += time.perf_counter() - c0
+        await asyncio.sleep(0)
+    while any(c.received < ticks for c in fast):
+        await asyncio.sleep(0)
+    total = time.perf_counter() - t0
+    await mgr.shutdown()
+    return call / ticks * 1e6, total / ticks * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--ticks", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{args.ticks} ticks per room; µs per tick (broadcast call / all fast clients served)")
+    print(f"{'clients':>8} {'slow':>5}  {'sequential send_json':>24}  {'encode once + outboxes':>24}")
+    for size in (10, 100, 1000):
+        for slow in (False, True):
+            ref = asyncio.run(_run(size, args.ticks, slow, reference=True))
+            new = asyncio.run(_run(size, args.ticks, slow, reference=False))
+            print(f"{size:>8} {'yes' if slow else 'no':>5}  "
+                  f"{ref[0]:>10.0f} / {ref[1]:>10.0f}  {new[0]:>10.0f} / {new[1]:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
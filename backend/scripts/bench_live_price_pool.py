@@ -0,0 +1,134 @@
+"""
+Micro-benchmark: what the live-price upstream costs per 1,000 watched tickers, one FMP
+socket per ticker vs the pooled sockets of `app.services.live_price_manager`.
+
+A local fake FMP server (tests/fake_fmp_ws.py) runs in its own process so its sockets
+and memory don't count. Each layout then runs in a fresh process: a `LivePriceManager`
+opens a room per ticker (one dummy client each) until every upstream socket is
+connected and subscribed, and reports the growth in open file descriptors, RSS and
+asyncio tasks, plus the time to get there:
+
+  * per-ticker — the pool capped at one ticker per socket: the original layout
+  * pooled     — the configured `LIVE_PRICE_UPSTREAM_*` pool
+
+Plain ws:// on loopback, so the TLS session each real socket also carries is NOT in
+these numbers; it only widens the gap. No network.
+
+Usage:
+    ./venv/bin/python scripts/bench_live_price_pool.py
+    ./venv/bin/python scripts/bench_live_price_pool.py --tickers 3000 --per-socket 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import multiprocessing as mp
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import app.services.live_price_manager as m  # noqa: E402
+from tests.fake_fmp_ws import FakeFMPServer, eventually  # noqa: E402
+
+
+def _serve(conn) -> None:
+    async def run():
+        server = FakeFMPServer()
+        await server.start()
+        conn.send(server.url)
+        await asyncio.Event().wait()
+
+    asyncio.run(run())
+
+
+def _fds() -> int:
+    return len(os.listdir("/proc/self/fd"))
+
+
+def _rss_kb() -> int:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+class _Client:
+    async def send_json(self, message):
+        pass
+
+    async def close(self):
+        pass
+
+
+def _measure(url: str, tickers: int, per_socket: int, sockets: int, conn) -> None:
+    async def run():
+        m.FMP_WS_URL_STOCK = url
+        mgr = m.LivePriceManager()
+        mgr._upstream = m.FMPUpstreamPool(
+            mgr._on_tick, mgr._on_upstream_lost,
+            symbols_per_socket=per_socket, sockets_per_endpoint=sockets,
+        )
+
+        async def no_quote(room):
+            room.previous_close = 100.0
+
+        mgr._fetch_previous_close = no_quote
+        fds, rss, tasks = _fds(), _rss_kb(), len(asyncio.all_tasks())
+        t0 = time.perf_counter()
+        for i in range(tickers):
+            await mgr.subscribe(f"T{i:05d}", _Client())
+        pool = mgr._upstream
+        await eventually(
+            lambda: all(s.ws is not None for g in pool._sockets.values() for s in g),
+            timeout=120,
+        )
+        elapsed = time.perf_counter() - t0
+        conn.send((len(pool), _fds() - fds, _rss_kb() - rss,
+                   len(asyncio.all_tasks()) - tasks, elapsed))
+        await mgr.shutdown()
+
+    asyncio.run(run())
+
+
+def _run(target, *args):
+    parent, child = mp.Pipe()
+    proc = mp.Process(target=target, args=(*args, child), daemon=True)
+    proc.start()
+    return proc, parent
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--tickers", type=int, default=1000)
+    parser.add_argument("--per-socket", type=int,
+                        default=m.settings.LIVE_PRICE_UPSTREAM_SYMBOLS_PER_SOCKET)
+    parser.add_argument("--sockets", type=int,
+                        default=m.settings.LIVE_PRICE_UPSTREAM_SOCKETS_PER_ENDPOINT)
+    args = parser.parse_args()
+
+    server, pipe = _run(_serve)
+    url = pipe.recv()
+    print(f"{args.tickers} stock tickers, one client each, fake FMP at {url}")
+    print(f"{'layout':<12} {'sockets':>8} {'fds':>7} {'rss MB':>8} {'tasks':>7} "
+          f"{'ready s':>8}   per 1,000 tickers: fds / rss MB")
+    try:
+        for label, per_socket, sockets in (
+            ("per-ticker", 1, args.tickers),
+            ("pooled", args.per_socket, args.sockets),
+        ):
+            proc, result = _run(_measure, url, args.tickers, per_socket, sockets)
+            count, fds, rss_kb, tasks, elapsed = result.recv()
+            proc.join()
+            scale = 1000 / args.tickers
+            print(f"{label:<12} {count:>8} {fds:>7} {rss_kb / 1024:>8.1f} {tasks:>7} "
+                  f"{elapsed:>8.2f}   {fds * scale:>7.0f} / {rss_kb / 1024 * scale:.1f}")
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""
+Benchmark: one price-alert cycle at 50,000 rules — the old per-rule loop (an awaited
+UPDATE per rule, a `notify_users` call per fired rule) vs the set-based
+`PriceAlertService.evaluate_once` (diff in memory, chunked `apply_price_alert_states`
+writes, one `notify_each` fan-out).
+
+Supabase and APNs are in-memory stand-ins; every database round-trip sleeps
+``--rtt-ms`` in a worker thread, which is where the old loop spent its minute. A share
+of the rules (``--moved``) sees a new price this cycle and a smaller share
+(``--fired``) crosses its threshold; the rest are unchanged. The old loop is strictly
+serial per rule, so it is timed on the first ``--reference-sample`` rules and scaled.
+
+Usage:
+    ./venv/bin/python scripts/bench_price_alert_cycle.py
+    ./venv/bin/python scripts/bench_price_alert_cycle.py --rules 20000 --rtt-ms 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.config import settings  # noqa: E402
+from app.services import price_alert_service as pas  # noqa: E402
+from app.services import push_dispatch_service as pds  # noqa: E402
+from app.services.notification_kinds import KIND_PRICE_ALERT  # noqa: E402
+from app.services.price_alert_engine import evaluate_alert  # noqa: E402
+from app.services.price_bus import PriceBus  # noqa: E402
+
+_TICKERS = 400
+
+
+class _Counter:
+    def __init__(self, rtt: float):
+        self.rtt = rtt
+        self.trips = 0
+
+    def trip(self):
+        self.trips += 1
+        time.sleep(self.rtt)
+
+
+class _Query:
+    def __init__(self, db):
+        self.db = db
+        self.lo, self.hi = 0, None
+
+    def select(self, *a):
+        return self
+
+    def eq(self, *a):
+        return self
+
+    def in_(self, *a):
+        return self
+
+    def order(self, *a, **k):
+        return self
+
+    def limit(self, n):
+        return self
+
+    def range(self, lo, hi):
+        self.lo, self.hi = lo, hi
+        return self
+
+    def update(self, patch):
+        return self
+
+    def insert(self, row):
+        return self
+
+    def execute(self):
+        self.db.counter.trip()
+        data = self.db.rules[self.lo:self.hi + 1] if self.hi is not None else []
+        return type("R", (), {"data": data})()
+
+
+class _DB:
+    def __init__(self, rules, counter):
+        self.rules = rules
+        self.counter = counter
+
+    def table(self, name):
+        return _Query(self)
+
+    def rpc(self, name, params):
+        counter = self.counter
+        n = len(params.get("p_rows") or [])
+
+        class _Call:
+            def execute(self):
+                counter.trip()
+                return type("R", (), {"data": n})()
+
+        return _Call()
+
+
+class _Push:
+    enabled = True
+
+    async def send_to_user(self, *a, **k):
+        return 1
+
+
+def _dispatcher(db, counter) -> pds.PushDispatchService:
+    svc = object.__new__(pds.PushDispatchService)
+    svc.supabase = db
+    svc._push = _Push()
+
+    def _resolve(user_ids, kind, now):
+        for _ in range(4):  # prefs, cap counts, devices, unread: four bulk reads
+            counter.trip()
+        return {u: pds._Recipient(user_id=u, devices=[{"token": u}]) for u in user_ids}
+
+    svc.resolve_recipients = _resolve
+    svc.claim_send = lambda *a, **k: counter.trip() or True
+    svc.mark_state = lambda *a, **k: counter.trip()
+    return svc
+
+
+def _rules(n: int, moved: float, fired: float):
+    rules = []
+    for i in range(n):
+        frac = (i % 1000) / 1000
+        # Fired rules sit below a 140 line the quote (150) is now above; moved rules
+        # saw a different price last cycle; the rest already hold this cycle's state.
+        last = 130.0 if frac < fired else (149.0 if frac < moved else 150.0)
+        rules.append({
+            "id": f"r{i}", "user_id": f"u{i % 20000}", "ticker": f"T{i % _TICKERS}",
+            "asset_type": "stock", "kind": "price_above", "threshold": 140.0,
+            "repeat_mode": "daily", "armed": True, "last_price": last, "trigger_count": 0,
+        })
+    return rules
+
+
+def _bus() -> PriceBus:
+    bus = PriceBus()
+    for t in range(_TICKERS):
+        bus.publish_quote({"symbol": f"T{t}", "price": 150.0, "changePercentage": 1.0})
+    return bus
+
+
+async def _reference(svc: pas.PriceAlertService, rules, dispatcher) -> None:
+    """The pre-batch evaluate_once body: persist and notify one rule at a time."""
+    by_symbol = await _bus().get_quotes([f"T{t}" for t in range(_TICKERS)])
+    for rule in rules:
+        quote = by_symbol.get(rule["ticker"])
+        decision = evaluate_alert(
+            kind=rule["kind"], threshold=rule["threshold"], repeat_mode=rule["repeat_mode"],
+            armed=rule["armed"], last_price=rule["last_price"], price=quote["price"],
+            change_percent=quote["changePercentage"], rearm_pct=settings.PRICE_ALERT_REARM_PCT,
+        )
+        await asyncio.to_thread(svc._persist, rule, decision)
+        if not decision.fire:
+            continue
+        title, body = svc.fire_copy(rule, quote["price"], decision)
+        await dispatcher.notify_users(
+            [rule["user_id"]], kind=KIND_PRICE_ALERT, title=title, body=body,
+            dedup_key=svc.dedup_key(rule, "daily"),
+            route={"ticker": rule["ticker"], "route": "ticker"},
+        )
+
+
+def _setup(rules, rtt):
+    counter = _Counter(rtt)
+    db = _DB(rules, counter)
+    pas.get_supabase = lambda: db
+    svc = pas.PriceAlertService()
+    svc._active_universe = lambda: [f"T{t}" for t in range(_TICKERS)]
+    return svc, _dispatcher(db, counter), counter
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rules", type=int, default=50_000)
+    parser.add_argument("--rtt-ms", type=float, default=1.0)
+    parser.add_argument("--moved", type=float, default=0.20, help="share with a new price")
+    parser.add_argument("--fired", type=float, default=0.01, help="share crossing this cycle")
+    parser.add_argument("--reference-sample", type=int, default=5_000)
+    args = parser.parse_args()
+    settings.PUSH_DRY_RUN = False
+    rtt = args.rtt_ms / 1000
+    rules = _rules(args.rules, args.moved, args.fired)
+
+    sample = rules[:min(args.reference_sample, len(rules))]
+    svc, dispatcher, counter = _setup(sample, rtt)
+    t0 = time.perf_counter()
+    asyncio.run(_reference(svc, sample, dispatcher))
+    scale = len(rules) / len(sample)
+    ref_s, ref_trips = (time.perf_counter() - t0) * scale, int(counter.trips * scale)
+
+    svc, dispatcher, counter = _setup(rules, rtt)
+    pas.get_price_bus = _bus
+    pas.get_push_dispatch_service = lambda: dispatcher
+    t0 = time.perf_counter()
+    stats = asyncio.run(svc.evaluate_once())
+    new_s, new_trips = time.perf_counter() - t0, counter.trips
+
+    print(f"{args.rules:,} rules over {_TICKERS} tickers, {args.rtt_ms:g} ms per round-trip; "
+          f"{args.moved:.0%} moved, {args.fired:.0%} fired")
+    print(f"  cycle stats: {stats}")
+    print(f"  {'':<26}{'round-trips':>12}{'seconds':>10}")
+    print(f"  {'per-rule loop (scaled)':<26}{ref_trips:>12,}{ref_s:>10.1f}")
+    print(f"  {'set-based evaluate_once':<26}{new_trips:>12,}{new_s:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Micro-benchmark: checking one new price against the alert rules — `evaluate_alert` over
+every rule on the symbol (what a cycle did per quote) vs `PriceAlertIndex.crossed`
+(bisect to the rules whose boundary the price passed).
+
+Rules are spread over ``--symbols`` symbols with thresholds scattered ±20% around the
+price; each tick moves the price a few basis points, so almost every tick crosses
+nothing — the common case for a live feed. No I/O.
+
+Usage:
+    ./venv/bin/python scripts/bench_price_alert_index.py
+    ./venv/bin/python scripts/bench_price_alert_index.py --rules 200000 --symbols 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.price_alert_engine import evaluate_alert  # noqa: E402
+from app.services.price_alert_index import PriceAlertIndex  # noqa: E402
+
+_REARM = 0.005
+
+
+def _rules(n: int, symbols: int, rng: random.Random):
+    out = []
+    for i in range(n):
+        kind = rng.choice(["price_above", "price_below", "percent_move"])
+        threshold = rng.uniform(2, 10) if kind == "percent_move" else 100 * rng.uniform(0.8, 1.2)
+        out.append({
+            "id": f"r{i}", "ticker": f"S{i % symbols}", "kind": kind, "threshold": threshold,
+            "repeat_mode": "daily", "armed": True, "last_price": 100.0,
+        })
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rules", type=int, default=50_000)
+    parser.add_argument("--symbols", type=int, default=1)
+    parser.add_argument("--ticks", type=int, default=2_000)
+    args = parser.parse_args()
+    rng = random.Random(1)
+    rules = _rules(args.rules, args.symbols, rng)
+    by_symbol = {}
+    for r in rules:
+        by_symbol.setdefault(r["ticker"], []).append(r)
+
+    t0 = time.perf_counter()
+    index = PriceAlertIndex(_REARM)
+    index.replace(rules)
+    build_ms = (time.perf_counter() - t0) * 1e3
+
+    ticks = [(f"S{rng.randrange(args.symbols)}", 100 * (1 + rng.uniform(-0.002, 0.002)),
+              rng.uniform(-1, 1)) for _ in range(args.ticks)]
+
+    t0 = time.perf_counter()
+    scanned = 0
+    for symbol, price, move in ticks[: max(1, args.ticks // 20)]:
+        for r in by_symbol[symbol]:
+            evaluate_alert(kind=r["kind"], threshold=r["threshold"],
+                           repeat_mode=r["repeat_mode"], armed=r["armed"],
+                           last_price=r["last_price"], price=price, change_percent=move,
+                           rearm_pct=_REARM)
+            scanned += 1
+    scan_us = (time.perf_counter() - t0) / max(1, args.ticks // 20) * 1e6
+
+    t0 = time.perf_counter()
+    touched = 0
+    for symbol, price, move in ticks:
+        touched += len(index.crossed(symbol, price, move))
+    index_us = (time.perf_counter() - t0) / args.ticks * 1e6
+
+    per_symbol = args.rules // args.symbols
+    print(f"{args.rules:,} rules over {args.symbols} symbol(s) (~{per_symbol:,} per symbol); "
+          f"index built in {build_ms:.0f} ms")
+    print(f"  full scan, evaluate_alert per rule : {scan_us:>10.1f} µs per tick")
+    print(f"  PriceAlertIndex.crossed            : {index_us:>10.1f} µs per tick "
+          f"({touched / args.ticks:.1f} rules touched on average)")
+
+
+if __name__ == "__main__":
+    main()
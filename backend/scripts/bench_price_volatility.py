@@ -0,0 +1,125 @@
+"""
+Micro-benchmark: the price-volatility math over a whole universe, list-based loops vs
+the NumPy panel (`app.services.price_volatility`).
+
+A synthetic universe of random-walk closes — by default 3,000 symbols × 5 years
+(1,260 trading days) on one shared business-day axis, with a sprinkling of short
+histories and bad closes — scored three ways:
+
+  * reference — the pre-vectorization pure-Python loops (frozen in
+    tests/test_price_volatility_vectorized.py), one symbol at a time
+  * per-symbol — `_compute_price_volatility`, one symbol at a time
+  * panel      — `_price_panel` + `_compute_price_volatility_batch`, all symbols at once
+
+plus the σ-only pass the daily precompute runs (`_sigma_daily_batch`). No network.
+
+Usage:
+    ./venv/bin/python scripts/bench_price_volatility.py
+    ./venv/bin/python scripts/bench_price_volatility.py --symbols 500 --years 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+from typing import Callable, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.price_volatility import (  # noqa: E402
+    _BASELINE_DAYS,
+    _compute_price_volatility,
+    _compute_price_volatility_batch,
+    _day_axis,
+    _price_panel,
+    _sigma_daily_batch,
+)
+from tests.test_price_volatility_vectorized import (  # noqa: E402
+    _reference_compute_price_volatility,
+    _reference_daily_returns,
+    _reference_std_dev_pop,
+)
+
+
+def _universe(symbols: int, bars: int, seed: int = 7):
+    rng = random.Random(seed)
+    axis: List[date] = []
+    d = date(2026, 6, 30)
+    while len(axis) < bars:
+        if d.weekday() < 5:
+            axis.append(d)
+        d -= timedelta(days=1)
+    axis.reverse()
+    series: List[List[float]] = []
+    for i in range(symbols):
+        n = bars if i % 10 else rng.randint(20, bars)  # every 10th: a recent listing
+        p, vol = rng.uniform(5, 500), rng.choice([0.008, 0.015, 0.03, 0.06])
+        closes = []
+        for _ in range(n):
+            p *= 1 + rng.gauss(0, vol)
+            closes.append(p)
+        if i % 17 == 0:
+            closes[rng.randrange(n)] = float("nan")
+        series.append(closes)
+    return axis, series
+
+
+def _time(call: Callable[[], object], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples) * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--symbols", type=int, default=3000)
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    axis, series = _universe(args.symbols, args.years * 252)
+    print(f"{args.symbols} symbols × {len(axis)} bars")
+
+    def reference():
+        for s in series:
+            _reference_compute_price_volatility(s, axis[-len(s):])
+
+    day_axis = _day_axis(axis)  # built once, as `_build_price_action` does per report
+    width = _BASELINE_DAYS + 1
+
+    def per_symbol():
+        for s in series:
+            _compute_price_volatility(s, day_axis[-len(s):])
+
+    def panel():
+        closes, lengths = _price_panel(series, width=width)
+        _compute_price_volatility_batch(closes, lengths, dates=day_axis[-width:])
+
+    def sigma_reference():
+        for s in series:
+            _reference_std_dev_pop(_reference_daily_returns(s[-(_BASELINE_DAYS + 1):]))
+
+    def sigma_panel():
+        closes, _ = _price_panel(series, width=width)
+        _sigma_daily_batch(closes)
+
+    ref = _time(reference, args.repeat)
+    for label, call in (("reference (lists)", reference), ("per-symbol (NumPy)", per_symbol),
+                        ("panel (NumPy)", panel)):
+        ms = ref if call is reference else _time(call, args.repeat)
+        print(f"{label:<22} full volatility {ms:9.1f} ms   ({ref / ms:5.1f}x)")
+    sref = _time(sigma_reference, args.repeat)
+    spanel = _time(sigma_panel, args.repeat)
+    print(f"{'σ only':<22} reference {sref:9.1f} ms   panel {spanel:7.1f} ms   ({sref / spanel:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Micro-benchmark: per-check cost of `RateLimiter.is_allowed` at 100k tracked keys.
+
+Compares the in-memory sliding window (timestamp list per key, OrderedDict LRU) with the
+Redis GCRA backend (one scalar per key, one atomic script call per check). The tracked-key
+table is pre-filled first, because that is where the in-memory limiter's cost lives: list
+rebuilds per check, LRU maintenance, eviction once the table is at its cap.
+
+The in-memory cap is raised to the key count for the run so the table really holds 100k
+keys (production caps each pool at 20k and evicts past it).
+
+Usage:
+    # In-memory vs fakeredis (no server needed). fakeredis emulates Lua in-process and is
+    # ~100x slower than a real server — use it to check the run works, not to quote numbers:
+    ./venv/bin/python scripts/bench_rate_limiter.py
+
+    # Against a real server (includes the network round-trip that dominates in production):
+    ./venv/bin/python scripts/bench_rate_limiter.py --redis-url redis://localhost:6379/15
+
+⚠️  --redis-url FLUSHES the `caydex:rl:*` keys on that database when it finishes. Point it
+    at a scratch DB, never at the production limiter.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Callable, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.core.redis_rate_limit import RedisRateLimitBackend  # noqa: E402
+from app.core.security import RateLimiter  # noqa: E402
+
+
+def _measure(check: Callable[[str], bool], keys: List[str], n: int) -> List[float]:
+    samples: List[float] = []
+    for _ in range(n):
+        key = random.choice(keys)
+        t0 = time.perf_counter()
+        check(key)
+        samples.append((time.perf_counter() - t0) * 1e6)
+    return samples
+
+
+def _report(label: str, samples: List[float]) -> None:
+    samples.sort()
+    p50 = samples[len(samples) // 2]
+    p99 = samples[int(len(samples) * 0.99)]
+    print(
+        f"{label:<28} mean {statistics.fmean(samples):8.1f} µs   "
+        f"p50 {p50:8.1f} µs   p99 {p99:8.1f} µs"
+    )
+
+
+def _fill_and_measure(label: str, rl: RateLimiter, keys: List[str], checks: int) -> None:
+    t0 = time.perf_counter()
+    for key in keys:
+        rl.is_allowed(key, max_requests=15, window_seconds=60)
+    fill = time.perf_counter() - t0
+    print(f"{label}: filled {len(keys):,} keys in {fill:.2f}s")
+    _report(
+        f"{label} (hot check)",
+        _measure(lambda k: rl.is_allowed(k, max_requests=15, window_seconds=60), keys, checks),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--keys", type=int, default=100_000)
+    parser.add_argument("--checks", type=int, default=20_000)
+    parser.add_argument("--redis-url", default=None)
+    args = parser.parse_args()
+
+    keys = [f"guest:{i:08d}" for i in range(args.keys)]
+
+    memory = RateLimiter()
+    memory._MAX_TRACKED = args.keys
+    _fill_and_measure("memory", memory, keys, args.checks)
+
+    if args.redis_url:
+        import redis
+
+        client = redis.Redis.from_url(args.redis_url)
+        label = "redis"
+    else:
+        try:
+            import fakeredis
+        except ImportError:
+            print("fakeredis not installed and no --redis-url given — skipping the GCRA run")
+            return
+        client = fakeredis.FakeRedis()
+        label = "fakeredis"
+
+    shared = RateLimiter()
+    backend = RedisRateLimitBackend(client)
+    shared.set_backend(backend)
+    try:
+        _fill_and_measure(label, shared, keys, args.checks)
+        used = client.info("memory").get("used_memory_human") if args.redis_url else "n/a"
+        print(f"{label}: server memory {used}; fallbacks to memory: {backend.errors}")
+    finally:
+        backend.clear()
+
+
+if __name__ == "__main__":
+    main()
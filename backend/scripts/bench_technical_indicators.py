@@ -0,0 +1,128 @@
+"""
+Micro-benchmark: technical-analysis gauges for a whole universe, the per-ticker ``ta``
+path vs the NumPy panel sweep (`app.services.technical_indicators`).
+
+A synthetic universe — by default 500 symbols × ~600 calendar days of business-day
+bars (~413 daily / ~86 weekly), with a sprinkling of recent listings so the panel
+runs more than one length bucket — scored three ways:
+
+  * ta path — per ticker: `_daily_to_weekly` + `_compute_timeframe_signal` on the
+    daily and weekly frames, exactly what `_build_analysis` runs after its fetch
+  * panel   — `TechnicalAnalysisService.compute_analysis_batch` over every ticker
+  * incremental — per ticker, the stored daily + weekly `SeriesState`s advanced over
+    the newest bar: the warm path of `_build_analysis` from its short window of bars
+    (resample included) to both timeframes' values, minus the fetch itself
+
+Reports total and per-ticker cost. No network.
+
+Usage:
+    ./venv/bin/python scripts/bench_technical_indicators.py
+    ./venv/bin/python scripts/bench_technical_indicators.py --symbols 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import Callable, List
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.indicator_state import SeriesState  # noqa: E402
+from app.services.price_history_store import DailyBars  # noqa: E402
+from app.services.technical_analysis_service import (  # noqa: E402
+    TechnicalAnalysisService,
+    _timeframe_columns,
+)
+
+
+def _universe(symbols: int, bars: int, seed: int = 7) -> List[pd.DataFrame]:
+    rng = np.random.default_rng(seed)
+    index = pd.DatetimeIndex(pd.bdate_range(end="2026-06-30", periods=bars), name="date")
+    frames = []
+    for i in range(symbols):
+        n = bars if i % 10 else int(rng.integers(30, bars))  # every 10th: a recent listing
+        close = rng.uniform(5, 500) * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+        spread = np.abs(rng.normal(0, 0.01, n))
+        frames.append(pd.DataFrame({
+            "open": close * (1 + rng.normal(0, 0.005, n)),
+            "high": close * (1 + spread),
+            "low": close * (1 - spread),
+            "close": close,
+            "volume": rng.integers(1_000, 5_000_000, n).astype(float),
+        }, index=index[-n:]))
+    return frames
+
+
+def _time(call: Callable[[], object], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples) * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--symbols", type=int, default=500)
+    parser.add_argument("--bars", type=int, default=413)  # ~600 calendar days
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    frames = _universe(args.symbols, args.bars)
+    svc = object.__new__(TechnicalAnalysisService)  # no FMP client: nothing is fetched
+    bars = [
+        DailyBars(
+            f"T{i}",
+            df.index.values.astype("datetime64[D]"),
+            *(df[c].to_numpy() for c in ("open", "high", "low", "close", "volume")),
+        )
+        for i, df in enumerate(frames)
+    ]
+    print(f"{args.symbols} symbols × up to {args.bars} daily bars")
+
+    def ta_path():
+        for df in frames:
+            svc._compute_timeframe_signal(df)
+            svc._compute_timeframe_signal(svc._daily_to_weekly(df))
+
+    def panel():
+        svc.compute_analysis_batch(bars)
+
+    # States settled through yesterday, then today's bar arrives. The window starts
+    # where `_advance_analysis` fetches from: the first day of the last settled week.
+    seeded = []
+    for b in bars:
+        columns = _timeframe_columns(b._slice(0, len(b) - 1), is_crypto=False)
+        states = {tf: SeriesState.from_bars(*cols)[0] for tf, cols in columns.items()}
+        since = min(states["daily"].last_day, states["weekly"].last_day - 6)
+        start = int(np.searchsorted(b.dates.astype("datetime64[D]").astype(np.int64), since))
+        seeded.append((states, b._slice(start, len(b))))
+    for states, window in seeded[:5]:
+        columns = _timeframe_columns(window, is_crypto=False)
+        assert all(st.advance(*columns[tf]) is not None for tf, st in states.items())
+
+    def incremental():
+        for states, window in seeded:
+            columns = _timeframe_columns(window, is_crypto=False)
+            for tf, state in states.items():
+                state.advance(*columns[tf])
+
+    ref = _time(ta_path, args.repeat)
+    fast = _time(panel, args.repeat)
+    inc = _time(incremental, args.repeat)
+    for label, ms in (("ta path (per ticker)", ref), ("panel (NumPy)", fast),
+                      ("incremental (state)", inc)):
+        per = ms * 1e3 / args.symbols
+        print(f"{label:<22} {ms:9.1f} ms total   {per:8.1f} µs/ticker   ({ref / ms:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+Benchmark: reading one cached `ticker_data_cache` collection — the JSONB row (parse,
+re-validate every model, then `collect()`'s deep copy) vs the binary row (decompress,
+decode five small fields, deep-copy bytes; the rest decode when first read).
+
+The collection is synthetic but large-cap sized: ``--quarters`` of income / balance /
+cash-flow / metrics / ratios rows, ``--days`` of daily bars, news, insider trades, peers,
+and every Pydantic model in the registry filled with ``--rows`` rows per list. The
+per-persona pass is modelled by touching ``--touch`` fields after the copy (what
+`assemble_report` and `build_financial_context` read); ``--touch all`` reads every field.
+
+"Row bytes" is the size the column's value adds to the PostgREST response body.
+
+Usage:
+    ./venv/bin/python scripts/bench_ticker_data_cache.py
+    ./venv/bin/python scripts/bench_ticker_data_cache.py --rows 200 --touch all
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import dataclasses
+import datetime as dt
+import enum
+import json
+import os
+import random
+import sys
+import time
+import typing
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from pydantic import BaseModel  # noqa: E402
+
+from app.services import ticker_data_cache as tdc  # noqa: E402
+from app.services.agents.ticker_report_data_collector import CollectedTickerData  # noqa: E402
+
+# What the per-persona layer reads off a cached collection (assemble_report,
+# build_financial_context, the Stage B snapshot-card block).
+_PERSONA_FIELDS = (
+    "holders_response", "signal_of_confidence", "earnings", "growth_chart", "profit_power",
+    "industry_tam", "sector_aggregates", "analyst_analysis", "snap_profitability",
+    "snap_health", "snap_growth", "snap_valuation", "quote", "income", "estimates",
+    "insider_trades", "news", "moat_grounded_pillars", "price_action_partial",
+)
+
+
+def _fake(annotation, rows: int, rng: random.Random, depth: int = 0):
+    """A valid value for ``annotation``: lists get ``rows`` items, models recurse."""
+    origin, args = typing.get_origin(annotation), typing.get_args(annotation)
+    if origin is typing.Union:
+        return _fake(next(a for a in args if a is not type(None)), rows, rng, depth)
+    if origin is typing.Literal:
+        return args[0]
+    if origin in (list, typing.List):
+        n = rows if depth < 2 else 3
+        return [_fake(args[0] if args else str, rows, rng, depth + 1) for _ in range(n)]
+    if origin in (dict, typing.Dict):
+        return {f"k{i}": _fake(args[1] if args else float, rows, rng, depth + 1) for i in range(4)}
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return annotation(**{
+                name: _fake(f.annotation, rows, rng, depth + 1)
+                for name, f in annotation.model_fields.items()
+            })
+        if issubclass(annotation, enum.Enum):
+            return next(iter(annotation))
+        if issubclass(annotation, bool):
+            return rng.random() < 0.5
+        if issubclass(annotation, int):
+            return rng.randint(0, 10**9)
+        if issubclass(annotation, float):
+            return rng.uniform(-1e6, 1e9)
+        if issubclass(annotation, dt.datetime):
+            return dt.datetime(2026, 6, 1, tzinfo=dt.timezone.utc)
+        if issubclass(annotation, dt.date):
+            return dt.date(2026, 6, 1)
+    return f"value-{rng.randint(0, 10**6)}"
+
+
+def _statement(quarters: int, rng: random.Random, keys: int = 40):
+    return [{"date": f"{2016 + q // 4}-{3 * (q % 4) + 3:02d}-30",
+             **{f"metric{k}": rng.uniform(-1e10, 1e11) for k in range(keys)}}
+            for q in range(quarters)]
+
+
+def _collection(args, rng: random.Random) -> CollectedTickerData:
+    out = CollectedTickerData(ticker="AAPL", persona_key="warren_buffett")
+    out.profile = {"symbol": "AAPL", "companyName": "Apple Inc.", "sector": "Technology",
+                   "description": "x" * 1500}
+    out.quote = {"symbol": "AAPL", "price": 190.0, "changePercentage": 0.4}
+    for name in ("income", "balance", "cash_flow", "key_metrics", "ratios"):
+        setattr(out, name, _statement(args.quarters, rng))
+    out.estimates = _statement(12, rng, keys=20)
+    out.historical = {"historical": [
+        {"date": f"d{i}", "open": rng.uniform(100, 200), "high": rng.uniform(100, 200),
+         "low": rng.uniform(100, 200), "close": rng.uniform(100, 200),
+         "volume": rng.randint(10**7, 10**8)} for i in range(args.days)]}
+    out.news = [{"title": f"headline {i}", "text": "y" * 400, "site": "reuters.com",
+                 "publishedDate": "2026-06-01"} for i in range(50)]
+    out.insider_trades = [{"reportingName": f"Insider {i}", "securitiesTransacted": i * 100,
+                           "price": rng.uniform(100, 200), "transactionType": "S-Sale"}
+                          for i in range(200)]
+    out.peer_profiles = [{"symbol": f"P{i}", "mktCap": rng.uniform(1e9, 3e12)} for i in range(12)]
+    out.transcript = "z" * 60_000
+    out.computed = {"current_price": 190.0, "roe": 150.0,
+                    "recent_prices": [rng.uniform(150, 200) for _ in range(250)],
+                    "recent_price_dates": [dt.date(2026, 1, 1) + dt.timedelta(days=i)
+                                           for i in range(250)]}
+    out.meta = {"symbol": "AAPL", "agent": "buffett"}
+    out.moat_grounded_pillars = {p: {"score": 7.0, "evidence": "e" * 300}
+                                 for p in ("Brand", "Network", "Cost", "Switching", "IP")}
+    for name, model in tdc._PYDANTIC_FIELDS.items():
+        setattr(out, name, _fake(model, args.rows, rng))
+    for name, (cls, _) in tdc._DATACLASS_FIELDS.items():
+        setattr(out, name, cls(**{f.name: _fake(f.type if not isinstance(f.type, str)
+                                                 else float, args.rows, rng)
+                                  for f in dataclasses.fields(cls)}))
+    return out
+
+
+def _timed(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--quarters", type=int, default=40)
+    parser.add_argument("--days", type=int, default=1260)
+    parser.add_argument("--rows", type=int, default=60)
+    parser.add_argument("--touch", default="persona", choices=["persona", "all", "none"])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    rng = random.Random(1)
+    out = _collection(args, rng)
+    names = {f.name for f in dataclasses.fields(CollectedTickerData)}
+    touch = {"persona": _PERSONA_FIELDS, "all": tuple(sorted(names)), "none": ()}[args.touch]
+
+    payload = tdc._serialize(out)
+    assert payload is not None, "synthetic collection did not serialize"
+    body = json.dumps(payload)
+    blob = tdc.encode_collection(payload)
+
+    def jsonb_read():
+        base = tdc._deserialize(json.loads(body), names)
+        copied = copy.deepcopy(base)
+        for name in touch:
+            getattr(copied, name)
+
+    def binary_read():
+        base = tdc._deserialize_binary(blob, names)
+        copied = copy.deepcopy(base)
+        for name in touch:
+            getattr(copied, name)
+
+    jsonb_ms = _timed(jsonb_read, args.repeat)
+    binary_ms = _timed(binary_read, args.repeat)
+    frame = "zstd" if tdc._zstd else "zlib"
+    records = "msgpack" if tdc._msgpack else "json"
+    print(f"collection: {args.quarters} quarters, {args.days} daily bars, {args.rows} rows per "
+          f"model list; touching {len(touch)} of {len(names)} fields ({args.touch})")
+    print(f"binary row: {frame} frame of {records} records")
+    print(f"  {'':<30}{'row KB':>10}{'read + copy + touch ms':>26}")
+    print(f"  {'JSONB collected_data':<30}{len(body) / 1024:>10.0f}{jsonb_ms:>26.1f}")
+    print(f"  {'binary collected_blob':<30}{len(blob) / 1024:>10.0f}{binary_ms:>26.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Benchmark: one `ticker_report_cache` hit — a JSONB row read (what every hit was), a
+compressed-row read (TICKER_REPORT_CACHE_COMPRESSED), and the in-process tier.
+
+Supabase is an in-memory stand-in that sleeps ``--rtt-ms`` per read and hands back the
+row the way PostgREST does: as a JSON response body the client parses. "Bytes per
+hit" is the size of that body. The report is synthetic but shaped like a real one
+(weekly price overlay, quarterly series, peers, insider rows, narratives), sized with
+``--weeks`` / ``--quarters``.
+
+Usage:
+    ./venv/bin/python scripts/bench_ticker_report_cache.py
+    ./venv/bin/python scripts/bench_ticker_report_cache.py --hits 500 --rtt-ms 25
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.config import settings  # noqa: E402
+from app.services import ticker_report_cache as trc  # noqa: E402
+
+
+def _report(weeks: int, quarters: int, rng: random.Random) -> dict:
+    price = 180.0
+    prices = []
+    for i in range(weeks):
+        price *= 1 + rng.uniform(-0.03, 0.03)
+        prices.append({"date": f"2020-W{i:03d}", "close": round(price, 2)})
+    metrics = ("revenue", "net_income", "eps", "free_cash_flow", "gross_margin",
+               "operating_margin", "roe", "debt_to_equity")
+    series = {
+        m: [{"period": f"Q{q % 4 + 1} {2005 + q // 4}", "value": rng.uniform(-1e9, 1e11),
+             "sector_avg": rng.uniform(-1e9, 1e11), "yoy_pct": rng.uniform(-50, 50)}
+            for q in range(quarters)]
+        for m in metrics
+    }
+    words = ["margin", "guidance", "demand", "services", "buyback", "supply", "growth",
+             "pricing", "cloud", "regulatory", "competition", "cash", "segment"]
+    return {
+        "ticker": "AAPL",
+        "company_name": "Apple Inc.",
+        "quality_score": 72,
+        "price_action": {"prices": [p["close"] for p in prices], "current_price": price,
+                         "narrative": " ".join(rng.choices(words, k=120))},
+        "future_forecast": {"timeline_prices": prices},
+        "fundamentals": series,
+        "moat_competition": {"competitors": [
+            {"ticker": f"P{i}", "name": f"Peer {i}", "market_cap": rng.uniform(1e9, 3e12),
+             "scores": {k: rng.uniform(0, 10) for k in ("brand", "network", "cost",
+                                                         "switching", "intangibles")}}
+            for i in range(12)]},
+        "insider_data": [{"name": f"Insider {i}", "shares": rng.randint(100, 100_000),
+                          "price": rng.uniform(100, 250), "type": rng.choice(["S", "P"]),
+                          "date": f"2026-0{1 + i % 9}-1{i % 9}"} for i in range(60)],
+        "sections": {f"section_{i}": " ".join(rng.choices(words, k=200)) for i in range(10)},
+    }
+
+
+class _Response:
+    def __init__(self, body: bytes):
+        self.data = json.loads(body)
+
+
+class _Table:
+    def __init__(self, body: bytes, rtt: float, stats: dict):
+        self.body, self.rtt, self.stats = body, rtt, stats
+
+    def table(self, name):
+        return self
+
+    def select(self, columns):
+        return self
+
+    def eq(self, *a):
+        return self
+
+    def limit(self, n):
+        return self
+
+    async def execute(self):
+        self.stats["reads"] += 1
+        self.stats["bytes"] += len(self.body)
+        await asyncio.sleep(self.rtt)
+        return _Response(self.body)
+
+
+async def _time(hits: int, stats: dict) -> float:
+    t0 = time.perf_counter()
+    for _ in range(hits):
+        assert await trc.get_cached_report("AAPL", "warren_buffett") is not None
+    return (time.perf_counter() - t0) / hits
+
+
+def _run(label: str, row: dict, *, compressed: bool, memory: bool, args) -> None:
+    settings.TICKER_REPORT_CACHE_COMPRESSED = compressed
+    settings.TICKER_REPORT_MEMORY_MAX_ENTRIES = 256 if memory else 0
+    trc._memory.clear()
+    stats = {"reads": 0, "bytes": 0}
+    body = json.dumps([row]).encode()
+    trc.get_async_supabase = lambda: _Table(body, args.rtt_ms / 1000, stats)
+    per_hit = asyncio.run(_time(args.hits, stats))
+    print(f"  {label:<28}{per_hit * 1e3:>10.2f}{stats['bytes'] / args.hits / 1024:>14.1f}"
+          f"{stats['reads']:>8}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--hits", type=int, default=200)
+    parser.add_argument("--rtt-ms", type=float, default=15.0)
+    parser.add_argument("--weeks", type=int, default=312)
+    parser.add_argument("--quarters", type=int, default=84)
+    args = parser.parse_args()
+    report = _report(args.weeks, args.quarters, random.Random(1))
+    now = datetime.now(timezone.utc).isoformat()
+    jsonb_row = {"ticker_report_data": report, "cached_at": now}
+    blob_row = {"ticker_report_data": None, trc.BLOB_COLUMN: trc.encode_report(report),
+                "cached_at": now}
+
+    codec = blob_row[trc.BLOB_COLUMN].split(":", 1)[0]
+    print(f"{args.hits} hits on one (ticker, persona), {args.rtt_ms:g} ms per round-trip; "
+          f"report {len(json.dumps(report)) / 1024:.0f} KB as JSON, blob codec {codec}")
+    print(f"  {'':<28}{'ms/hit':>10}{'KB/hit (wire)':>14}{'reads':>8}")
+    _run("JSONB row (before)", jsonb_row, compressed=False, memory=False, args=args)
+    _run("compressed row", blob_row, compressed=True, memory=False, args=args)
+    _run("in-process tier", jsonb_row, compressed=False, memory=True, args=args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""A local stand-in for FMP's real-time WebSocket endpoints.
+
+Speaks the subset of the protocol `LivePriceManager` uses: an optional ``login`` event
+(the crypto host requires it before any subscription counts), ``subscribe`` /
+``unsubscribe`` with a single ticker or a list, and trade ticks of the shape
+``{"s": "aapl", "t": ..., "type": "T", "lp": 150.25, "v": ...}`` with the symbol
+lowercased, as FMP sends them. Every event each connection received is recorded, so
+tests can assert what was sent as well as what arrived.
+
+Used by the live-price tests and by ``scripts/bench_live_price_pool.py``.
+"""
+
+import asyncio
+import json
+import time
+
+from websockets.asyncio.server import serve
+
+
+class FakeConnection:
+    def __init__(self, ws):
+        self.ws = ws
+        self.events: list[dict] = []
+        self.subscribed: set[str] = set()
+        self.logged_in = False
+        self.closed = False
+
+
+class FakeFMPServer:
+    def __init__(self, *, require_login: bool = False):
+        self.require_login = require_login
+        self.connections: list[FakeConnection] = []
+        self.accepting = True
+        self._server = None
+        self.url = ""
+
+    async def __aenter__(self) -> "FakeFMPServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+    async def start(self, port: int = 0) -> None:
+        self._server = await serve(self._handle, "127.0.0.1", port, ping_interval=None)
+        port = self._server.sockets[0].getsockname()[1]
+        self.url = f"ws://127.0.0.1:{port}"
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    @property
+    def live(self) -> list[FakeConnection]:
+        return [c for c in self.connections if not c.closed]
+
+    async def _handle(self, ws) -> None:
+        if not self.accepting:
+            await ws.close(code=1013, reason="try again later")
+            return
+        conn = FakeConnection(ws)
+        self.connections.append(conn)
+        try:
+            async for raw in ws:
+                event = json.loads(raw)
+                conn.events.append(event)
+                kind, data = event.get("event"), event.get("data") or {}
+                if kind == "login":
+                    conn.logged_in = True
+                    continue
+                tickers = data.get("ticker")
+                tickers = [tickers] if isinstance(tickers, str) else list(tickers or ())
+                if kind == "subscribe" and (conn.logged_in or not self.require_login):
+                    conn.subscribed.update(t.lower() for t in tickers)
+                elif kind == "unsubscribe":
+                    conn.subscribed.difference_update(t.lower() for t in tickers)
+        except Exception:
+            pass
+        finally:
+            conn.closed = True
+
+    async def tick(self, symbol: str, price: float, **extra) -> int:
+        """Send a trade tick to every connection subscribed to ``symbol``; returns how many."""
+        frame = json.dumps({
+            "s": symbol.lower(), "t": int(time.time()), "type": "T", "lp": price, **extra,
+        })
+        sent = 0
+        for conn in self.live:
+            if symbol.lower() in conn.subscribed:
+                await conn.ws.send(frame)
+                sent += 1
+        return sent
+
+    async def drop(self) -> None:
+        """Close every live connection, as an FMP edge node restarting would."""
+        for conn in self.live:
+            await conn.ws.close()
+
+
+async def eventually(predicate, timeout: float = 3.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.01)
@@ -424,7 +424,7 @@ async def test_direct_path_routes_through_the_semaphore():
     try:
         service = object.__new__(trs.TickerReportService)
 
-        async def _fake_pipeline(ticker, persona_key):
+        async def _fake_pipeline(ticker, persona_key, on_progress=None):
             return {"ok": True}
 
         service._generate_uncontended = _fake_pipeline
@@ -0,0 +1,143 @@
+"""
+Tests for the async PostgREST client (app/database.py `AsyncPostgrestClient`).
+
+The hot read paths moved off `asyncio.to_thread(<sync SDK>)` onto this client, so
+its requests must be the ones postgrest-py would have sent: filters as
+`col=op.value`, repeated `.order()` composing into one parameter, `.range()` as
+offset/limit, the count header, and a 4xx surfacing as postgrest's own
+`APIError` so the callers' existing `except` clauses keep catching it.
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from postgrest.exceptions import APIError
+
+from app import database
+from app.database import AsyncPostgrestClient
+
+
+def _client(handler) -> AsyncPostgrestClient:
+    http = httpx.AsyncClient(
+        base_url="https://example.supabase.co/rest/v1",
+        transport=httpx.MockTransport(handler),
+    )
+    return AsyncPostgrestClient(http)
+
+
+@pytest.mark.asyncio
+async def test_select_filters_and_limit_build_the_sdk_query():
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen["path"] = request.url.path
+        seen["params"] = list(request.url.params.multi_items())
+        return httpx.Response(200, json=[{"id": "u1"}])
+
+    client = _client(handler)
+    result = await client.table("users").select("*").eq("id", "u1").limit(1).execute()
+
+    assert result.data == [{"id": "u1"}]
+    assert seen["path"] == "/rest/v1/users"
+    assert seen["params"] == [("select", "*"), ("id", "eq.u1"), ("limit", "1")]
+
+
+@pytest.mark.asyncio
+async def test_order_composes_and_range_becomes_offset_limit():
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen["params"] = list(request.url.params.multi_items())
+        return httpx.Response(200, json=[])
+
+    client = _client(handler)
+    await (
+        client.table("ticker_news_cache")
+        .select("*")
+        .order("published_at", desc=True, nullsfirst=False)
+        .order("id", desc=True)
+        .range(20, 39)
+        .execute()
+    )
+    assert ("order", "published_at.desc.nullslast,id.desc") in seen["params"]
+    assert ("offset", "20") in seen["params"]
+    assert ("limit", "20") in seen["params"]
+
+
+@pytest.mark.asyncio
+async def test_in_filter_quotes_reserved_characters():
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen["params"] = dict(request.url.params)
+        return httpx.Response(200, json=[])
+
+    await _client(handler).table("t").select("*").in_("k", ["AAPL", "BRK,B", None]).execute()
+    assert seen["params"]["k"] == 'in.(AAPL,"BRK,B",null)'
+
+
+@pytest.mark.asyncio
+async def test_count_header_is_sent_and_parsed():
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["prefer"] == "count=exact"
+        return httpx.Response(200, json=[{}], headers={"content-range": "0-0/42"})
+
+    result = await _client(handler).table("t").select("id", count="exact").execute()
+    assert result.count == 42
+
+
+@pytest.mark.asyncio
+async def test_upsert_sends_body_and_conflict_target():
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen["method"] = request.method
+        seen["params"] = dict(request.url.params)
+        seen["prefer"] = request.headers["prefer"]
+        seen["body"] = json.loads(request.content)
+        return httpx.Response(201, json=[{"ticker": "AAPL"}])
+
+    await _client(handler).table("t").upsert([{"ticker": "AAPL"}], on_conflict="ticker").execute()
+    assert seen["method"] == "POST"
+    assert seen["params"] == {"on_conflict": "ticker"}
+    assert "resolution=merge-duplicates" in seen["prefer"]
+    assert seen["body"] == [{"ticker": "AAPL"}]
+
+
+@pytest.mark.asyncio
+async def test_error_status_raises_postgrest_api_error():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            400, json={"message": "column users.nope does not exist", "code": "42703"}
+        )
+
+    with pytest.raises(APIError) as exc:
+        await _client(handler).table("users").select("nope").execute()
+    assert exc.value.code == "42703"
+
+
+@pytest.mark.asyncio
+async def test_a_large_body_is_parsed_off_the_event_loop(monkeypatch):
+    offloaded = []
+    real_to_thread = asyncio.to_thread
+
+    async def spy(fn, *args):
+        offloaded.append(fn)
+        return await real_to_thread(fn, *args)
+
+    monkeypatch.setattr(database.asyncio, "to_thread", spy)
+    big = [{"ticker": "AAPL", "collected_data": {"rows": "x" * database._OFFLOOP_JSON_BYTES}}]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params.get("ticker") == "eq.AAPL":
+            return httpx.Response(200, json=big)
+        return httpx.Response(200, json=[{"id": "u1"}])
+
+    client = _client(handler)
+    assert (await client.table("users").select("*").execute()).data == [{"id": "u1"}]
+    assert offloaded == []                       # a small row parses inline
+    result = await client.table("t").select("*").eq("ticker", "AAPL").execute()
+    assert result.data == big
+    assert offloaded == [json.loads]
@@ -86,6 +86,18 @@ class _RaisingSB:
         raise RuntimeError("transient postgrest blip")
 
 
+class _AsyncSB(_SB):
+    """Async PostgREST stub — `get_current_user` reads through `get_async_supabase`."""
+
+    async def execute(self, *a, **k):
+        return _SB.execute(self)
+
+
+class _AsyncRaisingSB(_RaisingSB):
+    async def execute(self, *a, **k):
+        _RaisingSB.execute(self)
+
+
 def _row():
     return [{"id": _USER_ID, "email": "u@example.com", "tier": "free", "password_changed_at": None}]
 
@@ -171,7 +183,7 @@ async def test_strict_valid_token_resolves():
 async def test_missing_users_row_is_ACCOUNT_NOT_FOUND():
     with pytest.raises(HTTPException) as exc:
         await get_current_user(
-            credentials=_creds(_access()), user_id=_USER_ID, supabase=_SB([])
+            credentials=_creds(_access()), user_id=_USER_ID, supabase=_AsyncSB([])
         )
     assert exc.value.status_code == 401
     assert _code(exc.value) == "AUTH_ACCOUNT_NOT_FOUND"
@@ -185,7 +197,7 @@ async def test_users_read_failure_is_503_not_500():
     already answered 503 — one failure mode must not have two contracts."""
     with pytest.raises(HTTPException) as exc:
         await get_current_user(
-            credentials=_creds(_access()), user_id=_USER_ID, supabase=_RaisingSB()
+            credentials=_creds(_access()), user_id=_USER_ID, supabase=_AsyncRaisingSB()
         )
     assert exc.value.status_code == 503
     assert _code(exc.value) == "AUTH_UNAVAILABLE"
@@ -197,7 +209,7 @@ async def test_password_change_eviction_is_SESSION_EXPIRED():
     rows = [{"id": _USER_ID, "email": "u@example.com", "password_changed_at": changed}]
     with pytest.raises(HTTPException) as exc:
         await get_current_user(
-            credentials=_creds(_access()), user_id=_USER_ID, supabase=_SB(rows)
+            credentials=_creds(_access()), user_id=_USER_ID, supabase=_AsyncSB(rows)
         )
     assert exc.value.status_code == 401
     assert _code(exc.value) == "AUTH_SESSION_EXPIRED"
@@ -8,7 +8,7 @@ TTM run to 06:00 UTC via the pure helper `_next_weekly_ttm_run`, now unit-testab
 
 from datetime import datetime, timedelta, timezone
 
-from app.main import _next_weekly_ttm_run, _next_quarterly_dossier_run
+from app.jobs import _next_weekly_ttm_run, _next_quarterly_dossier_run
 
 
 def test_ttm_next_run_is_sunday_0600_utc():
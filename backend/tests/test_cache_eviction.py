@@ -4,8 +4,8 @@ services (stock/etf/crypto/index). Without a cap these module-level dicts grew
 unbounded in the long-lived Railway process — expired rows are only swept
 lazily on read of the same key.
 
-Eviction is least-recently-written: a write moves the key to the tail and, once
-the cap is exceeded, entries are dropped from the head.
+Eviction is least-recently-used: a write or a hit moves the key to the tail and,
+once the cap is exceeded, entries are dropped from the head (app/core/cache.py).
 """
 
 import importlib
@@ -155,7 +155,11 @@ def test_legacy_cached_report_is_schema_validated_before_serving():
 
     from app.api.v1.endpoints import ticker_report as tr
 
-    src = inspect.getsource(tr.get_ticker_report)
+    # Both report routes (the GET and the SSE stream) serve their free paths through
+    # `_free_report`, so that is where the legacy hit must be validated.
+    for route in (tr.get_ticker_report, tr.stream_ticker_report):
+        assert "_free_report(" in inspect.getsource(route)
+    src = inspect.getsource(tr._free_report)
     head = src[: src.index("FREE PATH 2")]
     assert "_validate_report(" in head, (
         "the legacy cache hit must be validated like every other return on this endpoint"
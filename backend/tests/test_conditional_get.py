@@ -0,0 +1,186 @@
+"""Conditional GETs on the cache-backed read routes (app/api/conditional.py), and the
+entry versions app.core.cache records for them.
+
+Pinned here:
+  * a response is versioned only when EVERY entry it touched has a version — a miss
+    that is never followed by a store (a degraded build, an in-flight join) leaves it
+    unversioned, and an unversioned response goes out exactly as before: no ETag, no
+    Cache-Control;
+  * `record_entry` versions by identity — a copy of the cached value is not the entry;
+  * `If-None-Match` with the current tag is a bodiless 304; a new store is a new tag;
+  * a route that resolves a ``user`` is tagged per caller (id AND tier) and ``private``;
+  * an error envelope the endpoint returns passes through untouched.
+"""
+
+from fastapi import APIRouter, Depends, FastAPI, Header
+from fastapi.testclient import TestClient
+
+from app.api.conditional import ConditionalRoute, conditional, etag_matches
+from app.api.error_response import ErrorCode, make_error_response
+from app.core.cache import (
+    CacheRegistry,
+    record_entry,
+    record_unversioned,
+    record_version,
+    track_versions,
+)
+
+
+def _app():
+    region = CacheRegistry(budget_bytes=0).register("quotes", ttl=60, max_entries=8)
+    router = APIRouter(route_class=ConditionalRoute)
+
+    def _user(x_user: str = Header("u1"), x_tier: str = Header("free")) -> dict:
+        return {"id": x_user, "tier": x_tier}
+
+    @router.get("/quote/{symbol}")
+    @conditional()
+    async def quote(symbol: str):
+        hit = region.lookup(symbol)
+        if hit is None:
+            hit = {"symbol": symbol, "price": 1.0}
+            region.store(symbol, hit)
+        return hit
+
+    @router.get("/degraded/{symbol}")
+    @conditional()
+    async def degraded(symbol: str):
+        region.lookup(symbol)                        # a miss nothing stores after
+        return {"symbol": symbol, "price": 0.0}
+
+    @router.get("/gated/{symbol}")
+    @conditional(max_age=60)
+    async def gated(symbol: str, user: dict = Depends(_user)):
+        return await quote(symbol)
+
+    @router.get("/missing/{symbol}")
+    @conditional()
+    async def missing(symbol: str):
+        region.lookup("AAPL")
+        return make_error_response(ErrorCode.TICKER_NOT_FOUND, message="nope")
+
+    app = FastAPI()
+    app.include_router(router, prefix="/api/v1/things")
+    return TestClient(app), region
+
+
+def test_a_miss_then_a_store_resolves_and_a_bare_miss_does_not():
+    registry = CacheRegistry(budget_bytes=0)
+    region = registry.register("r", ttl=60, max_entries=8)
+    with track_versions() as log:
+        assert region.lookup("a") is None
+        region.store("a", 1)
+    assert log.fingerprint() is not None
+    with track_versions() as log:
+        region.lookup("b")
+    assert log.fingerprint() is None
+    with track_versions() as log:
+        pass
+    assert log.fingerprint() is None               # touched nothing → describes nothing
+
+
+def test_a_new_store_is_a_new_version():
+    region = CacheRegistry(budget_bytes=0).register("r", ttl=60, max_entries=8)
+    region.store("a", 1)
+    with track_versions() as first:
+        region.lookup("a")
+    region.store("a", 1)                           # same value, new entry
+    with track_versions() as second:
+        region.lookup("a")
+    assert first.fingerprint() != second.fingerprint()
+
+
+def test_record_entry_versions_by_identity():
+    value = {"rows": [1, 2]}
+    entry = (123.0, value)
+    with track_versions() as log:
+        record_entry("legacy", "k", entry, value)
+    assert log.versions == {"legacy:k": 123.0}
+    with track_versions() as log:
+        record_entry("legacy", "k", entry, dict(value))   # equal, but not the entry
+    assert log.fingerprint() is None
+    with track_versions() as log:
+        record_unversioned("live", "k")
+        record_version("live", "k", "open")              # the last event wins
+    assert log.fingerprint() is not None
+
+
+def test_recording_outside_a_block_is_a_no_op():
+    record_version("x", "k", 1)
+    record_unversioned("x", "k")
+
+
+def test_200_carries_the_tag_and_a_match_is_a_bodiless_304():
+    client, region = _app()
+    first = client.get("/api/v1/things/quote/AAPL")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"')
+    assert first.headers["Cache-Control"] == "public, no-cache"
+
+    again = client.get("/api/v1/things/quote/AAPL", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["ETag"] == etag
+
+    region.store("AAPL", {"symbol": "AAPL", "price": 2.0})
+    moved = client.get("/api/v1/things/quote/AAPL", headers={"If-None-Match": etag})
+    assert moved.status_code == 200
+    assert moved.json()["price"] == 2.0
+    assert moved.headers["ETag"] != etag
+
+
+def test_the_tag_covers_the_path():
+    client, _ = _app()
+    a = client.get("/api/v1/things/quote/AAPL").headers["ETag"]
+    b = client.get("/api/v1/things/quote/MSFT").headers["ETag"]
+    assert a != b
+
+
+def test_an_unversioned_response_goes_out_as_before():
+    client, _ = _app()
+    r = client.get("/api/v1/things/degraded/TSLA", headers={"If-None-Match": "*"})
+    assert r.status_code == 200
+    assert "ETag" not in r.headers
+    assert "Cache-Control" not in r.headers
+
+
+def test_a_user_scoped_route_is_private_and_tagged_per_caller_and_tier():
+    client, _ = _app()
+    free = client.get("/api/v1/things/gated/AAPL")
+    assert free.headers["Cache-Control"] == "private, max-age=60"
+    pro = client.get("/api/v1/things/gated/AAPL", headers={"X-Tier": "pro"})
+    other = client.get("/api/v1/things/gated/AAPL", headers={"X-User": "u2"})
+    assert len({free.headers["ETag"], pro.headers["ETag"], other.headers["ETag"]}) == 3
+    upgraded = client.get(
+        "/api/v1/things/gated/AAPL",
+        headers={"X-Tier": "pro", "If-None-Match": free.headers["ETag"]},
+    )
+    assert upgraded.status_code == 200
+
+
+def test_an_error_envelope_passes_through():
+    client, region = _app()
+    region.store("AAPL", {"symbol": "AAPL"})
+    r = client.get("/api/v1/things/missing/AAPL", headers={"If-None-Match": "*"})
+    assert r.status_code == 404
+    assert "ETag" not in r.headers
+
+
+def test_etag_matches_is_weak_and_handles_lists_and_star():
+    tag = 'W/"abc"'
+    assert etag_matches('"abc"', tag)
+    assert etag_matches('W/"zzz", W/"abc"', tag)
+    assert etag_matches("*", tag)
+    assert not etag_matches('"abd"', tag)
+    assert not etag_matches(None, tag)
+
+
+def test_the_endpoint_function_itself_is_unchanged():
+    from app.api.v1.endpoints import etfs
+
+    route = next(r for r in etfs.router.routes if r.endpoint is etfs.get_etf_detail)
+    assert isinstance(route, ConditionalRoute)
+    # The route runs a wrapper; the module function the endpoint tests call is untouched.
+    assert route.dependant.call is not etfs.get_etf_detail
+    assert etfs.get_etf_detail.__conditional_get__.max_age == 0
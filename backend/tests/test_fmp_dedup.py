@@ -0,0 +1,172 @@
+"""
+FMPClient request coalescing and per-endpoint response reuse (app/integrations/fmp.py).
+
+Every public method funnels through `_make_request`, so that is where identical calls from
+different services meet. Pinned here: concurrent duplicates go upstream ONCE; listed
+endpoints are reused within their TTL and unlisted ones never are; every caller gets its own
+copy; failures and degraded payloads are not cached; a bare `FMPClient()` caches nothing; and
+the dedup counters add up.
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.cache import CacheRegistry
+from app.integrations import fmp
+from app.integrations.fmp import FMPClient, FMPUnavailableException
+
+
+def _client(upstream, cached=True) -> FMPClient:
+    region = CacheRegistry(0).register("fmp_responses", ttl=60, max_entries=64) if cached else None
+    client = FMPClient(response_cache=region)
+    client._make_request_impl = upstream
+    return client
+
+
+def _counting(payload, delay=0.0):
+    calls = []
+
+    async def upstream(endpoint, params=None):
+        calls.append((endpoint, dict(params or {})))
+        await asyncio.sleep(delay)
+        return payload() if callable(payload) else payload
+
+    return upstream, calls
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_go_upstream_once():
+    upstream, calls = _counting(lambda: [{"symbol": "AAPL", "companyName": "Apple"}], delay=0.02)
+    client = _client(upstream, cached=False)
+
+    results = await asyncio.gather(*(client.get_company_profile("aapl") for _ in range(5)))
+    assert len(calls) == 1
+    assert all(r["companyName"] == "Apple" for r in results)
+    stats = client.dedup_stats()["endpoints"]["profile"]
+    assert stats == {"calls": 5, "cache_hits": 0, "coalesced": 4, "fetched": 1}
+
+
+@pytest.mark.asyncio
+async def test_listed_endpoint_is_reused_within_its_ttl():
+    upstream, calls = _counting(lambda: [{"date": "2025-06-30", "revenue": 1}])
+    client = _client(upstream)
+    await client.get_income_statement("MSFT", period="quarter", limit=4)
+    await client.get_income_statement("MSFT", period="quarter", limit=4)
+    # Different params are a different request.
+    await client.get_income_statement("MSFT", period="annual", limit=4)
+    assert len(calls) == 2
+    assert client.dedup_stats()["endpoints"]["income-statement"]["cache_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_unlisted_endpoint_is_never_cached():
+    upstream, calls = _counting(lambda: [{"symbol": "AAPL"}])
+    client = _client(upstream)
+    await client._make_request("search-symbol", params={"query": "apple"})
+    await client._make_request("search-symbol", params={"query": "apple"})
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_quote_ttl_is_seconds_and_profile_ttl_is_hours():
+    assert fmp._response_ttl("quote") <= 10
+    assert fmp._response_ttl("profile") >= 3600
+    assert fmp._response_ttl("income-statement") > fmp._response_ttl("profile")
+    assert fmp._response_ttl("historical-chart/5min") == fmp._INTRADAY_TTL
+    assert fmp._response_ttl("search-symbol") == 0
+
+
+@pytest.mark.asyncio
+async def test_each_caller_gets_its_own_copy():
+    upstream, _ = _counting(lambda: [{"symbol": "AAPL", "price": 1.0}], delay=0.01)
+    client = _client(upstream)
+
+    async def mutating_reader():
+        quote = await client.get_stock_price_quote("AAPL")
+        quote["price"] = -1.0
+        return quote
+
+    leader, joiner = await asyncio.gather(mutating_reader(), client.get_stock_price_quote("AAPL"))
+    assert leader["price"] == -1.0
+    assert joiner["price"] == 1.0
+    assert (await client.get_stock_price_quote("AAPL"))["price"] == 1.0  # cache untouched
+
+
+@pytest.mark.asyncio
+async def test_a_price_series_copies_the_list_but_shares_its_bars():
+    bars = [{"date": "2025-06-02", "close": 2.0}, {"date": "2025-06-01", "close": 1.0}]
+    upstream, _ = _counting(lambda: {"symbol": "AAPL", "historical": [dict(b) for b in bars]})
+    client = _client(upstream)
+
+    first = await client.get_historical_prices("AAPL", "2025-06-01", "2025-06-02")
+    first["historical"].sort(key=lambda p: p["date"])      # what the chart helpers do
+    second = await client.get_historical_prices("AAPL", "2025-06-01", "2025-06-02")
+    assert [p["date"] for p in second["historical"]] == ["2025-06-02", "2025-06-01"]
+    third = await client.get_historical_prices("AAPL", "2025-06-01", "2025-06-02")
+    assert third["historical"] is not second["historical"]
+    assert third["historical"][0] is second["historical"][0]   # no deep walk per hit
+
+
+@pytest.mark.asyncio
+async def test_failure_is_shared_counted_once_and_not_cached():
+    attempts = []
+
+    async def upstream(endpoint, params=None):
+        attempts.append(1)
+        await asyncio.sleep(0.01)
+        if len(attempts) == 1:
+            raise FMPUnavailableException("502")
+        return [{"symbol": "AAPL"}]
+
+    client = _client(upstream)
+    results = await asyncio.gather(
+        client._make_request("quote", params={"symbol": "AAPL"}),
+        client._make_request("quote", params={"symbol": "AAPL"}),
+        return_exceptions=True,
+    )
+    assert all(isinstance(r, FMPUnavailableException) for r in results)
+    assert client.request_failures == 1
+    assert await client._make_request("quote", params={"symbol": "AAPL"}) == [{"symbol": "AAPL"}]
+    assert len(attempts) == 2
+
+
+@pytest.mark.asyncio
+async def test_degraded_payloads_are_not_cached():
+    payloads = iter([[], {"Error Message": "Limit Reach"}, [{"symbol": "AAPL"}]])
+    upstream, calls = _counting(lambda: next(payloads))
+    client = _client(upstream)
+    for _ in range(3):
+        await client._make_request("quote", params={"symbol": "AAPL"})
+    await client._make_request("quote", params={"symbol": "AAPL"})
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_strand_joiners():
+    upstream, _ = _counting(lambda: [{"symbol": "AAPL"}], delay=0.05)
+    client = _client(upstream, cached=False)
+    leader = asyncio.create_task(client._make_request("quote", params={"symbol": "AAPL"}))
+    await asyncio.sleep(0)
+    joiner = asyncio.create_task(client._make_request("quote", params={"symbol": "AAPL"}))
+    await asyncio.sleep(0)
+    leader.cancel()
+    with pytest.raises(RuntimeError):
+        await joiner
+    assert client._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_apikey_is_not_part_of_the_key():
+    assert fmp._request_key("quote", {"symbol": "A", "apikey": "secret"}) == "quote?symbol=A"
+
+
+@pytest.mark.asyncio
+async def test_totals_add_up():
+    upstream, _ = _counting(lambda: [{"symbol": "AAPL"}])
+    client = _client(upstream)
+    await client.get_stock_price_quote("AAPL")
+    await client.get_stock_price_quote("AAPL")
+    totals = client.dedup_stats()["totals"]
+    assert totals["calls"] == 2 and totals["fetched"] == 1 and totals["cache_hits"] == 1
+    assert totals["saved_rate"] == 0.5
@@ -0,0 +1,145 @@
+"""
+The FMP rate governor (app/integrations/fmp.py `FMPRateGovernor`).
+
+A priority token bucket every FMP attempt draws from. Pinned here: the fast path does not
+queue; a waiting interactive request beats a background one that queued first; background
+cannot spend the reserve; a 429's Retry-After pauses the bucket and the request is re-queued
+rather than failed; a request that queues too long fails as a rate limit; and the priority
+follows a job into the tasks it spawns.
+
+Rates are set high (thousands per minute) so every wait here is milliseconds of real time.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from app.integrations import fmp
+from app.integrations.fmp import (
+    FMPClient,
+    FMPPriority,
+    FMPRateGovernor,
+    FMPRateLimitException,
+    fmp_priority,
+)
+
+
+@pytest.mark.asyncio
+async def test_fast_path_grants_up_to_capacity_without_queueing():
+    gov = FMPRateGovernor(per_minute=600)  # 10/s, burst 100
+    for _ in range(50):
+        await gov.acquire(FMPPriority.INTERACTIVE)
+    assert gov.queued["interactive"] == 0
+    assert gov.granted["interactive"] == 50
+
+
+@pytest.mark.asyncio
+async def test_interactive_is_served_before_earlier_background():
+    gov = FMPRateGovernor(per_minute=6000, background_reserve=0.0)
+    gov._tokens = 0.0
+    order = []
+
+    async def take(priority, label):
+        await gov.acquire(priority)
+        order.append(label)
+
+    background = [asyncio.create_task(take(FMPPriority.BACKGROUND, f"bg{i}")) for i in range(3)]
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(take(FMPPriority.INTERACTIVE, "user"))
+    await asyncio.gather(*background, interactive)
+    assert order[0] == "user"
+
+
+@pytest.mark.asyncio
+async def test_background_cannot_spend_the_reserve():
+    gov = FMPRateGovernor(per_minute=60, background_reserve=0.5)  # 1/s, burst 10, reserve 5
+    gov._tokens = 3.0
+    # Interactive still goes straight through…
+    await asyncio.wait_for(gov.acquire(FMPPriority.INTERACTIVE), timeout=0.05)
+    # …background, below the reserve, has to wait for the bucket to refill past it.
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(gov.acquire(FMPPriority.BACKGROUND), timeout=0.1)
+
+
+@pytest.mark.asyncio
+async def test_pause_holds_every_request():
+    gov = FMPRateGovernor(per_minute=6000)
+    gov.pause(0.15)
+    t0 = time.monotonic()
+    await gov.acquire(FMPPriority.INTERACTIVE)
+    assert time.monotonic() - t0 >= 0.14
+    assert gov.rate_limited == 1
+
+
+@pytest.mark.asyncio
+async def test_queue_wait_is_bounded():
+    gov = FMPRateGovernor(per_minute=6000, max_wait=0.05)
+    gov.pause(5)
+    with pytest.raises(FMPRateLimitException):
+        await gov.acquire(FMPPriority.INTERACTIVE)
+    assert gov.timeouts == 1
+    assert gov.stats()["waiting"] == 0
+
+
+def test_retry_after_parsing():
+    assert fmp._retry_after_seconds("5", 0) == 5
+    assert fmp._retry_after_seconds("9999", 0) == fmp._RATE_LIMIT_MAX_PAUSE
+    when = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 25 <= fmp._retry_after_seconds(format_datetime(when, usegmt=True), 0) <= 30
+    # FMP /stable usually omits the header: short exponential backoff instead.
+    assert fmp._retry_after_seconds(None, 0) == fmp._RATE_LIMIT_BASE_PAUSE
+    assert fmp._retry_after_seconds("garbage", 1) == fmp._RATE_LIMIT_BASE_PAUSE * 2
+
+
+@pytest.mark.asyncio
+async def test_priority_follows_a_job_into_its_tasks():
+    async def seen():
+        return fmp._fmp_priority.get()
+
+    assert await asyncio.create_task(seen()) == FMPPriority.INTERACTIVE
+    with fmp_priority(FMPPriority.BACKGROUND):
+        task = asyncio.create_task(seen())
+    assert await task == FMPPriority.BACKGROUND
+    assert fmp._fmp_priority.get() == FMPPriority.INTERACTIVE
+
+
+class _Resp:
+    def __init__(self, status, data=None, headers=None):
+        self.status_code = status
+        self._data = data or []
+        self.headers = headers or {}
+
+    def json(self):
+        return self._data
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise httpx.HTTPStatusError(
+                "x", request=httpx.Request("GET", "https://x"), response=self
+            )
+
+
+@pytest.mark.asyncio
+async def test_429_pauses_then_requeues_instead_of_failing():
+    script = [_Resp(429, headers={"Retry-After": "0.1"}), _Resp(200, [{"symbol": "AAPL"}])]
+    calls = []
+
+    class _Fake:
+        async def get(self, url, params=None):
+            calls.append(time.monotonic())
+            return script[min(len(calls) - 1, len(script) - 1)]
+
+    client = FMPClient()
+
+    async def _get_client():
+        return _Fake()
+
+    client._get_client = _get_client
+    assert await client._make_request("quote", {"symbol": "AAPL"}) == [{"symbol": "AAPL"}]
+    assert len(calls) == 2
+    assert calls[1] - calls[0] >= 0.09
+    assert client._governor.rate_limited == 1
@@ -4,8 +4,10 @@ FMP transient-failure retry + degrade behavior.
 FMP's gateway intermittently returns 5xx (e.g. the 502 that paged on the
 `profile` endpoint for CSWI) or drops the connection. A single blip must NOT
 fail the request or page on-call: _make_request retries with backoff, then
-degrades to a typed FMPUnavailableException logged at WARNING. Auth (401) and
-quota (429) are NOT retried.
+degrades to a typed FMPUnavailableException logged at WARNING. Auth (401) is NOT
+retried; a quota 429 pauses the rate governor and is re-queued within the same
+attempt budget (the pause itself is covered in test_fmp_governor.py and stubbed
+out here).
 
 Pure logic — the httpx client is faked; no network. asyncio.sleep is stubbed so
 the backoff adds no wall-clock. Run via `python -m pytest` from backend/.
@@ -62,6 +64,8 @@ def _no_sleep(monkeypatch):
     async def _fast_sleep(_seconds):
         return None
     monkeypatch.setattr("app.integrations.fmp.asyncio.sleep", _fast_sleep)
+    # The governor's Retry-After pause waits on loop timers, not asyncio.sleep.
+    monkeypatch.setattr("app.integrations.fmp.FMPRateGovernor.pause", lambda self, s: None)
 
 
 def _client_with(fake):
@@ -100,12 +104,19 @@ def test_network_error_retries_then_degrades():
     assert fake.calls == 3
 
 
-def test_429_is_not_retried():
+def test_persistent_429_is_requeued_then_raises():
     fake = _FakeClient([_FakeResponse(429, headers={"Retry-After": "5"})])
     c = _client_with(fake)
     with pytest.raises(FMPRateLimitException):
         asyncio.run(c._make_request("profile", {"symbol": "CSWI"}))
-    assert fake.calls == 1  # quota errors don't get retried
+    assert fake.calls == 3  # queued behind the pause, within the same attempt budget
+
+
+def test_429_then_200_recovers():
+    fake = _FakeClient([_FakeResponse(429), _FakeResponse(200, [{"symbol": "CSWI"}])])
+    c = _client_with(fake)
+    assert asyncio.run(c._make_request("profile", {"symbol": "CSWI"})) == [{"symbol": "CSWI"}]
+    assert fake.calls == 2
 
 
 def test_429_extracts_retry_after_onto_exception():
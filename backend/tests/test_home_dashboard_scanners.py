@@ -518,6 +518,20 @@ async def test_scanner_cache_hit_skips_rebuild(monkeypatch):
     assert s.fmp.gainer_calls == calls
 
 
+@pytest.mark.asyncio
+async def test_an_empty_shared_build_is_served_but_never_cached(monkeypatch):
+    s = _fresh_service(monkeypatch)
+
+    async def peer_came_up_empty(*args, **kwargs):
+        return None
+
+    monkeypatch.setattr(svc, "shared_build", peer_came_up_empty)
+    groups = await s.get_scanners()
+    assert isinstance(groups, ScannerGroupsResponse)
+    assert groups.movers is None
+    assert not HomeDashboardService._scanner_cache   # the next call retries
+
+
 @pytest.mark.asyncio
 async def test_one_card_failure_does_not_kill_others(monkeypatch):
     s = _fresh_service(monkeypatch)
@@ -0,0 +1,111 @@
+"""The HTTP stack under every route: the pure-ASGI middlewares in app.main and the
+default `FastJSONResponse` (app/api/responses.py).
+
+Pinned here:
+  * the body cap 413s only an oversized write to a capped path — other methods, other
+    paths and bodies under the cap go through untouched;
+  * every response (including a 404 and a 413) carries X-Process-Time / X-Request-ID,
+    and `request.state.request_id` is the id that went out in the header;
+  * `FastJSONResponse` renders the same data stdlib JSON does, plus what stdlib
+    couldn't (NaN, Decimal, numpy scalars, sets), and a model is rendered directly.
+"""
+
+import json
+from decimal import Decimal
+
+import numpy as np
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+import app.api.responses as responses
+from app.api.responses import FastJSONResponse
+from app.main import (
+    _MAX_JSON_BODY_BYTES,
+    BodySizeCapMiddleware,
+    RequestTimingMiddleware,
+)
+
+
+class _Row(BaseModel):
+    symbol: str
+    price: float
+    tags: list[str] = []
+
+
+def _client() -> TestClient:
+    app = FastAPI(default_response_class=FastJSONResponse)
+
+    @app.patch("/api/v1/users/me")
+    async def patch_me(request: Request):
+        return {"size": len(await request.body()), "request_id": request.state.request_id}
+
+    @app.post("/api/v1/chat/send")
+    async def chat(request: Request):
+        return {"size": len(await request.body())}
+
+    @app.get("/api/v1/users/me")
+    async def get_me():
+        return _Row(symbol="AAPL", price=1.5, tags=["a"])
+
+    app.add_middleware(BodySizeCapMiddleware)
+    app.add_middleware(RequestTimingMiddleware)
+    return TestClient(app)
+
+
+def test_oversized_write_to_a_capped_path_is_413():
+    r = _client().patch("/api/v1/users/me", content=b"x" * (_MAX_JSON_BODY_BYTES + 1))
+    assert r.status_code == 413
+    assert r.json()["error_code"] == "INVALID_INPUT"
+    assert "X-Request-ID" in r.headers
+
+
+def test_uncapped_paths_methods_and_small_bodies_pass_through():
+    client = _client()
+    big = b"x" * (_MAX_JSON_BODY_BYTES + 1)
+    assert client.post("/api/v1/chat/send", content=big).json() == {"size": len(big)}
+    assert client.patch("/api/v1/users/me", content=b"{}").status_code == 200
+    assert client.get("/api/v1/users/me").status_code == 200
+
+
+def test_timing_headers_on_every_response_and_request_id_in_state():
+    client = _client()
+    r = client.patch("/api/v1/users/me", content=b"{}")
+    assert float(r.headers["X-Process-Time"]) >= 0
+    assert r.json()["request_id"] == r.headers["X-Request-ID"]
+    missing = client.get("/nope")
+    assert missing.status_code == 404
+    assert "X-Process-Time" in missing.headers
+
+
+def test_a_returned_model_is_rendered_directly():
+    assert _client().get("/api/v1/users/me").json() == {
+        "symbol": "AAPL", "price": 1.5, "tags": ["a"],
+    }
+
+
+def test_fast_render_matches_stdlib_on_plain_data():
+    content = {"a": [1, 2.5, None, True], "b": {"nested": "é ✓"}, "c": []}
+    fast = FastJSONResponse(content).body
+    assert json.loads(fast) == json.loads(json.dumps(content))
+
+
+def test_fast_render_handles_what_stdlib_could_not():
+    body = json.loads(FastJSONResponse({
+        "nan": float("nan"),
+        "dec": Decimal("1.25"),
+        "np": np.float32(0.5),
+        "arr": np.array([1, 2]),
+        "set": {3},
+        "model": _Row(symbol="MSFT", price=2.0),
+        1: "int key",
+    }).body)
+    assert body == {
+        "nan": None, "dec": 1.25, "np": 0.5, "arr": [1, 2], "set": [3],
+        "model": {"symbol": "MSFT", "price": 2.0, "tags": []}, "1": "int key",
+    }
+
+
+def test_without_orjson_it_is_plain_json_response(monkeypatch):
+    monkeypatch.setattr(responses, "_orjson", None)
+    assert FastJSONResponse({"a": 1}).body == b'{"a":1}'
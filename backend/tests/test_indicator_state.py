@@ -0,0 +1,165 @@
+"""Incremental technical-analysis state (app/services/indicator_state.py).
+
+Pinned here: replaying a history through the accumulator gives the panel engine's
+values (and so the ``ta`` path's) at every gate, with a missing range inside the ADX
+warm-up; ``preview`` scores a provisional bar without committing it; the state
+round-trips through JSON; ``SeriesState.advance`` over new bars equals a fresh replay
+and refuses a window whose last settled bar moved; and the service's warm path fetches
+only the bars since its state, matches a full rebuild, and rebuilds on a split.
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services import technical_analysis_service as tas
+from app.services.indicator_state import IndicatorAccumulator, SeriesState
+from app.services.technical_indicators import panel_indicators
+from tests.test_technical_indicators import _forget, _frame, _service
+
+
+def _hlc(df):
+    return tuple(df[k].to_numpy() for k in ("high", "low", "close"))
+
+
+def _finite(x):
+    return None if not np.isfinite(x) else float(x)
+
+
+def _assert_matches_panel(got, high, low, close, where):
+    want = panel_indicators(high[None], low[None], close[None])
+    assert list(got) == list(want)
+    for name, col in want.items():
+        g, w = _finite(got[name]), _finite(col[0])
+        if w is None:
+            assert g is None, (where, name, g)
+        else:
+            assert g == pytest.approx(w, rel=1e-9, abs=1e-9), (where, name)
+
+
+@pytest.mark.parametrize("n", [1, 13, 14, 15, 27, 28, 29, 35, 36, 120, 201, 413])
+def test_replay_matches_the_panel_engine(n):
+    for seed in range(3):
+        high, low, close = _hlc(_frame(n, seed))
+        _assert_matches_panel(IndicatorAccumulator.from_bars(high, low, close).values(),
+                              high, low, close, (n, seed))
+
+
+def test_missing_ranges_inside_the_adx_warm_up():
+    df = _frame(120, 9)
+    df.iloc[3:9, df.columns.get_loc("high")] = np.nan  # the seed reaches past bar 14
+    high, low, close = _hlc(df)
+    _assert_matches_panel(IndicatorAccumulator.from_bars(high, low, close).values(),
+                          high, low, close, "nan-warmup")
+
+
+def test_preview_is_push_without_commit_and_state_round_trips_json():
+    high, low, close = _hlc(_frame(300, 4))
+    acc = IndicatorAccumulator.from_bars(high[:-1], low[:-1], close[:-1])
+    before = json.dumps(acc.to_dict())
+    preview = acc.preview(high[-1], low[-1], close[-1])
+    assert json.dumps(acc.to_dict()) == before  # untouched
+    full = IndicatorAccumulator.from_bars(high, low, close).values()
+    assert json.dumps(preview) == json.dumps(full)
+
+    restored = IndicatorAccumulator.from_dict(json.loads(before))
+    assert json.dumps(restored.preview(high[-1], low[-1], close[-1])) == json.dumps(full)
+
+
+def _recent(n, seed):
+    """A history whose last session is today — the warm path refuses stale states."""
+    df = _frame(n, seed)
+    df.index = pd.DatetimeIndex(pd.bdate_range(end=pd.Timestamp.utcnow().date(), periods=n), name="date")
+    return df
+
+
+def _columns(df):
+    days = df.index.values.astype("datetime64[D]").astype(np.int64).tolist()
+    return (days,) + tuple(c.tolist() for c in _hlc(df))
+
+
+def test_advance_equals_a_fresh_replay_and_refuses_moved_history():
+    df = _frame(300, 5)
+    state, _ = SeriesState.from_bars(*_columns(df.iloc[:250]))
+    # A window that overlaps the settled bar and runs 50 bars on.
+    tail = df.iloc[240:]
+    new_state, values = state.advance(*_columns(tail))
+    fresh_state, fresh_values = SeriesState.from_bars(*_columns(df))
+    assert json.dumps(values) == json.dumps(fresh_values)
+    assert new_state.last_day == fresh_state.last_day
+    assert state.acc.bars == 249  # the original is untouched
+
+    # Nothing new: the stored settled bar is the newest one.
+    same, _ = state.advance(*_columns(df.iloc[240:249]))
+    assert same is state
+
+    split = tail.copy()
+    split[["open", "high", "low", "close"]] *= 0.1  # re-adjusted upstream
+    assert state.advance(*_columns(split)) is None
+    assert state.advance(*_columns(df.iloc[260:])) is None  # the settled bar is missing
+
+
+@pytest.mark.asyncio
+async def test_warm_build_fetches_only_the_tail_and_matches_a_full_rebuild():
+    full = _recent(430, 31)
+    frames = {"INCA": full.iloc[:420]}
+    calls = []
+    svc = _service(frames, calls)
+    froms = []
+    fetch = svc._fetch_daily_ohlcv_uncached
+
+    async def tracking(ticker, from_date=None):
+        froms.append(from_date)
+        return await fetch(ticker, from_date)
+
+    svc._fetch_daily_ohlcv_uncached = tracking
+    _forget("INCA")
+    try:
+        await svc._build_analysis("INCA", False)  # cold: full history, seeds the states
+        assert tas._state_cache.lookup("INCA:daily") is not None
+
+        frames["INCA"] = full  # ten more sessions, the last one still forming
+        warm = await svc._build_analysis("INCA", False)
+        assert froms and froms[-1] is not None
+        assert (full.index[-1] - pd.Timestamp(froms[-1])).days < 30  # a tail, not 600 days
+
+        _forget("INCA")
+        rebuilt = await svc._build_analysis("INCA", False)
+        assert warm.model_dump() == rebuilt.model_dump()
+
+        # A split re-adjusts the whole history: the state no longer lines up.
+        split = full.copy()
+        split[["open", "high", "low", "close"]] /= 4
+        frames["INCA"] = split
+        calls.clear()
+        adjusted = await svc._build_analysis("INCA", False)
+        assert calls[-1] == "INCA" and len(calls) == 2  # the tail, then the full history
+        _forget("INCA")
+        assert adjusted.model_dump() == (await svc._build_analysis("INCA", False)).model_dump()
+    finally:
+        _forget("INCA")
+
+
+@pytest.mark.asyncio
+async def test_second_sweep_advances_instead_of_refetching():
+    frames = {"SWA": _recent(413, 41), "SWB": _recent(200, 42)}
+    svc = _service(frames)
+    froms = []
+    fetch = svc._fetch_daily_ohlcv_uncached
+
+    async def tracking(ticker, from_date=None):
+        froms.append(from_date)
+        return await fetch(ticker, from_date)
+
+    svc._fetch_daily_ohlcv_uncached = tracking
+    _forget(*frames)
+    try:
+        assert await svc.precompute_universe(list(frames)) == 2
+        assert froms == [None, None]  # cold: full histories
+        froms.clear()
+        assert await svc.precompute_universe(list(frames)) == 2
+        assert len(froms) == 2 and all(f is not None for f in froms)
+    finally:
+        _forget(*frames)
@@ -73,6 +73,7 @@ _INFLIGHT_MODULES = [
     "signals_service.py",
     "valuation_snapshot_service.py",
     "widget_movers_service.py",
+    "price_bus.py",
 ]
 
 
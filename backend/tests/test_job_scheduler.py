@@ -0,0 +1,412 @@
+"""
+The in-process job scheduler (app/core/scheduler.py) and the job table (app/jobs.py).
+
+Pinned here: cron / interval / calendar schedules fire when they say; a pass that would
+exceed its job's cap is skipped, not stacked; the global budget caps concurrent passes
+across jobs; a pass defers while request p95 is above the threshold and is never starved
+past the max deferral; a failing pass is recorded and the job keeps its schedule; a leased
+pass is skipped while another process holds the job and releases its lease on failure; and
+every loop lifespan used to spawn by hand is registered as a named job, split between the
+API and the worker with nothing missing or doubled.
+
+Time-based cases use millisecond intervals so the file runs in well under a second.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.scheduler import (
+    At,
+    BackgroundBudget,
+    Cron,
+    Every,
+    Job,
+    JobScheduler,
+    RequestLatencyTracker,
+)
+
+
+def _budget(max_concurrent=2, threshold=1.0, max_defer=0.2, tracker=None):
+    return BackgroundBudget(
+        max_concurrent=max_concurrent,
+        latency=tracker or RequestLatencyTracker(60, min_samples=5),
+        p95_threshold_seconds=threshold,
+        max_defer_seconds=max_defer,
+        poll_seconds=0.01,
+    )
+
+
+def _utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+# ── schedules ──
+
+
+def test_daily_cron_fires_at_the_next_occurrence():
+    cron = Cron("0 8 * * *")
+    assert cron.next_after(_utc(2026, 3, 2, 7, 59, 30)) == _utc(2026, 3, 2, 8, 0)
+    # Strictly after: AT the fire time means tomorrow.
+    assert cron.next_after(_utc(2026, 3, 2, 8, 0)) == _utc(2026, 3, 3, 8, 0)
+
+
+def test_cron_steps_lists_and_ranges():
+    assert Cron("*/15 * * * *").next_after(_utc(2026, 3, 2, 9, 16)) == _utc(2026, 3, 2, 9, 30)
+    assert Cron("0 9,17 * * 1-5").next_after(_utc(2026, 3, 6, 18, 0)) == _utc(2026, 3, 9, 9, 0)
+
+
+def test_weekly_cron_matches_the_ttm_calendar():
+    from app.jobs import _next_weekly_ttm_run
+
+    cron = Cron("0 6 * * 0")
+    now = _utc(2026, 1, 1, 0, 0)
+    for _ in range(40):
+        assert cron.next_after(now) == _next_weekly_ttm_run(now)
+        now += timedelta(hours=61)
+
+
+def test_cron_in_a_market_timezone_follows_dst():
+    close = Cron("0 16 * * 1-5", tz="America/New_York")
+    assert close.next_after(_utc(2026, 7, 1, 12, 0)) == _utc(2026, 7, 1, 20, 0)
+    assert close.next_after(_utc(2026, 12, 1, 12, 0)) == _utc(2026, 12, 1, 21, 0)
+
+
+def test_restricted_day_fields_match_either():
+    # The 1st of the month OR any Monday.
+    cron = Cron("0 0 1 * 1")
+    assert cron.next_after(_utc(2026, 3, 2, 1, 0)) == _utc(2026, 3, 9, 0, 0)  # a Monday
+    assert cron.next_after(_utc(2026, 3, 30, 1, 0)) == _utc(2026, 4, 1, 0, 0)
+
+
+@pytest.mark.parametrize("expr", ["0 8 * *", "60 * * * *", "0 8 32 * *", "*/0 * * * *"])
+def test_bad_cron_is_rejected(expr):
+    with pytest.raises(ValueError):
+        Cron(expr)
+
+
+# ── passes, caps and the budget ──
+
+
+@pytest.mark.asyncio
+async def test_interval_job_runs_after_its_delay_and_repeats():
+    ran = []
+
+    async def work():
+        ran.append(1)
+
+    sched = JobScheduler(_budget())
+    sched.register(Job("tick", work, Every(0.01), start_delay=0.01))
+    task = sched.start(lambda coro, name: asyncio.create_task(coro, name=name))["tick"]
+    await asyncio.sleep(0.1)
+    task.cancel()
+    assert len(ran) >= 3
+    status = sched.status()["jobs"]["tick"]
+    assert status["runs"] == len(ran) and status["failures"] == 0
+    assert status["last_duration_seconds"] is not None
+
+
+@pytest.mark.asyncio
+async def test_calendar_job_waits_for_its_first_slot():
+    ran = []
+
+    async def work():
+        ran.append(1)
+
+    sched = JobScheduler(_budget())
+    far = _utc(2099, 1, 1)
+    sched.register(Job("quarterly", work, At(lambda now: far, "never soon"), run_on_start=False))
+    task = sched.start(lambda coro, name: asyncio.create_task(coro, name=name))["quarterly"]
+    await asyncio.sleep(0.02)
+    task.cancel()
+    assert ran == []
+    assert sched.status()["jobs"]["quarterly"]["next_run_at"].startswith("2099-01-01")
+
+
+@pytest.mark.asyncio
+async def test_overlapping_pass_is_skipped_not_stacked():
+    gate = asyncio.Event()
+
+    async def work():
+        await gate.wait()
+
+    sched = JobScheduler(_budget())
+    sched.register(Job("sweep", work, Every(60)))
+    first = asyncio.create_task(sched.run_once("sweep"))
+    await asyncio.sleep(0)
+    assert await sched.run_once("sweep") is False
+    gate.set()
+    assert await first is True
+    assert sched.status()["jobs"]["sweep"]["skipped"] == 1
+
+
+@pytest.mark.asyncio
+async def test_global_budget_caps_concurrent_passes_across_jobs():
+    active, peak = 0, 0
+
+    async def work():
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.02)
+        active -= 1
+
+    sched = JobScheduler(_budget(max_concurrent=1))
+    for name in ("a", "b", "c"):
+        sched.register(Job(name, work, Every(60)))
+    await asyncio.gather(*(sched.run_once(n) for n in ("a", "b", "c")))
+    assert peak == 1
+
+
+@pytest.mark.asyncio
+async def test_unbudgeted_job_ignores_the_budget():
+    gate = asyncio.Event()
+
+    async def hog():
+        await gate.wait()
+
+    async def alert():
+        return None
+
+    sched = JobScheduler(_budget(max_concurrent=1))
+    sched.register(Job("hog", hog, Every(60)))
+    sched.register(Job("alerts", alert, Every(60), budgeted=False))
+    hogging = asyncio.create_task(sched.run_once("hog"))
+    await asyncio.sleep(0)
+    assert await asyncio.wait_for(sched.run_once("alerts"), timeout=0.1) is True
+    gate.set()
+    await hogging
+
+
+@pytest.mark.asyncio
+async def test_pass_defers_while_requests_are_slow_then_runs():
+    tracker = RequestLatencyTracker(60, min_samples=5)
+    for _ in range(10):
+        tracker.record(3.0)
+    budget = _budget(threshold=1.0, max_defer=5.0, tracker=tracker)
+    assert budget.congested()
+
+    async def recover():
+        await asyncio.sleep(0.05)
+        tracker._samples.clear()
+        tracker._memo = (0.0, None)
+
+    asyncio.create_task(recover())
+    async with budget.slot() as waited:
+        assert 0.04 <= waited < 1.0
+    assert budget.deferrals == 1 and budget.forced == 0
+
+
+@pytest.mark.asyncio
+async def test_deferral_is_bounded():
+    tracker = RequestLatencyTracker(60, min_samples=5)
+    for _ in range(10):
+        tracker.record(3.0)
+    budget = _budget(threshold=1.0, max_defer=0.05, tracker=tracker)
+    async with budget.slot() as waited:
+        assert waited < 0.5
+    assert budget.forced == 1
+
+
+def test_too_few_requests_is_not_congestion():
+    tracker = RequestLatencyTracker(60, min_samples=20)
+    for _ in range(5):
+        tracker.record(10.0)
+    assert tracker.p95() is None
+    assert not _budget(tracker=tracker).congested()
+
+
+@pytest.mark.asyncio
+async def test_failing_pass_is_recorded_and_the_job_keeps_running():
+    calls = []
+
+    async def flaky():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("upstream down")
+
+    sched = JobScheduler(_budget())
+    sched.register(Job("flaky", flaky, Every(0.01)))
+    task = sched.start(lambda coro, name: asyncio.create_task(coro, name=name))["flaky"]
+    await asyncio.sleep(0.05)
+    task.cancel()
+    status = sched.status()["jobs"]["flaky"]
+    assert status["failures"] == 1 and status["runs"] >= 2
+    assert status["last_error"] is None  # cleared by the next good pass
+
+
+@pytest.mark.asyncio
+async def test_unregistered_pass_still_runs():
+    sched = JobScheduler(_budget())
+    async with sched.running("not-registered") as ok:
+        assert ok is True
+
+
+def test_duplicate_names_are_rejected():
+    sched = JobScheduler(_budget())
+
+    async def work():
+        return None
+
+    sched.register(Job("x", work, Every(1)))
+    with pytest.raises(ValueError):
+        sched.register(Job("x", work, Every(1)))
+
+
+# ── the lifespan's job table ──
+
+
+_ALL_JOBS = {
+    "warm_social_cache", "news_pre_warmer", "report_pre_warmer", "scanner_pre_warmer",
+    "industry_dossier", "ttm_benchmark", "volatility_precompute", "whale_hydration",
+    "whale_profile_pre_warmer", "research_reconciliation", "subscription_expiry",
+    "insight_sweeper", "notification_dispatch", "notification_senders", "price_alerts",
+    "ta_precompute", "price_bus_poll",
+}
+_PROCESS_LOCAL = {"warm_social_cache", "scanner_pre_warmer", "ta_precompute"}
+
+
+def _registered(process, runner, monkeypatch):
+    from app import jobs
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "BACKGROUND_JOBS_RUNNER", runner)
+    sched = JobScheduler(_budget())
+    jobs.register_background_jobs(sched, process=process)
+    jobs.register_notification_jobs(sched, process=process)
+    return sched
+
+
+def test_every_background_loop_is_a_registered_job(monkeypatch):
+    sched = _registered("web", "web", monkeypatch)
+    assert set(sched.jobs) == _ALL_JOBS
+    # User-visible deliveries must never wait behind request latency.
+    for name in ("notification_dispatch", "notification_senders", "price_alerts",
+                 "research_reconciliation", "price_bus_poll"):
+        assert sched.jobs[name].budgeted is False, name
+
+
+def test_worker_mode_splits_the_table_without_gaps_or_overlap(monkeypatch):
+    web = set(_registered("web", "worker", monkeypatch).jobs)
+    worker = set(_registered("worker", "worker", monkeypatch).jobs)
+    assert web == _PROCESS_LOCAL
+    assert worker == _ALL_JOBS - _PROCESS_LOCAL
+    # The whale warm is ordered on an in-process event set by hydration: same process.
+    assert {"whale_hydration", "whale_profile_pre_warmer"} <= worker
+
+
+def test_the_lease_is_only_installed_in_worker_mode(monkeypatch):
+    from app import jobs
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "BACKGROUND_JOBS_RUNNER", "web")
+    assert jobs.job_lease_hook() is None
+    monkeypatch.setattr(settings, "BACKGROUND_JOBS_RUNNER", "worker")
+    assert jobs.job_lease_hook() is not None
+
+
+# ── cross-process leases ──
+
+
+def _fake_lease(granted, log):
+    from contextlib import asynccontextmanager
+
+    @asynccontextmanager
+    async def lease(name, seconds):
+        log.append(("claim", name, seconds))
+        if not granted:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            log.append(("release", name))
+
+    return lease
+
+
+@pytest.mark.asyncio
+async def test_pass_is_skipped_while_another_process_holds_the_lease():
+    ran, log = [], []
+
+    async def work():
+        ran.append(1)
+
+    sched = JobScheduler(_budget(), lease=_fake_lease(False, log))
+    sched.register(Job("news", work, Every(60), lease_seconds=30))
+    assert await sched.run_once("news") is False
+    assert ran == [] and log == [("claim", "news", 30)]
+    status = sched.status()["jobs"]["news"]
+    assert status["lease_skipped"] == 1 and status["runs"] == 0
+
+
+@pytest.mark.asyncio
+async def test_lease_is_released_even_when_the_pass_fails():
+    log = []
+
+    async def boom():
+        raise RuntimeError("upstream down")
+
+    sched = JobScheduler(_budget(), lease=_fake_lease(True, log))
+    sched.register(Job("news", boom, Every(60), lease_seconds=30))
+    assert await sched.run_once("news") is False
+    assert log == [("claim", "news", 30), ("release", "news")]
+    assert sched.status()["jobs"]["news"]["failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_unleased_jobs_never_touch_the_lease():
+    log = []
+
+    async def work():
+        return None
+
+    sched = JobScheduler(_budget(), lease=_fake_lease(False, log))
+    sched.register(Job("alerts", work, Every(60), budgeted=False))
+    assert await sched.run_once("alerts") is True
+    assert log == []
+
+
+@pytest.mark.asyncio
+async def test_job_lease_fails_closed_and_records_the_outcome(monkeypatch):
+    from app.services import notification_jobs
+
+    released = []
+    monkeypatch.setattr(notification_jobs, "claim_lease", lambda job, seconds: False)
+    async with notification_jobs.job_lease("news", 30) as held:
+        assert held is False
+
+    monkeypatch.setattr(notification_jobs, "claim_lease", lambda job, seconds: True)
+    monkeypatch.setattr(
+        notification_jobs, "release_lease",
+        lambda job, success, error=None: released.append((job, success, error)),
+    )
+    with pytest.raises(RuntimeError):
+        async with notification_jobs.job_lease("news", 30) as held:
+            assert held is True
+            raise RuntimeError("boom")
+    assert released == [("news", False, "RuntimeError: boom")]
+
+
+def test_a_failing_lease_rpc_is_a_refusal(monkeypatch):
+    from app.services import notification_jobs
+
+    class _Down:
+        def rpc(self, *a, **kw):
+            raise ConnectionError("supabase unreachable")
+
+    monkeypatch.setattr(notification_jobs, "_sb", lambda: _Down())
+    assert notification_jobs.claim_lease("news", 30) is False
+    notification_jobs.release_lease("news", success=True)  # never raises
+
+
+def test_request_timing_feeds_the_budget():
+    from fastapi.testclient import TestClient
+
+    from app.core import scheduler
+    from app.main import app
+
+    before = len(scheduler._request_latency._samples)
+    TestClient(app).get("/health/live")
+    assert len(scheduler._request_latency._samples) == before + 1
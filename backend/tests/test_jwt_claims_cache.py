@@ -0,0 +1,129 @@
+"""
+The verified-claims cache in app/core/security.py (`verified_claims`).
+
+A bearer that verified once is answered from an LRU until its `exp` instead of re-running
+the signature check on every request. Pinned here: the second decode does not touch jose,
+the key material is part of the cache key (a rotated secret misses rather than honouring an
+old token), entries die at `exp`, failures are never cached, the LRU stays bounded, and the
+password-change eviction still fires on a cached token.
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+from jose import JWTError, jwt
+
+from app.core import security
+from app.core.security import VerifiedClaimsCache, create_access_token, decode_token
+from app.dependencies import _reject_if_password_changed_since_issue
+
+_USER_ID = "11111111-2222-3333-4444-555555555555"
+
+
+def _count_decodes(monkeypatch) -> list:
+    calls = []
+    real = security.jwt.decode
+
+    def counting(*a, **k):
+        calls.append(1)
+        return real(*a, **k)
+
+    monkeypatch.setattr(security.jwt, "decode", counting)
+    return calls
+
+
+def test_second_decode_is_a_cache_hit(monkeypatch):
+    calls = _count_decodes(monkeypatch)
+    token = create_access_token({"sub": _USER_ID})
+    first = decode_token(token)
+    second = decode_token(token)
+    assert first == second and first["sub"] == _USER_ID
+    assert len(calls) == 1
+
+
+def test_cached_payload_is_a_copy():
+    token = create_access_token({"sub": _USER_ID})
+    decode_token(token)["sub"] = "someone-else"
+    assert decode_token(token)["sub"] == _USER_ID
+
+
+def test_rotated_secret_misses_the_cache(monkeypatch):
+    token = create_access_token({"sub": _USER_ID})
+    decode_token(token)
+    monkeypatch.setattr(security.settings, "SECRET_KEY", "rotated-" + security.settings.SECRET_KEY)
+    with pytest.raises(JWTError):
+        decode_token(token)
+
+
+def test_failures_are_not_cached(monkeypatch):
+    calls = _count_decodes(monkeypatch)
+    for _ in range(3):
+        with pytest.raises(JWTError):
+            decode_token("not.a.jwt")
+    assert len(calls) == 3
+
+
+def test_entry_expires_at_exp(monkeypatch):
+    cache = VerifiedClaimsCache(8)
+    key = VerifiedClaimsCache.key("t", "m")
+    cache.put(key, {"sub": "u", "exp": time.time() + 60})
+    assert cache.get(key) is not None
+    real_time = time.time
+    monkeypatch.setattr(security.time, "time", lambda: real_time() + 61)
+    assert cache.get(key) is None
+    assert len(cache) == 0
+
+
+def test_payload_without_exp_is_not_cached():
+    cache = VerifiedClaimsCache(8)
+    key = VerifiedClaimsCache.key("t")
+    cache.put(key, {"sub": "u"})
+    assert cache.get(key) is None
+
+
+def test_lru_is_bounded():
+    cache = VerifiedClaimsCache(3)
+    exp = time.time() + 60
+    keys = [VerifiedClaimsCache.key(f"t{i}") for i in range(4)]
+    for k in keys[:3]:
+        cache.put(k, {"exp": exp})
+    cache.get(keys[0])  # touch → keys[1] is now the oldest
+    cache.put(keys[3], {"exp": exp})
+    assert len(cache) == 3
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+
+
+@pytest.mark.asyncio
+async def test_supabase_hs256_is_cached_per_secret(monkeypatch):
+    monkeypatch.setattr(security.settings, "SUPABASE_JWT_SECRET", "sb-secret")
+    token = jwt.encode(
+        {"sub": _USER_ID, "aud": "authenticated",
+         "exp": datetime.now(timezone.utc) + timedelta(hours=1)},
+        "sb-secret",
+        algorithm="HS256",
+    )
+    calls = _count_decodes(monkeypatch)
+    assert (await security.verify_supabase_token(token))["sub"] == _USER_ID
+    assert (await security.verify_supabase_token(token))["sub"] == _USER_ID
+    assert len(calls) == 1
+
+    monkeypatch.setattr(security.settings, "SUPABASE_JWT_SECRET", "rotated")
+    assert await security.verify_supabase_token(token) is None
+
+
+def test_password_change_still_evicts_a_cached_token():
+    now = datetime.now(timezone.utc)
+    token = jwt.encode(
+        {"sub": _USER_ID, "type": "access", "iat": int((now - timedelta(minutes=5)).timestamp()),
+         "exp": now + timedelta(hours=1)},
+        security.settings.SECRET_KEY,
+        algorithm=security.settings.ALGORITHM,
+    )
+    decode_token(token)  # cached
+    row = {"id": _USER_ID, "password_changed_at": now.isoformat()}
+    with pytest.raises(HTTPException) as exc:
+        _reject_if_password_changed_since_issue(token, row)
+    assert exc.value.status_code == 401
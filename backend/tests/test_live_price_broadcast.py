@@ -0,0 +1,185 @@
+"""Room fan-out in LivePriceManager: conflation, one encode per frame, per-client outboxes.
+
+Pinned here: a broadcast serializes its frame once however many clients the room has,
+and every client receives those exact bytes; it never waits on a client, so a stuck
+connection delays nobody and only keeps the newest few frames; a client whose send
+fails leaves the room; a burst of ticks inside a room's conflation window goes
+out as the newest one; and a many-symbol subscribe fetches its previous closes
+concurrently without holding up another client's room join. The upstream pool is
+stubbed — no sockets.
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+import app.services.live_price_manager as m
+
+
+class _Client:
+    def __init__(self):
+        self.texts = []
+
+    async def send_text(self, text):
+        self.texts.append(text)
+
+    async def close(self):
+        pass
+
+
+class _NoUpstream:
+    async def subscribe(self, ticker):
+        pass
+
+    async def unsubscribe(self, ticker):
+        pass
+
+    async def close(self):
+        pass
+
+    def __len__(self):
+        return 0
+
+
+def _manager(monkeypatch, fps=0):
+    monkeypatch.setattr(m.settings, "LIVE_PRICE_MAX_FRAMES_PER_SECOND", fps)
+    mgr = m.LivePriceManager()
+    mgr._upstream = _NoUpstream()
+
+    async def fetch(room):
+        room.previous_close = 100.0
+        room.previous_close_epoch_day = 10**9
+
+    mgr._fetch_previous_close = fetch
+    return mgr
+
+
+def _update(price):
+    return {"type": "price_update", "symbol": "SPY", "price": price}
+
+
+async def _until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not met in time"
+        await asyncio.sleep(0.005)
+
+
+@pytest.mark.asyncio
+async def test_one_encode_per_frame_for_the_whole_room(monkeypatch):
+    mgr = _manager(monkeypatch)
+    clients = [_Client() for _ in range(50)]
+    for c in clients:
+        await mgr.subscribe("SPY", c)
+    encodes = []
+    real = m._encode
+    monkeypatch.setattr(m, "_encode", lambda msg: encodes.append(msg) or real(msg))
+
+    await mgr._broadcast(mgr._rooms["SPY"], _update(500.25))
+    await _until(lambda: all(c.texts for c in clients))
+
+    assert len(encodes) == 1
+    assert {c.texts[0] for c in clients} == {json.dumps(_update(500.25), separators=(",", ":"))}
+
+    # A late joiner gets the cached frame, still without another encode.
+    late = _Client()
+    await mgr.subscribe("SPY", late)
+    await _until(lambda: late.texts)
+    assert late.texts == clients[0].texts and len(encodes) == 1
+    await mgr.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_a_stuck_client_delays_nobody_and_keeps_only_fresh_frames(monkeypatch):
+    mgr = _manager(monkeypatch)
+    release = asyncio.Event()
+
+    class _Stuck(_Client):
+        async def send_text(self, text):
+            await release.wait()
+            self.texts.append(text)
+
+    stuck, fast = _Stuck(), _Client()
+    await mgr.subscribe("SPY", stuck)
+    await mgr.subscribe("SPY", fast)
+    room = mgr._rooms["SPY"]
+
+    for i in range(20):
+        await asyncio.wait_for(mgr._broadcast(room, _update(float(i))), timeout=0.5)
+        await asyncio.sleep(0)
+    await _until(lambda: len(fast.texts) == 20)
+
+    release.set()
+    await _until(lambda: stuck.texts and json.loads(stuck.texts[-1])["price"] == 19.0)
+    # The frame already in flight, then only the newest the queue could hold.
+    assert len(stuck.texts) <= 1 + m._CLIENT_QUEUE_MAX
+    await mgr.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_a_client_whose_send_fails_leaves_the_room(monkeypatch):
+    mgr = _manager(monkeypatch)
+
+    class _Dead(_Client):
+        async def send_text(self, text):
+            raise RuntimeError("socket closed")
+
+    dead, alive = _Dead(), _Client()
+    await mgr.subscribe("SPY", dead)
+    await mgr.subscribe("SPY", alive)
+    await mgr._broadcast(mgr._rooms["SPY"], _update(1.0))
+    await _until(lambda: dead not in mgr._rooms["SPY"].clients)
+    assert alive in mgr._rooms["SPY"].clients and dead not in mgr._rooms["SPY"].outboxes
+    await mgr.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_ticks_inside_the_window_conflate_to_the_newest(monkeypatch):
+    mgr = _manager(monkeypatch, fps=10)
+    client = _Client()
+    await mgr.subscribe("SPY", client)
+    assert mgr._rooms["SPY"].frame_interval == pytest.approx(0.1)
+
+    for i in range(30):
+        mgr._on_tick("SPY", {"s": "spy", "lp": 100.0 + i, "t": int(time.time())})
+        await asyncio.sleep(0.001)
+    await _until(lambda: client.texts and json.loads(client.texts[-1])["price"] == 129.0)
+    await asyncio.sleep(0.15)
+    prices = [json.loads(t)["price"] for t in client.texts]
+    assert prices[-1] == 129.0
+    assert len(prices) < 10  # ~30 ms of ticks at 10 frames/s, not one frame per tick
+    assert prices == sorted(prices)
+    await mgr.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_a_large_subscribe_does_not_block_other_joins(monkeypatch):
+    mgr = _manager(monkeypatch)
+    await mgr.subscribe("SPY", _Client())
+    gate = asyncio.Event()
+    fetching = []
+
+    async def slow_fetch(room):
+        fetching.append(room.ticker)
+        await gate.wait()
+        room.previous_close = 100.0
+
+    mgr._fetch_previous_close = slow_fetch
+    big = _Client()
+    symbols = [f"T{i}" for i in range(40)]
+    batch = asyncio.create_task(mgr.subscribe_many(symbols, big))
+    await _until(lambda: len(fetching) == 40)      # all in flight at once
+
+    # Another client joins an open room while those closes are outstanding.
+    other = _Client()
+    await asyncio.wait_for(mgr.subscribe("SPY", other), 0.5)
+    assert other in mgr._rooms["SPY"].clients
+    assert not batch.done()
+
+    gate.set()
+    await batch
+    assert all(big in mgr._rooms[s].clients for s in symbols)
+    assert {mgr._rooms[s].previous_close for s in symbols} == {100.0}
+    await mgr.shutdown()
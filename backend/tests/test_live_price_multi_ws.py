@@ -0,0 +1,152 @@
+"""The multi-ticker live-price socket (`/ws/prices`) and its BatchedPriceClient.
+
+Pinned here: ticks are conflated per symbol and flushed as one batched frame; an
+unwatched or lost symbol never reaches the client; the endpoint answers subscribe /
+unsubscribe with the full symbol set, refuses stock symbols outside market hours,
+rejects bad input, takes a single slot of the per-user cap, and leaves every room
+on disconnect. The endpoint runs against a fake manager — no FMP.
+"""
+
+import asyncio
+import time
+from collections import defaultdict
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1.endpoints import live_price
+from app.services.live_price_manager import BatchedPriceClient
+
+
+class _Socket:
+    def __init__(self):
+        self.sent = []
+
+    async def send_json(self, message):
+        self.sent.append(message)
+
+
+def _tick(symbol, price):
+    return {"type": "price_update", "symbol": symbol, "price": price}
+
+
+@pytest.mark.asyncio
+async def test_ticks_are_conflated_into_one_batched_frame():
+    socket = _Socket()
+    client = BatchedPriceClient(socket, interval=0.05)
+    client.symbols.update({"AAPL", "MSFT"})
+    for price in (1.0, 2.0, 3.0):
+        await client.send_json(_tick("AAPL", price))
+    await client.send_json(_tick("MSFT", 9.0))
+    await client.send_json(_tick("TSLA", 5.0))  # not watched: dropped
+
+    flusher = asyncio.create_task(client.run())
+    await asyncio.sleep(0.01)
+    assert socket.sent == [{"type": "prices", "data": [_tick("AAPL", 3.0), _tick("MSFT", 9.0)]}]
+
+    # A lost feed drops the symbol and is passed on; later ticks for it are ignored.
+    await client.send_json({"type": "error", "symbol": "MSFT", "message": "gone"})
+    await client.send_json(_tick("MSFT", 10.0))
+    await client.send_json(_tick("AAPL", 4.0))
+    await asyncio.sleep(0.08)
+    assert socket.sent[1:] == [
+        {"type": "error", "symbol": "MSFT", "message": "gone"},
+        {"type": "prices", "data": [_tick("AAPL", 4.0)]},
+    ]
+    assert client.symbols == {"AAPL"}
+    flusher.cancel()
+
+
+class _FakeManager:
+    def __init__(self):
+        self.rooms = defaultdict(set)
+
+    async def subscribe(self, ticker, client):
+        self.rooms[ticker].add(client)
+        await client.send_json(_tick(ticker, 100.0))  # the room's cached price
+
+    async def subscribe_many(self, tickers, client):
+        for ticker in tickers:
+            await self.subscribe(ticker, client)
+
+    async def unsubscribe(self, ticker, client):
+        self.rooms[ticker].discard(client)
+        if not self.rooms[ticker]:
+            del self.rooms[ticker]
+
+
+def _settled(predicate, timeout=2.0):
+    # The handler's cleanup runs on the TestClient's loop after the socket closes.
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+@pytest.fixture
+def endpoint(monkeypatch):
+    manager = _FakeManager()
+    state = {"market_open": True}
+    monkeypatch.setattr(live_price, "get_live_price_manager", lambda: manager)
+    monkeypatch.setattr(live_price, "is_market_active", lambda: state["market_open"])
+    monkeypatch.setattr(live_price, "_BATCH_INTERVAL_SECONDS", 0.01)
+    app = FastAPI()
+    app.include_router(live_price.router)
+    with TestClient(app) as client:
+        yield client, manager, state
+
+
+def test_subscribe_batches_and_unsubscribe(endpoint):
+    client, manager, _ = endpoint
+    with client.websocket_connect("/ws/prices") as ws:
+        ws.send_json({"action": "subscribe", "symbols": ["aapl", "BTCUSD", "AAPL"]})
+        assert ws.receive_json() == {
+            "type": "subscriptions", "symbols": ["AAPL", "BTCUSD"],
+            "rejected": [], "market_closed": [],
+        }
+        frame = ws.receive_json()
+        assert frame["type"] == "prices"
+        assert sorted(p["symbol"] for p in frame["data"]) == ["AAPL", "BTCUSD"]
+        assert set(manager.rooms) == {"AAPL", "BTCUSD"}
+
+        ws.send_json({"action": "unsubscribe", "symbols": ["AAPL"]})
+        assert ws.receive_json()["symbols"] == ["BTCUSD"]
+        assert set(manager.rooms) == {"BTCUSD"}
+
+        ws.send_json({"action": "ping"})
+        assert ws.receive_json() == {"type": "pong"}
+    # Disconnect leaves every room and frees the connection slot.
+    assert _settled(lambda: not manager.rooms and not live_price._active_connections)
+
+
+def test_closed_market_and_bad_input(endpoint):
+    client, manager, state = endpoint
+    state["market_open"] = False
+    with client.websocket_connect("/ws/prices") as ws:
+        ws.send_json({"action": "subscribe", "symbols": ["AAPL", "ETHUSD", "bad ticker!", 7]})
+        reply = ws.receive_json()
+        assert reply["symbols"] == ["ETHUSD"]
+        assert reply["market_closed"] == ["AAPL"]
+        assert reply["rejected"] == ["bad ticker!", "7"]
+        assert ws.receive_json()["data"] == [_tick("ETHUSD", 100.0)]
+
+        ws.send_text("not json")
+        assert ws.receive_json()["type"] == "error"
+        ws.send_json({"action": "subscribe", "symbols": ["X"] * (live_price._MAX_SYMBOLS_PER_CONNECTION + 1)})
+        assert ws.receive_json() == {"type": "error", "message": "Too many symbols"}
+        ws.send_json({"action": "dance"})
+        assert ws.receive_json() == {"type": "error", "message": "Unknown action"}
+    assert _settled(lambda: not manager.rooms)
+
+
+def test_a_watchlist_socket_takes_one_slot_of_the_cap(endpoint, monkeypatch):
+    client, _, _ = endpoint
+    monkeypatch.setattr(live_price, "_MAX_CONNECTIONS_PER_KEY", 1)
+    with client.websocket_connect("/ws/prices") as ws:
+        ws.send_json({"action": "subscribe", "symbols": [f"S{i}" for i in range(60)]})
+        assert len(ws.receive_json()["symbols"]) == 60
+        with pytest.raises(Exception):
+            with client.websocket_connect("/ws/prices") as second:
+                second.receive_json()
+    assert _settled(lambda: not live_price._active_connections)
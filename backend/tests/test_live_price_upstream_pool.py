@@ -0,0 +1,196 @@
+"""The pooled upstream FMP sockets behind LivePriceManager.
+
+Against a local fake FMP server (tests/fake_fmp_ws.py) on each endpoint: many tickers
+share a few sockets, stock and crypto stay on their own hosts (crypto logs in first and
+subscribes lowercase), ticks reach only their own room, a dropped socket comes back
+with every ticker re-subscribed in one bulk event, a socket is closed with its last
+ticker, and a socket that cannot reconnect tells its rooms the feed is gone.
+"""
+
+import asyncio
+import json
+
+import pytest
+import pytest_asyncio
+
+import app.services.live_price_manager as m
+from tests.fake_fmp_ws import FakeFMPServer, eventually
+
+
+class _Client:
+    def __init__(self):
+        self.frames = []
+        self.closed = False
+
+    async def send_text(self, text):
+        self.frames.append(json.loads(text))
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest_asyncio.fixture
+async def servers(monkeypatch):
+    stock, crypto = FakeFMPServer(), FakeFMPServer(require_login=True)
+    await stock.start()
+    await crypto.start()
+    monkeypatch.setattr(m, "FMP_WS_URL_STOCK", stock.url)
+    monkeypatch.setattr(m, "FMP_WS_URL_CRYPTO", crypto.url)
+    monkeypatch.setattr(m, "_RECONNECT_BACKOFF_SECONDS", 0.01)
+    monkeypatch.setattr(m.settings, "LIVE_PRICE_MAX_FRAMES_PER_SECOND", 0)
+    yield stock, crypto
+    await stock.stop()
+    await crypto.stop()
+
+
+def _manager(per_socket=3):
+    mgr = m.LivePriceManager()
+    mgr._upstream = m.FMPUpstreamPool(
+        mgr._on_tick, mgr._on_upstream_lost, symbols_per_socket=per_socket,
+        sockets_per_endpoint=2,
+    )
+
+    async def fetch(room):
+        room.previous_close = 100.0
+        room.previous_close_epoch_day = 10**9  # never stale
+
+    mgr._fetch_previous_close = fetch
+    return mgr
+
+
+def _subscribed(server):
+    return sorted(t for c in server.live for t in c.subscribed)
+
+
+@pytest.mark.asyncio
+async def test_tickers_pack_onto_a_few_sockets_per_endpoint(servers):
+    stock, crypto = servers
+    mgr = _manager(per_socket=3)
+    stocks = ["AAPL", "MSFT", "NVDA", "SPY", "TSLA", "AMD", "META", "GOOG"]
+    for t in stocks + ["BTCUSD", "ETHUSD"]:
+        await mgr.subscribe(t, _Client())
+
+    await eventually(lambda: _subscribed(stock) == sorted(t.lower() for t in stocks))
+    await eventually(lambda: _subscribed(crypto) == ["btcusd", "ethusd"])
+    # Two sockets of three, then the cap: the rest go to the least loaded one.
+    assert len(stock.live) == 2 and len(crypto.live) == 1
+    assert sorted(len(c.subscribed) for c in stock.live) == [4, 4]
+    assert crypto.live[0].events[0]["event"] == "login"
+    assert len(mgr._upstream) == 3
+    await mgr.shutdown()
+    assert len(mgr._upstream) == 0
+
+
+@pytest.mark.asyncio
+async def test_ticks_are_demuxed_to_their_own_room(servers):
+    stock, crypto = servers
+    mgr = _manager()
+    aapl, msft, btc = _Client(), _Client(), _Client()
+    await mgr.subscribe("AAPL", aapl)
+    await mgr.subscribe("MSFT", msft)
+    await mgr.subscribe("BTCUSD", btc)
+    await eventually(lambda: len(_subscribed(stock)) == 2 and _subscribed(crypto) == ["btcusd"])
+
+    await stock.tick("AAPL", 110.0, v=5)
+    await stock.tick("MSFT", 90.0)
+    await crypto.tick("BTCUSD", 150.0)
+    await eventually(lambda: aapl.frames and msft.frames and btc.frames)
+
+    assert [f["symbol"] for f in aapl.frames] == ["AAPL"]
+    assert aapl.frames[0]["price"] == 110.0 and aapl.frames[0]["change_percent"] == 10.0
+    assert aapl.frames[0]["volume"] == 5
+    assert [f["symbol"] for f in msft.frames] == ["MSFT"]
+    assert btc.frames[0]["symbol"] == "BTCUSD" and btc.frames[0]["change"] == 50.0
+    await mgr.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_reconnect_resubscribes_every_ticker_in_bulk(servers):
+    stock, _ = servers
+    mgr = _manager(per_socket=10)
+    tickers = ["AAPL", "MSFT", "NVDA", "SPY"]
+    for t in tickers:
+        await mgr.subscribe(t, _Client())
+    await eventually(lambda: len(_subscribed(stock)) == 4)
+    first = stock.live[0]
+
+    await stock.drop()
+    await eventually(lambda: stock.live and stock.live[0] is not first and len(_subscribed(stock)) == 4)
+    events = stock.live[0].events
+    assert len(events) == 1 and events[0]["event"] == "subscribe"
+    assert sorted(events[0]["data"]["ticker"]) == sorted(tickers)
+
+    client = _Client()
+    await mgr.subscribe("AAPL", client)
+    await stock.tick("AAPL", 101.0)
+    await eventually(lambda: any(f.get("price") == 101.0 for f in client.frames))
+    await mgr.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_last_ticker_leaving_closes_its_socket(servers):
+    stock, _ = servers
+    mgr = _manager()
+    a, b = _Client(), _Client()
+    await mgr.subscribe("AAPL", a)
+    await mgr.subscribe("MSFT", b)
+    await eventually(lambda: len(_subscribed(stock)) == 2)
+
+    await mgr.unsubscribe("AAPL", a)
+    await eventually(lambda: _subscribed(stock) == ["msft"])
+    assert stock.live[0].events[-1] == {"event": "unsubscribe", "data": {"ticker": "AAPL"}}
+
+    await mgr.unsubscribe("MSFT", b)
+    await eventually(lambda: not stock.live)
+    assert len(mgr._upstream) == 0 and not mgr._rooms
+    await mgr.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_a_socket_that_cannot_reconnect_releases_its_rooms(servers):
+    stock, _ = servers
+    mgr = _manager()
+    client = _Client()
+    await mgr.subscribe("AAPL", client)
+    await eventually(lambda: _subscribed(stock) == ["aapl"])
+
+    stock.accepting = False
+    await stock.drop()
+    await eventually(lambda: client.closed, timeout=5)
+    assert client.frames[-1] == {
+        "type": "error", "symbol": "AAPL", "message": "Live price feed unavailable",
+    }
+    assert "AAPL" not in mgr._rooms and len(mgr._upstream) == 0
+
+    # A later subscriber starts afresh on a new socket.
+    stock.accepting = True
+    await mgr.subscribe("AAPL", _Client())
+    await eventually(lambda: _subscribed(stock) == ["aapl"])
+    await mgr.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_a_stalled_room_drops_old_ticks_without_holding_the_socket(servers):
+    stock, _ = servers
+    mgr = _manager()
+    release = asyncio.Event()
+
+    class _Slow(_Client):
+        async def send_text(self, text):
+            await release.wait()
+            self.frames.append(json.loads(text))
+
+    slow, fast = _Slow(), _Client()
+    await mgr.subscribe("AAPL", slow)
+    await mgr.subscribe("MSFT", fast)
+    await eventually(lambda: len(_subscribed(stock)) == 2)
+
+    for i in range(m._ROOM_INBOX_MAX * 2):
+        await stock.tick("AAPL", 100.0 + i)
+    await stock.tick("MSFT", 95.0)
+    await eventually(lambda: fast.frames)  # not stuck behind AAPL's backlog
+
+    release.set()
+    await eventually(lambda: slow.frames and slow.frames[-1]["price"] == 100.0 + m._ROOM_INBOX_MAX * 2 - 1)
+    assert len(slow.frames) <= m._ROOM_INBOX_MAX + 1
+    await mgr.shutdown()
@@ -86,7 +86,7 @@ def test_intermediate_bundle_is_present_and_loaded():
 
 
 # ---------------------------------------------------------------------------
-# _open_fmp_ws end-to-end (fake socket)
+# _open_fmp_ws + _send_subscription end-to-end (fake socket)
 # ---------------------------------------------------------------------------
 
 class _FakeWS:
@@ -109,12 +109,19 @@ def _install_fake_connect(monkeypatch):
     return record
 
 
+async def _open_and_subscribe(ticker):
+    # What a pooled socket does on (re)connect for the tickers it carries.
+    url, send_login, sub_ticker = m._fmp_ws_target(ticker)
+    ws = await m._open_fmp_ws(url, send_login)
+    await m._send_subscription(ws, "subscribe", [sub_ticker])
+    return ws
+
+
 @pytest.mark.asyncio
 async def test_open_crypto_ws_logs_in_then_subscribes_lowercase(monkeypatch):
     record = _install_fake_connect(monkeypatch)
-    mgr = m.LivePriceManager()
 
-    ws = await mgr._open_fmp_ws("BTCUSD")
+    ws = await _open_and_subscribe("BTCUSD")
 
     # Correct endpoint + certifi TLS context passed through.
     assert record["url"] == m.FMP_WS_URL_CRYPTO
@@ -130,9 +137,8 @@ async def test_open_crypto_ws_logs_in_then_subscribes_lowercase(monkeypatch):
 @pytest.mark.asyncio
 async def test_open_stock_ws_subscribes_without_login(monkeypatch):
     record = _install_fake_connect(monkeypatch)
-    mgr = m.LivePriceManager()
 
-    ws = await mgr._open_fmp_ws("aapl")
+    ws = await _open_and_subscribe("aapl")
 
     assert record["url"].startswith(m.FMP_WS_URL_STOCK)
     assert record["kwargs"].get("ssl") is m._SSL_CONTEXT
@@ -141,3 +147,16 @@ async def test_open_stock_ws_subscribes_without_login(monkeypatch):
     events = [e["event"] for e in ws.sent]
     assert events == ["subscribe"]
     assert ws.sent[0]["data"]["ticker"] == "AAPL"
+
+
+@pytest.mark.asyncio
+async def test_bulk_subscription_is_chunked_list_events(monkeypatch):
+    _install_fake_connect(monkeypatch)
+    ws = await m._open_fmp_ws(m.FMP_WS_URL_CRYPTO, True)
+    tickers = [f"c{i}usd" for i in range(m._SUBSCRIBE_CHUNK + 5)]
+
+    await m._send_subscription(ws, "subscribe", tickers)
+
+    assert [e["event"] for e in ws.sent] == ["login", "subscribe", "subscribe"]
+    assert ws.sent[1]["data"]["ticker"] == tickers[:m._SUBSCRIBE_CHUNK]
+    assert ws.sent[2]["data"]["ticker"] == tickers[m._SUBSCRIBE_CHUNK:]
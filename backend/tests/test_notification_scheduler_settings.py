@@ -16,7 +16,7 @@ import ast
 import inspect
 import textwrap
 
-import app.main as main_mod
+import app.jobs as jobs_mod
 from app.config import settings
 
 _SCHEDULER = "_run_scheduled_notification_senders"
@@ -24,7 +24,7 @@ _SCHEDULER = "_run_scheduled_notification_senders"
 
 def _settings_attrs_read_by(func_name: str) -> set[str]:
     """Every `settings.X` attribute referenced inside a function, via AST."""
-    src = textwrap.dedent(inspect.getsource(getattr(main_mod, func_name)))
+    src = textwrap.dedent(inspect.getsource(getattr(jobs_mod, func_name)))
     found: set[str] = set()
     for node in ast.walk(ast.parse(src)):
         if (isinstance(node, ast.Attribute)
@@ -36,7 +36,7 @@ def _settings_attrs_read_by(func_name: str) -> set[str]:
 
 def test_the_scan_found_the_scheduler():
     """Guard against the guard: a renamed function would make this pass vacuously."""
-    assert hasattr(main_mod, _SCHEDULER), f"{_SCHEDULER} not found in app.main"
+    assert hasattr(jobs_mod, _SCHEDULER), f"{_SCHEDULER} not found in app.jobs"
     assert _settings_attrs_read_by(_SCHEDULER), "no settings.* reads found — scan drifted"
 
 
@@ -0,0 +1,200 @@
+"""One set-based price-alert cycle (`PriceAlertService.evaluate_once`).
+
+Pinned here: only rules whose state changed are written, and they go out in chunked
+bulk calls rather than one UPDATE per rule; a failed bulk call falls back to per-row
+writes so the latch is never lost; the rule read pages past PostgREST's row cap; and the
+fired alerts leave as ONE batched `notify_each`, whose recipient lookups are shared and
+whose per-user cap still advances between a user's own alerts. No Supabase, no APNs.
+"""
+
+import pytest
+
+from app.services import price_alert_service as pas
+from app.services.notification_kinds import KIND_PRICE_ALERT
+from app.services.price_alert_engine import evaluate_alert
+from app.services.price_bus import PriceBus
+from app.services.push_dispatch_service import OutgoingPush, PushDispatchService, _Recipient
+
+
+class _Query:
+    def __init__(self, db):
+        self.db = db
+        self.lo, self.hi = 0, None
+
+    def select(self, *a):
+        return self
+
+    def eq(self, *a):
+        return self
+
+    def in_(self, *a):
+        return self
+
+    def order(self, *a, **k):
+        return self
+
+    def range(self, lo, hi):
+        self.lo, self.hi = lo, hi
+        return self
+
+    def update(self, patch):
+        self.db.row_updates.append(patch)
+        return self
+
+    def execute(self):
+        self.db.reads += 1
+        hi = len(self.db.rules) if self.hi is None else min(self.hi + 1, self.lo + self.db.cap)
+        return type("R", (), {"data": self.db.rules[self.lo:hi]})()
+
+
+class _DB:
+    cap = 1000  # PostgREST's default max-rows
+
+    def __init__(self, rules, rpc_fails=False):
+        self.rules = rules
+        self.rpc_fails = rpc_fails
+        self.rpc_calls = []
+        self.row_updates = []
+        self.reads = 0
+
+    def table(self, name):
+        return _Query(self)
+
+    def rpc(self, name, params):
+        self.rpc_calls.append((name, params))
+        if self.rpc_fails:
+            raise RuntimeError("PGRST202")
+        return type("Q", (), {"execute": lambda q: type("R", (), {"data": len(params["p_rows"])})()})()
+
+
+def _rule(i, ticker="AAPL", **kw):
+    row = {"id": f"r{i}", "user_id": f"u{i % 7}", "ticker": ticker, "kind": "price_above",
+           "threshold": 140.0, "repeat_mode": "daily", "armed": True, "last_price": 130.0,
+           "trigger_count": 0}
+    row.update(kw)
+    return row
+
+
+class _Dispatcher:
+    def __init__(self):
+        self.batches = []
+
+    async def notify_each(self, messages, *, kind):
+        self.batches.append((kind, list(messages)))
+        return len(messages)
+
+
+def _service(monkeypatch, rules, price=150.0, rpc_fails=False):
+    bus = PriceBus()
+    bus.publish_quote({"symbol": "AAPL", "price": price, "changePercentage": 0.5})
+    monkeypatch.setattr(pas, "get_price_bus", lambda: bus)
+    dispatcher = _Dispatcher()
+    monkeypatch.setattr(pas, "get_push_dispatch_service", lambda: dispatcher)
+    monkeypatch.setattr(pas, "get_supabase", lambda: _DB(rules, rpc_fails=rpc_fails))
+    svc = pas.PriceAlertService()
+    svc._active_universe = lambda: ["AAPL"]
+    return svc, dispatcher
+
+
+def test_unchanged_state_is_not_a_change():
+    rule = _rule(1, last_price=150.0)
+    held = evaluate_alert(kind="price_above", threshold=140.0, repeat_mode="daily",
+                          armed=True, last_price=150.0, price=150.0)
+    assert not pas.PriceAlertService.state_changed(rule, held)
+    moved = evaluate_alert(kind="price_above", threshold=140.0, repeat_mode="daily",
+                           armed=True, last_price=150.0, price=151.0)
+    assert pas.PriceAlertService.state_changed(rule, moved)
+    # A stored NaN baseline is "never observed" to the engine, and so is held as None.
+    nan_rule = _rule(2, last_price=float("nan"))
+    no_quote = evaluate_alert(kind="price_above", threshold=140.0, repeat_mode="daily",
+                              armed=True, last_price=float("nan"), price=None)
+    assert not pas.PriceAlertService.state_changed(nan_rule, no_quote)
+
+
+@pytest.mark.asyncio
+async def test_a_cycle_writes_only_changed_rows_in_bulk_and_sends_one_batch(monkeypatch):
+    rules = [_rule(i) for i in range(2500)]                     # cross 140 → fire
+    rules += [_rule(i, last_price=150.0) for i in range(2500, 5000)]  # already above: no change
+    svc, dispatcher = _service(monkeypatch, rules)
+
+    stats = await svc.evaluate_once()
+
+    assert stats == {"tickers": 1, "rules": 5000, "evaluated": 2500, "written": 2500,
+                     "fired": 2500, "sent": 2500}
+    assert svc.supabase.reads == 6  # five full pages and the empty one that ends it
+    calls = svc.supabase.rpc_calls
+    assert [name for name, _ in calls] == ["apply_price_alert_states"] * 3
+    assert [len(p["p_rows"]) for _, p in calls] == [1000, 1000, 500]
+    assert calls[0][1]["p_rows"][0] == {
+        "id": "r0", "last_price": 150.0, "armed": False, "fired": True, "deactivate": False,
+    }
+    assert svc.supabase.row_updates == []
+
+    assert len(dispatcher.batches) == 1
+    kind, messages = dispatcher.batches[0]
+    assert kind == KIND_PRICE_ALERT and len(messages) == 2500
+    assert messages[0].title == "AAPL is above $140.00"
+    assert messages[0].route["alert_id"] == "r0"
+
+
+@pytest.mark.asyncio
+async def test_a_quiet_cycle_writes_and_sends_nothing(monkeypatch):
+    svc, dispatcher = _service(monkeypatch, [_rule(i, last_price=150.0) for i in range(10)])
+    stats = await svc.evaluate_once()
+    assert stats["evaluated"] == 0 and stats["written"] == 0 and stats["fired"] == 0
+    assert svc.supabase.rpc_calls == [] and dispatcher.batches == []
+
+
+@pytest.mark.asyncio
+async def test_a_failed_bulk_write_falls_back_to_per_row(monkeypatch):
+    svc, _ = _service(monkeypatch, [_rule(i) for i in range(3)], rpc_fails=True)
+    stats = await svc.evaluate_once()
+    assert stats["written"] == 3
+    assert len(svc.supabase.row_updates) == 3
+    assert all(p["armed"] is False and p["trigger_count"] == 1 for p in svc.supabase.row_updates)
+
+
+class _FakePush:
+    enabled = True
+
+    def __init__(self):
+        self.sent = []
+
+    async def send_to_user(self, user_id, *, title, body, data=None, **kw):
+        self.sent.append((user_id, title, kw.get("badge")))
+        return 1
+
+
+@pytest.mark.asyncio
+async def test_notify_each_resolves_once_and_advances_each_users_cap(monkeypatch):
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "PUSH_DRY_RUN", False)
+    svc = object.__new__(PushDispatchService)
+    svc._push = _FakePush()
+    resolves = []
+
+    def _resolve(user_ids, kind, now):
+        resolves.append(list(user_ids))
+        return {
+            uid: _Recipient(user_id=uid, devices=[{"token": uid}],
+                            category_sent_today=0, unread=3)
+            for uid in user_ids
+        }
+
+    svc.resolve_recipients = _resolve
+    svc.claim_send = lambda *a, **k: True
+    svc.mark_state = lambda *a, **k: None
+    # A cap of two per user per day for this kind's category.
+    monkeypatch.setattr(
+        "app.services.push_dispatch_service.category_cap", lambda category, override=None: 2
+    )
+
+    messages = [OutgoingPush("u1", f"t{i}", "b", f"k{i}") for i in range(3)]
+    messages.append(OutgoingPush("u2", "t9", "b", "k9"))
+    sent = await svc.notify_each(messages, kind=KIND_PRICE_ALERT)
+
+    assert resolves == [["u1", "u2"]]
+    assert sent == 3
+    # u1's third alert is capped; its badge counts up between its own alerts.
+    assert [(u, t, b) for u, t, b in svc._push.sent if u == "u1"] == [("u1", "t0", 4), ("u1", "t1", 5)]
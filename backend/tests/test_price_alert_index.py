@@ -0,0 +1,191 @@
+"""The per-symbol alert trigger index (app/services/price_alert_index.py) and the live path
+built on it.
+
+The index is only safe if it never misses a rule whose decision a price would change,
+so the central test here is exhaustive against the engine itself: for randomised rules
+in every state and prices on both sides of every boundary, each rule the engine would
+fire, re-arm, seed or move to the other side of its line must be among the rules the
+index returns. Then: re-indexing moves a rule to its new boundary; a live price-bus
+update fires a crossed rule without waiting for a cycle, leaves a rule the user just
+edited alone, and does nothing outside the session.
+"""
+
+import asyncio
+import random
+
+import pytest
+
+from app.services import price_alert_service as pas
+from app.services.price_alert_engine import evaluate_alert, finite_price
+from app.services.price_alert_index import PriceAlertIndex
+from app.services.price_bus import PriceBus
+
+_REARM = 0.005
+
+
+def _side(kind, price, limit):
+    """The only thing the engine reads from a baseline: is it on the far side?"""
+    return price < limit if kind == "price_above" else price > limit
+
+
+def _must_touch(rule, price, move):
+    d = evaluate_alert(
+        kind=rule["kind"], threshold=rule["threshold"], repeat_mode=rule["repeat_mode"],
+        armed=rule["armed"], last_price=rule["last_price"], price=price,
+        change_percent=move, rearm_pct=_REARM,
+    )
+    if d.fire or d.new_armed != rule["armed"]:
+        return True
+    if rule["kind"] == "percent_move":
+        return False   # its baseline is never read
+    prev = finite_price(rule["last_price"])
+    if prev is None:
+        return d.new_last_price is not None   # a seed
+    # A latched rule's baseline is unread until it re-arms, which rewrites it.
+    if not rule["armed"] or d.new_last_price is None:
+        return False
+    return _side(rule["kind"], d.new_last_price, rule["threshold"]) != _side(
+        rule["kind"], prev, rule["threshold"])
+
+
+def _random_rules(rng, n):
+    kinds = ["price_above", "price_below", "percent_move"]
+    rules = []
+    for i in range(n):
+        kind = rng.choice(kinds)
+        threshold = rng.choice([1.5, 2.0, 5.0]) if kind == "percent_move" else rng.choice(
+            [95.0, 100.0, 105.0])
+        rules.append({
+            "id": f"r{i}", "ticker": rng.choice(["AAPL", "MSFT"]), "kind": kind,
+            "threshold": threshold, "repeat_mode": rng.choice(["once", "daily"]),
+            # The engine never latches a percent rule, so one is never stored disarmed.
+            "armed": kind == "percent_move" or rng.random() < 0.7,
+            "last_price": rng.choice([None, float("nan"), 90.0, 95.0, 99.9, 100.0,
+                                      100.1, 105.0, 110.0]),
+        })
+    return rules
+
+
+def test_every_rule_a_price_could_change_is_returned():
+    rng = random.Random(7)
+    rules = _random_rules(rng, 600)
+    index = PriceAlertIndex(_REARM)
+    index.replace(rules)
+    prices = [None, float("nan"), 0.0, 80.0, 94.5, 95.0, 99.5, 99.9, 100.0, 100.1, 100.5,
+              105.0, 105.6, 130.0]
+    moves = [None, 0.0, 1.5, -2.0, 4.9, -7.0]
+    for symbol in ("AAPL", "MSFT"):
+        mine = [r for r in rules if r["ticker"] == symbol]
+        for price in prices:
+            for move in moves:
+                got = {r["id"] for r in index.crossed(symbol, price, move)}
+                want = {r["id"] for r in mine if _must_touch(r, price, move)}
+                assert want <= got, (price, move, sorted(want - got))
+
+
+def test_a_quiet_price_touches_nothing():
+    index = PriceAlertIndex(_REARM)
+    index.replace([
+        {"id": "a", "ticker": "AAPL", "kind": "price_above", "threshold": 200.0,
+         "armed": True, "last_price": 150.0},
+        {"id": "b", "ticker": "AAPL", "kind": "price_below", "threshold": 100.0,
+         "armed": True, "last_price": 150.0},
+        {"id": "c", "ticker": "AAPL", "kind": "percent_move", "threshold": 5.0},
+        {"id": "x", "ticker": "AAPL", "kind": "nonsense", "threshold": 5.0},
+    ])
+    assert len(index) == 3
+    assert index.crossed("AAPL", 151.0, 0.4) == []
+    assert [r["id"] for r in index.crossed("aapl", 201.0, 0.4)] == ["a"]
+    assert [r["id"] for r in index.crossed("AAPL", 99.0, -6.0)] == ["b", "c"]
+    assert index.crossed("MSFT", 1.0, 50.0) == []
+
+
+def test_placing_a_rule_moves_it_to_its_next_boundary():
+    index = PriceAlertIndex(_REARM)
+    rule = {"id": "a", "ticker": "AAPL", "kind": "price_above", "threshold": 200.0,
+            "armed": True, "last_price": 150.0}
+    index.replace([rule])
+    assert index.crossed("AAPL", 200.0)
+
+    rule.update(armed=False, last_price=201.0)   # fired: now waits to re-arm
+    index.place(rule)
+    assert index.crossed("AAPL", 200.0) == []
+    assert index.crossed("AAPL", 199.5) == []
+    assert index.crossed("AAPL", 200.0 * (1 - _REARM)) == [rule]
+
+    index.remove("a")
+    assert len(index) == 0 and index.symbols() == []
+
+
+class _Dispatcher:
+    def __init__(self):
+        self.titles = []
+
+    async def notify_each(self, messages, *, kind):
+        self.titles.extend(m.title for m in messages)
+        return len(messages)
+
+
+async def _live_service(monkeypatch, *, phase="regular"):
+    bus = PriceBus()
+    bus.publish_quote({"symbol": "AAPL", "price": 150.0, "changePercentage": 0.1})
+    dispatcher = _Dispatcher()
+    monkeypatch.setattr(pas, "get_price_bus", lambda: bus)
+    monkeypatch.setattr(pas, "get_push_dispatch_service", lambda: dispatcher)
+    monkeypatch.setattr(pas, "get_supabase", lambda: None)
+    monkeypatch.setattr(pas, "session_phase", lambda: phase)
+    svc = pas.PriceAlertService()
+    svc._active_universe = lambda: ["AAPL"]
+    rules = [
+        {"id": "up", "user_id": "u1", "ticker": "AAPL", "kind": "price_above",
+         "threshold": 160.0, "repeat_mode": "daily", "armed": True, "last_price": 150.0},
+        {"id": "far", "user_id": "u2", "ticker": "AAPL", "kind": "price_above",
+         "threshold": 300.0, "repeat_mode": "daily", "armed": True, "last_price": 150.0},
+    ]
+    svc._active_rules = lambda tickers: [dict(r) for r in rules]
+    written = []
+    svc._persist_many = lambda changes: written.extend(r["id"] for r, _ in changes) or len(changes)
+    stats = await svc.evaluate_once()
+    assert stats["evaluated"] == 0 and stats["fired"] == 0
+    return svc, bus, dispatcher, written
+
+
+async def _settle(svc):
+    for _ in range(50):
+        await asyncio.sleep(0)
+        if svc._live_task is None:
+            return
+
+
+@pytest.mark.asyncio
+async def test_a_live_trade_fires_a_crossed_rule_without_a_cycle(monkeypatch):
+    svc, bus, dispatcher, written = await _live_service(monkeypatch)
+    bus.publish_trade("AAPL", 155.0)         # crosses nothing
+    await _settle(svc)
+    assert written == [] and dispatcher.titles == []
+
+    bus.publish_trade("AAPL", 161.0)
+    await _settle(svc)
+    assert written == ["up"]
+    assert dispatcher.titles == ["AAPL is above $160.00"]
+
+    bus.publish_trade("AAPL", 162.0)         # latched now: nothing more
+    await _settle(svc)
+    assert written == ["up"] and len(dispatcher.titles) == 1
+
+
+@pytest.mark.asyncio
+async def test_a_rule_the_user_just_edited_is_left_to_the_next_cycle(monkeypatch):
+    svc, bus, dispatcher, written = await _live_service(monkeypatch)
+    svc._edited["up"] = float("inf")          # what `update` / `delete` record
+    bus.publish_trade("AAPL", 161.0)
+    await _settle(svc)
+    assert written == [] and dispatcher.titles == []
+
+
+@pytest.mark.asyncio
+async def test_no_live_evaluation_outside_the_session(monkeypatch):
+    svc, bus, dispatcher, written = await _live_service(monkeypatch, phase="closed")
+    bus.publish_trade("AAPL", 161.0)
+    await _settle(svc)
+    assert svc._live_task is None and written == []
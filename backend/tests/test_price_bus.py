@@ -0,0 +1,223 @@
+"""The in-process latest-quote bus (app/services/price_bus.py).
+
+Pinned here: a read bulk-quotes only what it does not hold fresh, and concurrent
+reads share one fetch; a symbol FMP does not return is not re-asked every call; a live
+trade moves the price and day change on top of the last full row and notifies
+subscribers, while a trade with no full row under it is never served as fresh; the poller re-quotes only watched, stale symbols in one call and forgets
+what nobody reads; a live room feeds the bus; and the price-alert cycle reads through
+it. The FMP client is faked — no network.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.services import price_bus as pb
+from app.services.price_bus import PriceBus
+
+
+class _FMP:
+    def __init__(self, prices, gate=None):
+        self.prices = prices
+        self.calls = []
+        self.gate = gate
+
+    async def get_batch_quotes_bulk(self, symbols):
+        self.calls.append(list(symbols))
+        if self.gate is not None:
+            await self.gate.wait()
+        return [
+            {"symbol": s, "price": self.prices[s], "previousClose": 100.0,
+             "changePercentage": (self.prices[s] - 100.0), "name": f"{s} Inc"}
+            for s in symbols if s in self.prices
+        ]
+
+
+@pytest.fixture
+def fmp(monkeypatch):
+    fake = _FMP({"AAPL": 101.0, "MSFT": 99.0, "NVDA": 120.0})
+    monkeypatch.setattr(pb, "get_fmp_client", lambda: fake)
+    return fake
+
+
+@pytest.mark.asyncio
+async def test_reads_fetch_only_what_is_not_fresh(fmp):
+    bus = PriceBus()
+    first = await bus.get_quotes(["aapl", "MSFT", "AAPL"], max_age=60)
+    assert fmp.calls == [["AAPL", "MSFT"]]
+    assert first["AAPL"]["price"] == 101.0 and set(first) == {"AAPL", "MSFT"}
+
+    second = await bus.get_quotes(["AAPL", "NVDA"], max_age=60)
+    assert fmp.calls[-1] == ["NVDA"]  # AAPL came from the snapshot
+    assert second["AAPL"] is first["AAPL"]
+
+    await bus.get_quotes(["AAPL"], max_age=0)
+    assert fmp.calls[-1] == ["AAPL"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reads_share_one_fetch(fmp):
+    fmp.gate = asyncio.Event()
+    bus = PriceBus()
+    a = asyncio.create_task(bus.get_quotes(["AAPL", "MSFT"]))
+    await asyncio.sleep(0)
+    b = asyncio.create_task(bus.get_quotes(["MSFT"]))
+    await asyncio.sleep(0)
+    fmp.gate.set()
+    ra, rb = await asyncio.gather(a, b)
+    assert fmp.calls == [["AAPL", "MSFT"]]
+    assert rb["MSFT"] is ra["MSFT"]
+
+
+@pytest.mark.asyncio
+async def test_a_symbol_fmp_does_not_return_is_not_re_asked_every_read(fmp):
+    bus = PriceBus()
+    assert await bus.get_quotes(["DELISTED"], max_age=60) == {}
+    assert await bus.get_quotes(["DELISTED"], max_age=60) == {}
+    assert fmp.calls == [["DELISTED"]]
+
+
+@pytest.mark.asyncio
+async def test_live_trades_move_the_row_and_notify(fmp):
+    bus = PriceBus()
+    seen = []
+    stop = bus.subscribe(lambda symbol, row: seen.append((symbol, row["price"])))
+    await bus.get_quotes(["AAPL"])
+    held = bus.snapshot(["AAPL"])["AAPL"]
+
+    bus.publish_trade("aapl", 110.0, volume=5, timestamp=1)
+    row = bus.snapshot(["AAPL"])["AAPL"]
+    assert row["price"] == 110.0 and row["name"] == "AAPL Inc"  # full row kept
+    assert row["change"] == pytest.approx(10.0)
+    assert row["changePercentage"] == pytest.approx(10.0)
+    assert held["price"] == 101.0  # a snapshot already handed out never changes
+    assert seen == [("AAPL", 101.0), ("AAPL", 110.0)]
+
+    bus.publish_trade("AAPL", 88.0, previous_close=80.0)  # the room's own close wins
+    assert bus.snapshot(["AAPL"])["AAPL"]["changePercentage"] == pytest.approx(10.0)
+
+    bus.publish_trade("NEWCO", 5.0)  # no close anywhere: no stale change fields
+    assert "changePercentage" not in bus.snapshot(["NEWCO"])["NEWCO"]
+    bus.publish_trade("NEWCO", float("nan"))
+    assert bus.snapshot(["NEWCO"])["NEWCO"]["price"] == 5.0
+
+    stop()
+    bus.publish_trade("AAPL", 90.0)
+    assert len(seen) == 4
+
+
+@pytest.mark.asyncio
+async def test_a_trade_before_any_quote_does_not_satisfy_a_read(fmp):
+    bus = PriceBus()
+    bus.publish_trade("AAPL", 105.0, previous_close=100.0)
+    assert bus.age("AAPL") == float("inf")
+
+    row = (await bus.get_quotes(["AAPL"], max_age=60))["AAPL"]
+    assert fmp.calls == [["AAPL"]]
+    assert row["name"] == "AAPL Inc"  # the full row, not the trade-only one
+
+    bus.publish_trade("AAPL", 106.0)  # now on top of a full row: fresh
+    assert (await bus.get_quotes(["AAPL"], max_age=60))["AAPL"]["price"] == 106.0
+    assert fmp.calls == [["AAPL"]]
+
+
+@pytest.mark.asyncio
+async def test_poll_requotes_watched_stale_symbols_and_forgets_idle_ones(fmp, monkeypatch):
+    bus = PriceBus()
+    assert await bus.poll_once() == 0  # nothing watched, nothing to do
+    await bus.get_quotes(["AAPL", "MSFT", "NVDA"])
+    fmp.calls.clear()
+
+    assert await bus.poll_once() == 0  # all fresh
+    for s in ("AAPL", "MSFT", "NVDA"):
+        bus._fresh_at[s] -= 3600
+    bus.publish_trade("NVDA", 121.0)  # live trade: fresh again
+    assert await bus.poll_once() == 2
+    assert fmp.calls == [["AAPL", "MSFT"]]
+
+    monkeypatch.setattr(pb.settings, "PRICE_BUS_WATCH_TTL_SECONDS", 0)
+    for s in bus._watched:
+        bus._watched[s] -= 1
+    for s in bus._fresh_at:
+        bus._fresh_at[s] -= 1
+    assert await bus.poll_once() == 0
+    assert bus.snapshot(["AAPL", "MSFT", "NVDA"]) == {}
+
+
+@pytest.mark.asyncio
+async def test_a_live_room_publishes_its_trades(monkeypatch):
+    import app.services.live_price_manager as m
+
+    bus = PriceBus()
+    monkeypatch.setattr(m, "get_price_bus", lambda: bus)
+    monkeypatch.setattr(m.settings, "LIVE_PRICE_MAX_FRAMES_PER_SECOND", 0)
+
+    class _NoUpstream:
+        async def subscribe(self, ticker):
+            pass
+
+        async def unsubscribe(self, ticker):
+            pass
+
+        async def close(self):
+            pass
+
+        def __len__(self):
+            return 0
+
+    class _Client:
+        async def send_text(self, text):
+            pass
+
+        async def close(self):
+            pass
+
+    mgr = m.LivePriceManager()
+    mgr._upstream = _NoUpstream()
+
+    async def fetch(room):
+        room.previous_close = 200.0
+        room.previous_close_epoch_day = 10**9
+
+    mgr._fetch_previous_close = fetch
+    await mgr.subscribe("TSLA", _Client())
+    mgr._on_tick("TSLA", {"s": "tsla", "lp": 210.0, "v": 7, "t": int(time.time())})
+    deadline = time.monotonic() + 2
+    while not bus.snapshot(["TSLA"]) and time.monotonic() < deadline:
+        await asyncio.sleep(0.005)
+    row = bus.snapshot(["TSLA"])["TSLA"]
+    assert row["price"] == 210.0 and row["changePercentage"] == pytest.approx(5.0)
+    assert row["volume"] == 7
+    await mgr.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_price_alert_cycle_reads_the_bus(monkeypatch):
+    from app.services import price_alert_service as pas
+
+    bus = PriceBus()
+    bus.publish_quote({"symbol": "AAPL", "price": 150.0, "changePercentage": 1.0})
+    monkeypatch.setattr(pas, "get_price_bus", lambda: bus)
+    monkeypatch.setattr(pb, "get_fmp_client", lambda: pytest.fail("no quote call expected"))
+
+    sent = []
+
+    class _Dispatcher:
+        async def notify_each(self, messages, *, kind):
+            sent.extend(m.title for m in messages)
+            return len(messages)
+
+    monkeypatch.setattr(pas, "get_push_dispatch_service", lambda: _Dispatcher())
+    monkeypatch.setattr(pas, "get_supabase", lambda: None)
+    svc = pas.PriceAlertService()
+    svc._active_universe = lambda: ["AAPL"]
+    svc._active_rules = lambda tickers: [{
+        "id": "r1", "user_id": "u1", "ticker": "AAPL", "kind": "price_above",
+        "threshold": 140.0, "repeat_mode": "once", "armed": True, "last_price": 130.0,
+    }]
+    svc._persist_many = lambda changes: len(changes)
+
+    stats = await svc.evaluate_once()
+    assert stats == {"tickers": 1, "rules": 1, "evaluated": 1, "written": 1, "fired": 1, "sent": 1}
+    assert sent == ["AAPL is above $140.00"]
@@ -0,0 +1,193 @@
+"""The local columnar daily-price store (app/services/price_history_store.py).
+
+Pinned here: the first read backfills and later reads are served from disk with no FMP
+call; a top-up fetches only the trailing days, appends the new ones and replaces the
+mutable last bar; an upstream re-adjustment (a split) rewrites the history instead of
+appending onto a stale scale; an older ``from_date`` extends the store backwards once;
+deep history pages in 5000-bar steps; a failed top-up serves the stored bars; and the
+consumers see the same rows through the store as through the direct call.
+
+The FMP client is a fake that serves a deterministic business-day series. No network.
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from app.config import settings
+from app.services import price_history_store as phs
+from app.services.price_history_store import PriceHistoryStore, parse_fmp_daily
+
+
+def _business_days(start: date, end: date):
+    d = start
+    while d <= end:
+        if d.weekday() < 5:
+            yield d
+        d += timedelta(days=1)
+
+
+class _FakeFMP:
+    """FMP's EOD endpoint: newest-first, at most 5000 rows per call."""
+
+    def __init__(self, listed: date = date(2000, 1, 3), scale: float = 1.0):
+        self.listed = listed
+        self.asof = date.today()
+        self.scale = scale
+        self.last_close_bump = 0.0
+        self.calls = []
+        self.fail = False
+
+    def close_on(self, d: date) -> float:
+        return round((100.0 + (d - self.listed).days * 0.01) * self.scale, 6)
+
+    async def get_historical_prices(self, ticker, from_date=None, to_date=None):
+        self.calls.append((ticker, from_date, to_date))
+        if self.fail:
+            raise RuntimeError("fmp down")
+        start = max(date.fromisoformat(from_date), self.listed) if from_date else self.listed
+        end = date.fromisoformat(to_date) if to_date else self.asof
+        days = list(_business_days(start, min(end, self.asof)))[-5000:]
+        rows = []
+        for i, d in enumerate(days):
+            close = self.close_on(d) + (self.last_close_bump if i == len(days) - 1 else 0.0)
+            rows.append({
+                "symbol": ticker, "date": d.isoformat(), "open": close - 1, "high": close + 1,
+                "low": close - 2, "close": close, "volume": 1000 + i,
+            })
+        rows.reverse()
+        return rows
+
+
+def _store(tmp_path, interval=900.0):
+    return PriceHistoryStore(tmp_path / "prices", topup_interval_seconds=interval)
+
+
+def _ago(days: int) -> str:
+    return (date.today() - timedelta(days=days)).isoformat()
+
+
+@pytest.mark.asyncio
+async def test_backfill_then_reads_come_from_disk(tmp_path):
+    fmp, store = _FakeFMP(), _store(tmp_path)
+    bars = await store.daily(fmp, "aapl", _ago(400))
+    assert len(fmp.calls) == 1 and len(bars) > 250
+    assert bars.symbol == "AAPL"
+    assert bars.dates[0] >= np.datetime64(_ago(400))
+    # Within the top-up interval: zero calls, and a narrower window is a slice.
+    recent = await store.daily(fmp, "AAPL", _ago(30))
+    assert len(fmp.calls) == 1
+    assert isinstance(store.read("AAPL").close, np.memmap)
+    assert recent.dates[0] >= np.datetime64(_ago(30))
+    assert recent.close[-1] == bars.close[-1]
+
+
+@pytest.mark.asyncio
+async def test_top_up_appends_and_replaces_the_last_bar(tmp_path, monkeypatch):
+    fmp, store = _FakeFMP(), _store(tmp_path, interval=0)
+    today = date.today()
+    # Backfill as of a week ago, with that day's bar still provisional upstream.
+    fmp.asof = today - timedelta(days=7)
+    fmp.last_close_bump = 0.5
+    monkeypatch.setattr(phs, "_today", lambda: np.datetime64(fmp.asof, "D"))
+    await store.daily(fmp, "MSFT", _ago(120))
+    last_before = store.read("MSFT").dates[-1]
+
+    fmp.calls.clear()
+    fmp.asof, fmp.last_close_bump = today, 0.0
+    monkeypatch.setattr(phs, "_today", lambda: np.datetime64(today, "D"))
+    bars = await store.daily(fmp, "MSFT", _ago(120))
+    assert len(fmp.calls) == 1
+    _, since, _ = fmp.calls[0]
+    assert since == str(last_before - np.timedelta64(14, "D"))  # trailing days only
+    expected = [d.isoformat() for d in _business_days(date.fromisoformat(_ago(120)), today)]
+    assert np.datetime_as_string(bars.dates, unit="D").tolist() == expected
+    # The provisional bar was replaced by upstream's settled one.
+    i = expected.index(str(last_before))
+    assert bars.close[i] == pytest.approx(fmp.close_on(date.fromisoformat(expected[i])))
+    assert store.rewrites == 1  # the backfill only: the top-up appended in place
+
+
+@pytest.mark.asyncio
+async def test_upstream_readjustment_rewrites_the_history(tmp_path):
+    fmp, store = _FakeFMP(), _store(tmp_path, interval=0)
+    await store.daily(fmp, "NVDA", _ago(200))
+    fmp.scale = 0.1  # a 10:1 split, applied retroactively upstream
+    bars = await store.daily(fmp, "NVDA", _ago(200))
+    assert store.rewrites == 2
+    first = date.fromisoformat(np.datetime_as_string(bars.dates[0], unit="D"))
+    assert bars.close[0] == pytest.approx(fmp.close_on(first))
+
+
+@pytest.mark.asyncio
+async def test_older_from_date_extends_backwards_once(tmp_path):
+    fmp, store = _FakeFMP(), _store(tmp_path)
+    await store.daily(fmp, "KO", _ago(100))
+    bars = await store.daily(fmp, "KO", _ago(1000))
+    assert len(fmp.calls) == 2
+    assert bars.dates[0] >= np.datetime64(_ago(1000))
+    assert bars.dates[0] <= np.datetime64(_ago(990))
+    assert np.all(np.diff(bars.dates.astype("int64")) > 0)  # no duplicated seam
+    await store.daily(fmp, "KO", _ago(1000))
+    assert len(fmp.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_deep_history_is_paged(tmp_path):
+    fmp, store = _FakeFMP(listed=date(1985, 1, 2)), _store(tmp_path)
+    bars = await store.daily(fmp, "IBM", "1970-01-01")
+    assert len(fmp.calls) >= 2
+    assert bars.dates[0] == np.datetime64("1985-01-02")
+    assert len(bars) == len(list(_business_days(date(1985, 1, 2), date.today())))
+
+
+@pytest.mark.asyncio
+async def test_failed_top_up_serves_the_stored_bars(tmp_path):
+    fmp, store = _FakeFMP(), _store(tmp_path, interval=0)
+    first = await store.daily(fmp, "T", _ago(60))
+    fmp.fail = True
+    again = await store.daily(fmp, "T", _ago(60))
+    assert len(again) == len(first)
+
+
+def test_parse_drops_unusable_rows_and_duplicates():
+    cols = parse_fmp_daily({"historical": [
+        {"date": "2026-03-04", "close": 11.0, "volume": None},
+        {"date": "2026-03-03", "close": float("nan")},
+        {"date": "2026-03-02", "close": 0},
+        {"date": "2026-03-02", "close": 9.0},
+        {"date": "", "close": 8.0},
+        {"date": "2026-03-01", "adjClose": 7.0},
+    ]})
+    # The first USABLE row for a date wins: 03-02's zero close gives way to 9.0.
+    assert np.datetime_as_string(cols["dates"], unit="D").tolist() == [
+        "2026-03-01", "2026-03-02", "2026-03-04",
+    ]
+    assert cols["close"].tolist() == [7.0, 9.0, 11.0]
+    assert np.isnan(cols["volume"][2])
+
+
+@pytest.mark.asyncio
+async def test_fetch_daily_history_matches_the_direct_call(tmp_path, monkeypatch):
+    fmp = _FakeFMP()
+    direct = await phs.fetch_daily_history(fmp, "AMD", from_date=_ago(90))
+    assert fmp.calls == [("AMD", _ago(90), None)]  # pass-through: same arguments
+
+    monkeypatch.setattr(settings, "PRICE_HISTORY_STORE_DIR", str(tmp_path / "prices"))
+    served = await phs.fetch_daily_history(fmp, "AMD", from_date=_ago(90))
+    keys = ("date", "open", "high", "low", "close", "volume")
+    assert [{k: r[k] for k in keys} for r in served] == [{k: r[k] for k in keys} for r in direct]
+
+
+@pytest.mark.asyncio
+async def test_chart_all_reads_the_store(tmp_path, monkeypatch):
+    from app.services.chart_helper import fetch_chart_data
+
+    monkeypatch.setattr(settings, "PRICE_HISTORY_STORE_DIR", str(tmp_path / "prices"))
+    fmp = _FakeFMP(listed=date(1990, 1, 2))
+    first = await fetch_chart_data(fmp, "SPY", "ALL", "monthly")
+    calls = len(fmp.calls)
+    second = await fetch_chart_data(fmp, "SPY", "ALL", "monthly")
+    assert len(fmp.calls) == calls  # served from disk
+    assert first == second and first[0]["date"].startswith("1990-01")
@@ -0,0 +1,329 @@
+"""Parity: the NumPy price-volatility engine vs the list-based loops it replaced.
+
+`_reference_*` below are the pre-vectorization implementations, frozen verbatim
+(only renamed). The vectorized functions must produce the same σ (to summation
+order), the same rounded window metrics, the same chosen window and tier, and
+the same date→bar indices — on clean series and on the dirty ones FMP actually
+serves (NaN / Infinity tokens, zero and None closes, short histories).
+
+The panel functions are pinned row-for-row against the single-symbol ones.
+"""
+
+import bisect
+import math
+import random
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from app.services.price_volatility import (
+    _BASELINE_DAYS,
+    _DEFAULT_WINDOW,
+    _EVAL_WINDOWS,
+    _bar_indices,
+    _compute_price_volatility,
+    _compute_price_volatility_batch,
+    _daily_returns,
+    _price_panel,
+    _sigma_daily_batch,
+    _std_dev_pop,
+    _tier_for_z,
+)
+from app.services.agents.ticker_report_data_collector import (
+    _index_for_date,
+    _indices_for_dates,
+)
+
+
+# ── Frozen reference implementation ─────────────────────────────────────────
+
+def _reference_daily_returns(prices):
+    out = []
+    for i in range(1, len(prices)):
+        prev = prices[i - 1]
+        curr = prices[i]
+        if (
+            prev is not None and curr is not None
+            and math.isfinite(prev) and math.isfinite(curr)
+            and prev > 0
+        ):
+            out.append((curr - prev) / prev)
+    return out
+
+
+def _reference_std_dev_pop(values):
+    if len(values) < 2:
+        return None
+    mean = sum(values) / len(values)
+    var = sum((v - mean) ** 2 for v in values) / len(values)
+    sigma = var ** 0.5
+    return sigma if math.isfinite(sigma) else None
+
+
+def _reference_compute_price_volatility(
+    prices, price_dates=None, baseline_days=_BASELINE_DAYS, windows=_EVAL_WINDOWS,
+):
+    out = {
+        "sigma_daily": None, "windows": [], "chosen_window": _DEFAULT_WINDOW,
+        "chosen_ref_idx": None, "tier": "Typical", "chosen_z": None,
+        "chosen_move_pct": None, "chosen_band_pct": None,
+    }
+    if len(prices) < 30:
+        return out
+    if price_dates is not None and len(price_dates) != len(prices):
+        price_dates = None
+    baseline_slice = prices[-(baseline_days + 1):]
+    sigma_daily = _reference_std_dev_pop(_reference_daily_returns(baseline_slice))
+    if sigma_daily is None or not math.isfinite(sigma_daily) or sigma_daily <= 0:
+        return out
+    out["sigma_daily"] = sigma_daily
+    newest = prices[-1]
+    if newest is None or not math.isfinite(newest):
+        return out
+    metrics = []
+    if price_dates:
+        today = price_dates[-1]
+        for n in windows:
+            target = today - timedelta(days=n)
+            idx = bisect.bisect_right(price_dates, target) - 1
+            if idx < 0 or idx >= len(prices) - 1:
+                continue
+            oldest = prices[idx]
+            if not oldest or not math.isfinite(oldest) or oldest <= 0:
+                continue
+            move_pct = (newest - oldest) / oldest * 100
+            trading_days = len(prices) - 1 - idx
+            n_day_sigma_pct = sigma_daily * (trading_days ** 0.5) * 100
+            z = abs(move_pct) / n_day_sigma_pct if n_day_sigma_pct > 0 else 0.0
+            metrics.append({
+                "days": n, "ref_idx": idx, "move_pct": round(move_pct, 2),
+                "z": round(z, 2), "band_2sigma": round(n_day_sigma_pct * 2, 2),
+            })
+    else:
+        for n in windows:
+            if len(prices) <= n:
+                continue
+            ref_idx = len(prices) - (n + 1)
+            oldest = prices[ref_idx]
+            if not oldest or not math.isfinite(oldest) or oldest <= 0:
+                continue
+            move_pct = (newest - oldest) / oldest * 100
+            n_day_sigma_pct = sigma_daily * (n ** 0.5) * 100
+            z = abs(move_pct) / n_day_sigma_pct if n_day_sigma_pct > 0 else 0.0
+            metrics.append({
+                "days": n, "ref_idx": ref_idx, "move_pct": round(move_pct, 2),
+                "z": round(z, 2), "band_2sigma": round(n_day_sigma_pct * 2, 2),
+            })
+    out["windows"] = metrics
+    if not metrics:
+        return out
+    most_unusual = max(metrics, key=lambda w: w["z"])
+    if most_unusual["z"] < 1.0:
+        chosen = next((w for w in metrics if w["days"] == _DEFAULT_WINDOW), most_unusual)
+    else:
+        chosen = most_unusual
+    out["chosen_window"] = chosen["days"]
+    out["chosen_ref_idx"] = chosen["ref_idx"]
+    out["chosen_z"] = chosen["z"]
+    out["chosen_move_pct"] = chosen["move_pct"]
+    out["chosen_band_pct"] = chosen["band_2sigma"]
+    out["tier"] = _tier_for_z(chosen["z"])
+    return out
+
+
+# ── Fixtures ─────────────────────────────────────────────────────────────────
+
+def _trading_days(n, end=date(2026, 6, 30)):
+    days, d = [], end
+    while len(days) < n:
+        if d.weekday() < 5:
+            days.append(d)
+        d -= timedelta(days=1)
+    return days[::-1]
+
+
+def _walk(rng, n, vol):
+    prices, p = [], rng.uniform(5, 500)
+    for _ in range(n):
+        p *= 1 + rng.gauss(0, vol)
+        prices.append(p)
+    return prices
+
+
+def _dirty(rng, prices):
+    out = list(prices)
+    for _ in range(rng.randint(0, 4)):
+        out[rng.randrange(len(out))] = rng.choice(
+            [float("nan"), float("inf"), float("-inf"), 0.0, None, -1.0],
+        )
+    return out
+
+
+def _series(seed):
+    rng = random.Random(seed)
+    n = rng.choice([2, 20, 29, 30, 31, 45, 61, 120, 181, 182, 260, 400])
+    prices = _walk(rng, n, rng.choice([0.002, 0.01, 0.03, 0.08]))
+    if seed % 3 == 0:
+        prices = _dirty(rng, prices)
+    if seed % 11 == 0 and n > 5:
+        prices[-1] = rng.choice([float("nan"), None])
+    return prices, _trading_days(n)
+
+
+def _assert_same_volatility(got, want):
+    if want["sigma_daily"] is None:
+        assert got["sigma_daily"] is None
+    else:
+        assert got["sigma_daily"] == pytest.approx(want["sigma_daily"], rel=1e-12)
+    # Rounded to 2dp from a σ equal to ~1 ulp: identical except on an exact .xx5 tie.
+    assert [(w["days"], w["ref_idx"]) for w in got["windows"]] == [
+        (w["days"], w["ref_idx"]) for w in want["windows"]
+    ]
+    for g, w in zip(got["windows"], want["windows"]):
+        for k in ("move_pct", "z", "band_2sigma"):
+            assert g[k] == pytest.approx(w[k], abs=0.011)
+    for k in ("chosen_window", "chosen_ref_idx", "tier"):
+        assert got[k] == want[k]
+
+
+# ── Scalar parity ────────────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("seed", range(60))
+def test_daily_returns_and_std_match_the_reference(seed):
+    prices, _ = _series(seed)
+    got, want = _daily_returns(prices), _reference_daily_returns(prices)
+    assert got == pytest.approx(want, rel=0, abs=0)  # elementwise, bit-identical
+    g, w = _std_dev_pop(got), _reference_std_dev_pop(want)
+    assert (g is None) == (w is None)
+    if w is not None:
+        assert g == pytest.approx(w, rel=1e-12)
+
+
+def test_std_dev_pop_edge_cases():
+    assert _std_dev_pop([]) is None
+    assert _std_dev_pop([0.5]) is None
+    assert _std_dev_pop([0.01, float("nan")]) is None
+    assert _std_dev_pop([0.01, float("inf")]) is None
+    assert _std_dev_pop([0.02, 0.02, 0.02]) == 0.0
+    assert isinstance(_std_dev_pop([0.01, 0.03]), float)
+
+
+@pytest.mark.parametrize("seed", range(120))
+@pytest.mark.parametrize("with_dates", [True, False])
+def test_compute_price_volatility_matches_the_reference(seed, with_dates):
+    prices, dates = _series(seed)
+    price_dates = dates if with_dates else None
+    _assert_same_volatility(
+        _compute_price_volatility(prices, price_dates),
+        _reference_compute_price_volatility(prices, price_dates),
+    )
+
+
+def test_big_moves_pick_the_same_window_and_tier():
+    # A quiet series that then gaps hard: every tier boundary gets exercised.
+    for jump in (1.0, 1.03, 1.06, 1.12, 1.25, 0.8):
+        prices = [100.0 * (1 + 0.004 * ((i % 5) - 2)) for i in range(250)]
+        prices[-12:] = [p * jump for p in prices[-12:]]
+        for price_dates in (None, _trading_days(len(prices))):
+            got = _compute_price_volatility(prices, price_dates)
+            want = _reference_compute_price_volatility(prices, price_dates)
+            _assert_same_volatility(got, want)
+
+
+def test_misaligned_dates_fall_back_to_trading_days():
+    prices, dates = _series(7)
+    got = _compute_price_volatility(prices, dates[1:])
+    _assert_same_volatility(got, _reference_compute_price_volatility(prices, None))
+
+
+def test_a_datetime64_axis_is_accepted_in_place_of_dates():
+    prices, dates = _series(5)
+    axis = np.asarray(dates, dtype="datetime64[D]")
+    assert _compute_price_volatility(prices, axis) == _compute_price_volatility(prices, dates)
+
+
+# ── Panel parity (many symbols at once) ──────────────────────────────────────
+
+def test_panel_rows_match_the_single_symbol_path():
+    series = [_series(seed)[0] for seed in range(80)]
+    panel, lengths = _price_panel(series)
+    assert panel.shape == (80, max(len(s) for s in series))
+    assert lengths.tolist() == [len(s) for s in series]
+    rows = _compute_price_volatility_batch(panel, lengths)
+    for prices, row in zip(series, rows):
+        _assert_same_volatility(row, _reference_compute_price_volatility(prices))
+
+
+def test_panel_rows_match_on_a_shared_date_axis():
+    rng = random.Random(42)
+    axis = _trading_days(300)
+    series = [_walk(rng, rng.choice([25, 40, 90, 181, 300]), 0.02) for _ in range(50)]
+    panel, lengths = _price_panel(series, width=len(axis))
+    rows = _compute_price_volatility_batch(panel, lengths, dates=axis)
+    for prices, row in zip(series, rows):
+        # Each symbol's own dates are the axis's trailing len(prices) entries.
+        want = _reference_compute_price_volatility(prices, axis[-len(prices):])
+        _assert_same_volatility(row, want)
+
+
+def test_a_baseline_wide_panel_gives_the_same_rows_as_a_full_one():
+    rng = random.Random(3)
+    axis = _trading_days(1000)
+    series = [_walk(rng, rng.choice([25, 200, 700, 1000]), 0.02) for _ in range(30)]
+    full = _compute_price_volatility_batch(*_price_panel(series), dates=axis)
+    narrow_panel, lengths = _price_panel(series, width=_BASELINE_DAYS + 1)
+    narrow = _compute_price_volatility_batch(
+        narrow_panel, lengths, dates=axis[-(_BASELINE_DAYS + 1):],
+    )
+    for prices, a, b in zip(series, full, narrow):
+        assert a == b
+        if b["chosen_ref_idx"] is not None:  # still an index into the whole series
+            want = _reference_compute_price_volatility(prices, axis[-len(prices):])
+            assert b["chosen_ref_idx"] == want["chosen_ref_idx"]
+
+
+def test_sigma_batch_matches_the_scalar_sigma_per_row():
+    series = [_series(seed)[0] for seed in range(60)]
+    panel, _ = _price_panel(series, width=_BASELINE_DAYS + 1)
+    sigmas, counts = _sigma_daily_batch(panel)
+    for prices, sigma, count in zip(series, sigmas.tolist(), counts.tolist()):
+        returns = _reference_daily_returns(prices[-(_BASELINE_DAYS + 1):])
+        want = _reference_std_dev_pop(returns)
+        assert count == len(returns)
+        if want is None:
+            assert math.isnan(sigma)
+        else:
+            assert sigma == pytest.approx(want, rel=1e-12)
+
+
+def test_price_panel_keeps_the_newest_closes_when_truncating():
+    panel, lengths = _price_panel([[1.0, 2.0, 3.0, 4.0], [5.0], []], width=3)
+    assert lengths.tolist() == [4, 1, 0]  # full lengths: indices map back to the series
+    assert panel[0].tolist() == [2.0, 3.0, 4.0]
+    assert math.isnan(panel[1][0]) and panel[1][2] == 5.0
+    assert np.isnan(panel[2]).all()
+
+
+# ── Date → bar index ─────────────────────────────────────────────────────────
+
+def test_bar_indices_match_bisect():
+    dates = _trading_days(260)
+    targets = [dates[0] - timedelta(days=3)] + [
+        dates[0] + timedelta(days=k) for k in range(0, 380, 3)
+    ]
+    got = _bar_indices(targets, dates).tolist()
+    assert got == [bisect.bisect_right(dates, t) - 1 for t in targets]
+
+
+def test_indices_for_dates_match_index_for_date():
+    prices = [100.0 + i for i in range(260)]
+    dates = _trading_days(260)
+    today = dates[-1]
+    targets = [today - timedelta(days=k) for k in (0, 1, 2, 5, 30, 45, 400, 500)]
+    axis = np.asarray(dates, dtype="datetime64[D]")
+    for price_dates in (dates, axis, None, dates[1:]):
+        batch = _indices_for_dates(targets, today, prices, price_dates)
+        assert batch == [_index_for_date(t, today, prices, price_dates) for t in targets]
+    assert _indices_for_dates([], today, prices, dates) == []
+    assert _indices_for_dates(targets[:2], today, [], None) == [0, 0]
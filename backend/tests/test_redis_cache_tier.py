@@ -0,0 +1,223 @@
+"""
+Tests for the optional Redis L2 tier (app/core/redis_cache.py).
+
+Run against fakeredis so they need no server; point REDIS_URL at a real
+redis-server and call `init_redis_l2()` to exercise the same paths live. What is
+pinned here: bytes round-trip under the namespaced key, the lock is exclusive
+and only its owner can release it, two "processes" (two registries sharing one
+Redis) run ONE build between them, and a dead Redis degrades to the in-memory
+tier instead of failing the request.
+"""
+
+import asyncio
+
+import pytest
+from pydantic import BaseModel
+
+from app.core import cache as cache_mod
+from app.core import redis_cache
+from app.core.cache import CacheRegistry, ModelCodec
+from app.core.redis_cache import RedisCacheBackend
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+class _Analysis(BaseModel):
+    symbol: str
+    gauge_value: float = 0.5
+
+
+def _backend(server=None) -> RedisCacheBackend:
+    server = server or fakeredis.FakeServer()
+    return RedisCacheBackend(fakeredis.aioredis.FakeRedis(server=server))
+
+
+@pytest.mark.asyncio
+async def test_round_trip_is_namespaced_and_expires():
+    server = fakeredis.FakeServer()
+    backend = _backend(server)
+    await backend.set("ta:AAPL", b"payload", ttl=60)
+
+    raw = fakeredis.aioredis.FakeRedis(server=server)
+    assert await raw.get("caydex:cache:ta:AAPL") == b"payload"
+    assert 0 < await raw.pttl("caydex:cache:ta:AAPL") <= 60_000
+
+    assert await backend.get("ta:AAPL") == b"payload"
+    await backend.delete("ta:AAPL")
+    assert await backend.get("ta:AAPL") is None
+
+
+@pytest.mark.asyncio
+async def test_lock_is_exclusive_and_owner_only_release():
+    server = fakeredis.FakeServer()
+    a, b = _backend(server), _backend(server)
+
+    token = await a.acquire_lock("k", ttl=30)
+    assert token is not None
+    assert await b.acquire_lock("k", ttl=30) is None
+
+    # A stale token (a builder whose lock lapsed) must not free the current holder's.
+    await b.release_lock("k", "not-the-owner")
+    assert await b.acquire_lock("k", ttl=30) is None
+
+    await a.release_lock("k", token)
+    assert await b.acquire_lock("k", ttl=30) is not None
+
+
+@pytest.mark.asyncio
+async def test_two_processes_share_one_build(monkeypatch):
+    """Two registries = two workers' in-memory tiers; one Redis between them."""
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(cache_mod, "_L2_POLL_SECONDS", 0.01)
+    codec = ModelCodec(_Analysis)
+    calls = 0
+
+    async def build():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return _Analysis(symbol="AAPL")
+
+    worker_a = CacheRegistry(0).register("technical_analysis", ttl=60, max_entries=8)
+    worker_b = CacheRegistry(0).register("technical_analysis", ttl=60, max_entries=8)
+
+    async def run(region, backend):
+        # Each worker has its own client; the module-level backend is swapped per
+        # call the way each process would have installed its own at boot.
+        monkeypatch.setattr(cache_mod, "_l2_backend", backend)
+        return await region.get_or_build("ta:AAPL", build, codec=codec)
+
+    backend_a, backend_b = _backend(server), _backend(server)
+    first = asyncio.create_task(run(worker_a, backend_a))
+    await asyncio.sleep(0.01)  # worker A holds the lock and is mid-build
+    second = await run(worker_b, backend_b)
+    assert (await first).symbol == second.symbol == "AAPL"
+    assert calls == 1
+    assert worker_b.l2_hits == 1
+    assert "ta:AAPL" in worker_b  # the peer's value also warms B's own L1
+
+
+@pytest.mark.asyncio
+async def test_a_peer_build_that_returns_none_releases_its_waiters(monkeypatch):
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(cache_mod, "_L2_POLL_SECONDS", 0.01)
+    codec = ModelCodec(_Analysis)
+    calls = 0
+    result = None
+
+    async def build():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return result
+
+    worker_a = CacheRegistry(0).register("technical_analysis", ttl=60, max_entries=8)
+    worker_b = CacheRegistry(0).register("technical_analysis", ttl=60, max_entries=8)
+
+    async def run(region, backend):
+        monkeypatch.setattr(cache_mod, "_l2_backend", backend)
+        return await region.get_or_build("ta:AAPL", build, codec=codec)
+
+    backend_a, backend_b = _backend(server), _backend(server)
+    first = asyncio.create_task(run(worker_a, backend_a))
+    await asyncio.sleep(0.01)  # worker A holds the lock and is mid-build
+    started = asyncio.get_running_loop().time()
+    assert await run(worker_b, backend_b) is None
+    assert asyncio.get_running_loop().time() - started < 1.0  # not the 10s wait
+    assert await first is None
+    assert calls == 1
+    assert "ta:AAPL" not in worker_b
+
+    # The marker describes that build only: the next holder builds for real.
+    result = _Analysis(symbol="AAPL")
+    assert (await run(worker_a, backend_a)).symbol == "AAPL"
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_a_peer_build_that_raises_makes_its_waiters_rebuild(monkeypatch):
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(cache_mod, "_L2_POLL_SECONDS", 0.01)
+    codec = ModelCodec(_Analysis)
+    calls = 0
+
+    async def build():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        if calls == 1:
+            raise RuntimeError("upstream 503")
+        return _Analysis(symbol="AAPL")
+
+    worker_a = CacheRegistry(0).register("technical_analysis", ttl=60, max_entries=8)
+    worker_b = CacheRegistry(0).register("technical_analysis", ttl=60, max_entries=8)
+
+    async def run(region, backend):
+        monkeypatch.setattr(cache_mod, "_l2_backend", backend)
+        return await region.get_or_build("ta:AAPL", build, codec=codec)
+
+    backend_a, backend_b = _backend(server), _backend(server)
+    first = asyncio.create_task(run(worker_a, backend_a))
+    await asyncio.sleep(0.01)  # worker A holds the lock and is mid-build
+    started = asyncio.get_running_loop().time()
+    second = await run(worker_b, backend_b)
+    assert asyncio.get_running_loop().time() - started < 1.0  # not the 10s wait
+    with pytest.raises(RuntimeError):
+        await first
+    # The failure is not B's answer: B took the released lock and built it itself.
+    assert second.symbol == "AAPL"
+    assert calls == 2
+    assert "ta:AAPL" in worker_b
+
+
+class _DeadClient:
+    def __init__(self):
+        self.calls = 0
+
+    def register_script(self, script):
+        return None
+
+    async def get(self, *a, **k):
+        self.calls += 1
+        raise ConnectionError("redis down")
+
+    set = delete = get
+
+
+@pytest.mark.asyncio
+async def test_dead_redis_degrades_to_memory(monkeypatch):
+    client = _DeadClient()
+    backend = RedisCacheBackend(client)
+    monkeypatch.setattr(cache_mod, "_l2_backend", backend)
+    region = CacheRegistry(0).register("t", ttl=60, max_entries=8)
+    codec = ModelCodec(_Analysis)
+
+    async def build():
+        return _Analysis(symbol="MSFT")
+
+    value = await region.get_or_build("k", build, codec=codec)
+    assert value.symbol == "MSFT"
+    assert region.lookup("k") is not None
+    # The breaker is open after the first failure: later calls skip Redis entirely.
+    assert client.calls == 1
+    assert await backend.get("k") is None
+    assert client.calls == 1
+    # The lock fails OPEN so the build is never blocked on an unreachable server.
+    assert await backend.acquire_lock("k", ttl=30) is not None
+
+
+@pytest.mark.asyncio
+async def test_init_without_url_leaves_memory_tier(monkeypatch):
+    monkeypatch.setattr(redis_cache.settings, "REDIS_URL", None)
+    monkeypatch.setattr(redis_cache, "_backend", None)
+    assert await redis_cache.init_redis_l2() is None
+    assert cache_mod.get_l2_backend() is None
+
+
+@pytest.mark.asyncio
+async def test_init_with_unreachable_url_is_not_fatal(monkeypatch):
+    monkeypatch.setattr(redis_cache.settings, "REDIS_URL", "redis://127.0.0.1:1/0")
+    monkeypatch.setattr(redis_cache.settings, "REDIS_TIMEOUT_SECONDS", 0.2)
+    monkeypatch.setattr(redis_cache, "_backend", None)
+    assert await redis_cache.init_redis_l2() is None
+    assert cache_mod.get_l2_backend() is None
@@ -0,0 +1,150 @@
+"""
+Tests for the Redis GCRA backend behind `RateLimiter` (app/core/redis_rate_limit.py).
+
+Against fakeredis (with its Lua support), so the atomic script itself runs. Pins: the
+same burst the sliding window allowed, a refill at the emission interval, the
+protected/general split surviving as separate key namespaces, ONE limit across two
+limiter instances (two workers), O(1) state per key with a TTL no longer than the
+window, the in-memory fallback when Redis cannot answer, and the async check keeping
+the round-trip off the event loop.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.core.redis_rate_limit import RedisRateLimitBackend
+from app.core.security import RateLimiter
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+def _limiter(server=None) -> RateLimiter:
+    rl = RateLimiter()
+    client = fakeredis.FakeRedis(server=server or fakeredis.FakeServer())
+    rl.set_backend(RedisRateLimitBackend(client))
+    return rl
+
+
+def test_burst_matches_the_sliding_window():
+    rl = _limiter()
+    allowed = sum(1 for _ in range(20) if rl.is_allowed("u", max_requests=15, window_seconds=60))
+    assert allowed == 15
+    # Decided in Redis: nothing landed in the per-process pools.
+    assert not rl._requests and not rl._protected
+
+
+def test_refills_one_request_per_emission_interval():
+    rl = _limiter()
+    assert rl.is_allowed("u", max_requests=2, window_seconds=0.2)
+    assert rl.is_allowed("u", max_requests=2, window_seconds=0.2)
+    assert not rl.is_allowed("u", max_requests=2, window_seconds=0.2)
+    time.sleep(0.12)  # one interval (0.1s) later exactly one more conforms
+    assert rl.is_allowed("u", max_requests=2, window_seconds=0.2)
+    assert not rl.is_allowed("u", max_requests=2, window_seconds=0.2)
+
+
+def test_one_limit_across_workers():
+    server = fakeredis.FakeServer()
+    worker_a, worker_b = _limiter(server), _limiter(server)
+    verdicts = [
+        (worker_a if i % 2 else worker_b).is_allowed("login:email:x", 10, 900, protected=True)
+        for i in range(20)
+    ]
+    assert sum(verdicts) == 10
+
+
+def test_pools_are_separate_namespaces_with_bounded_ttl():
+    server = fakeredis.FakeServer()
+    rl = _limiter(server)
+    raw = fakeredis.FakeRedis(server=server)
+
+    assert rl.is_allowed("k", 1, 60, protected=True)
+    # The same identifier in the general pool has its own budget.
+    assert rl.is_allowed("k", 1, 60)
+    assert not rl.is_allowed("k", 1, 60, protected=True)
+
+    assert sorted(raw.keys("caydex:rl:*")) == [b"caydex:rl:g:k", b"caydex:rl:p:k"]
+    # One scalar per key, expiring within its window — a minted-id flood drains on its own.
+    assert raw.type("caydex:rl:p:k") == b"string"
+    assert 0 < raw.pttl("caydex:rl:p:k") <= 60_000
+
+
+def test_zero_budget_is_denied():
+    rl = _limiter()
+    assert rl.is_allowed("u", max_requests=0, window_seconds=60) is False
+
+
+def test_clear_drops_redis_buckets():
+    rl = _limiter()
+    for _ in range(3):
+        rl.is_allowed("u", 3, 60)
+    assert not rl.is_allowed("u", 3, 60)
+    rl.clear()
+    assert rl.is_allowed("u", 3, 60)
+
+
+class _DeadClient:
+    def register_script(self, script):
+        def _call(**kwargs):
+            raise ConnectionError("redis down")
+        return _call
+
+
+def test_unreachable_redis_falls_back_to_memory_pools():
+    rl = RateLimiter()
+    backend = RedisRateLimitBackend(_DeadClient())
+    rl.set_backend(backend)
+    allowed = sum(1 for _ in range(20) if rl.is_allowed("u", max_requests=15, window_seconds=60))
+    # Limits still hold — per-process, from the in-memory pool — rather than lifting.
+    assert allowed == 15
+    assert "u" in rl._requests
+    # The breaker opened on the first error; the rest never touched the client.
+    assert backend.errors == 1
+
+
+class _SlowClient:
+    """A Redis that takes 200ms to answer, and notes the thread it was called on."""
+
+    def __init__(self):
+        self.threads = []
+
+    def register_script(self, script):
+        def _call(**kwargs):
+            self.threads.append(threading.current_thread())
+            time.sleep(0.2)
+            return 1
+        return _call
+
+
+@pytest.mark.asyncio
+async def test_async_check_keeps_a_slow_redis_off_the_event_loop():
+    rl = RateLimiter()
+    client = _SlowClient()
+    rl.set_backend(RedisRateLimitBackend(client))
+    ticks = 0
+
+    async def _ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker = asyncio.create_task(_ticker())
+    try:
+        assert await rl.is_allowed_async("u", 15, 60) is True
+    finally:
+        ticker.cancel()
+    # The loop kept running while Redis was answering.
+    assert ticks >= 5
+    assert client.threads and client.threads[0] is not threading.main_thread()
+
+
+@pytest.mark.asyncio
+async def test_async_check_falls_back_to_memory_pools():
+    rl = RateLimiter()
+    rl.set_backend(RedisRateLimitBackend(_DeadClient()))
+    verdicts = [await rl.is_allowed_async("u", max_requests=2, window_seconds=60) for _ in range(3)]
+    assert verdicts == [True, True, False]
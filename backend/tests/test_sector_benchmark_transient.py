@@ -13,6 +13,7 @@ import pytest
 
 from app.services import sector_benchmark_lookup as sbl
 from app.services.sector_benchmark_lookup import SectorBenchmarkLookup, _is_transient
+from app.utils import supabase_errors as se
 
 
 # ── _is_transient classification ─────────────────────────────────────────────
@@ -123,7 +124,7 @@ class _FakeSupabase:
 
 
 def test_fetch_rows_retries_stale_http2_then_succeeds(monkeypatch):
-    monkeypatch.setattr(sbl.time, "sleep", lambda *_a, **_k: None)  # no backoff wait
+    monkeypatch.setattr(se.time, "sleep", lambda *_a, **_k: None)  # no backoff wait
     lk = SectorBenchmarkLookup.__new__(SectorBenchmarkLookup)  # skip get_supabase()
 
     good_rows = [
@@ -145,7 +146,7 @@ def test_fetch_rows_retries_stale_http2_then_succeeds(monkeypatch):
 
 
 def test_fetch_rows_reraises_after_persistent_transient(monkeypatch):
-    monkeypatch.setattr(sbl.time, "sleep", lambda *_a, **_k: None)
+    monkeypatch.setattr(se.time, "sleep", lambda *_a, **_k: None)
     lk = SectorBenchmarkLookup.__new__(SectorBenchmarkLookup)
     lk.supabase = _FakeSupabase([
         httpx.LocalProtocolError("in state ConnectionState.CLOSED"),
@@ -158,7 +159,7 @@ def test_fetch_rows_reraises_after_persistent_transient(monkeypatch):
 
 def test_get_benchmarks_degrades_to_empty_and_warns_on_transient(monkeypatch, caplog):
     import logging
-    monkeypatch.setattr(sbl.time, "sleep", lambda *_a, **_k: None)
+    monkeypatch.setattr(se.time, "sleep", lambda *_a, **_k: None)
     lk = SectorBenchmarkLookup.__new__(SectorBenchmarkLookup)
     lk.supabase = _FakeSupabase([
         httpx.LocalProtocolError("in state ConnectionState.CLOSED"),
@@ -222,7 +223,7 @@ def test_is_transient_delegates_to_the_shared_classifier():
 
 
 def test_fetch_rows_retries_a_520_then_succeeds(monkeypatch):
-    monkeypatch.setattr(sbl.time, "sleep", lambda *_a, **_k: None)
+    monkeypatch.setattr(se.time, "sleep", lambda *_a, **_k: None)
     lk = SectorBenchmarkLookup.__new__(SectorBenchmarkLookup)
     good_rows = [{"metric_name": "pe_ratio", "period_label": "Q4'25",
                   "median_value": 22.5, "sample_size": 40}]
@@ -239,7 +240,7 @@ def test_fetch_rows_does_not_retry_a_23505(monkeypatch):
     Guards the boundary between "gateway blip" and "PostgREST said no": both arrive
     as the same APIError type, and only `.code` tells them apart.
     """
-    monkeypatch.setattr(sbl.time, "sleep", lambda *_a, **_k: None)
+    monkeypatch.setattr(se.time, "sleep", lambda *_a, **_k: None)
     lk = SectorBenchmarkLookup.__new__(SectorBenchmarkLookup)
     lk.supabase = _FakeSupabase([_postgrest_error("23505")])
 
@@ -251,7 +252,7 @@ def test_fetch_rows_does_not_retry_a_23505(monkeypatch):
 
 def test_get_benchmarks_warns_not_errors_on_a_520(monkeypatch, caplog):
     import logging
-    monkeypatch.setattr(sbl.time, "sleep", lambda *_a, **_k: None)
+    monkeypatch.setattr(se.time, "sleep", lambda *_a, **_k: None)
     lk = SectorBenchmarkLookup.__new__(SectorBenchmarkLookup)
     lk.supabase = _FakeSupabase([_gateway_error(520)])
 
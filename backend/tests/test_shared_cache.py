@@ -0,0 +1,278 @@
+"""
+Tests for the shared cache engine (app/core/cache.py).
+
+Every per-service `_cache` dict now lives in a `CacheRegion` registered with one
+process-wide `CacheRegistry`. These pin the behaviour the services rely on:
+LRU-on-read, per-entry TTLs with the reader's TTL winning, the global byte
+budget evicting across regions, single-flight builds that survive a cancelled
+leader, and the optional L2 tier round-trip.
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from app.core import cache as cache_mod
+from app.core.cache import CacheRegistry, approx_size
+
+
+def _registry(budget_bytes: int = 0) -> CacheRegistry:
+    return CacheRegistry(budget_bytes=budget_bytes)
+
+
+def test_lookup_refreshes_lru_position():
+    region = _registry().register("t", ttl=60, max_entries=2)
+    region.store("a", 1)
+    region.store("b", 2)
+    assert region.lookup("a") == 1  # `a` is now the most recently used
+    region.store("c", 3)
+    assert "b" not in region
+    assert region.lookup("a") == 1
+    assert region.lookup("c") == 3
+    assert region.evictions == 1
+
+
+def test_per_entry_ttl_and_reader_ttl_precedence():
+    region = _registry().register("t", ttl=60, max_entries=8)
+    region.store("short", "x", ttl=1)
+    region["old"] = (time.time() - 30, "y")
+
+    # Entry TTL applies when the reader passes none.
+    region._entries["short"].ts -= 5
+    assert region.lookup("short") is None
+    assert "short" not in region
+
+    # An explicit reader TTL wins over the stored one.
+    assert region.lookup("old") == "y"
+    assert region.lookup("old", ttl=10) is None
+    assert region.expirations == 2
+
+
+def test_legacy_mapping_view_round_trips():
+    region = _registry().register("t", ttl=60, max_entries=8)
+    ts = time.time() - 5
+    region["k"] = (ts, {"v": 1})
+    assert region["k"] == (ts, {"v": 1}, 60)
+    assert list(region) == ["k"]
+    del region["k"]
+    assert len(region) == 0
+    assert region.bytes == 0
+
+
+def test_byte_accounting_tracks_writes_and_deletes():
+    reg = _registry()
+    region = reg.register("t", ttl=60, max_entries=8)
+    region.store("a", "x" * 1000)
+    assert region.bytes >= 1000
+    assert reg.total_bytes == region.bytes
+    region.store("a", "y")
+    assert region.bytes < 1000
+    region.discard("a")
+    assert region.bytes == 0 and reg.total_bytes == 0
+
+
+def test_global_budget_evicts_oldest_across_regions():
+    blob = "z" * 10_000
+    reg = _registry(budget_bytes=approx_size(blob) * 3)
+    a = reg.register("a", ttl=60, max_entries=100)
+    b = reg.register("b", ttl=60, max_entries=100)
+
+    a.store("a1", blob)
+    time.sleep(0.001)
+    b.store("b1", blob)
+    time.sleep(0.001)
+    a.store("a2", blob)
+    time.sleep(0.001)
+    b.store("b2", blob)  # over budget: the oldest entry anywhere (a1) goes
+
+    assert "a1" not in a
+    assert {"a2"} == set(a) and {"b1", "b2"} == set(b)
+    assert reg.total_bytes <= reg.budget_bytes
+    assert reg.budget_evictions == 1
+
+
+def test_global_budget_victim_is_least_recently_read_not_oldest_write():
+    blob = "z" * 10_000
+    reg = _registry(budget_bytes=approx_size(blob) * 3)
+    a = reg.register("a", ttl=60, max_entries=100)
+    b = reg.register("b", ttl=60, max_entries=100)
+
+    a.store("a1", blob)
+    time.sleep(0.001)
+    b.store("b1", blob)
+    time.sleep(0.001)
+    a.store("a2", blob)
+    time.sleep(0.001)
+    assert a.lookup("a1") == blob                  # written first, but hot
+    time.sleep(0.001)
+    b.store("b2", blob)  # over budget: the coldest entry anywhere (b1) goes
+
+    assert {"a1", "a2"} == set(a) and {"b2"} == set(b)
+    assert reg.budget_evictions == 1
+
+
+def test_register_returns_existing_region():
+    reg = _registry()
+    first = reg.register("same", ttl=60, max_entries=8)
+    first.store("k", 1)
+    again = reg.register("same", ttl=60, max_entries=8)
+    assert again is first
+    assert again.lookup("k") == 1
+
+
+def test_trim_sweeps_expired_before_evicting_live():
+    region = _registry().register("t", ttl=60, max_entries=2)
+    region["stale"] = (time.time() - 120, "old")
+    region.store("live", 1)
+    region.store("new", 2)
+    assert "stale" not in region
+    assert {"live", "new"} == set(region)
+    assert region.evictions == 0
+
+
+@pytest.mark.asyncio
+async def test_deduped_shares_one_build():
+    region = _registry().register("t", ttl=60, max_entries=8)
+    calls = 0
+
+    async def build():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "v"
+
+    results = await asyncio.gather(*(region.deduped("k", build) for _ in range(5)))
+    assert results == ["v"] * 5
+    assert calls == 1
+    assert region.joins == 4
+    assert region.inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_releases_joiners():
+    region = _registry().register("t", ttl=60, max_entries=8)
+    started = asyncio.Event()
+
+    async def build():
+        started.set()
+        await asyncio.sleep(10)
+
+    leader = asyncio.create_task(region.deduped("k", build))
+    await started.wait()
+    joiner = asyncio.create_task(region.deduped("k", build))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(joiner, timeout=1)
+    assert region.inflight == {}
+
+
+class _FakeL2:
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ttl):
+        self.data[key] = value
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+
+class _JsonCodec:
+    def dumps(self, value):
+        return json.dumps(value).encode()
+
+    def loads(self, raw):
+        return json.loads(raw)
+
+
+@pytest.mark.asyncio
+async def test_get_or_build_populates_and_reads_l2(monkeypatch):
+    backend = _FakeL2()
+    monkeypatch.setattr(cache_mod, "_l2_backend", backend)
+    region = _registry().register("rep", ttl=60, max_entries=8, codec=_JsonCodec())
+    calls = 0
+
+    async def build():
+        nonlocal calls
+        calls += 1
+        return {"n": 1}
+
+    assert await region.get_or_build("AAPL", build) == {"n": 1}
+    assert backend.data == {"rep:AAPL": b'{"n": 1}'}
+
+    # A cold L1 (another process, or a restart) is refilled from L2, not rebuilt.
+    region.clear()
+    assert await region.get_or_build("AAPL", build) == {"n": 1}
+    assert calls == 1
+    assert region.l2_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_publish_fills_both_tiers_for_the_next_reader(monkeypatch):
+    backend = _FakeL2()
+    monkeypatch.setattr(cache_mod, "_l2_backend", backend)
+    region = _registry().register("rep", ttl=60, max_entries=8, codec=_JsonCodec())
+
+    async def build():
+        raise AssertionError("a published key must not be rebuilt")
+
+    await region.publish("MSFT", {"n": 2}, ttl=30)
+    await region.publish("NONE", None)
+    assert backend.data == {"rep:MSFT": b'{"n": 2}'}
+    assert await region.get_or_build("MSFT", build) == {"n": 2}
+    region.clear()
+    assert await region.get_or_build("MSFT", build) == {"n": 2}  # via L2
+
+
+@pytest.mark.asyncio
+async def test_recall_reads_both_tiers_and_never_builds(monkeypatch):
+    backend = _FakeL2()
+    monkeypatch.setattr(cache_mod, "_l2_backend", backend)
+    region = _registry().register("st", ttl=60, max_entries=8, codec=_JsonCodec())
+
+    assert await region.recall("AAPL") is None
+    backend.data["st:AAPL"] = b'{"bars": 3}'
+    assert await region.recall("AAPL") == {"bars": 3}
+    assert region.lookup("AAPL") == {"bars": 3}  # copied into L1
+    assert region.l2_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_get_or_build_never_caches_none():
+    region = _registry().register("t", ttl=60, max_entries=8)
+
+    async def build():
+        return None
+
+    assert await region.get_or_build("k", build) is None
+    assert "k" not in region
+
+
+def test_stats_shape():
+    reg = _registry(budget_bytes=1 << 20)
+    region = reg.register("t", ttl=60, max_entries=8)
+    region.store("k", 1)
+    region.lookup("k")
+    region.lookup("missing")
+    stats = reg.stats()
+    assert stats["budget_bytes"] == 1 << 20
+    assert stats["total_entries"] == 1
+    assert stats["hit_rate"] == 0.5
+    assert stats["regions"]["t"]["hits"] == 1
+    assert stats["regions"]["t"]["misses"] == 1
+
+
+def test_migrated_services_share_the_process_registry():
+    from app.services import etf_service, technical_analysis_service
+
+    regions = cache_mod.get_cache_registry().regions()
+    assert regions["etf"] is etf_service._cache
+    assert regions["technical_analysis"] is technical_analysis_service._cache
+    assert "etf" in cache_mod.cache_stats()["regions"]
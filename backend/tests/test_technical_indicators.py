@@ -0,0 +1,162 @@
+"""The NumPy panel engine for technical analysis (app/services/technical_indicators.py).
+
+Pinned here: every gauge indicator computed over a panel equals the ``ta``-library value
+``TechnicalAnalysisService._indicator_values`` produces for each ticker alone — at and
+around every minimum-history gate, with missing highs/lows; the array weekly resample
+equals the pandas one for stocks and crypto; the batch responses equal
+``_build_analysis``; and the universe sweep publishes responses that ``get_analysis``
+then serves without fetching. No network.
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+from fastapi import HTTPException
+
+from app.services import technical_analysis_service as tas
+from app.services.price_history_store import DailyBars
+from app.services.technical_analysis_service import TechnicalAnalysisService
+from app.services.technical_indicators import group_by_length, panel_indicators, weekly_bars
+
+
+def _frame(n: int, seed: int, *, start: str = "2024-01-02", freq: str = "B") -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 50 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    high = close * (1 + np.abs(rng.normal(0, 0.01, n)))
+    low = close * (1 - np.abs(rng.normal(0, 0.01, n)))
+    open_ = close * (1 + rng.normal(0, 0.005, n))
+    volume = rng.integers(1_000, 1_000_000, n).astype(float)
+    if n > 40:
+        high[rng.integers(0, n, 2)] = np.nan  # FMP rows with a close but no range
+        low[rng.integers(0, n, 2)] = np.nan
+        open_[rng.integers(0, n, 3)] = np.nan
+        volume[rng.integers(0, n, 3)] = np.nan
+    index = pd.DatetimeIndex(pd.date_range(start, periods=n, freq=freq), name="date")
+    return pd.DataFrame(
+        {"open": open_, "high": high, "low": low, "close": close, "volume": volume}, index=index,
+    )
+
+
+def _bars(symbol: str, df: pd.DataFrame) -> DailyBars:
+    return DailyBars(
+        symbol,
+        df.index.values.astype("datetime64[D]"),
+        *(df[c].to_numpy(dtype=np.float64) for c in ("open", "high", "low", "close", "volume")),
+    )
+
+
+def _assert_same_values(got, want, where):
+    assert set(got) == set(want)
+    for name, expected in want.items():
+        value = tas._safe_float(got[name])
+        if expected is None:
+            assert value is None, (where, name, value)
+        else:
+            assert value == pytest.approx(expected, rel=1e-9, abs=1e-9), (where, name)
+
+
+@pytest.mark.parametrize("n", [5, 10, 13, 14, 15, 20, 27, 28, 34, 35, 50, 120, 260, 413])
+def test_panel_matches_the_ta_path(n):
+    frames = [_frame(n, seed) for seed in range(4)]
+    panel = panel_indicators(
+        np.stack([f["high"].to_numpy() for f in frames]),
+        np.stack([f["low"].to_numpy() for f in frames]),
+        np.stack([f["close"].to_numpy() for f in frames]),
+    )
+    for row, df in enumerate(frames):
+        want = TechnicalAnalysisService._indicator_values(df)
+        _assert_same_values({k: v[row] for k, v in panel.items()}, want, (n, row))
+
+
+def test_flat_prices_degrade_like_the_ta_path():
+    # Zero ranges: stoch/williams/CCI divide by zero, RSI sees no losses.
+    df = _frame(60, 1)
+    df[["open", "high", "low", "close"]] = 10.0
+    panel = panel_indicators(df[["high"]].T.values, df[["low"]].T.values, df[["close"]].T.values)
+    want = TechnicalAnalysisService._indicator_values(df)
+    _assert_same_values({k: v[0] for k, v in panel.items()}, want, "flat")
+
+
+@pytest.mark.parametrize("is_crypto", [False, True])
+def test_weekly_bars_match_the_pandas_resample(is_crypto):
+    df = _frame(300, 3, freq="D" if is_crypto else "B")
+    df = df.drop(df.index[100:112])  # a gap longer than a week: pandas emits an empty bin
+    want = TechnicalAnalysisService._daily_to_weekly(df, is_crypto=is_crypto)
+    dates, o, h, lo, c, v = weekly_bars(
+        df.index.values, *(df[k].to_numpy() for k in ("open", "high", "low", "close", "volume")),
+        is_crypto=is_crypto,
+    )
+    assert dates.tolist() == want.index.values.astype("datetime64[D]").tolist()
+    for got, col in ((o, "open"), (h, "high"), (lo, "low"), (c, "close"), (v, "volume")):
+        np.testing.assert_allclose(got, want[col].to_numpy(), rtol=1e-12, equal_nan=True)
+
+
+def test_group_by_length_keeps_input_order():
+    assert group_by_length([3, 5, 3, 4, 5]) == {3: [0, 2], 5: [1, 4], 4: [3]}
+
+
+def _service(frames, calls=None):
+    svc = object.__new__(TechnicalAnalysisService)
+    svc.fmp = None
+
+    async def fetch(ticker, from_date=None):
+        if calls is not None:
+            calls.append(ticker)
+        if ticker not in frames:
+            raise HTTPException(status_code=404, detail="no data")
+        df = frames[ticker]
+        return df[df.index >= pd.Timestamp(from_date)] if from_date else df
+
+    svc._fetch_daily_ohlcv = fetch
+    svc._fetch_daily_ohlcv_uncached = fetch
+    return svc
+
+
+def _forget(*tickers):
+    for ticker in tickers:
+        tas._cache.discard(f"ta:{ticker}")
+        for tf in ("daily", "weekly"):
+            tas._state_cache.discard(f"{ticker}:{tf}")
+
+
+@pytest.mark.asyncio
+async def test_batch_responses_equal_the_per_ticker_build():
+    frames = {
+        "AAA": _frame(413, 11),
+        "BBB": _frame(413, 12),
+        "CCC": _frame(90, 13),     # short history: the long MAs are gated off
+        "DDD": _frame(20, 14),     # weekly panel too short for every oscillator
+        "BTCUSD": _frame(600, 15, freq="D"),
+    }
+    svc = _service(frames)
+    _forget(*frames)
+    batch = svc.compute_analysis_batch([_bars(t, df) for t, df in frames.items()])
+    assert set(batch) == set(frames)
+    for ticker in frames:
+        is_crypto = tas.detect_asset_class(ticker) == "crypto"
+        want = await svc._build_analysis(ticker, is_crypto)
+        got = batch[ticker]
+        assert got.model_dump() == want.model_dump(), ticker
+        assert not math.isnan(got.gauge_value)
+    _forget(*frames)
+
+
+@pytest.mark.asyncio
+async def test_precompute_publishes_what_get_analysis_serves():
+    frames = {"PCA": _frame(413, 21), "PCB": _frame(300, 22)}
+    calls = []
+    svc = _service(frames, calls)
+    _forget("PCA", "PCB", "PCMISSING")
+    try:
+        published = await svc.precompute_universe(["pca", "PCB", "PCMISSING", "PCA"])
+        assert published == 2
+        assert sorted(calls) == ["PCA", "PCB", "PCMISSING"]  # deduplicated, upper-cased
+
+        calls.clear()
+        served = await svc.get_analysis("PCA")
+        assert calls == []  # a cache hit — no history fetch, no indicator pass
+        assert served.model_dump() == (await svc._build_analysis("PCA", False)).model_dump()
+    finally:
+        _forget("PCA", "PCB", "PCMISSING")
@@ -12,16 +12,28 @@ Pure / offline — no network, no Supabase.
 
 from __future__ import annotations
 
+import copy
 import dataclasses
 import json
 from datetime import date, datetime, timezone
 
+import pytest
+
+from app.schemas.profit_power import ProfitPowerDataPointSchema, ProfitPowerResponse
+from app.schemas.stock_overview import SnapshotItemResponse
+from app.services import ticker_data_cache as tdc
 from app.services.ticker_data_cache import (
     _PYDANTIC_FIELDS,
     _deserialize,
+    _deserialize_binary,
     _serialize,
+    encode_collection,
+)
+from app.services.agents.ticker_report_data_collector import (
+    CollectedTickerData,
+    TickerReportDataCollector,
+    _AGENT_MAP,
 )
-from app.services.agents.ticker_report_data_collector import CollectedTickerData
 from app.services.industry_tam_service import IndustryTAM
 from app.services.sector_aggregates_service import SectorAggregates
 
@@ -132,3 +144,150 @@ def test_unknown_field_in_cached_data_is_ignored():
     back = _deserialize(blob, _field_names())
     assert back is not None
     assert not hasattr(back, "some_removed_field")
+
+
+# ── Binary, lazily-decoded rows ──────────────────────────────────────
+
+
+def _rich_sample() -> CollectedTickerData:
+    out = _sample()
+    out.snap_health = SnapshotItemResponse(category="Financial Health", rating=4, metrics=[])
+    out.profit_power = ProfitPowerResponse(
+        symbol="ORCL",
+        annual=[ProfitPowerDataPointSchema(period="2025", gross_margin=70.1)],
+        quarterly=[],
+    )
+    out.transcript = "Operator: good afternoon."
+    return out
+
+
+def _binary(out: CollectedTickerData):
+    blob = encode_collection(_serialize(out))
+    assert blob is not None
+    return _deserialize_binary(blob, _field_names())
+
+
+def test_profit_power_is_in_the_registry_so_collections_serialize():
+    # It was missing, so any collection carrying the Profit Power model failed the
+    # JSON-clean check and was never cached at all.
+    assert _serialize(_rich_sample()) is not None
+    back = _deserialize(_serialize(_rich_sample()), _field_names())
+    assert isinstance(back.profit_power, ProfitPowerResponse)
+
+
+def test_binary_roundtrip_matches_the_jsonb_one():
+    out = _rich_sample()
+    back = _binary(out)
+    assert isinstance(back, CollectedTickerData)
+    for f in dataclasses.fields(CollectedTickerData):
+        assert getattr(back, f.name) == getattr(out, f.name), f.name
+    assert back.computed["recent_price_dates"][0] == date(2026, 6, 14)
+    assert isinstance(back.sector_aggregates, SectorAggregates)
+
+
+def test_binary_fields_decode_on_first_read_only():
+    back = _binary(_rich_sample())
+    assert "profile" in back.__dict__ and "computed" in back.__dict__
+    assert "profit_power" not in back.__dict__ and "income" not in back.__dict__
+
+    assert back.profit_power.annual[0].gross_margin == 70.1
+    assert back.__dict__["profit_power"] is back.profit_power   # decoded once, then plain
+    assert "snap_health" not in back.__dict__
+
+    back.income = []                                   # an assignment simply wins
+    assert back.income == []
+
+
+def test_deep_copying_a_binary_collection_copies_bytes_not_models():
+    base = _binary(_rich_sample())
+    a, b = copy.deepcopy(base), copy.deepcopy(base)
+    assert "snap_health" not in a.__dict__
+    assert a.snap_health == b.snap_health and a.snap_health is not b.snap_health
+    assert "snap_health" not in base.__dict__
+
+
+@pytest.mark.asyncio
+async def test_collect_stamps_the_persona_without_decoding_the_base(monkeypatch):
+    base = _binary(_rich_sample())
+
+    async def _fake_get_or_collect(ticker, fetch_fresh):
+        return base
+
+    monkeypatch.setattr(tdc, "get_or_collect", _fake_get_or_collect)
+    out = await TickerReportDataCollector(fmp=object()).collect("ORCL", "cathie_wood")
+    assert out.persona_key == "cathie_wood"
+    assert out.meta["agent"] == _AGENT_MAP.get("cathie_wood", "buffett")
+    assert "profit_power" not in out.__dict__ and "holders_response" not in out.__dict__
+    assert base.persona_key == "warren_buffett"
+
+
+def test_binary_rows_from_another_shape_or_garbage_are_misses(monkeypatch):
+    blob = encode_collection(_serialize(_rich_sample()))
+    assert _deserialize_binary("not base64 at all!", _field_names()) is None
+    assert _deserialize_binary(blob[:40], _field_names()) is None
+    monkeypatch.setattr(tdc, "_schema_fingerprint", lambda: "another-shape")
+    assert _deserialize_binary(blob, _field_names()) is None
+
+
+def test_a_bad_lazy_field_degrades_to_its_default():
+    payload = _serialize(_rich_sample())
+    payload["snap_health"] = {"category": "Financial Health"}    # missing required fields
+    back = _deserialize_binary(encode_collection(payload), _field_names())
+    assert back is not None
+    assert back.snap_health is None
+    assert back.profit_power is not None
+
+
+class _Table:
+    """Both Supabase clients at once: the async read chain and the sync upsert."""
+
+    def __init__(self):
+        self.row = None
+        self.selects = []
+
+    def table(self, name):
+        return self
+
+    def select(self, columns):
+        self.selects.append(columns)
+        return self
+
+    def eq(self, *a):
+        return self
+
+    def limit(self, n):
+        return self
+
+    def upsert(self, row, on_conflict=None):
+        self.row = dict(row)
+        return _Done()
+
+    async def execute(self):
+        return type("R", (), {"data": [dict(self.row)] if self.row else []})()
+
+
+class _Done:
+    def execute(self):
+        return None
+
+
+@pytest.mark.asyncio
+async def test_binary_rows_store_and_read_through_the_table(monkeypatch):
+    from app.config import settings
+
+    table = _Table()
+    monkeypatch.setattr(tdc, "get_supabase", lambda: table)
+    monkeypatch.setattr(tdc, "get_async_supabase", lambda: table)
+    monkeypatch.setattr(settings, "TICKER_DATA_CACHE_BINARY", True)
+
+    await tdc.store_collection("orcl", _rich_sample())
+    assert table.row["collected_data"] is None and table.row[tdc.BLOB_COLUMN]
+
+    back = await tdc.get_cached_collection("ORCL")
+    assert table.selects == [f"collected_data, {tdc.BLOB_COLUMN}, cached_at"]
+    assert back.profile["companyName"] == "Oracle Corporation"
+    assert "profit_power" not in back.__dict__
+
+    monkeypatch.setattr(settings, "TICKER_DATA_CACHE_BINARY", False)
+    await tdc.get_cached_collection("ORCL")
+    assert table.selects[-1] == "collected_data, cached_at"
@@ -0,0 +1,170 @@
+"""The hot in-process tier and the compressed row format of ticker_report_cache.
+
+Pinned here: a fresh row is read from the table once per (ticker, persona, close
+cycle) and then served from memory; a new close moves the key so nothing stale is
+served; a write seeds the tier with a detached copy; a compressed row decodes to the
+same dict its JSONB twin would; and the blob column is never selected while
+compression is off (before migration 156 it does not exist). No Supabase.
+"""
+
+import base64
+import json
+import zlib
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.config import settings
+from app.services import ticker_report_cache as trc
+
+_REPORT = {
+    "ticker": "AAPL",
+    "quality_score": 72,
+    "price_action": {"prices": [190.0, 191.5, 189.25], "change_pct": 1.2},
+}
+
+
+class _Result:
+    def __init__(self, data):
+        self.data = data
+
+
+class _AsyncQuery:
+    def __init__(self, db):
+        self.db = db
+
+    def table(self, name):
+        return self
+
+    def select(self, columns):
+        self.db.selects.append(columns)
+        return self
+
+    def eq(self, *a):
+        return self
+
+    def limit(self, n):
+        return self
+
+    async def execute(self):
+        self.db.reads += 1
+        return _Result([dict(self.db.row)] if self.db.row else [])
+
+
+class _SyncQuery:
+    def __init__(self, db):
+        self.db = db
+
+    def table(self, name):
+        return self
+
+    def upsert(self, row, on_conflict=None):
+        self.db.row = dict(row)
+        return self
+
+    def execute(self):
+        return _Result([self.db.row])
+
+
+class _DB:
+    def __init__(self, row=None):
+        self.row = row
+        self.reads = 0
+        self.selects = []
+
+
+@pytest.fixture
+def db(monkeypatch):
+    trc._memory.clear()
+    store = _DB()
+    monkeypatch.setattr(trc, "get_async_supabase", lambda: _AsyncQuery(store))
+    monkeypatch.setattr(trc, "get_supabase", lambda: _SyncQuery(store))
+    yield store
+    trc._memory.clear()
+
+
+def _fresh_row(**kw):
+    row = {"ticker_report_data": dict(_REPORT),
+           "cached_at": datetime.now(timezone.utc).isoformat()}
+    row.update(kw)
+    return row
+
+
+@pytest.mark.asyncio
+async def test_a_fresh_row_is_read_once_per_cycle(db):
+    db.row = _fresh_row()
+    first = await trc.get_cached_report("aapl", "Warren_Buffett")
+    second = await trc.get_cached_report("AAPL", "warren_buffett")
+    assert first == _REPORT and second is first
+    assert db.reads == 1
+    assert db.selects == ["ticker_report_data, cached_at"]
+
+
+@pytest.mark.asyncio
+async def test_a_new_close_moves_the_key_and_the_row_reads_stale(db, monkeypatch):
+    db.row = _fresh_row()
+    assert await trc.get_cached_report("AAPL", "warren_buffett") is not None
+
+    later = datetime.now(timezone.utc) + timedelta(minutes=1)
+    monkeypatch.setattr(trc, "current_close_cycle_start", lambda now=None: later)
+    assert await trc.get_cached_report("AAPL", "warren_buffett") is None
+    assert db.reads == 2
+
+
+@pytest.mark.asyncio
+async def test_a_write_seeds_the_tier_with_a_detached_copy(db):
+    report = {"ticker": "NVDA", "price_action": {"prices": [1.0, 2.0]}}
+    await trc.upsert_cached_report("nvda", "warren_buffett", report)
+    report["price_action"]["prices"].append(99.0)   # the caller keeps editing its dict
+
+    served = await trc.get_cached_report("NVDA", "warren_buffett")
+    assert served == {"ticker": "NVDA", "price_action": {"prices": [1.0, 2.0]}}
+    assert db.reads == 0
+
+
+@pytest.mark.asyncio
+async def test_a_stale_short_interest_payload_is_never_kept(db):
+    stale = {"hidden_market_signals": {"short_interest": {"change_3m": 4.0, "history": []}}}
+    db.row = _fresh_row(ticker_report_data=stale)
+    assert await trc.get_cached_report("AAPL", "warren_buffett") is None
+    await trc.upsert_cached_report("AAPL", "warren_buffett", stale)
+    assert len(trc._memory) == 0
+
+
+@pytest.mark.asyncio
+async def test_zero_entries_disables_the_tier(db, monkeypatch):
+    monkeypatch.setattr(settings, "TICKER_REPORT_MEMORY_MAX_ENTRIES", 0)
+    db.row = _fresh_row()
+    await trc.get_cached_report("AAPL", "warren_buffett")
+    await trc.get_cached_report("AAPL", "warren_buffett")
+    assert db.reads == 2 and len(trc._memory) == 0
+
+
+def test_blob_round_trip_and_bad_blobs():
+    blob = trc.encode_report(_REPORT)
+    assert blob.split(":", 1)[0] in ("zstd", "zlib")
+    assert trc.decode_report(blob) == _REPORT
+    # Rows written by a replica without zstandard stay readable everywhere.
+    legacy = "zlib:" + base64.b64encode(zlib.compress(json.dumps(_REPORT).encode())).decode()
+    assert trc.decode_report(legacy) == _REPORT
+    with pytest.raises(ValueError):
+        trc.decode_report("lz4:AAAA")
+
+
+@pytest.mark.asyncio
+async def test_compressed_rows_write_a_blob_and_read_back(db, monkeypatch):
+    monkeypatch.setattr(settings, "TICKER_REPORT_CACHE_COMPRESSED", True)
+    await trc.upsert_cached_report("AAPL", "warren_buffett", _REPORT)
+    assert db.row["ticker_report_data"] is None
+    assert trc.decode_report(db.row[trc.BLOB_COLUMN]) == _REPORT
+
+    trc._memory.clear()                                   # another worker, cold
+    assert await trc.get_cached_report("AAPL", "warren_buffett") == _REPORT
+    assert db.selects == [f"ticker_report_data, {trc.BLOB_COLUMN}, cached_at"]
+
+
+@pytest.mark.asyncio
+async def test_jsonb_wins_over_a_leftover_blob(db, monkeypatch):
+    monkeypatch.setattr(settings, "TICKER_REPORT_CACHE_COMPRESSED", True)
+    db.row = _fresh_row(**{trc.BLOB_COLUMN: trc.encode_report({"ticker": "OLD"})})
+    assert await trc.get_cached_report("AAPL", "warren_buffett") == _REPORT
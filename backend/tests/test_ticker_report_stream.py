@@ -0,0 +1,312 @@
+"""Progressive delivery of the ticker report over SSE (`GET /stocks/{ticker}/report/stream`).
+
+Pinned here:
+  * the service pushes the real-data sections BEFORE Stage A is even called, and
+    each Stage-B narrative as it lands;
+  * the endpoint relays those as `section` / `narrative` frames, validated against
+    the report schema (internal keys and unvalidatable sections are dropped), then
+    a `done` frame carrying the same validated report the GET returns;
+  * billing matches the GET: a cache hit is free, a miss charges once, and a
+    failure, a degraded report or a client disconnect refunds once — with the
+    admission slot released on every exit;
+  * admission and the charge happen on the stream's first iteration: concurrent
+    streams are capped, and a stream dropped before it starts costs nothing.
+
+Mirrors tests/test_ticker_report_credits.py's mock style — no Supabase, FMP or Gemini.
+"""
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+import app.api.v1.endpoints.ticker_report as tr
+import app.services.ticker_report_service as trs
+from app.services.agents.narrative_prompts import NarrativeJob, run_narrative_jobs
+from app.services.agents.persona_config import get_persona_config
+
+USER = {"id": "authed-user-1"}
+
+
+def _install(monkeypatch, *, cached=None, generate=None):
+    """Wire the endpoint's collaborators. Returns the fake CreditService class."""
+
+    async def _fake_legacy(ticker, persona):
+        return None
+
+    async def _fake_cached(ticker, persona):
+        return cached
+
+    monkeypatch.setattr(tr, "_check_legacy_report_cache", _fake_legacy)
+    monkeypatch.setattr(tr, "get_cached_report", _fake_cached)
+    monkeypatch.setattr(tr, "_validate_report", lambda report, ticker, persona: (report, None))
+
+    class _FakeService:
+        async def generate_fresh_report(self, ticker, persona, on_progress=None):
+            return await generate(on_progress)
+
+    monkeypatch.setattr(tr, "TickerReportService", _FakeService)
+
+    class FakeCreditService:
+        DEEP_RESEARCH_COST = 20
+        precharge = MagicMock(return_value=100)
+        refund_ledgered = MagicMock(return_value=120)
+
+    monkeypatch.setattr(tr, "CreditService", FakeCreditService)
+    monkeypatch.setattr(tr, "_INFLIGHT_REPORTS", 0)
+    return FakeCreditService
+
+
+def _parse(frame: str):
+    event_line, data_line = frame.strip().split("\n")
+    return event_line[len("event: "):], json.loads(data_line[len("data: "):])
+
+
+async def _frames(response):
+    return [_parse(f) async for f in response.body_iterator]
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_streams_meta_and_done_for_free(monkeypatch):
+    credit = _install(monkeypatch, cached={"symbol": "AAPL"})
+    frames = await _frames(await tr.stream_ticker_report("aapl", "warren_buffett", user=USER))
+    assert frames == [
+        ("meta", {"ticker": "AAPL", "persona": "warren_buffett", "cached": True}),
+        ("done", {"report": {"symbol": "AAPL"}}),
+    ]
+    credit.precharge.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_miss_streams_sections_then_done_and_charges_once(monkeypatch):
+    async def generate(on_progress):
+        on_progress("section", {"key": "quality_score", "data": 71})
+        on_progress("section", {"key": "_scoring_inputs", "data": {"roe": 1}})   # internal
+        on_progress("section", {"key": "quality_score", "data": "not-a-score"})   # invalid
+        await asyncio.sleep(0)
+        on_progress("narrative", {"label": "executive_summary_text",
+                                  "key": "executive_summary_text", "data": "A compounder."})
+        return {"symbol": "AAPL", "quality_score": 71}
+
+    credit = _install(monkeypatch, generate=generate)
+    frames = await _frames(await tr.stream_ticker_report("AAPL", "warren_buffett", user=USER))
+
+    assert frames == [
+        ("meta", {"ticker": "AAPL", "persona": "warren_buffett", "cached": False}),
+        ("section", {"key": "quality_score", "data": 71.0}),
+        ("narrative", {"key": "executive_summary_text", "data": "A compounder.",
+                       "label": "executive_summary_text"}),
+        ("done", {"report": {"symbol": "AAPL", "quality_score": 71}}),
+    ]
+    credit.precharge.assert_called_once()
+    credit.refund_ledgered.assert_not_called()
+    assert tr._INFLIGHT_REPORTS == 0
+
+
+@pytest.mark.asyncio
+async def test_a_failed_generation_is_an_error_frame_and_a_refund(monkeypatch):
+    async def generate(on_progress):
+        on_progress("section", {"key": "quality_score", "data": 50})
+        raise RuntimeError("gemini exploded")
+
+    credit = _install(monkeypatch, generate=generate)
+    frames = await _frames(await tr.stream_ticker_report("AAPL", "warren_buffett", user=USER))
+
+    assert [e for e, _ in frames] == ["meta", "section", "error"]
+    assert frames[-1][1]["details"]["step"] == "report_generation"
+    credit.refund_ledgered.assert_called_once()
+    assert tr._INFLIGHT_REPORTS == 0
+
+
+@pytest.mark.asyncio
+async def test_a_degraded_report_is_refunded_not_delivered(monkeypatch):
+    async def generate(on_progress):
+        return {"symbol": "AAPL", "_degraded": "stage_a_TimeoutError"}
+
+    credit = _install(monkeypatch, generate=generate)
+    frames = await _frames(await tr.stream_ticker_report("AAPL", "warren_buffett", user=USER))
+
+    assert frames[-1][0] == "error"
+    assert frames[-1][1]["error_code"] == "GEMINI_UNAVAILABLE"
+    credit.refund_ledgered.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_a_disconnect_cancels_the_pipeline_refunds_and_frees_the_slot(monkeypatch):
+    cancelled = asyncio.Event()
+
+    async def generate(on_progress):
+        on_progress("section", {"key": "quality_score", "data": 60})
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    credit = _install(monkeypatch, generate=generate)
+    response = await tr.stream_ticker_report("AAPL", "warren_buffett", user=USER)
+    stream = response.body_iterator
+    assert _parse(await stream.__anext__())[0] == "meta"
+    assert _parse(await stream.__anext__())[0] == "section"
+    assert tr._INFLIGHT_REPORTS == 1
+    await stream.aclose()                      # the client went away
+
+    await asyncio.wait_for(cancelled.wait(), 1)
+    credit.refund_ledgered.assert_called_once()
+    assert tr._INFLIGHT_REPORTS == 0
+
+
+@pytest.mark.asyncio
+async def test_bad_input_is_json_and_a_failed_charge_is_an_error_frame(monkeypatch):
+    credit = _install(monkeypatch)
+    bad = await tr.stream_ticker_report("AAPL", "nobody", user=USER)
+    assert json.loads(bad.body)["error_code"] == "INVALID_PERSONA"
+
+    credit.precharge.return_value = None       # out of credits
+    frames = await _frames(await tr.stream_ticker_report("AAPL", "warren_buffett", user=USER))
+    assert [e for e, _ in frames] == ["error"]
+    assert frames[0][1]["error_code"] == "INSUFFICIENT_CREDITS"
+    credit.refund_ledgered.assert_not_called()  # nothing was debited
+    assert tr._INFLIGHT_REPORTS == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_cold_streams_are_capped(monkeypatch):
+    release = asyncio.Event()
+
+    async def generate(on_progress):
+        await release.wait()
+        return {"symbol": "AAPL"}
+
+    credit = _install(monkeypatch, generate=generate)
+    monkeypatch.setattr(tr.settings, "REPORT_GET_MAX_INFLIGHT", 2)
+    responses = [
+        await tr.stream_ticker_report("AAPL", "warren_buffett", user=USER) for _ in range(5)
+    ]
+    assert tr._INFLIGHT_REPORTS == 0            # nothing is taken until a stream starts
+    streams = [r.body_iterator for r in responses]
+    first = [_parse(f) for f in await asyncio.gather(*(s.__anext__() for s in streams))]
+
+    assert [e for e, _ in first].count("meta") == 2
+    busy = [d for e, d in first if e == "error"]
+    assert len(busy) == 3 and all(d["error_code"] == "SYSTEM_BUSY" for d in busy)
+    assert credit.precharge.call_count == 2
+    assert tr._INFLIGHT_REPORTS == 2
+
+    release.set()
+    for s in streams:
+        async for _ in s:
+            pass
+    assert tr._INFLIGHT_REPORTS == 0
+    credit.refund_ledgered.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_a_disconnect_before_the_first_frame_costs_nothing(monkeypatch):
+    async def generate(on_progress):
+        raise AssertionError("never started")
+
+    credit = _install(monkeypatch, generate=generate)
+    response = await tr.stream_ticker_report("AAPL", "warren_buffett", user=USER)
+    await response.body_iterator.aclose()       # the client went away before any frame
+    credit.precharge.assert_not_called()
+    credit.refund_ledgered.assert_not_called()
+    assert tr._INFLIGHT_REPORTS == 0
+
+
+# ── Service: what gets pushed, and when ──────────────────────────────────────
+
+
+class _Collector:
+    def __init__(self, log):
+        self.log = log
+
+    async def collect(self, ticker, persona_key):
+        self.log.append("collect")
+        return MagicMock(ticker=ticker)
+
+    def assemble_report(self, out, shell):
+        self.log.append("assemble")
+        return {
+            "symbol": out.ticker,
+            "price_action": {"prices": [1.0, 2.0], "narrative": ""},
+            "revenue_forecast": {"management_guidance": shell.get("guidance", "maintained")},
+            "moat_competition": {"durability_note": ""},
+            "core_thesis": {"bull_case": [], "bear_case": []},
+            "critical_factors": [],
+        }
+
+
+class _Gemini:
+    async def create_narrative_cache(self, system_instruction, evidence, ttl_minutes=None):
+        return None
+
+    async def generate_text(self, prompt, system_instruction=None):
+        return {"text": "A durable moat built on switching costs."}
+
+    async def delete_cache(self, handle):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_service_pushes_real_data_sections_before_stage_a(monkeypatch):
+    log, events = [], []
+    service = trs.TickerReportService.__new__(trs.TickerReportService)
+    service.collector = _Collector(log)
+    service.gemini = _Gemini()
+
+    async def stage_a(out, persona, evidence):
+        log.append("stage_a")
+        return {"guidance": "raised"}
+
+    async def noop(*a, **k):
+        pass
+
+    async def no_dedup(ticker, persona_key, run, key_prefix=""):
+        return await run()
+
+    monkeypatch.setattr(service, "_generate_stage_a", stage_a)
+    monkeypatch.setattr(trs, "build_financial_context", lambda out: "EVIDENCE")
+    monkeypatch.setattr(trs, "build_narrative_jobs", lambda persona, evidence, report: [
+        NarrativeJob(label="moat_durability_note", prompt="p", word_cap=20,
+                     apply=lambda v: report["moat_competition"].__setitem__("durability_note", v),
+                     fallback_value="-", section="moat_competition"),
+    ])
+    monkeypatch.setattr(trs, "synthesize_core_thesis", noop)
+    monkeypatch.setattr(trs, "synthesize_critical_factors", noop)
+    monkeypatch.setattr(trs, "upsert_cached_report", noop)
+    monkeypatch.setattr("app.services.research_service.run_agent_deduped", no_dedup)
+
+    def on_progress(event, data):
+        events.append((event, data["key"], len(log)))
+
+    await service.generate_fresh_report("AAPL", "warren_buffett", on_progress=on_progress)
+
+    early = [(k, n) for e, k, n in events if e == "section" and n == 2]  # collect + preview
+    assert ("price_action", 2) in early and ("revenue_forecast", 2) in early
+    assert log[:3] == ["collect", "assemble", "stage_a"]
+    sent_after_assembly = [k for e, k, n in events if e == "section" and n == 4]
+    # Stage A changed revenue_forecast → re-sent; price_action did not → not re-sent.
+    assert "revenue_forecast" in sent_after_assembly
+    assert "price_action" not in sent_after_assembly
+    assert ("narrative", "moat_competition", 4) in events
+    assert events[-1][:2] == ("section", "critical_factors")
+
+
+@pytest.mark.asyncio
+async def test_on_applied_fires_for_every_job_and_a_broken_listener_is_harmless():
+    persona = get_persona_config("warren_buffett")
+    seen = []
+    jobs = [
+        NarrativeJob(label=label, prompt="p", word_cap=20, apply=lambda v: None,
+                     fallback_value="-")
+        for label in ("a", "b")
+    ]
+
+    def listener(job):
+        seen.append(job.label)
+        raise RuntimeError("listener bug")
+
+    await run_narrative_jobs(jobs, _Gemini(), persona, on_applied=listener)
+    assert sorted(seen) == ["a", "b"]
@@ -0,0 +1,232 @@
+"""
+The auth users-row cache (app/core/user_cache.py) must never outlive a write that matters.
+
+`get_current_user` / `get_current_user_or_guest` reuse the caller's `users` row for a few
+seconds so the hot authenticated routes skip one round-trip each. The security property
+this file pins is that the reuse does NOT delay a password-change eviction: the token minted
+before the change is rejected on the very next request, on both dependencies, because the
+password-change path drops the cached row before it returns. The same goes for a tier change
+(the IAP mirror), a profile edit and account deletion, and for a read that was already in
+flight when the invalidation landed.
+
+Hermetic: one in-memory `users` table shared by a sync stub (the writers) and an async stub
+(the strict dependency's reader), so a write is visible to the next read exactly as in prod.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import jwt
+
+from app.api.v1.endpoints import auth as auth_ep
+from app.config import settings
+from app.core import user_cache
+from app.dependencies import get_current_user, get_current_user_or_guest
+
+_USER_ID = "aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee"
+
+
+class _Table:
+    """The one `users` row both stubs read and write, plus a read counter."""
+
+    def __init__(self):
+        self.row = {"id": _USER_ID, "email": "u@example.com", "tier": "free",
+                    "password_changed_at": None}
+        self.reads = 0
+
+
+class _Query:
+    def __init__(self, table: _Table):
+        self._t = table
+        self._update = None
+
+    def update(self, values):
+        self._update = values
+        return self
+
+    def __getattr__(self, _name):
+        return lambda *a, **k: self
+
+    def _run(self):
+        if self._update is not None:
+            self._t.row.update(self._update)
+            return [dict(self._t.row)]
+        self._t.reads += 1
+        return [dict(self._t.row)]
+
+    def execute(self):
+        class _R:
+            data = self._run()
+        return _R()
+
+
+class _AsyncQuery(_Query):
+    async def execute(self):
+        return _Query.execute(self)
+
+
+class _SyncDB:
+    def __init__(self, table):
+        self._t = table
+
+    def table(self, _name):
+        return _Query(self._t)
+
+
+class _AsyncDB(_SyncDB):
+    def table(self, _name):
+        return _AsyncQuery(self._t)
+
+
+def _token_issued(seconds_ago: int) -> str:
+    now = datetime.now(timezone.utc)
+    return jwt.encode(
+        {
+            "sub": _USER_ID,
+            "iat": int((now - timedelta(seconds=seconds_ago)).timestamp()),
+            "exp": now + timedelta(hours=1),
+            "type": "access",
+        },
+        settings.SECRET_KEY,
+        algorithm=settings.ALGORITHM,
+    )
+
+
+def _creds(token):
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+async def _strict(table, token):
+    return await get_current_user(
+        credentials=_creds(token), user_id=_USER_ID, supabase=_AsyncDB(table)
+    )
+
+
+@pytest.mark.asyncio
+async def test_repeat_requests_reuse_the_row():
+    table = _Table()
+    old = _token_issued(60)
+    for _ in range(5):
+        user = await _strict(table, old)
+        assert user["id"] == _USER_ID
+    assert table.reads == 1
+
+
+@pytest.mark.asyncio
+async def test_returned_row_is_a_copy():
+    table = _Table()
+    token = _token_issued(60)
+    (await _strict(table, token))["tier"] = "premium"
+    assert (await _strict(table, token))["tier"] == "free"
+
+
+@pytest.mark.asyncio
+async def test_password_change_revokes_a_cached_token_immediately():
+    table = _Table()
+    old = _token_issued(60)
+    await _strict(table, old)  # warm: the row is now cached with password_changed_at=None
+
+    auth_ep._mark_password_changed(_SyncDB(table), _USER_ID)
+
+    with pytest.raises(HTTPException) as exc:
+        await _strict(table, old)
+    assert exc.value.status_code == 401
+    assert exc.value.detail["error_code"] == "AUTH_SESSION_EXPIRED"
+
+
+@pytest.mark.asyncio
+async def test_password_change_revokes_on_the_identity_dependency_too():
+    table = _Table()
+    old = _token_issued(60)
+    user = await get_current_user_or_guest(authorization=f"Bearer {old}", supabase=_SyncDB(table))
+    assert user["id"] == _USER_ID
+
+    auth_ep._mark_password_changed(_SyncDB(table), _USER_ID)
+
+    with pytest.raises(HTTPException) as exc:
+        await get_current_user_or_guest(authorization=f"Bearer {old}", supabase=_SyncDB(table))
+    assert exc.value.detail["error_code"] == "AUTH_SESSION_EXPIRED"
+
+
+@pytest.mark.asyncio
+async def test_failed_stamp_still_drops_the_cached_row():
+    class _Broken(_SyncDB):
+        def table(self, _name):
+            raise RuntimeError("db down")
+
+    table = _Table()
+    await _strict(table, _token_issued(60))
+    auth_ep._mark_password_changed(_Broken(table), _USER_ID)
+    assert user_cache.cached_user_record(_USER_ID) is None
+
+
+@pytest.mark.asyncio
+async def test_in_flight_read_does_not_repopulate_after_invalidation():
+    """The read started before the password change; its (old) row must not be cached."""
+    table = _Table()
+    gate = asyncio.Event()
+
+    class _SlowQuery(_AsyncQuery):
+        async def execute(self):
+            rows = _Query.execute(self)  # snapshot BEFORE the write lands
+            await gate.wait()
+            return rows
+
+    class _SlowDB(_SyncDB):
+        def table(self, _name):
+            return _SlowQuery(self._t)
+
+    old = _token_issued(60)
+    pending = asyncio.create_task(
+        get_current_user(credentials=_creds(old), user_id=_USER_ID, supabase=_SlowDB(table))
+    )
+    await asyncio.sleep(0)
+    auth_ep._mark_password_changed(_SyncDB(table), _USER_ID)
+    gate.set()
+    await pending  # served the pre-change row — it was read before the change
+
+    assert user_cache.cached_user_record(_USER_ID) is None
+    with pytest.raises(HTTPException):
+        await _strict(table, old)
+
+
+@pytest.mark.asyncio
+async def test_tier_change_drops_the_cached_row(monkeypatch):
+    from app.services import iap_service
+
+    table = _Table()
+    token = _token_issued(60)
+    assert (await _strict(table, token))["tier"] == "free"
+
+    svc = iap_service.IAPService.__new__(iap_service.IAPService)
+    svc.supabase = _SyncDB(table)
+    monkeypatch.setattr(svc, "winning_tier", lambda _uid: "pro", raising=False)
+    try:
+        svc.reconcile_user_tier(_USER_ID)
+    except Exception:
+        pass  # the credit-period RPC after the mirror is best-effort and not under test
+
+    assert (await _strict(table, token))["tier"] == "pro"
+
+
+@pytest.mark.asyncio
+async def test_disabled_ttl_reads_every_time(monkeypatch):
+    monkeypatch.setattr(user_cache.settings, "USER_RECORD_CACHE_TTL_SECONDS", 0)
+    table = _Table()
+    token = _token_issued(60)
+    await _strict(table, token)
+    await _strict(table, token)
+    assert table.reads == 2
+
+
+def test_writers_invalidate_after_their_users_write():
+    """Source-scan: every endpoint that rewrites `users` drops the cached row."""
+    import inspect
+
+    from app.api.v1.endpoints import users as users_ep
+
+    for fn in (users_ep.update_profile, users_ep._write_avatar_url, users_ep.delete_account):
+        assert "invalidate_user_record(" in inspect.getsource(fn), fn.__name__
@@ -12,6 +12,7 @@ from app.services.volatility_cache_service import (
     VolatilityCacheService,
     _chronological_closes,
     _sigma_from_closes,
+    _sigmas_from_closes,
 )
 
 
@@ -83,6 +84,37 @@ def test_sigma_matches_the_shared_helper_over_the_baseline():
     assert sample == len(_daily_returns(baseline))
 
 
+def test_batch_sigmas_match_the_per_symbol_helper():
+    series = [[100.0] * 20, [100.0] * 50, []]
+    walk = [100.0]
+    for i in range(1, 300):
+        walk.append(walk[-1] * (1.012 if i % 3 else 0.985))
+    series += [walk, walk[:40], walk[:45] + [float("nan")] + walk[45:90]]
+    for got, (sigma, sample) in zip(_sigmas_from_closes(series), map(_sigma_from_closes, series)):
+        assert got[1] == sample
+        assert got[0] == (pytest.approx(sigma, rel=1e-12) if sigma is not None else None)
+
+
+@pytest.mark.asyncio
+async def test_recompute_universe_scores_in_chunks_and_upserts_each_symbol(monkeypatch):
+    class _FMP:
+        async def get_historical_prices(self, sym, from_date=None):
+            if sym == "BAD":
+                raise RuntimeError("upstream 500")
+            step = 1.01 if sym < "M" else 1.03
+            return [{"close": 100.0 * (step if i % 2 else 1 / step)} for i in range(60)]
+
+    written = {}
+    svc = _NoDBService()
+    svc.fmp = _FMP()
+    monkeypatch.setattr(mod, "_RECOMPUTE_CHUNK", 2)
+    monkeypatch.setattr(svc, "_upsert", lambda t, s, n: written.setdefault(t, (s, n)) and 1)
+    rows = await svc.recompute_universe(["aapl", "BAD", "xom", "KO"], skip_if_fresh_hours=0)
+    assert rows == 3 and sorted(written) == ["AAPL", "KO", "XOM"]
+    assert written["XOM"][0] > written["AAPL"][0] > 0
+    assert written["AAPL"][1] == 59
+
+
 # ── Sweeper read path degrades, never raises ──────────────────────────────
 
 class _NoDBService(VolatilityCacheService):
@@ -326,10 +326,10 @@ def _strip_py_comments(src: str) -> str:
 def _hydration_job_body() -> str:
     """Just `_run_whale_hydration_job`, comments removed.
 
-    Bounded to the function: asserting against the whole of main.py would pass on a
+    Bounded to the function: asserting against the whole of jobs.py would pass on a
     token that lives in an unrelated job.
     """
-    src = Path(__file__).resolve().parents[1] / "app" / "main.py"
+    src = Path(__file__).resolve().parents[1] / "app" / "jobs.py"
     text = src.read_text()
     start = text.index("async def _run_whale_hydration_job(")
     nxt = text.find("\nasync def ", start + 1)
@@ -354,7 +354,7 @@ def test_the_prewarmer_is_sequential_not_gathered():
     has no genuine suspension point. Sequential + an explicit yield bounds the stall to
     one build."""
     import inspect
-    import app.main as m
+    import app.jobs as m
 
     src = inspect.getsource(m._run_whale_profile_pre_warmer)
     # Strip comments and docstrings FIRST. The explanation next to this code names
@@ -454,7 +454,7 @@ def test_todays_run_is_tracked_durably_not_inferred_from_the_boot_clock():
     after a revert.
     """
     import inspect
-    import app.main as m
+    import app.jobs as m
 
     src = inspect.getsource(m._run_whale_hydration_job)
     src_nc = re.sub(r'"""(?:.|\n)*?"""', "", src)
@@ -483,7 +483,7 @@ def test_the_prewarmer_waits_on_an_event_not_a_magic_sleep():
     sweep STARTS at t=120s and is unbounded, so the pre-warmer woke 60s into it and any
     whale swept afterwards had its just-written warm thrown away."""
     import inspect
-    import app.main as m
+    import app.jobs as m
 
     src = inspect.getsource(m._run_whale_profile_pre_warmer)
     src_nc = re.sub(r'"""(?:.|\n)*?"""', "", src)
@@ -500,7 +500,7 @@ def test_the_sweep_event_is_set_even_when_the_sweep_fails():
     """It is an ORDERING signal, not a success signal. Gating it on success would let one
     bad sweep suppress warming forever."""
     import inspect
-    import app.main as m
+    import app.jobs as m
 
     src = inspect.getsource(m._run_whale_hydration_job)
     idx = src.index("_politician_sweep_done.set()")